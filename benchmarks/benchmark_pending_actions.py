@@ -0,0 +1,230 @@
+"""Benchmark pending action queue performance.
+
+Compares the heap-based PendingActionQueue against the previous sorted-list
+implementation (``list.insert`` + ``list.pop(0)`` + full-list rebuild on
+cancel) under latency-realistic workloads with many in-flight orders.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Set environment before importing config
+os.environ["DYNACONF_ENV"] = "development"
+
+from finbot.core.contracts.latency import LATENCY_NORMAL, LATENCY_SLOW, LatencyConfig
+from finbot.services.execution.pending_actions import ActionType, PendingAction, PendingActionQueue
+
+
+class ListPendingActionQueue:
+    """Previous sorted-list queue implementation, kept as the baseline."""
+
+    def __init__(self) -> None:
+        """Initialize empty action queue."""
+        self.actions: list[PendingAction] = []
+
+    def add_action(self, action: PendingAction) -> None:
+        """Binary-search insert into the sorted list."""
+        left, right = 0, len(self.actions)
+        while left < right:
+            mid = (left + right) // 2
+            if self.actions[mid].scheduled_time <= action.scheduled_time:
+                left = mid + 1
+            else:
+                right = mid
+        self.actions.insert(left, action)
+
+    def get_due_actions(self, current_time: datetime) -> list[PendingAction]:
+        """Pop due actions from the front of the list."""
+        due_actions: list[PendingAction] = []
+        while self.actions and self.actions[0].scheduled_time <= current_time:
+            due_actions.append(self.actions.pop(0))
+        return due_actions
+
+    def cancel_order_actions(self, order_id: str) -> int:
+        """Rebuild the list without the order's actions."""
+        original_count = len(self.actions)
+        self.actions = [action for action in self.actions if action.order_id != order_id]
+        return original_count - len(self.actions)
+
+    def get_pending_count(self) -> int:
+        """Get number of pending actions."""
+        return len(self.actions)
+
+
+def generate_synthetic_workload(n_orders: int, cancel_fraction: float = 0.01) -> tuple[list[str], set[str]]:
+    """Generate order IDs and the subset that will be cancelled mid-flight.
+
+    Args:
+        n_orders: Number of in-flight orders
+        cancel_fraction: Fraction of orders cancelled before filling
+
+    Returns:
+        Tuple of (order_ids, cancelled_order_ids)
+    """
+    random.seed(42)
+    order_ids = [f"order-{i:07d}" for i in range(n_orders)]
+    cancelled = set(random.sample(order_ids, int(n_orders * cancel_fraction)))
+    return order_ids, cancelled
+
+
+def run_workload(
+    queue: PendingActionQueue | ListPendingActionQueue,
+    order_ids: list[str],
+    cancelled: set[str],
+    latency_config: LatencyConfig,
+    tick: timedelta = timedelta(milliseconds=10),
+) -> int:
+    """Drive a queue through submit → fill/cancel for every order.
+
+    All orders are submitted within one simulated second so that they are
+    in flight together, then the queue is drained tick by tick. Submissions
+    schedule fills with a random fill latency; cancelled orders have their
+    pending actions removed and a CANCEL scheduled instead.
+
+    Args:
+        queue: Queue implementation under test
+        order_ids: Orders to submit
+        cancelled: Orders to cancel after submission
+        latency_config: Latency profile used for scheduling
+        tick: Simulated interval between market data updates
+
+    Returns:
+        Number of actions processed
+    """
+    rng = random.Random(42)
+    start = datetime(2024, 1, 15, 9, 30)
+    spacing = timedelta(seconds=1) / len(order_ids)
+    min_ms = latency_config.fill_latency_min.total_seconds() * 1000
+    max_ms = latency_config.fill_latency_max.total_seconds() * 1000
+
+    for i, order_id in enumerate(order_ids):
+        queue.add_action(
+            PendingAction(
+                action_type=ActionType.SUBMIT,
+                order_id=order_id,
+                scheduled_time=start + i * spacing + latency_config.submission_latency,
+                data={},
+            )
+        )
+
+    processed = 0
+    now = start
+    while queue.get_pending_count():
+        now += tick
+        for action in queue.get_due_actions(now):
+            processed += 1
+            if action.action_type != ActionType.SUBMIT:
+                continue
+            queue.add_action(
+                PendingAction(
+                    action_type=ActionType.FILL,
+                    order_id=action.order_id,
+                    scheduled_time=now + timedelta(milliseconds=rng.uniform(min_ms, max_ms)),
+                    data={},
+                )
+            )
+            if action.order_id in cancelled:
+                queue.cancel_order_actions(action.order_id)
+                queue.add_action(
+                    PendingAction(
+                        action_type=ActionType.CANCEL,
+                        order_id=action.order_id,
+                        scheduled_time=now + latency_config.cancel_latency,
+                        data={},
+                    )
+                )
+
+    return processed
+
+
+def benchmark_queue(
+    queue_cls: type[PendingActionQueue] | type[ListPendingActionQueue],
+    n_orders: int,
+    latency_config: LatencyConfig,
+    n_runs: int = 5,
+) -> dict:
+    """Benchmark one queue implementation.
+
+    Args:
+        queue_cls: Queue class to instantiate per run
+        n_orders: Number of in-flight orders
+        latency_config: Latency profile
+        n_runs: Number of benchmark runs to average
+
+    Returns:
+        Dict with timing results
+    """
+    order_ids, cancelled = generate_synthetic_workload(n_orders)
+
+    # Warm-up run
+    run_workload(queue_cls(), order_ids[: min(n_orders, 1000)], cancelled, latency_config)
+
+    times = []
+    processed = 0
+    for _ in range(n_runs):
+        queue = queue_cls()
+        start = time.perf_counter()
+        processed = run_workload(queue, order_ids, cancelled, latency_config)
+        end = time.perf_counter()
+        times.append(end - start)
+
+    return {
+        "n_orders": n_orders,
+        "n_runs": n_runs,
+        "n_actions": processed,
+        "min_time": min(times),
+        "max_time": max(times),
+        "mean_time": np.mean(times),
+        "std_time": np.std(times),
+    }
+
+
+def run_benchmarks():
+    """Run benchmarks for both queues across latency profiles and sizes."""
+    print("=" * 80)
+    print("Pending Action Queue Performance Benchmark")
+    print("=" * 80)
+    print()
+    print("Configuration:")
+    print("  - Baseline: sorted list (insert / pop(0) / rebuild on cancel)")
+    print("  - Candidate: binary heap with tombstones and order_id index")
+    print("  - Cancelled orders: 1%")
+    print()
+
+    profiles = [("NORMAL", LATENCY_NORMAL), ("SLOW", LATENCY_SLOW)]
+    sizes = [1_000, 10_000, 100_000]
+
+    results = []
+    print(f"{'Profile':<8} {'Orders':<9} {'List (ms)':<12} {'Heap (ms)':<12} {'Speedup':<10} {'Heap throughput':<20}")
+    print("-" * 80)
+
+    for profile_name, latency_config in profiles:
+        for n_orders in sizes:
+            n_runs = 1 if n_orders >= 100_000 else 3
+            baseline = benchmark_queue(ListPendingActionQueue, n_orders, latency_config, n_runs=n_runs)
+            heap = benchmark_queue(PendingActionQueue, n_orders, latency_config, n_runs=n_runs)
+            results.append((profile_name, baseline, heap))
+
+            speedup = baseline["mean_time"] / heap["mean_time"]
+            throughput = heap["n_actions"] / heap["mean_time"]
+            print(
+                f"{profile_name:<8} {n_orders:<9,} {baseline['mean_time'] * 1000:<12.1f} "
+                f"{heap['mean_time'] * 1000:<12.1f} {speedup:<10.1f} {throughput:,.0f} actions/sec"
+            )
+
+    print()
+    print("Notes:")
+    print("  - list.pop(0) and list.insert are O(n); heap push/pop are O(log n)")
+    print("  - Cancelling one order is O(n) for the list and O(k) for the heap")
+
+    return results
+
+
+if __name__ == "__main__":
+    results = run_benchmarks()
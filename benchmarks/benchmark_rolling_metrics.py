@@ -0,0 +1,94 @@
+"""Benchmark rolling-window portfolio analytics.
+
+Compares the cumulative-sum ``rolling_statistics`` kernel against the previous
+per-window loop (``np.mean`` / ``np.std`` / ``np.cov`` on a fresh slice for
+every bar) for 252-bar rolling metrics on long daily histories.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+
+import numpy as np
+
+# Set environment before importing config
+os.environ["DYNACONF_ENV"] = "development"
+
+from finbot.services.portfolio_analytics.rolling import rolling_statistics
+
+
+def loop_rolling_metrics(returns: np.ndarray, benchmark: np.ndarray, window: int) -> tuple[np.ndarray, ...]:
+    """Previous O(n * window) implementation for one series, kept as the baseline."""
+    n = len(returns)
+    sqrt_ann = math.sqrt(252)
+    sharpe = np.full(n, np.nan)
+    vol = np.full(n, np.nan)
+    beta = np.full(n, np.nan)
+    for i in range(window - 1, n):
+        start = i - window + 1
+        window_excess = returns[start : i + 1]
+        mu = float(np.mean(window_excess))
+        sigma = float(np.std(window_excess, ddof=1))
+        sharpe[i] = (mu / sigma * sqrt_ann) if sigma > 0 else 0.0
+        vol[i] = sigma * sqrt_ann
+        window_bench = benchmark[start : i + 1]
+        bench_var = float(np.var(window_bench, ddof=1))
+        beta[i] = float(np.cov(window_excess, window_bench, ddof=1)[0, 1]) / bench_var if bench_var > 0 else 0.0
+    return sharpe, vol, beta
+
+
+def time_call(func, n_runs: int) -> float:
+    """Mean wall time of ``func()`` in seconds over ``n_runs`` runs (after one warm-up)."""
+    func()
+    times = []
+    for _ in range(n_runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return float(np.mean(times))
+
+
+def run_benchmarks():
+    """Time the loop baseline and the kernel on 30 years of daily returns."""
+    print("=" * 80)
+    print("Rolling Metrics Performance Benchmark")
+    print("=" * 80)
+    print()
+    print("Configuration:")
+    print("  - 30 years of daily returns (7,560 bars), window = 252")
+    print("  - Baseline: per-window loop (Sharpe, vol, beta), one series at a time")
+    print("  - Candidate: rolling_statistics (Sharpe, vol, Sortino, drawdown, beta, correlation)")
+    print()
+
+    rng = np.random.default_rng(42)
+    n_obs, window = 7_560, 252
+    benchmark = rng.normal(0.0004, 0.011, n_obs)
+
+    print(f"{'Series':<8} {'Loop (ms)':<12} {'Kernel (ms)':<13} {'Speedup':<10}")
+    print("-" * 80)
+
+    results = []
+    for n_series in (1, 10, 50):
+        returns = rng.normal(0.0004, 0.01, (n_obs, n_series))
+
+        # The loop is linear in n_series; time one series and scale
+        loop_one = time_call(lambda returns=returns: loop_rolling_metrics(returns[:, 0], benchmark, window), n_runs=1)
+        loop_time = loop_one * n_series
+        kernel_time = time_call(
+            lambda returns=returns: rolling_statistics(returns, window=window, benchmark_returns=benchmark), n_runs=5
+        )
+        results.append((n_series, loop_time, kernel_time))
+        print(f"{n_series:<8} {loop_time * 1000:<12.0f} {kernel_time * 1000:<13.1f} {loop_time / kernel_time:<10.0f}")
+
+    print()
+    print("Notes:")
+    print("  - Loop cost is O(n_obs * window) per series; kernel cost is O(n_obs) per series")
+    print("  - Loop time for >1 series is extrapolated from the single-series run")
+
+    return results
+
+
+if __name__ == "__main__":
+    results = run_benchmarks()
@@ -146,6 +146,18 @@ class NautilusAdapter(BacktestEngine):
             costs=fallback_result.costs,
         )
 
+    def cache_key(self) -> str:
+        """Fingerprint of the adapter settings that affect run results (not the price data)."""
+        return hash_dictionary(
+            {
+                "adapter": self.name,
+                "random_seed": self._random_seed,
+                "fallback_enabled": self._enable_backtrader_fallback,
+                "native_execution_enabled": self._enable_native_execution,
+                "nautilus_version": self.version,
+            }
+        )
+
     # Backward-compatible shim for older call sites/docs.
     def run_backtest(self, request: BacktestRunRequest) -> BacktestRunResult:
         """Backward-compatible alias to `run`."""
@@ -14,8 +14,13 @@ from finbot.libs.logger.audit import audit_operation
     is_flag=True,
     help="Only show stale data sources",
 )
+@click.option(
+    "--rescan",
+    is_flag=True,
+    help="Re-check every file instead of trusting unchanged directories",
+)
 @click.pass_context
-def status(ctx: click.Context, stale_only: bool) -> None:
+def status(ctx: click.Context, stale_only: bool, rescan: bool) -> None:
     """Show data freshness and pipeline health.
 
     \b
@@ -28,10 +33,12 @@ def status(ctx: click.Context, stale_only: bool) -> None:
     Examples:
       finbot status
       finbot status --stale-only
+      finbot status --rescan
     """
     verbose = ctx.obj.get("verbose", False)
     parameters = {
         "stale_only": stale_only,
+        "rescan": rescan,
         "verbose": verbose,
         "trace_id": ctx.obj.get("trace_id"),
     }
@@ -47,7 +54,7 @@ def status(ctx: click.Context, stale_only: bool) -> None:
 
         from finbot.services.data_quality.check_data_freshness import check_all_freshness
 
-        statuses = check_all_freshness()
+        statuses = check_all_freshness(rescan=True) if rescan else check_all_freshness()
 
         if stale_only:
             statuses = [s for s in statuses if s.is_stale]
@@ -29,6 +29,24 @@ def get_max_threads() -> int:
     return compute_max_threads(reserved_threads=reserved_threads)
 
 
+def get_price_history_cache_bytes() -> int:
+    """
+    Get the memory budget of the process-wide price history cache in bytes.
+
+    Returns from settings if configured, otherwise 512 MiB.
+    """
+    return int(settings.get("caching.price_history_cache_mb", 512)) * 1024 * 1024
+
+
+def get_persist_data_catalog() -> bool:
+    """
+    Get whether the data status catalog is persisted between runs.
+
+    Returns from settings if configured, otherwise True.
+    """
+    return bool(settings.get("caching.persist_data_catalog", True))
+
+
 def get_alpha_vantage_api_key() -> str:
     """Get Alpha Vantage API key from environment."""
     return _api_key_manager.get_key("ALPHA_VANTAGE_API_KEY")
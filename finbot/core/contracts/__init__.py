@@ -11,6 +11,7 @@ from finbot.core.contracts.factor_analytics import (
 )
 from finbot.core.contracts.interfaces import (
     BacktestEngine,
+    CacheableBacktestEngine,
     ExecutionSimulator,
     MarketDataProvider,
     PortfolioStateStore,
@@ -103,6 +104,7 @@ __all__ = [
     "BatchStatus",
     "BenchmarkComparisonResult",
     "CVaRResult",
+    "CacheableBacktestEngine",
     "CostEvent",
     "CostModel",
     "CostSummary",
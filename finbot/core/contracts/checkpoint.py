@@ -36,6 +36,7 @@ class ExecutionCheckpoint:
         commission_per_share: Commission configuration
         latency_config_name: Latency profile name (INSTANT/FAST/NORMAL/SLOW)
         risk_config_data: Risk configuration as dict (optional)
+        numeric_mode: Accounting numeric mode (decimal/float/fixed_point)
 
     Example:
         >>> checkpoint = ExecutionCheckpoint(
@@ -74,3 +75,4 @@ class ExecutionCheckpoint:
     commission_per_share: Decimal = Decimal("0")
     latency_config_name: str = "INSTANT"
     risk_config_data: dict | None = None
+    numeric_mode: str = "decimal"
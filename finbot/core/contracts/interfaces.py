@@ -58,6 +58,14 @@ class BacktestEngine(Protocol):
         """Execute a backtest and return canonical run results."""
 
 
+@runtime_checkable
+class CacheableBacktestEngine(BacktestEngine, Protocol):
+    """Backtest engine whose results may be cached across runs."""
+
+    def cache_key(self) -> str:
+        """Return a fingerprint of every engine setting that affects results."""
+
+
 @runtime_checkable
 class RealtimeQuoteProvider(Protocol):
     """Provides real-time price quotes for securities."""
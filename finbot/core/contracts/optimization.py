@@ -7,7 +7,7 @@ portfolio strategies. Engine-agnostic: works with any set of
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True, slots=True)
@@ -21,6 +21,10 @@ class ParetoPoint:
         objective_a: Extracted value for the primary objective (e.g., CAGR).
         objective_b: Extracted value for the secondary objective (e.g., max_drawdown).
         is_pareto_optimal: True when no other evaluated point dominates this one.
+        objective_values: Values of every objective, in ``ParetoResult.objective_names``
+            order (the first two are ``objective_a`` and ``objective_b``).
+        pareto_rank: Non-dominated sorting front (1 = Pareto front), or ``None``
+            when ranks were not computed.
     """
 
     strategy_name: str
@@ -29,6 +33,8 @@ class ParetoPoint:
     objective_a: float
     objective_b: float
     is_pareto_optimal: bool
+    objective_values: tuple[float, ...] = ()
+    pareto_rank: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -42,6 +48,10 @@ class ParetoResult:
         pareto_front: Subset of ``all_points`` that are Pareto-optimal.
         dominated_points: Subset of ``all_points`` that are dominated.
         n_evaluated: Total number of points evaluated (== ``len(all_points)``).
+        objective_names: Every objective, in order (at least ``objective_a_name``
+            and ``objective_b_name``).
+        n_fronts: Number of non-dominated fronts, or ``None`` when ranks were
+            not computed.
     """
 
     objective_a_name: str
@@ -50,3 +60,5 @@ class ParetoResult:
     pareto_front: tuple[ParetoPoint, ...]
     dominated_points: tuple[ParetoPoint, ...]
     n_evaluated: int
+    objective_names: tuple[str, ...] = field(default_factory=tuple)
+    n_fronts: int | None = None
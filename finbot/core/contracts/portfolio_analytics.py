@@ -7,7 +7,8 @@ metrics.  Engine-agnostic; works with any returns or price series.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True, slots=True)
@@ -26,6 +27,11 @@ class RollingMetricsResult:
             as strings).  Same length as ``sharpe``.
         annualization_factor: Trading periods per year used for scaling
             (e.g. 252 for daily data).
+        sortino: Rolling annualized Sortino ratio; ``None`` if not computed.
+        drawdown: Rolling drawdown from the highest wealth within the window
+            (0 or negative); ``None`` if not computed.
+        correlation: Rolling correlation with the benchmark; ``None`` when no
+            benchmark was supplied.
     """
 
     window: int
@@ -35,6 +41,9 @@ class RollingMetricsResult:
     beta: tuple[float, ...] | None
     dates: tuple[str, ...]
     annualization_factor: int
+    sortino: tuple[float, ...] | None = None
+    drawdown: tuple[float, ...] | None = None
+    correlation: tuple[float, ...] | None = None
 
     def __post_init__(self) -> None:
         """Validate rolling metrics result fields."""
@@ -48,8 +57,10 @@ class RollingMetricsResult:
             )
         if len(self.dates) != len(self.sharpe):
             raise ValueError(f"dates length ({len(self.dates)}) must equal sharpe length ({len(self.sharpe)})")
-        if self.beta is not None and len(self.beta) != len(self.sharpe):
-            raise ValueError(f"beta length ({len(self.beta)}) must equal sharpe length ({len(self.sharpe)})")
+        for name in ("beta", "sortino", "drawdown", "correlation"):
+            series = getattr(self, name)
+            if series is not None and len(series) != len(self.sharpe):
+                raise ValueError(f"{name} length ({len(series)}) must equal sharpe length ({len(self.sharpe)})")
         if self.annualization_factor < 1:
             raise ValueError(f"annualization_factor must be >= 1, got {self.annualization_factor}")
 
@@ -147,7 +158,8 @@ class DrawdownAnalysisResult:
             up to ``top_n`` entries.
         underwater_curve: Signed underwater fraction at each bar
             (e.g. -0.20 means 20% below the running peak).
-            Length equals ``n_observations``.
+            Length equals ``n_observations``.  ``compute_drawdown_analysis``
+            returns a read-only float64 NumPy array; excluded from ``==``.
         n_periods: Number of periods in ``periods`` (after top-N truncation).
         max_depth: Worst single drawdown depth across all detected periods
             (positive fraction).
@@ -161,7 +173,7 @@ class DrawdownAnalysisResult:
     """
 
     periods: tuple[DrawdownPeriod, ...]
-    underwater_curve: tuple[float, ...]
+    underwater_curve: Sequence[float] = field(compare=False)
     n_periods: int
     max_depth: float
     avg_depth: float
@@ -110,6 +110,9 @@ class ProviderStatus:
         last_error: Most recent error message, or None.
         total_requests: Total requests made to this provider in the session.
         total_errors: Total failed requests in the session.
+        cache_hits: Fresh quotes from this provider served from the cache.
+        cache_stale_hits: Stale quotes from this provider served while being refreshed.
+        cache_misses: Cache misses this provider supplied the quote for.
     """
 
     provider: QuoteProvider
@@ -118,3 +121,6 @@ class ProviderStatus:
     last_error: str | None = None
     total_requests: int = 0
     total_errors: int = 0
+    cache_hits: int = 0
+    cache_stale_hits: int = 0
+    cache_misses: int = 0
@@ -75,9 +75,9 @@ class RegimePeriod:
     market_volatility: float
 
     def __post_init__(self) -> None:
-        """Validate period dates."""
-        if self.start >= self.end:
-            raise ValueError(f"start must be before end: {self.start} >= {self.end}")
+        """Validate period dates (a one-day period has ``start == end``)."""
+        if self.start > self.end:
+            raise ValueError(f"start must be before end: {self.start} > {self.end}")
 
 
 @dataclass(frozen=True, slots=True)
@@ -5,6 +5,10 @@ All charts include accessibility features:
 - Alt text via layout annotations
 - High contrast color scheme
 - Keyboard-navigable legends
+
+Line charts keep at most ``max_points`` points per trace (see
+``finbot.utils.data_science_utils.data_transformation.downsampling``), so
+century-long daily series stay responsive in the browser.
 """
 
 from __future__ import annotations
@@ -13,6 +17,15 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
+from finbot.utils.data_science_utils.data_transformation.downsampling import (
+    DownsampleMethod,
+    downsample_frame_indices,
+    downsample_series,
+)
+
+# Points per trace; more than a chart can resolve on a typical screen
+DEFAULT_MAX_POINTS = 2000
+
 
 def _add_accessibility_features(fig: go.Figure, description: str) -> go.Figure:
     """Add common accessibility features to a plotly figure.
@@ -46,6 +59,7 @@ def create_time_series_chart(
     normalize: bool = False,
     y_label: str = "Price",
     description: str | None = None,
+    max_points: int | None = DEFAULT_MAX_POINTS,
 ) -> go.Figure:
     """Create a line chart from multiple time series.
 
@@ -55,6 +69,7 @@ def create_time_series_chart(
         normalize: If True, normalize all series to start at 1.0
         y_label: Y-axis label
         description: Accessible description of chart content
+        max_points: Points kept per series (LTTB downsampling); None plots every point
 
     Returns:
         Plotly figure with accessibility features
@@ -66,6 +81,8 @@ def create_time_series_chart(
 
     for idx, (name, series) in enumerate(data.items()):
         y = series / series.iloc[0] if normalize else series
+        if max_points is not None:
+            y = downsample_series(y, max_points)
         color = colors[idx % len(colors)]
         fig.add_trace(
             go.Scatter(
@@ -247,6 +264,7 @@ def create_fan_chart(
     title: str,
     max_paths: int = 200,
     description: str | None = None,
+    max_points: int | None = DEFAULT_MAX_POINTS,
 ) -> go.Figure:
     """Create a fan chart from Monte Carlo simulation trials.
 
@@ -255,22 +273,32 @@ def create_fan_chart(
         title: Chart title
         max_paths: Maximum number of individual paths to display
         description: Accessible description of chart content
+        max_points: Periods kept per trace, chosen to keep the shape of the
+            percentile lines; None plots every period
 
     Returns:
         Plotly figure with accessibility features
     """
     fig = go.Figure()
 
+    # Percentile bands over every period; the plotted periods follow their shape
+    percentiles = trials_df.quantile([0.05, 0.50, 0.95]).T.set_axis(["p5", "p50", "p95"], axis=1)
+    percentiles.index = pd.RangeIndex(trials_df.shape[1])
+    if max_points is not None:
+        percentiles = percentiles.iloc[downsample_frame_indices(percentiles, max_points)]
+    periods = list(percentiles.index)
+    p5, p50, p95 = percentiles["p5"], percentiles["p50"], percentiles["p95"]
+
     # Plot a sample of individual paths (light blue, low opacity)
     n_trials = len(trials_df)
     sample_idx = np.random.default_rng(42).choice(n_trials, min(max_paths, n_trials), replace=False)
-    periods = list(range(trials_df.shape[1]))
+    paths = trials_df.to_numpy()[:, periods]
 
     for i in sample_idx:
         fig.add_trace(
             go.Scatter(
                 x=periods,
-                y=trials_df.iloc[i].values,
+                y=paths[i],
                 mode="lines",
                 line={"color": "rgba(0,114,178,0.08)", "width": 0.5},  # Blue with low opacity
                 showlegend=False,
@@ -278,11 +306,6 @@ def create_fan_chart(
             )
         )
 
-    # Percentile bands with high-contrast, colorblind-friendly colors
-    p5 = trials_df.quantile(0.05)
-    p50 = trials_df.quantile(0.50)
-    p95 = trials_df.quantile(0.95)
-
     # Use distinct line styles and colors
     fig.add_trace(
         go.Scatter(
@@ -337,6 +360,7 @@ def create_drawdown_chart(
     series: pd.Series,
     title: str = "Drawdown",
     description: str | None = None,
+    max_points: int | None = DEFAULT_MAX_POINTS,
 ) -> go.Figure:
     """Create a drawdown chart from a value series.
 
@@ -344,19 +368,22 @@ def create_drawdown_chart(
         series: Time series of values
         title: Chart title
         description: Accessible description of chart content
+        max_points: Points kept (min/max per bucket, so every trough and
+            recovery peak is plotted); None plots every point
 
     Returns:
         Plotly figure with accessibility features
     """
     cummax = series.cummax()
     drawdown = (series - cummax) / cummax
+    plotted = drawdown if max_points is None else downsample_series(drawdown, max_points, DownsampleMethod.MINMAX)
     fig = go.Figure()
 
     # Use orange instead of red (better for colorblind users)
     fig.add_trace(
         go.Scatter(
-            x=drawdown.index,
-            y=drawdown.values,
+            x=plotted.index,
+            y=plotted.values,
             fill="tozeroy",
             mode="lines",
             name="Drawdown",
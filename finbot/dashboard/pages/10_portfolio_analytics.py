@@ -132,6 +132,8 @@ with tab1:
 
     valid_sharpe = [x for x in roll_result.sharpe if x == x]  # filter NaN
     valid_vol = [x for x in roll_result.volatility if x == x]
+    valid_sortino = [x for x in roll_result.sortino or () if x == x]
+    valid_dd = [x for x in roll_result.drawdown or () if x == x]
     col1, col2, col3 = st.columns(3)
     col1.metric(
         "Mean Rolling Sharpe",
@@ -147,6 +149,18 @@ with tab1:
             "Mean Rolling Beta",
             f"{(sum(valid_beta) / len(valid_beta)):.2f}" if valid_beta else "N/A",
         )
+    col4, col5, col6 = st.columns(3)
+    col4.metric(
+        "Mean Rolling Sortino",
+        f"{(sum(valid_sortino) / len(valid_sortino)):.2f}" if valid_sortino else "N/A",
+    )
+    col5.metric("Worst Window Drawdown", f"{min(valid_dd):.1%}" if valid_dd else "N/A")
+    if roll_result.correlation is not None:
+        valid_corr = [x for x in roll_result.correlation if x == x]
+        col6.metric(
+            "Mean Rolling Correlation",
+            f"{(sum(valid_corr) / len(valid_corr)):.2f}" if valid_corr else "N/A",
+        )
 
     from finbot.services.portfolio_analytics.viz import plot_rolling_metrics as _plot_roll
 
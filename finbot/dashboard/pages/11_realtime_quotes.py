@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import uuid
+from typing import TYPE_CHECKING
+
 import streamlit as st
 
 from finbot.core.contracts.realtime_data import ProviderStatus, Quote
 from finbot.dashboard.disclaimer import show_sidebar_accessibility, show_sidebar_disclaimer
 
+if TYPE_CHECKING:
+    from finbot.services.realtime_data import CompositeQuoteProvider, QuotePrefetcher
+
 st.set_page_config(page_title="Real-Time Quotes — Finbot", layout="wide")
 
 show_sidebar_disclaimer()
@@ -15,9 +21,32 @@ show_sidebar_accessibility()
 st.title("Real-Time Quotes")
 st.markdown(
     "Live stock and ETF prices from Alpaca (US, IEX feed), Twelve Data (US + Canada/TSX), "
-    "and yfinance (fallback). Quotes are cached for 15 seconds."
+    "and yfinance (fallback). Quotes are cached for 15 seconds and watchlist symbols are "
+    "refreshed in the background."
 )
 
+# A session's watchlist stays warm this long after its last rerun of the page
+_WATCHLIST_LEASE_SECONDS = 600.0
+
+
+@st.cache_resource
+def _quote_provider() -> CompositeQuoteProvider:
+    """One provider per server process, so the quote cache survives reruns and is shared by sessions."""
+    from finbot.services.realtime_data import CompositeQuoteProvider
+
+    return CompositeQuoteProvider(stale_grace_seconds=15.0)
+
+
+@st.cache_resource
+def _watchlist_prefetcher() -> QuotePrefetcher:
+    """Sessions lease their watchlists; a lease lapses once its session stops rerunning the page."""
+    from finbot.services.realtime_data import QuotePrefetcher
+
+    prefetcher = QuotePrefetcher(_quote_provider(), lease_ttl=_WATCHLIST_LEASE_SECONDS)
+    prefetcher.start_in_thread()
+    return prefetcher
+
+
 tab1, tab2, tab3 = st.tabs(["📊 Live Quotes", "📋 Watchlist", "🔧 Provider Status"])
 
 # ── Tab 1: Live Quotes ──────────────────────────────────────────────────────
@@ -41,11 +70,9 @@ with tab1:
             st.stop()
 
         with st.spinner("Fetching quotes..."):
-            from finbot.services.realtime_data import CompositeQuoteProvider
             from finbot.services.realtime_data.viz import plot_quote_table
 
-            provider = CompositeQuoteProvider()
-            batch = provider.get_quotes(symbols)
+            batch = _quote_provider().get_quotes(symbols)
 
         live_quotes = list(batch.quotes.values())
         st.session_state["live_quotes"] = live_quotes
@@ -94,15 +121,15 @@ with tab2:
             st.stop()
 
         with st.spinner(f"Fetching {len(symbols)} symbols..."):
-            from finbot.services.realtime_data import CompositeQuoteProvider
             from finbot.services.realtime_data.viz import plot_quote_table
 
-            provider = CompositeQuoteProvider()
-            batch = provider.get_quotes(symbols)
+            batch = _quote_provider().get_quotes(symbols)
 
         watchlist_quotes = list(batch.quotes.values())
         st.session_state["watchlist_quotes"] = watchlist_quotes
 
+        st.session_state["prefetched_watchlist"] = symbols
+
         if watchlist_quotes:
             fig = plot_quote_table(watchlist_quotes, title="Watchlist")
             st.plotly_chart(fig, use_container_width=True)
@@ -118,6 +145,11 @@ with tab2:
     else:
         st.info("Configure your watchlist in the sidebar and click **Refresh Watchlist**.")
 
+    # Keep this session's watchlist warm while the session is in use
+    if prefetched := st.session_state.get("prefetched_watchlist"):
+        lease_owner = st.session_state.setdefault("prefetch_lease_owner", uuid.uuid4().hex)
+        _watchlist_prefetcher().renew(lease_owner, prefetched)
+
 # ── Tab 3: Provider Status ───────────────────────────────────────────────────
 with tab3:
     check_btn = st.button("Check Provider Status", key="check_status")
@@ -125,11 +157,9 @@ with tab3:
     provider_statuses: list[ProviderStatus] | None = st.session_state.get("provider_statuses")
 
     if check_btn:
-        from finbot.services.realtime_data import CompositeQuoteProvider
         from finbot.services.realtime_data.viz import plot_provider_status
 
-        provider = CompositeQuoteProvider()
-        provider_statuses = provider.get_provider_status()
+        provider_statuses = _quote_provider().get_provider_status()
         st.session_state["provider_statuses"] = provider_statuses
 
         fig = plot_provider_status(provider_statuses, title="Provider Health")
@@ -141,6 +171,7 @@ with tab3:
                 st.write(f"**Available:** {ps.is_available}")
                 st.write(f"**Total Requests:** {ps.total_requests}")
                 st.write(f"**Total Errors:** {ps.total_errors}")
+                st.write(f"**Cache:** {ps.cache_hits} hits, {ps.cache_stale_hits} stale hits, {ps.cache_misses} misses")
                 if ps.last_success:
                     st.write(f"**Last Success:** {ps.last_success.strftime('%Y-%m-%d %H:%M:%S UTC')}")
                 if ps.last_error:
@@ -18,7 +18,8 @@ st.title("Data Status")
 st.markdown("Monitor data source freshness, file counts, and storage usage.")
 
 
-@st.cache_data(ttl=300)
+# Cheap to recompute: the data catalog only rescans directories that changed
+@st.cache_data(ttl=30)
 def _load_freshness() -> list[dict]:
     from finbot.services.data_quality.check_data_freshness import check_all_freshness
 
@@ -28,6 +29,7 @@ def _load_freshness() -> list[dict]:
             "Source": s.source.name,
             "Files": s.file_count,
             "Last Updated": s.age_str,
+            "Data Through": s.last_data_timestamp.strftime("%Y-%m-%d") if s.last_data_timestamp else "-",
             "Size": s.size_str,
             "Size (bytes)": s.total_size_bytes,
             "Max Age (days)": s.source.max_age_days,
@@ -61,7 +63,7 @@ try:
             return "background-color: #ffcccc"
         return "background-color: #ccffcc"
 
-    display_df = df[["Source", "Files", "Last Updated", "Size", "Status"]]
+    display_df = df[["Source", "Files", "Last Updated", "Data Through", "Size", "Status"]]
     st.dataframe(
         display_df.style.map(_highlight_status, subset=["Status"]),
         use_container_width=True,
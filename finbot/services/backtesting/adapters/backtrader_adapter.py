@@ -168,6 +168,26 @@ class BacktraderAdapter(BacktestEngine):
             costs=costs,
         )
 
+    def cache_key(self) -> str:
+        """Fingerprint of the adapter settings that affect run results (not the price data)."""
+        return hash_dictionary(
+            {
+                "strategy_registry": {name: cls.__qualname__ for name, cls in self._strategy_registry.items()},
+                "broker": self._broker.__name__,
+                "broker_kwargs": self._broker_kwargs,
+                "broker_commission": self._broker_commission.__name__,
+                "sizer": self._sizer.__name__,
+                "sizer_kwargs": self._sizer_kwargs,
+                "commission_model": self._commission_model.get_name(),
+                "spread_model": self._spread_model.get_name(),
+                "slippage_model": self._slippage_model.get_name(),
+                "missing_data_policy": str(self._missing_data_policy),
+                "random_seed": self._random_seed,
+                "auto_snapshot": self._auto_snapshot,
+                "enable_snapshot_replay": self._enable_snapshot_replay,
+            }
+        )
+
     def _resolve_data_snapshot_id(
         self,
         selected_histories: dict[str, pd.DataFrame],
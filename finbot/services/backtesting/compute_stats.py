@@ -4,25 +4,8 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
-import quantstats as qs
 
-
-def compute_drawdown_series(value_history: pd.Series) -> pd.Series:
-    """Compute peak-to-trough drawdown from a portfolio value series."""
-    values = value_history.dropna().astype(float)
-    if values.empty:
-        return pd.Series(dtype=float)
-
-    running_peak = values.cummax()
-    return (values / running_peak) - 1.0
-
-
-def compute_max_drawdown(value_history: pd.Series) -> float:
-    """Return the worst drawdown from a portfolio value series."""
-    drawdowns = compute_drawdown_series(value_history)
-    if drawdowns.empty:
-        return 0.0
-    return float(drawdowns.min())
+from finbot.services.backtesting.performance_metrics import compute_performance_metrics
 
 
 def compute_stats(
@@ -38,8 +21,6 @@ def compute_stats(
     sizer_kwargs: dict[str, Any],
     plot: bool = False,
 ) -> pd.DataFrame:
-    qs.extend_pandas()
-
     stats: dict[str, Any] = {}
 
     # Backtest info
@@ -62,28 +43,31 @@ def compute_stats(
     stats["Starting Value"] = value_history.iloc[0]
     stats["Ending Value"] = value_history.iloc[-1]
     stats["ROI"] = (stats["Ending Value"] - stats["Starting Value"]) / stats["Starting Value"]
-    stats["CAGR"] = value_history.cagr()  # quantstats extension method
+
+    # All ratios come from one pass over the returns (quantstats-compatible definitions)
+    metrics = compute_performance_metrics(value_history.to_numpy(dtype=float))
+    stats["CAGR"] = float(metrics.cagr[0])
 
     # Metric ratios
-    stats["Sharpe"] = value_history.sharpe()  # quantstats extension method
-    stats["Smart Sharpe"] = value_history.smart_sharpe()  # quantstats extension method
-    stats["Smart Sortino/sqrt(2)"] = value_history.smart_sortino() / np.sqrt(2)  # quantstats extension method
+    stats["Sharpe"] = float(metrics.sharpe[0])
+    stats["Smart Sharpe"] = float(metrics.smart_sharpe[0])
+    stats["Smart Sortino/sqrt(2)"] = float(metrics.smart_sortino[0]) / np.sqrt(2)
     stats["Omega"] = None
-    stats["Calmar"] = value_history.calmar()  # quantstats extension method
-    stats["Common Sense Ratio"] = value_history.common_sense_ratio()  # quantstats extension method
-    stats["Profit Factor"] = value_history.profit_factor()  # quantstats extension method
-    stats["Kelly Criterion"] = value_history.kelly_criterion()  # quantstats extension method
+    stats["Calmar"] = float(metrics.calmar[0])
+    stats["Common Sense Ratio"] = float(metrics.common_sense_ratio[0])
+    stats["Profit Factor"] = float(metrics.profit_factor[0])
+    stats["Kelly Criterion"] = float(metrics.kelly_criterion[0])
 
     # Volatility & drawdown
-    stats["Max Drawdown"] = compute_max_drawdown(value_history)
-    stats["Annualized Volatility"] = value_history.volatility()  # quantstats extension method
-    stats["Risk of Ruin"] = value_history.risk_of_ruin()  # quantstats extension method
-    stats["Expected Shortfall (cVar)"] = value_history.expected_shortfall()  # quantstats extension method
+    stats["Max Drawdown"] = float(metrics.max_drawdown[0])
+    stats["Annualized Volatility"] = float(metrics.volatility[0])
+    stats["Risk of Ruin"] = float(metrics.risk_of_ruin[0])
+    stats["Expected Shortfall (cVar)"] = float(metrics.expected_shortfall[0])
 
     # Period stats
-    stats["Best Day"] = value_history.best()  # quantstats extension method
-    stats["Worst Day"] = value_history.worst()  # quantstats extension method
-    stats["Win Days %"] = value_history.win_rate()  # quantstats extension method
+    stats["Best Day"] = float(metrics.best[0])
+    stats["Worst Day"] = float(metrics.worst[0])
+    stats["Win Days %"] = float(metrics.win_rate[0])
 
     # Cash stats (vectorized)
     cash_utilizations = 1 - (cash_history / value_history)
@@ -93,6 +77,8 @@ def compute_stats(
     df = pd.DataFrame({key: (value,) for key, value in stats.items()})
 
     if plot:
+        import quantstats as qs  # heavy import, only needed for the HTML report
+
         qs.reports.html(value_history, title=f"{stocks} - {strat}", output=True)
 
     return df
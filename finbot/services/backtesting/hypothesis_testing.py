@@ -23,12 +23,19 @@ Typical usage::
     # Bootstrap CI for a single strategy
     ci = bootstrap_confidence_interval(strategy_results, metric="sharpe")
     print(f"95% CI: [{ci.lower:.3f}, {ci.upper:.3f}]")
+
+Resampling tests draw all resample indices as one integer matrix per chunk
+(bounded by ``_CHUNK_ELEMENTS``) and reduce each chunk with a single
+``mean(axis=1)``.  ``bootstrap_means`` exposes the engine for raw arrays,
+including block and stationary bootstraps for autocorrelated returns.
 """
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import math
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
+from enum import StrEnum
 
 import numpy as np
 import pandas as pd
@@ -37,6 +44,25 @@ import scipy.stats as stats
 from finbot.core.contracts import BacktestRunResult
 from finbot.core.contracts.walkforward import WalkForwardResult
 
+# Upper bound on resample-matrix elements materialized at once (~32 MB of int64)
+_CHUNK_ELEMENTS = 1 << 22
+
+# Null statistics within this relative distance of the observed one count as ties
+_TIE_RTOL = 1e-12
+
+
+class BootstrapMethod(StrEnum):
+    """Resampling scheme for bootstrap estimates.
+
+    IID draws observations independently.  BLOCK (moving block, circular)
+    and STATIONARY (Politis-Romano, geometric block lengths) resample runs
+    of consecutive observations to preserve autocorrelation.
+    """
+
+    IID = "iid"
+    BLOCK = "block"
+    STATIONARY = "stationary"
+
 
 @dataclass(frozen=True, slots=True)
 class HypothesisTestResult:
@@ -72,6 +98,8 @@ class BootstrapCI:
         upper: Upper bound of the confidence interval.
         confidence_level: e.g. 0.95 for 95% CI.
         n_bootstrap: Number of bootstrap iterations used.
+        method: Resampling scheme used.
+        block_length: Mean block length (None for i.i.d. resampling).
     """
 
     metric: str
@@ -80,6 +108,8 @@ class BootstrapCI:
     upper: float
     confidence_level: float
     n_bootstrap: int
+    method: BootstrapMethod = BootstrapMethod.IID
+    block_length: int | None = None
 
 
 def _extract_metric(results: Sequence[BacktestRunResult], metric: str) -> list[float]:
@@ -94,6 +124,128 @@ def _extract_metric(results: Sequence[BacktestRunResult], metric: str) -> list[f
     return values
 
 
+def _extract_metrics(results: Sequence[BacktestRunResult], metrics: Sequence[str]) -> np.ndarray:
+    """``(n_results, n_metrics)`` array of metric values."""
+    return np.column_stack([_extract_metric(results, metric) for metric in metrics])
+
+
+def _chunks(n_total: int, row_elements: int) -> Iterator[int]:
+    """Split ``n_total`` resamples into chunk sizes bounded by ``_CHUNK_ELEMENTS``."""
+    chunk = max(1, _CHUNK_ELEMENTS // max(row_elements, 1))
+    for start in range(0, n_total, chunk):
+        yield min(chunk, n_total - start)
+
+
+def _resample_indices(
+    rng: np.random.Generator,
+    n_rows: int,
+    n_obs: int,
+    method: BootstrapMethod,
+    block_length: int,
+) -> np.ndarray:
+    """``(n_rows, n_obs)`` bootstrap indices into ``n_obs`` observations."""
+    if method == BootstrapMethod.IID:
+        return rng.integers(0, n_obs, size=(n_rows, n_obs))
+
+    if method == BootstrapMethod.BLOCK:
+        n_blocks = -(-n_obs // block_length)
+        starts = rng.integers(0, n_obs, size=(n_rows, n_blocks, 1))
+        blocks = (starts + np.arange(block_length)) % n_obs
+        return blocks.reshape(n_rows, n_blocks * block_length)[:, :n_obs]
+
+    # Stationary: a new block starts at each position with probability 1 / block_length
+    positions = np.arange(n_obs)
+    new_block = rng.random((n_rows, n_obs)) < 1.0 / block_length
+    new_block[:, 0] = True
+    block_start = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+    starts = rng.integers(0, n_obs, size=(n_rows, n_obs))
+    return (np.take_along_axis(starts, block_start, axis=1) + positions - block_start) % n_obs
+
+
+def _default_block_length(n_obs: int) -> int:
+    """Rule-of-thumb block length ``ceil(n ** (1/3))``."""
+    return max(1, math.ceil(n_obs ** (1.0 / 3.0)))
+
+
+def bootstrap_means(
+    values: np.ndarray,
+    n_bootstrap: int = 10_000,
+    *,
+    method: str | BootstrapMethod = BootstrapMethod.IID,
+    block_length: int | None = None,
+    random_seed: int = 42,
+) -> np.ndarray:
+    """Bootstrap distribution of the mean of one or more series.
+
+    All series share the same resample indices, so cross-series dependence
+    is preserved.
+
+    Args:
+        values: ``(n_obs,)`` or ``(n_obs, n_series)`` observations, e.g.
+            per-window metrics or daily returns.
+        n_bootstrap: Number of bootstrap samples.
+        method: ``"iid"``, ``"block"`` or ``"stationary"``.
+        block_length: (Mean) block length for the block methods.  Defaults
+            to ``ceil(n_obs ** (1/3))``.
+        random_seed: Random seed for reproducibility.
+
+    Returns:
+        ``(n_bootstrap, n_series)`` array of resampled means (``n_series`` is
+        1 for 1-D input).
+
+    Raises:
+        ValueError: If ``values`` is not 1-D or 2-D or has fewer than 2
+            observations, ``n_bootstrap < 1``, ``block_length < 1`` or
+            ``method`` is unknown.
+    """
+    data = np.asarray(values, dtype=float)
+    if data.ndim == 1:
+        data = data[:, np.newaxis]
+    if data.ndim != 2:
+        raise ValueError(f"values must be 1-D or 2-D, got {data.ndim}-D")
+    n_obs = data.shape[0]
+    if n_obs < 2:
+        raise ValueError(f"values must have at least 2 observations, got {n_obs}")
+    if n_bootstrap < 1:
+        raise ValueError(f"n_bootstrap must be >= 1, got {n_bootstrap}")
+    method = BootstrapMethod(method)
+    if block_length is None:
+        block_length = _default_block_length(n_obs)
+    if block_length < 1:
+        raise ValueError(f"block_length must be >= 1, got {block_length}")
+
+    rng = np.random.default_rng(random_seed)
+    means = np.empty((n_bootstrap, data.shape[1]))
+    row = 0
+    for n_rows in _chunks(n_bootstrap, n_obs * data.shape[1]):
+        indices = _resample_indices(rng, n_rows, n_obs, method, block_length)
+        means[row : row + n_rows] = data[indices].mean(axis=1)
+        row += n_rows
+    return means
+
+
+def _permutation_null(combined: np.ndarray, n_a: int, n_permutations: int, rng: np.random.Generator) -> np.ndarray:
+    """Null distribution of ``mean(A) - mean(B)`` under random relabelling.
+
+    Args:
+        combined: ``(n_a + n_b, n_series)`` pooled observations.
+
+    Returns:
+        ``(n_permutations, n_series)`` mean differences.
+    """
+    n_total, n_series = combined.shape
+    n_b = n_total - n_a
+    total = combined.sum(axis=0)
+    null = np.empty((n_permutations, n_series))
+    row = 0
+    for n_rows in _chunks(n_permutations, n_total * n_series):
+        labels = rng.permuted(np.broadcast_to(np.arange(n_total), (n_rows, n_total)), axis=1)
+        sum_a = combined[labels[:, :n_a]].sum(axis=1)
+        null[row : row + n_rows] = sum_a / n_a - (total - sum_a) / n_b
+        row += n_rows
+    return null
+
+
 def paired_t_test(
     results_a: Sequence[BacktestRunResult],
     results_b: Sequence[BacktestRunResult],
@@ -232,18 +384,14 @@ def permutation_test(
     vals_a = np.array(_extract_metric(results_a, metric))
     vals_b = np.array(_extract_metric(results_b, metric))
 
-    observed_diff = float(np.mean(vals_a) - np.mean(vals_b))
-    combined = np.concatenate([vals_a, vals_b])
+    combined = np.concatenate([vals_a, vals_b])[:, np.newaxis]
     n_a = len(vals_a)
+    observed_diff = float(np.mean(vals_a) - np.mean(vals_b))
 
     rng = np.random.default_rng(random_seed)
-    null_diffs: list[float] = []
-    for _ in range(n_permutations):
-        perm = rng.permutation(combined)
-        null_diffs.append(float(np.mean(perm[:n_a]) - np.mean(perm[n_a:])))
-
-    null_arr = np.array(null_diffs)
-    p_val = float(np.mean(np.abs(null_arr) >= abs(observed_diff)))
+    null_arr = _permutation_null(combined, n_a, n_permutations, rng)[:, 0]
+    # Relabellings that reproduce the observed split differ from it only by rounding
+    p_val = float(np.mean(np.abs(null_arr) >= abs(observed_diff) * (1.0 - _TIE_RTOL)))
     significant = p_val < alpha
     decision = "reject H₀" if significant else "fail to reject H₀"
     notes = (
@@ -270,10 +418,14 @@ def bootstrap_confidence_interval(
     confidence_level: float = 0.95,
     n_bootstrap: int = 10_000,
     random_seed: int = 42,
+    method: str | BootstrapMethod = BootstrapMethod.IID,
+    block_length: int | None = None,
 ) -> BootstrapCI:
     """Bootstrap percentile confidence interval for a single metric.
 
-    Resamples with replacement to estimate sampling uncertainty.
+    Resamples with replacement to estimate sampling uncertainty.  Use
+    ``method="block"`` or ``"stationary"`` when consecutive results are
+    autocorrelated (e.g. overlapping walk-forward windows).
 
     Args:
         results: Backtest results (one per walk-forward window, or strategy runs).
@@ -281,19 +433,25 @@ def bootstrap_confidence_interval(
         confidence_level: e.g. 0.95 for 95% CI.
         n_bootstrap: Number of bootstrap samples.
         random_seed: Random seed for reproducibility.
+        method: ``"iid"``, ``"block"`` or ``"stationary"``.
+        block_length: (Mean) block length for the block methods.  Defaults
+            to ``ceil(n ** (1/3))``.
 
     Returns:
         BootstrapCI with lower/upper bounds.
 
     Raises:
-        ValueError: If n < 2.
+        ValueError: If n < 2 or the resampling options are invalid.
         KeyError: If metric not found.
     """
     vals = np.array(_extract_metric(results, metric))
     estimate = float(np.mean(vals))
+    method = BootstrapMethod(method)
+    if method != BootstrapMethod.IID and block_length is None:
+        block_length = _default_block_length(len(vals))
 
-    rng = np.random.default_rng(random_seed)
-    boot_means = np.array([np.mean(rng.choice(vals, size=len(vals), replace=True)) for _ in range(n_bootstrap)])
+    boot_means = bootstrap_means(vals, n_bootstrap, method=method, block_length=block_length, random_seed=random_seed)
+    boot_means = boot_means[:, 0]
 
     tail = (1.0 - confidence_level) / 2.0
     lower = float(np.percentile(boot_means, tail * 100))
@@ -306,64 +464,78 @@ def bootstrap_confidence_interval(
         upper=upper,
         confidence_level=confidence_level,
         n_bootstrap=n_bootstrap,
+        method=method,
+        block_length=block_length if method != BootstrapMethod.IID else None,
     )
 
 
 def compare_strategies(
     strategies: dict[str, Sequence[BacktestRunResult]],
-    metric: str = "cagr",
+    metric: str | Sequence[str] = "cagr",
     *,
     alpha: float = 0.05,
 ) -> pd.DataFrame:
     """Pairwise strategy comparison using paired t-tests.
 
     For N strategies, performs N*(N-1)/2 pairwise paired t-tests and returns
-    a summary DataFrame.
+    a summary DataFrame.  All pairs (and metrics) are tested in a single
+    vectorized ``ttest_1samp`` on the per-window differences, which is
+    equivalent to ``ttest_rel`` per pair.
 
     Note: Strategy result sequences must have the same length (same windows).
 
     Args:
         strategies: Dict mapping strategy name → sequence of BacktestRunResults.
-        metric: Canonical metric key.
+        metric: Canonical metric key, or a sequence of keys to test every
+            metric in one pass.
         alpha: Significance level.
 
     Returns:
         DataFrame with columns: strategy_a, strategy_b, mean_a, mean_b,
-        statistic, p_value, significant, winner.
+        statistic, p_value, significant, winner.  When ``metric`` is a
+        sequence, a leading ``metric`` column is added and rows are ordered
+        by pair, then metric.
 
     Raises:
-        ValueError: If fewer than 2 strategies provided.
+        ValueError: If fewer than 2 strategies provided or their lengths differ.
+        KeyError: If a metric is missing from any result.
     """
     names = list(strategies.keys())
     if len(names) < 2:
         raise ValueError(f"compare_strategies requires ≥2 strategies, got {len(names)}.")
 
-    rows = []
-    for i in range(len(names)):
-        for j in range(i + 1, len(names)):
-            name_a, name_b = names[i], names[j]
-            res = paired_t_test(strategies[name_a], strategies[name_b], metric, alpha=alpha)
-            vals_a = _extract_metric(strategies[name_a], metric)
-            vals_b = _extract_metric(strategies[name_b], metric)
-            mean_a = float(np.mean(vals_a))
-            mean_b = float(np.mean(vals_b))
-            winner = name_a if mean_a >= mean_b else name_b
-            if not res.significant:
-                winner = "no_significant_winner"
-            rows.append(
-                {
-                    "strategy_a": name_a,
-                    "strategy_b": name_b,
-                    "mean_a": mean_a,
-                    "mean_b": mean_b,
-                    "statistic": res.statistic,
-                    "p_value": res.p_value,
-                    "significant": res.significant,
-                    "winner": winner,
-                }
-            )
-
-    return pd.DataFrame(rows)
+    metrics = [metric] if isinstance(metric, str) else list(metric)
+    lengths = {len(results) for results in strategies.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"compare_strategies requires equal-length sequences. Got lengths {sorted(lengths)}.")
+
+    # (n_strategies, n_windows, n_metrics)
+    values = np.stack([_extract_metrics(strategies[name], metrics) for name in names])
+    pair_a, pair_b = np.triu_indices(len(names), k=1)
+    t_stat, p_val = stats.ttest_1samp(values[pair_a] - values[pair_b], popmean=0.0, axis=1)
+    means = values.mean(axis=1)
+    mean_a, mean_b = means[pair_a], means[pair_b]
+    significant = p_val < alpha
+
+    labels = np.asarray(names, dtype=object)
+    winner = np.where(mean_a >= mean_b, labels[pair_a, np.newaxis], labels[pair_b, np.newaxis])
+    winner = np.where(significant, winner, "no_significant_winner")
+
+    n_pairs, n_metrics = mean_a.shape
+    frame = pd.DataFrame(
+        {
+            "metric": np.tile(np.asarray(metrics, dtype=object), n_pairs),
+            "strategy_a": np.repeat(labels[pair_a], n_metrics),
+            "strategy_b": np.repeat(labels[pair_b], n_metrics),
+            "mean_a": mean_a.ravel(),
+            "mean_b": mean_b.ravel(),
+            "statistic": t_stat.ravel(),
+            "p_value": p_val.ravel(),
+            "significant": significant.ravel(),
+            "winner": winner.ravel(),
+        }
+    )
+    return frame.drop(columns="metric") if isinstance(metric, str) else frame
 
 
 def summarize_walk_forward_significance(
@@ -0,0 +1,221 @@
+"""Single-pass performance metrics for portfolio value histories.
+
+``compute_performance_metrics`` derives every ratio reported by
+``compute_stats`` from one set of shared intermediates (period returns,
+their count, mean, standard deviation, downside deviation and lag-1
+autocorrelation) instead of calling a separate quantstats function per
+metric, each of which re-derives and re-validates the returns.
+
+Metric definitions follow quantstats (the version locked in ``uv.lock``)
+with ``rf=0`` and are checked against it by the unit tests.  Like
+quantstats, missing returns (the first period and gaps) count as flat
+periods.  Inputs may be 2-D ``(n_obs, n_series)`` to evaluate many value
+histories (e.g. a parameter sweep) in one call; shorter series can be
+padded with trailing NaN.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.special import ndtri
+
+_DEFAULT_PERIODS = 252
+
+# Expected shortfall at 95% confidence: the mean of the returns below the
+# Gaussian value at risk ``mean + std * ppf(alpha)``
+_VAR_Z = float(ndtri(1 - 0.95))
+
+_TAIL_CUTOFF = 0.95
+
+# Autocorrelation penalty terms smaller than this are dropped
+_NEGLIGIBLE_TERM = 1e-18
+
+
+@dataclass(frozen=True, slots=True)
+class PerformanceMetrics:
+    """Performance metrics for one or more value histories.
+
+    Every attribute is a ``(n_series,)`` float array.  Ratios that are
+    undefined for a series (e.g. Sortino without losing periods) are NaN,
+    matching quantstats.
+
+    Attributes:
+        cagr: Compound annual growth rate.
+        sharpe: Annualized Sharpe ratio.
+        smart_sharpe: Sharpe ratio with autocorrelation penalty.
+        smart_sortino: Sortino ratio with autocorrelation penalty.
+        calmar: CAGR divided by the absolute maximum drawdown.
+        common_sense_ratio: Profit factor times tail ratio.
+        profit_factor: Sum of gains divided by the absolute sum of losses.
+        kelly_criterion: Kelly fraction from win rate and payoff ratio.
+        max_drawdown: Worst peak-to-trough drawdown of the values (<= 0).
+        volatility: Annualized standard deviation of returns.
+        risk_of_ruin: Probability of ruin from the win rate.
+        expected_shortfall: 95% expected shortfall (CVaR) below the Gaussian VaR.
+        best: Best period return.
+        worst: Worst period return.
+        win_rate: Share of positive returns among non-zero returns.
+    """
+
+    cagr: np.ndarray
+    sharpe: np.ndarray
+    smart_sharpe: np.ndarray
+    smart_sortino: np.ndarray
+    calmar: np.ndarray
+    common_sense_ratio: np.ndarray
+    profit_factor: np.ndarray
+    kelly_criterion: np.ndarray
+    max_drawdown: np.ndarray
+    volatility: np.ndarray
+    risk_of_ruin: np.ndarray
+    expected_shortfall: np.ndarray
+    best: np.ndarray
+    worst: np.ndarray
+    win_rate: np.ndarray
+
+
+def _masked_sum(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Column sums of ``values`` where ``mask`` is True."""
+    return np.where(mask, values, 0.0).sum(axis=0)
+
+
+def _masked_mean(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Column means of ``values`` where ``mask`` is True (NaN if none)."""
+    return _masked_sum(values, mask) / mask.sum(axis=0)
+
+
+def _autocorr_penalty(returns: np.ndarray, count: np.ndarray) -> np.ndarray:
+    """Lag-1 autocorrelation penalty ``sqrt(1 + 2 * sum((n - x) / n * |rho|**x))``.
+
+    ``rho`` pairs consecutive returns within each column's first ``count``
+    rows; it is NaN (and so is the penalty) for constant returns.
+    """
+    lead, lag = returns[:-1], returns[1:]
+    paired = np.arange(len(lead))[:, np.newaxis] < count - 1
+    lead_dev = np.where(paired, lead - _masked_mean(lead, paired), 0.0)
+    lag_dev = np.where(paired, lag - _masked_mean(lag, paired), 0.0)
+    rho = (lead_dev * lag_dev).sum(axis=0) / np.sqrt((lead_dev**2).sum(axis=0) * (lag_dev**2).sum(axis=0))
+    coef = np.abs(np.clip(rho, -1.0, 1.0))
+
+    # Terms below _NEGLIGIBLE_TERM cannot change 1 + 2 * sum(...) in float64
+    max_lag = max(int(count.max()) - 1, 1)
+    largest = float(np.nanmax(coef, initial=0.0))
+    if largest < 1.0:
+        max_lag = min(max_lag, 1 + math.ceil(math.log(_NEGLIGIBLE_TERM) / math.log(max(largest, _NEGLIGIBLE_TERM))))
+    lags = np.arange(1, max_lag + 1)[:, np.newaxis]
+    weights = np.where(lags < count, (count - lags) / count * coef**lags, 0.0)
+    return np.sqrt(1.0 + 2.0 * weights.sum(axis=0))
+
+
+def compute_performance_metrics(
+    values: np.ndarray,
+    periods: int = _DEFAULT_PERIODS,
+) -> PerformanceMetrics:
+    """Compute all ``compute_stats`` ratios from portfolio values in one pass.
+
+    Args:
+        values: ``(n_obs,)`` or ``(n_obs, n_series)`` portfolio values (not
+            returns).  NaN marks missing observations; trailing NaN pads a
+            series that is shorter than the others.
+        periods: Periods per year used for annualization.
+
+    Returns:
+        PerformanceMetrics with one entry per series (1 for 1-D input).
+
+    Raises:
+        ValueError: If ``values`` is not 1-D or 2-D or ``periods < 1``.
+    """
+    v = np.asarray(values, dtype=float)
+    if v.ndim == 1:
+        v = v[:, np.newaxis]
+    if v.ndim != 2:
+        raise ValueError(f"values must be 1-D or 2-D, got {v.ndim}-D")
+    if periods < 1:
+        raise ValueError(f"periods must be >= 1, got {periods}")
+
+    # Each series spans up to its last observed value
+    observed = ~np.isnan(v)
+    length = np.where(observed.any(axis=0), len(v) - np.argmax(observed[::-1], axis=0), 0)
+    span = np.arange(len(v))[:, np.newaxis] < length
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.zeros_like(v)
+        returns[1:] = v[1:] / v[:-1] - 1.0
+        returns[~np.isfinite(returns) | ~span] = 0.0
+        return _metrics_from_returns(v, returns, span, periods)
+
+
+def _metrics_from_returns(
+    values: np.ndarray, returns: np.ndarray, span: np.ndarray, periods: int
+) -> PerformanceMetrics:
+    """Derive every metric from the shared return intermediates."""
+    count = span.sum(axis=0)
+    sqrt_periods = np.sqrt(periods)
+
+    mean = _masked_mean(returns, span)
+    std = np.sqrt(_masked_sum((returns - mean) ** 2, span) / (count - 1))
+    losses = span & (returns < 0)
+    gains = span & (returns > 0)
+    n_losses = losses.sum(axis=0)
+    n_gains = gains.sum(axis=0)
+    loss_sum = _masked_sum(returns, losses)
+    penalty = _autocorr_penalty(returns, count)
+
+    # Sharpe / Sortino (rf = 0)
+    sharpe = mean / std * sqrt_periods
+    smart_sharpe = mean / (std * penalty) * sqrt_periods
+    downside = np.sqrt(_masked_sum(returns**2, losses) / count) * penalty
+    smart_sortino = np.where(downside == 0, np.nan, mean / downside * sqrt_periods)
+
+    # Growth: every period of the span counts towards the years
+    path = np.cumprod(1.0 + returns, axis=0)
+    cagr = np.abs(path[-1]) ** (periods / count) - 1
+
+    # Calmar uses the drawdown of the compounded returns path, starting from 1
+    path_drawdown = (path / np.maximum(np.maximum.accumulate(path, axis=0), 1.0)).min(axis=0) - 1.0
+    calmar = cagr / np.abs(path_drawdown)
+
+    # Reported drawdown follows the portfolio values, skipping missing ones
+    running_peak = np.fmax.accumulate(values, axis=0)
+    max_drawdown = np.nan_to_num(np.nanmin(values / running_peak, axis=0) - 1.0, nan=0.0)
+
+    # Win/loss statistics
+    nonzero = n_gains + n_losses
+    win_rate = np.where(nonzero > 0, n_gains / nonzero, 0.0)
+    gain_sum = _masked_sum(returns, gains)
+    abs_loss_sum = np.abs(loss_sum)
+    profit_factor = np.where(abs_loss_sum == 0, np.where(gain_sum == 0, 0.0, np.inf), gain_sum / abs_loss_sum)
+    payoff = (gain_sum / n_gains) / np.abs(loss_sum / n_losses)
+    kelly = np.where(payoff == 0, np.nan, (payoff * win_rate - (1 - win_rate)) / payoff)
+
+    tail_quantiles = [_TAIL_CUTOFF, 1 - _TAIL_CUTOFF]
+    if span.all():
+        upper, lower = np.quantile(returns, tail_quantiles, axis=0)
+    else:
+        upper, lower = np.nanquantile(np.where(span, returns, np.nan), tail_quantiles, axis=0)
+    tail_ratio = np.where(lower == 0, np.nan, np.abs(upper / lower))
+
+    value_at_risk = np.where(std > 0, mean + std * _VAR_Z, np.nan)
+    tail = span & (returns < value_at_risk)
+    expected_shortfall = np.where(tail.any(axis=0), _masked_sum(returns, tail) / tail.sum(axis=0), value_at_risk)
+
+    return PerformanceMetrics(
+        cagr=cagr,
+        sharpe=sharpe,
+        smart_sharpe=smart_sharpe,
+        smart_sortino=smart_sortino,
+        calmar=calmar,
+        common_sense_ratio=profit_factor * tail_ratio,
+        profit_factor=profit_factor,
+        kelly_criterion=kelly,
+        max_drawdown=max_drawdown,
+        volatility=std * sqrt_periods,
+        risk_of_ruin=((1 - win_rate) / (1 + win_rate)) ** count,
+        expected_shortfall=expected_shortfall,
+        best=np.where(count > 0, np.where(span, returns, -np.inf).max(axis=0), np.nan),
+        worst=np.where(count > 0, np.where(span, returns, np.inf).min(axis=0), np.nan),
+        win_rate=win_rate,
+    )
@@ -2,13 +2,117 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import cast
 
+import numpy as np
 import pandas as pd
 
 from finbot.core.contracts import BacktestRunResult
 from finbot.core.contracts.regime import MarketRegime, RegimeConfig, RegimeMetrics, RegimePeriod
 
+# Classification order for ``np.select``; the first matching condition wins
+_REGIME_CODES: tuple[MarketRegime, ...] = (
+    MarketRegime.VOLATILE,
+    MarketRegime.BULL,
+    MarketRegime.BEAR,
+    MarketRegime.SIDEWAYS,
+)
+_NO_REGIME = -1  # Code for dates without enough history
+
+
+def _price_column(market_data: pd.DataFrame) -> str:
+    """Get the price column to use ('Adj Close' preferred over 'Close')."""
+    if "Adj Close" in market_data.columns:
+        return "Adj Close"
+    if "Close" in market_data.columns:
+        return "Close"
+    raise ValueError("market_data must have 'Close' or 'Adj Close' column")
+
+
+def _rolling_stats(prices: pd.DataFrame, lookback_days: int) -> tuple[np.ndarray, np.ndarray]:
+    """Rolling annualized mean return and volatility for each price column.
+
+    Returns:
+        ``(rolling_returns, rolling_vol)`` arrays of shape ``(n_dates, n_columns)``
+    """
+    returns = prices.pct_change()
+    rolling = returns.rolling(window=lookback_days)
+    # Simple annualization: mean_daily * 252 and std_daily * sqrt(252)
+    rolling_returns = rolling.mean().to_numpy(dtype=float) * 252
+    rolling_vol = rolling.std().to_numpy(dtype=float) * (252**0.5)
+    return rolling_returns, rolling_vol
+
+
+def classify_regimes(
+    rolling_returns: np.ndarray,
+    rolling_vol: np.ndarray,
+    config: RegimeConfig,
+) -> np.ndarray:
+    """Classify rolling statistics into integer regime codes.
+
+    Codes index ``_REGIME_CODES``; dates where either statistic is NaN get
+    ``-1``.
+
+    Args:
+        rolling_returns: Annualized rolling returns (any shape)
+        rolling_vol: Annualized rolling volatility (same shape)
+        config: Regime detection configuration
+
+    Returns:
+        Integer array of regime codes with the input shape
+    """
+    valid = ~(np.isnan(rolling_returns) | np.isnan(rolling_vol))
+    return np.select(
+        [
+            ~valid,
+            rolling_vol > config.volatility_threshold,
+            rolling_returns > config.bull_threshold,
+            rolling_returns < config.bear_threshold,
+        ],
+        [_NO_REGIME, 0, 1, 2],
+        default=3,
+    )
+
+
+def _periods_from_codes(
+    index: pd.DatetimeIndex,
+    codes: np.ndarray,
+    rolling_returns: np.ndarray,
+    rolling_vol: np.ndarray,
+) -> list[RegimePeriod]:
+    """Run-length encode one column of regime codes into periods.
+
+    Dates without a regime are dropped first, so they never split a period.
+    Each period ends the day before the next one starts; the last period
+    ends on the final date of ``index``.
+    """
+    rows = np.flatnonzero(codes != _NO_REGIME)
+    if len(rows) == 0:
+        return []
+
+    valid_codes = codes[rows]
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(valid_codes)) + 1))
+    lengths = np.diff(np.append(starts, len(rows)))
+    mean_returns = np.add.reduceat(rolling_returns[rows], starts) / lengths
+    mean_vols = np.add.reduceat(rolling_vol[rows], starts) / lengths
+
+    start_dates = index[rows[starts]]
+    end_dates = [*(start_dates[1:] - pd.Timedelta(days=1)), index[-1]]
+
+    return [
+        RegimePeriod(
+            regime=_REGIME_CODES[code],
+            start=start,
+            end=end,
+            market_return=float(market_return),
+            market_volatility=float(market_vol),
+        )
+        for code, start, end, market_return, market_vol in zip(
+            valid_codes[starts], start_dates, end_dates, mean_returns, mean_vols, strict=True
+        )
+    ]
+
 
 class SimpleRegimeDetector:
     """Simple threshold-based regime detector using rolling returns and volatility.
@@ -18,9 +122,12 @@ class SimpleRegimeDetector:
     2. BULL: If return > bull_threshold and not volatile
     3. BEAR: If return < bear_threshold and not volatile
     4. SIDEWAYS: Otherwise
+
+    Dates are classified in one vectorized pass and consecutive dates with the
+    same regime are merged into periods by run-length encoding.
     """
 
-    def detect(  # noqa: C901
+    def detect(
         self,
         market_data: pd.DataFrame,
         config: RegimeConfig | None = None,
@@ -40,104 +147,67 @@ class SimpleRegimeDetector:
         if config is None:
             config = RegimeConfig()
 
-        # Validate market data
         if not isinstance(market_data.index, pd.DatetimeIndex):
             raise ValueError("market_data must have DatetimeIndex")
 
-        # Determine which price column to use
-        if "Adj Close" in market_data.columns:
-            price_col = "Adj Close"
-        elif "Close" in market_data.columns:
-            price_col = "Close"
-        else:
-            raise ValueError("market_data must have 'Close' or 'Adj Close' column")
-
-        prices = market_data[price_col].copy()
+        prices = market_data[[_price_column(market_data)]]
+        return self._detect_columns(prices, config)[0]
 
-        # Calculate daily returns
-        returns = prices.pct_change()
-
-        # Calculate rolling annualized returns
-        # Use simple compounding: (1 + mean_daily_return)^252 - 1
-        rolling_returns = returns.rolling(window=config.lookback_days).mean() * 252
+    def detect_batch(
+        self,
+        prices: pd.DataFrame | Mapping[str, pd.DataFrame],
+        config: RegimeConfig | None = None,
+    ) -> dict[str, list[RegimePeriod]]:
+        """Detect market regimes for many tickers at once.
 
-        # Calculate rolling annualized volatility
-        # Volatility = std_daily * sqrt(252)
-        rolling_vol = returns.rolling(window=config.lookback_days).std() * (252**0.5)
+        Rolling statistics and classification run over all tickers together;
+        each ticker's result is identical to ``detect`` on that ticker alone.
 
-        # Classify each day
-        regime_series = pd.Series(index=prices.index, dtype=object)
+        Args:
+            prices: Either a wide DataFrame of prices (DatetimeIndex, one column
+                per ticker) or a mapping of ticker to market data accepted by
+                ``detect``. Mapped frames sharing one index are batched
+                together; others are processed individually.
+            config: Regime detection configuration (uses defaults if None)
 
-        for date in prices.index:
-            ret = rolling_returns.loc[date]
-            vol = rolling_vol.loc[date]
+        Returns:
+            Dictionary mapping each ticker to its regime periods
 
-            # Skip if we don't have enough data yet
-            if pd.isna(ret) or pd.isna(vol):
-                regime_series.loc[date] = None
-                continue
+        Raises:
+            ValueError: If any input is invalid
+        """
+        if config is None:
+            config = RegimeConfig()
 
-            # Classify regime
-            if vol > config.volatility_threshold:
-                regime = MarketRegime.VOLATILE
-            elif ret > config.bull_threshold:
-                regime = MarketRegime.BULL
-            elif ret < config.bear_threshold:
-                regime = MarketRegime.BEAR
-            else:
-                regime = MarketRegime.SIDEWAYS
-
-            regime_series.loc[date] = regime
-
-        # Convert series to periods
-        periods: list[RegimePeriod] = []
-        current_regime: MarketRegime | None = None
-        period_start: pd.Timestamp | None = None
-        period_returns: list[float] = []
-        period_vols: list[float] = []
-
-        for date, regime in regime_series.items():
-            if regime is None:
-                continue
+        if isinstance(prices, pd.DataFrame):
+            if not isinstance(prices.index, pd.DatetimeIndex):
+                raise ValueError("prices must have DatetimeIndex")
+            return dict(zip(map(str, prices.columns), self._detect_columns(prices, config), strict=True))
+
+        frames = dict(prices)
+        for frame in frames.values():
+            if not isinstance(frame.index, pd.DatetimeIndex):
+                raise ValueError("market_data must have DatetimeIndex")
+        indexes = [frame.index for frame in frames.values()]
+        if not indexes or not all(index.equals(indexes[0]) for index in indexes[1:]):
+            return {ticker: self.detect(frame, config) for ticker, frame in frames.items()}
+
+        wide = pd.DataFrame(
+            {ticker: frame[_price_column(frame)].to_numpy() for ticker, frame in frames.items()},
+            index=indexes[0],
+        )
+        return dict(zip(frames, self._detect_columns(wide, config), strict=True))
 
-            ts = cast(pd.Timestamp, date)
-
-            if regime != current_regime:
-                # Save previous period if exists
-                if current_regime is not None and period_start is not None:
-                    periods.append(
-                        RegimePeriod(
-                            regime=current_regime,
-                            start=period_start,
-                            end=ts - pd.Timedelta(days=1),  # Previous day
-                            market_return=sum(period_returns) / len(period_returns) if period_returns else 0.0,
-                            market_volatility=sum(period_vols) / len(period_vols) if period_vols else 0.0,
-                        )
-                    )
-
-                # Start new period
-                current_regime = regime
-                period_start = ts
-                period_returns = [rolling_returns.loc[ts]]
-                period_vols = [rolling_vol.loc[ts]]
-            else:
-                # Continue current period
-                period_returns.append(rolling_returns.loc[ts])
-                period_vols.append(rolling_vol.loc[ts])
-
-        # Don't forget the last period
-        if current_regime is not None and period_start is not None:
-            periods.append(
-                RegimePeriod(
-                    regime=current_regime,
-                    start=period_start,
-                    end=prices.index[-1],
-                    market_return=sum(period_returns) / len(period_returns) if period_returns else 0.0,
-                    market_volatility=sum(period_vols) / len(period_vols) if period_vols else 0.0,
-                )
-            )
-
-        return periods
+    @staticmethod
+    def _detect_columns(prices: pd.DataFrame, config: RegimeConfig) -> list[list[RegimePeriod]]:
+        """Detect regime periods for every column of a wide price frame."""
+        rolling_returns, rolling_vol = _rolling_stats(prices, config.lookback_days)
+        codes = classify_regimes(rolling_returns, rolling_vol, config)
+        index = cast(pd.DatetimeIndex, prices.index)
+        return [
+            _periods_from_codes(index, codes[:, col], rolling_returns[:, col], rolling_vol[:, col])
+            for col in range(prices.shape[1])
+        ]
 
 
 def segment_by_regime(
@@ -147,6 +217,7 @@ def segment_by_regime(
     config: RegimeConfig | None = None,
     *,
     equity_curve: pd.Series | None = None,
+    periods: list[RegimePeriod] | None = None,
 ) -> dict[MarketRegime, RegimeMetrics]:
     """Segment backtest results by market regime.
 
@@ -169,6 +240,8 @@ def segment_by_regime(
         equity_curve: Optional portfolio value time series.  When supplied,
             per-regime annualised return, volatility, and Sharpe ratio are
             computed and included in ``RegimeMetrics.metrics``.
+        periods: Optional regime periods already detected from
+            *market_data*; skips running the detector again.
 
     Returns:
         Dictionary mapping each ``MarketRegime`` to its ``RegimeMetrics``.
@@ -176,11 +249,11 @@ def segment_by_regime(
     Raises:
         ValueError: If inputs are invalid.
     """
-    if detector is None:
-        detector = SimpleRegimeDetector()
-
-    # Detect regimes from market data
-    periods = detector.detect(market_data, config)
+    if periods is None:
+        if detector is None:
+            detector = SimpleRegimeDetector()
+        # Detect regimes from market data
+        periods = detector.detect(market_data, config)
 
     # Accumulate period counts and days per regime
     regime_stats: dict[MarketRegime, dict] = {
@@ -1,14 +1,86 @@
-"""Walk-forward testing implementation for backtesting validation."""
+"""Walk-forward testing implementation for backtesting validation.
+
+Window backtests are independent, so ``run_walk_forward`` can run them on a
+process pool (``max_workers``).  The engine, including any price histories it
+holds, is sent to each worker once when the pool starts rather than with every
+window.  Results can be memoized across runs in a ``WindowResultCache`` keyed
+by (config hash, data snapshot ID, window bounds), so re-runs and windows
+shared between configurations are not recomputed.
+"""
 
 from __future__ import annotations
 
-from copy import deepcopy
+import contextlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from dataclasses import replace
 
 import pandas as pd
 
-from finbot.core.contracts import BacktestRunRequest
-from finbot.core.contracts.interfaces import BacktestEngine
+from finbot.core.contracts import BacktestRunRequest, BacktestRunResult
+from finbot.core.contracts.interfaces import BacktestEngine, CacheableBacktestEngine
 from finbot.core.contracts.walkforward import WalkForwardConfig, WalkForwardResult, WalkForwardWindow
+from finbot.utils.dict_utils.hash_dictionary import hash_dictionary
+from finbot.utils.multiprocessing_utils.process_pools import new_process_pool
+
+WindowKey = tuple[str, str, pd.Timestamp, pd.Timestamp]
+
+_DEFAULT_CACHE_ENTRIES = 4096
+
+
+class WindowResultCache:
+    """Thread-safe LRU memo of per-window backtest results.
+
+    Keys are ``(config_hash, snapshot_id, start, end)``: the hash of every
+    request field except the dates (plus the engine type and its
+    ``cache_key()``), the data snapshot the backtest ran on, and the window
+    bounds.  A window is only reusable when both its data and its engine
+    configuration are identified, so requests without ``data_snapshot_id``
+    and engines that are not ``CacheableBacktestEngine`` are never cached.
+
+    Args:
+        max_entries: Maximum number of results kept; the least recently used
+            entry is evicted first.
+    """
+
+    def __init__(self, max_entries: int = _DEFAULT_CACHE_ENTRIES):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[WindowKey, BacktestRunResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: WindowKey) -> BacktestRunResult | None:
+        """Return the cached result for ``key``, or None."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: WindowKey, result: BacktestRunResult) -> None:
+        """Store ``result`` under ``key``, evicting the oldest entry if full."""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 def generate_windows(
@@ -121,57 +193,51 @@ def run_walk_forward(
     config: WalkForwardConfig,
     *,
     include_train: bool = False,
+    max_workers: int | None = None,
+    cache: WindowResultCache | None = None,
+    progress: Callable[[int, int], None] | None = None,
 ) -> WalkForwardResult:
     """Run walk-forward analysis.
 
     Args:
-        engine: Backtest engine to use
-        request: Base backtest request (will be modified per window)
+        engine: Backtest engine to use. Must be picklable when
+                ``max_workers > 1``.
+        request: Base backtest request (dates are replaced per window)
         config: Walk-forward configuration
         include_train: If True, also run backtests on training periods
+        max_workers: Number of worker processes for window backtests.
+                     None or 1 runs windows sequentially in-process.
+        cache: Optional result cache shared across runs. Used only when
+               ``request.data_snapshot_id`` identifies the input data and
+               the engine provides ``cache_key()``.
+        progress: Optional callback, called with (windows done, total
+                  windows) as each window backtest finishes.
 
     Returns:
         Walk-forward results with per-window metrics
 
     Raises:
-        ValueError: If request dates don't allow walk-forward windows
+        ValueError: If request dates don't allow walk-forward windows or
+            ``max_workers < 1``
     """
     # Determine date range from request
     if request.start is None or request.end is None:
         raise ValueError("Walk-forward requires explicit start and end dates in request")
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
 
     # Generate windows
     windows = generate_windows(request.start, request.end, config)
 
-    # Run backtests for each window
-    train_results: list = []
-    test_results: list = []
-
-    for window in windows:
-        # Run test window (out-of-sample)
-        test_request = BacktestRunRequest(
-            strategy_name=request.strategy_name,
-            symbols=request.symbols,
-            start=window.test_start,
-            end=window.test_end,
-            initial_cash=request.initial_cash,
-            parameters=deepcopy(request.parameters),
-        )
-        test_result = engine.run(test_request)
-        test_results.append(test_result)
-
-        # Optionally run train window (in-sample)
-        if include_train:
-            train_request = BacktestRunRequest(
-                strategy_name=request.strategy_name,
-                symbols=request.symbols,
-                start=window.train_start,
-                end=window.train_end,
-                initial_cash=request.initial_cash,
-                parameters=deepcopy(request.parameters),
-            )
-            train_result = engine.run(train_request)
-            train_results.append(train_result)
+    # Test windows (out-of-sample) first, then optional train windows (in-sample).
+    # Window requests share the base request's parameters; engines copy them per run.
+    bounds = [(window.test_start, window.test_end) for window in windows]
+    if include_train:
+        bounds += [(window.train_start, window.train_end) for window in windows]
+
+    results = _run_windows(engine, request, bounds, max_workers=max_workers, cache=cache, progress=progress)
+    test_results = results[: len(windows)]
+    train_results = results[len(windows) :]
 
     # Calculate summary metrics across all test windows
     summary_metrics = _calculate_summary_metrics(test_results)
@@ -180,11 +246,88 @@ def run_walk_forward(
         config=config,
         windows=tuple(windows),
         test_results=tuple(test_results),
-        train_results=tuple(train_results) if include_train else (),
+        train_results=tuple(train_results),
         summary_metrics=summary_metrics,
     )
 
 
+def _config_hash(engine: CacheableBacktestEngine, request: BacktestRunRequest) -> str:
+    """Hash of everything that determines a window result except its dates and data."""
+    return hash_dictionary(
+        {
+            "engine": f"{type(engine).__module__}.{type(engine).__qualname__}",
+            "engine_config": engine.cache_key(),
+            "strategy_name": request.strategy_name,
+            "symbols": list(request.symbols),
+            "initial_cash": request.initial_cash,
+            "parameters": request.parameters,
+        }
+    )
+
+
+def _run_windows(
+    engine: BacktestEngine,
+    request: BacktestRunRequest,
+    bounds: list[tuple[pd.Timestamp, pd.Timestamp]],
+    *,
+    max_workers: int | None,
+    cache: WindowResultCache | None,
+    progress: Callable[[int, int], None] | None = None,
+) -> list[BacktestRunResult]:
+    """Run one backtest per ``(start, end)`` bound, reusing cached and repeated windows."""
+    keys: dict[tuple[pd.Timestamp, pd.Timestamp], WindowKey] = {}
+    if cache is not None and request.data_snapshot_id is not None and isinstance(engine, CacheableBacktestEngine):
+        config_hash = _config_hash(engine, request)
+        keys = {bound: (config_hash, request.data_snapshot_id, *bound) for bound in bounds}
+
+    resolved: dict[tuple[pd.Timestamp, pd.Timestamp], BacktestRunResult] = {}
+    pending: list[tuple[pd.Timestamp, pd.Timestamp]] = []
+    for bound in dict.fromkeys(bounds):
+        cached = cache.get(keys[bound]) if cache is not None and bound in keys else None
+        if cached is not None:
+            resolved[bound] = cached
+        else:
+            pending.append(bound)
+
+    requests = [replace(request, start=start, end=end) for start, end in pending]
+    computed: list[BacktestRunResult] = []
+    with contextlib.ExitStack() as stack:
+        results: Iterator[BacktestRunResult]
+        if max_workers is None or max_workers == 1 or len(requests) < 2:
+            results = map(engine.run, requests)
+        else:
+            executor = stack.enter_context(
+                new_process_pool(min(max_workers, len(requests)), initializer=_init_worker, initargs=(engine,))
+            )
+            results = executor.map(_run_in_worker, requests)
+        for result in results:
+            computed.append(result)
+            if progress is not None:
+                progress(len(resolved) + len(computed), len(resolved) + len(requests))
+
+    for bound, result in zip(pending, computed, strict=True):
+        resolved[bound] = result
+        if cache is not None and bound in keys:
+            cache.put(keys[bound], result)
+
+    return [resolved[bound] for bound in bounds]
+
+
+_worker_engine: BacktestEngine | None = None
+
+
+def _init_worker(engine: BacktestEngine) -> None:
+    """Process-pool initializer: keep one engine (and its data) per worker."""
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _run_in_worker(request: BacktestRunRequest) -> BacktestRunResult:
+    """Run one window on the worker's engine."""
+    assert _worker_engine is not None
+    return _worker_engine.run(request)
+
+
 def _calculate_summary_metrics(results: list) -> dict[str, float]:
     """Calculate aggregate metrics across multiple backtest results.
 
@@ -1,16 +1,17 @@
 """Check freshness of all registered data sources.
 
-Scans data directories for parquet files, reports the most recent
-modification time, file count, and staleness status for each source.
+Reports the most recent modification time, file count, size, last data
+timestamp and staleness status for each source.  Directory contents come
+from the incrementally maintained ``DataCatalog``, so repeated checks only
+look at what changed on disk.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
 
-from finbot.services.data_quality.data_source_registry import DATA_SOURCES, DataSource
+from finbot.services.data_quality.data_source_registry import DataSource
 
 
 @dataclass
@@ -22,6 +23,7 @@ class DataSourceStatus:
     oldest_file: datetime | None
     newest_file: datetime | None
     total_size_bytes: int
+    last_data_timestamp: datetime | None = None
 
     @property
     def is_stale(self) -> bool:
@@ -57,38 +59,20 @@ class DataSourceStatus:
         return f"{size:.1f} TB"
 
 
-def _scan_directory(directory: Path, pattern: str) -> tuple[list[Path], int]:
-    """Return matching files and total size in bytes."""
-    if not directory.exists():
-        return [], 0
-    files = sorted(directory.glob(pattern))
-    total_size = sum(f.stat().st_size for f in files)
-    return files, total_size
+def check_source_freshness(source: DataSource, *, rescan: bool = False) -> DataSourceStatus:
+    """Check freshness of a single data source."""
+    from finbot.services.data_quality.data_catalog import get_data_catalog
 
+    return get_data_catalog().status(source, rescan=rescan)
 
-def check_source_freshness(source: DataSource) -> DataSourceStatus:
-    """Check freshness of a single data source."""
-    files, total_size = _scan_directory(source.directory, source.pattern)
-
-    if not files:
-        return DataSourceStatus(
-            source=source,
-            file_count=0,
-            oldest_file=None,
-            newest_file=None,
-            total_size_bytes=0,
-        )
-
-    mtimes = [datetime.fromtimestamp(f.stat().st_mtime) for f in files]
-    return DataSourceStatus(
-        source=source,
-        file_count=len(files),
-        oldest_file=min(mtimes),
-        newest_file=max(mtimes),
-        total_size_bytes=total_size,
-    )
-
-
-def check_all_freshness() -> list[DataSourceStatus]:
-    """Check freshness of all registered data sources."""
-    return [check_source_freshness(source) for source in DATA_SOURCES]
+
+def check_all_freshness(*, rescan: bool = False) -> list[DataSourceStatus]:
+    """Check freshness of all registered data sources.
+
+    Args:
+        rescan: Re-``stat()`` every file instead of trusting unchanged
+            directories, catching files rewritten in place.
+    """
+    from finbot.services.data_quality.data_catalog import get_data_catalog
+
+    return get_data_catalog().statuses(rescan=rescan)
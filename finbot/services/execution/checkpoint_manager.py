@@ -3,14 +3,44 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+from dataclasses import dataclass, field
 from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
+from typing import Any
 
 from finbot.core.contracts.checkpoint import CHECKPOINT_VERSION, ExecutionCheckpoint
 from finbot.core.contracts.latency import LATENCY_FAST, LATENCY_INSTANT, LATENCY_NORMAL, LATENCY_SLOW
 from finbot.core.contracts.risk import RiskConfig
-from finbot.services.execution.checkpoint_serialization import deserialize_checkpoint, serialize_checkpoint
+from finbot.services.execution.checkpoint_serialization import (
+    apply_checkpoint_delta,
+    decode_compact,
+    deserialize_checkpoint,
+    encode_compact,
+    serialize_checkpoint,
+    serialize_checkpoint_state,
+    serialize_orders,
+)
 from finbot.services.execution.execution_simulator import ExecutionSimulator
+from finbot.services.execution.ledger import NumericMode
+
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S_%f"
+LATEST_POINTER = "LATEST"
+FULL_SUFFIX = ".full.ckpt"
+DELTA_SUFFIX = ".delta.ckpt"
+
+
+@dataclass(slots=True)
+class _ChainState:
+    """What the previous incremental checkpoint of a simulator contained."""
+
+    last_file: str
+    completed_count: int
+    last_completed_id: str | None
+    pending: dict[str, dict] = field(default_factory=dict)
+    deltas_since_full: int = 0
 
 
 class CheckpointManager:
@@ -18,11 +48,20 @@ class CheckpointManager:
 
     Features:
     - Create checkpoints from simulator state
-    - Save checkpoints to disk (JSON format)
+    - Save checkpoints to disk (JSON format, or compact incremental format)
     - Load checkpoints from disk
     - Restore ExecutionSimulator from checkpoint
     - List available checkpoints
 
+    Incremental mode (``incremental=True``) is intended for frequent
+    checkpointing of long sessions. Completed orders are immutable, so each
+    save writes a delta holding only the orders completed since the previous
+    checkpoint plus pending orders that were added, changed or removed. Every
+    ``full_snapshot_interval`` saves (and on the first save of a manager) a full
+    snapshot is written instead. Files are zstd-compressed compact JSON written
+    atomically, and ``LATEST`` is a pointer holding the newest file name.
+    Loading replays deltas on top of the preceding full snapshot.
+
     Example:
         >>> manager = CheckpointManager(Path("checkpoints"))
         >>> checkpoint = manager.create_checkpoint(simulator, "sim-001")
@@ -30,14 +69,31 @@ class CheckpointManager:
         >>> restored_sim = manager.restore_simulator(checkpoint)
     """
 
-    def __init__(self, checkpoint_dir: Path | str):
+    def __init__(
+        self,
+        checkpoint_dir: Path | str,
+        incremental: bool = False,
+        full_snapshot_interval: int = 60,
+    ):
         """Initialize checkpoint manager.
 
         Args:
             checkpoint_dir: Directory for storing checkpoints
+            incremental: Write compact delta checkpoints instead of full JSON files
+            full_snapshot_interval: In incremental mode, write a full snapshot
+                after this many deltas
+
+        Raises:
+            ValueError: If full_snapshot_interval is less than 1
         """
+        if full_snapshot_interval < 1:
+            msg = f"full_snapshot_interval must be >= 1, got {full_snapshot_interval}"
+            raise ValueError(msg)
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self.incremental = incremental
+        self.full_snapshot_interval = full_snapshot_interval
+        self._chains: dict[str, _ChainState] = {}
 
     def create_checkpoint(
         self,
@@ -72,8 +128,8 @@ class CheckpointManager:
         risk_config_data = None
 
         if simulator.risk_checker:
-            peak_value = simulator.risk_checker.peak_value
-            daily_start_value = simulator.risk_checker.daily_start_value
+            peak_value = self._to_decimal(simulator.risk_checker.peak_value)
+            daily_start_value = self._to_decimal(simulator.risk_checker.daily_start_value)
             trading_enabled = simulator.risk_checker.trading_enabled
 
             # Serialize risk config
@@ -86,7 +142,7 @@ class CheckpointManager:
             checkpoint_timestamp=datetime.now(),
             cash=simulator.cash,
             initial_cash=simulator.initial_cash,
-            positions=simulator.positions.copy(),
+            positions=dict(simulator.positions),
             pending_orders=list(simulator.pending_orders.values()),
             completed_orders=list(simulator.completed_orders.values()),
             peak_value=peak_value,
@@ -96,6 +152,7 @@ class CheckpointManager:
             commission_per_share=simulator.commission_per_share,
             latency_config_name=latency_config_name,
             risk_config_data=risk_config_data,
+            numeric_mode=simulator.numeric_mode.value,
         )
 
     def save_checkpoint(
@@ -114,19 +171,19 @@ class CheckpointManager:
         sim_dir = self.checkpoint_dir / checkpoint.simulator_id
         sim_dir.mkdir(parents=True, exist_ok=True)
 
+        if self.incremental:
+            return self._save_incremental(sim_dir, checkpoint)
+
         # Create timestamped filename
-        timestamp_str = checkpoint.checkpoint_timestamp.strftime("%Y%m%d_%H%M%S_%f")
+        timestamp_str = checkpoint.checkpoint_timestamp.strftime(TIMESTAMP_FORMAT)
         checkpoint_path = sim_dir / f"{timestamp_str}.json"
 
         # Serialize and save
-        checkpoint_data = serialize_checkpoint(checkpoint)
-        with checkpoint_path.open("w") as f:
-            json.dump(checkpoint_data, f, indent=2)
+        checkpoint_bytes = json.dumps(serialize_checkpoint(checkpoint), indent=2).encode("utf-8")
+        self._write_atomic(checkpoint_path, checkpoint_bytes)
 
         # Update latest.json
-        latest_path = sim_dir / "latest.json"
-        with latest_path.open("w") as f:
-            json.dump(checkpoint_data, f, indent=2)
+        self._write_atomic(sim_dir / "latest.json", checkpoint_bytes)
 
         return checkpoint_path
 
@@ -155,18 +212,20 @@ class CheckpointManager:
 
         # Load specific timestamp or latest
         if timestamp is None:
-            checkpoint_path = sim_dir / "latest.json"
+            checkpoint_path = self._latest_path(sim_dir)
         else:
-            timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S_%f")
-            checkpoint_path = sim_dir / f"{timestamp_str}.json"
+            checkpoint_path = self._find_checkpoint(sim_dir, timestamp.strftime(TIMESTAMP_FORMAT))
 
         if not checkpoint_path.exists():
             msg = f"Checkpoint not found: {checkpoint_path}"
             raise FileNotFoundError(msg)
 
         # Load and deserialize
-        with checkpoint_path.open() as f:
-            checkpoint_data = json.load(f)
+        if checkpoint_path.suffix == ".json":
+            with checkpoint_path.open() as f:
+                checkpoint_data = json.load(f)
+        else:
+            checkpoint_data = self._replay(sim_dir, checkpoint_path.name)
 
         return deserialize_checkpoint(checkpoint_data)
 
@@ -211,18 +270,24 @@ class CheckpointManager:
             commission_per_share=checkpoint.commission_per_share,
             latency_config=latency_config,
             risk_config=risk_config,
+            numeric_mode=NumericMode(checkpoint.numeric_mode),
         )
 
         # Restore state
         simulator.cash = checkpoint.cash
-        simulator.positions = checkpoint.positions.copy()
+        simulator.positions = checkpoint.positions
         simulator.pending_orders = {order.order_id: order for order in checkpoint.pending_orders}
         simulator.completed_orders = {order.order_id: order for order in checkpoint.completed_orders}
 
         # Restore risk state
         if simulator.risk_checker and checkpoint.peak_value is not None:
-            simulator.risk_checker.peak_value = checkpoint.peak_value
-            simulator.risk_checker.daily_start_value = checkpoint.daily_start_value or checkpoint.cash
+            daily_start_value = checkpoint.daily_start_value or checkpoint.cash
+            if simulator.numeric_mode == NumericMode.DECIMAL:
+                simulator.risk_checker.peak_value = checkpoint.peak_value
+                simulator.risk_checker.daily_start_value = daily_start_value
+            else:
+                simulator.risk_checker.peak_value = float(checkpoint.peak_value)
+                simulator.risk_checker.daily_start_value = float(daily_start_value)
             simulator.risk_checker.trading_enabled = checkpoint.trading_enabled
 
         # Store simulator_id
@@ -249,14 +314,14 @@ class CheckpointManager:
 
         checkpoints: list[tuple[datetime, Path]] = []
 
-        for checkpoint_file in sim_dir.glob("*.json"):
-            if checkpoint_file.name == "latest.json":
+        for checkpoint_file in sim_dir.iterdir():
+            if checkpoint_file.name == "latest.json" or checkpoint_file.suffix not in (".json", ".ckpt"):
                 continue
 
-            # Parse timestamp from filename
-            timestamp_str = checkpoint_file.stem  # Remove .json
+            # Parse timestamp from filename (strip .json / .full.ckpt / .delta.ckpt)
+            timestamp_str = checkpoint_file.name.split(".", 1)[0]
             try:
-                timestamp = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S_%f")
+                timestamp = datetime.strptime(timestamp_str, TIMESTAMP_FORMAT)
                 checkpoints.append((timestamp, checkpoint_file))
             except ValueError:
                 # Skip files that don't match expected format
@@ -267,6 +332,145 @@ class CheckpointManager:
 
         return checkpoints
 
+    def _save_incremental(self, sim_dir: Path, checkpoint: ExecutionCheckpoint) -> Path:
+        """Write a delta or full compact checkpoint and advance the LATEST pointer.
+
+        Args:
+            sim_dir: Simulator checkpoint directory
+            checkpoint: Checkpoint to save
+
+        Returns:
+            Path to saved checkpoint file
+        """
+        timestamp_str = checkpoint.checkpoint_timestamp.strftime(TIMESTAMP_FORMAT)
+        completed = checkpoint.completed_orders
+        pending = {order["order_id"]: order for order in serialize_orders(checkpoint.pending_orders)}
+        last_completed_id = completed[-1].order_id if completed else None
+
+        chain = self._chains.get(checkpoint.simulator_id)
+        is_delta = (
+            chain is not None
+            and chain.deltas_since_full < self.full_snapshot_interval
+            and chain.last_file != f"{timestamp_str}{DELTA_SUFFIX}"
+            and self._read_pointer(sim_dir) == chain.last_file
+            and chain.completed_count <= len(completed)
+            and (chain.completed_count == 0 or completed[chain.completed_count - 1].order_id == chain.last_completed_id)
+        )
+
+        if chain is not None and is_delta:
+            payload = {
+                "kind": "delta",
+                "previous": chain.last_file,
+                "state": serialize_checkpoint_state(checkpoint),
+                "completed_added": serialize_orders(completed[chain.completed_count :]),
+                "pending_upserted": [
+                    order for order_id, order in pending.items() if chain.pending.get(order_id) != order
+                ],
+                "pending_removed": [order_id for order_id in chain.pending if order_id not in pending],
+            }
+            checkpoint_path = sim_dir / f"{timestamp_str}{DELTA_SUFFIX}"
+            deltas_since_full = chain.deltas_since_full + 1
+        else:
+            payload = {
+                "kind": "full",
+                "checkpoint": {
+                    **serialize_checkpoint_state(checkpoint),
+                    "pending_orders": list(pending.values()),
+                    "completed_orders": serialize_orders(completed),
+                },
+            }
+            checkpoint_path = sim_dir / f"{timestamp_str}{FULL_SUFFIX}"
+            deltas_since_full = 0
+
+        self._write_atomic(checkpoint_path, encode_compact(payload))
+        self._write_atomic(sim_dir / LATEST_POINTER, checkpoint_path.name.encode("utf-8"))
+
+        self._chains[checkpoint.simulator_id] = _ChainState(
+            last_file=checkpoint_path.name,
+            completed_count=len(completed),
+            last_completed_id=last_completed_id,
+            pending=pending,
+            deltas_since_full=deltas_since_full,
+        )
+        return checkpoint_path
+
+    def _replay(self, sim_dir: Path, name: str) -> dict:
+        """Rebuild serialized checkpoint data by replaying deltas onto their full snapshot.
+
+        Args:
+            sim_dir: Simulator checkpoint directory
+            name: Compact checkpoint file name to restore
+
+        Returns:
+            Serialized checkpoint data
+        """
+        deltas: list[dict] = []
+        payload = decode_compact((sim_dir / name).read_bytes())
+        while payload["kind"] == "delta":
+            deltas.append(payload)
+            payload = decode_compact((sim_dir / payload["previous"]).read_bytes())
+
+        data: dict = payload["checkpoint"]
+        for delta in reversed(deltas):
+            data = apply_checkpoint_delta(data, delta)
+        return data
+
+    def _latest_path(self, sim_dir: Path) -> Path:
+        """Resolve the newest checkpoint file (LATEST pointer or latest.json)."""
+        pointer = self._read_pointer(sim_dir)
+        legacy = sim_dir / "latest.json"
+        if pointer is None:
+            return legacy
+        if self.incremental or not legacy.exists():
+            return sim_dir / pointer
+        return legacy
+
+    @staticmethod
+    def _find_checkpoint(sim_dir: Path, timestamp_str: str) -> Path:
+        """Find the checkpoint file for a timestamp in any supported format."""
+        for suffix in (FULL_SUFFIX, DELTA_SUFFIX):
+            candidate = sim_dir / f"{timestamp_str}{suffix}"
+            if candidate.exists():
+                return candidate
+        return sim_dir / f"{timestamp_str}.json"
+
+    @staticmethod
+    def _read_pointer(sim_dir: Path) -> str | None:
+        """Read the LATEST pointer, or None if absent."""
+        pointer_path = sim_dir / LATEST_POINTER
+        if not pointer_path.exists():
+            return None
+        return pointer_path.read_text(encoding="utf-8").strip()
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write bytes via a temporary file and rename, so readers never see partial files.
+
+        Args:
+            path: Destination path
+            data: File contents
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _to_decimal(value: Any) -> Decimal:
+        """Convert risk state (Decimal, or float in fast numeric modes) to Decimal.
+
+        Args:
+            value: Risk state value
+
+        Returns:
+            Decimal value
+        """
+        return value if isinstance(value, Decimal) else Decimal(repr(value))
+
     def _serialize_risk_config(self, risk_config: RiskConfig) -> dict:
         """Serialize risk config to dict.
 
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import Iterable
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
+
+import zstandard as zstd
 
 from finbot.core.contracts.checkpoint import ExecutionCheckpoint
 from finbot.core.contracts.models import OrderSide, OrderType
@@ -19,6 +24,24 @@ def serialize_checkpoint(checkpoint: ExecutionCheckpoint) -> dict:
     Returns:
         JSON-compatible dictionary
     """
+    return {
+        **serialize_checkpoint_state(checkpoint),
+        "pending_orders": serialize_orders(checkpoint.pending_orders),
+        "completed_orders": serialize_orders(checkpoint.completed_orders),
+    }
+
+
+def serialize_checkpoint_state(checkpoint: ExecutionCheckpoint) -> dict:
+    """Convert checkpoint account, risk and configuration state (no orders) to a dict.
+
+    Used by delta checkpoints, which store orders separately.
+
+    Args:
+        checkpoint: Checkpoint to serialize
+
+    Returns:
+        JSON-compatible dictionary without ``pending_orders``/``completed_orders``
+    """
     return {
         "version": checkpoint.version,
         "simulator_id": checkpoint.simulator_id,
@@ -26,8 +49,6 @@ def serialize_checkpoint(checkpoint: ExecutionCheckpoint) -> dict:
         "cash": str(checkpoint.cash),
         "initial_cash": str(checkpoint.initial_cash),
         "positions": {symbol: str(qty) for symbol, qty in checkpoint.positions.items()},
-        "pending_orders": [_serialize_order(order) for order in checkpoint.pending_orders],
-        "completed_orders": [_serialize_order(order) for order in checkpoint.completed_orders],
         "peak_value": str(checkpoint.peak_value) if checkpoint.peak_value is not None else None,
         "daily_start_value": str(checkpoint.daily_start_value) if checkpoint.daily_start_value is not None else None,
         "trading_enabled": checkpoint.trading_enabled,
@@ -35,6 +56,7 @@ def serialize_checkpoint(checkpoint: ExecutionCheckpoint) -> dict:
         "commission_per_share": str(checkpoint.commission_per_share),
         "latency_config_name": checkpoint.latency_config_name,
         "risk_config_data": checkpoint.risk_config_data,
+        "numeric_mode": checkpoint.numeric_mode,
     }
 
 
@@ -63,9 +85,73 @@ def deserialize_checkpoint(data: dict) -> ExecutionCheckpoint:
         commission_per_share=Decimal(data.get("commission_per_share", "0")),
         latency_config_name=data.get("latency_config_name", "INSTANT"),
         risk_config_data=data.get("risk_config_data"),
+        numeric_mode=data.get("numeric_mode", "decimal"),
     )
 
 
+def serialize_orders(orders: Iterable[Order]) -> list[dict]:
+    """Serialize orders to dicts.
+
+    Args:
+        orders: Orders to serialize
+
+    Returns:
+        Serialized order data
+    """
+    return [_serialize_order(order) for order in orders]
+
+
+def apply_checkpoint_delta(data: dict, delta: dict) -> dict:
+    """Replay a delta checkpoint on top of serialized checkpoint data.
+
+    Args:
+        data: Serialized checkpoint (full snapshot or result of earlier replays)
+        delta: Delta payload with ``state``, ``completed_added``,
+            ``pending_upserted`` and ``pending_removed``
+
+    Returns:
+        Serialized checkpoint data after the delta
+    """
+    pending = {order["order_id"]: order for order in data["pending_orders"]}
+    for order_id in delta["pending_removed"]:
+        pending.pop(order_id, None)
+    for order in delta["pending_upserted"]:
+        pending[order["order_id"]] = order
+
+    return {
+        **delta["state"],
+        "pending_orders": list(pending.values()),
+        "completed_orders": data["completed_orders"] + delta["completed_added"],
+    }
+
+
+def encode_compact(data: dict[str, Any], level: int = 3) -> bytes:
+    """Encode checkpoint data as zstd-compressed compact JSON.
+
+    Args:
+        data: JSON-compatible dictionary
+        level: zstd compression level
+
+    Returns:
+        Encoded bytes
+    """
+    raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return zstd.ZstdCompressor(level=level).compress(raw)
+
+
+def decode_compact(payload: bytes) -> dict[str, Any]:
+    """Decode data written by ``encode_compact``.
+
+    Args:
+        payload: Encoded bytes
+
+    Returns:
+        Decoded dictionary
+    """
+    data: dict[str, Any] = json.loads(zstd.ZstdDecompressor().decompress(payload))
+    return data
+
+
 def _serialize_order(order: Order) -> dict:
     """Serialize Order to dict.
 
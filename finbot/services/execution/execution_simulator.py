@@ -4,16 +4,23 @@ from __future__ import annotations
 
 import random
 import uuid
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timedelta
 from decimal import Decimal
+from typing import Any
+
+import numpy as np
 
 from finbot.core.contracts.latency import LATENCY_INSTANT, LatencyConfig
 from finbot.core.contracts.models import OrderSide, OrderType
 from finbot.core.contracts.orders import Order, OrderExecution, OrderStatus, RejectionReason
+from finbot.core.contracts.realtime_data import Quote
 from finbot.core.contracts.risk import RiskConfig
+from finbot.services.execution.ledger import AccountLedger, NumericMode
+from finbot.services.execution.order_book import PendingOrderBook
 from finbot.services.execution.order_validator import OrderValidator
 from finbot.services.execution.pending_actions import ActionType, PendingAction, PendingActionQueue
-from finbot.services.execution.risk_checker import RiskChecker
+from finbot.services.execution.risk_checker import RiskBatchResult, RiskChecker
 
 
 class ExecutionSimulator:
@@ -25,6 +32,9 @@ class ExecutionSimulator:
     - Order validation before execution
     - Position and cash tracking
     - Support for market and limit orders
+    - Per-symbol pending order index with price-sorted limit books
+    - Batched market data processing for many symbols per timestamp
+    - Opt-in float64 / fixed-point accounting for high-volume replay
 
     Example with latency:
         >>> from finbot.core.contracts.latency import LATENCY_NORMAL
@@ -33,6 +43,14 @@ class ExecutionSimulator:
         ...     latency_config=LATENCY_NORMAL,
         ... )
         >>> # Orders will have realistic delays
+
+    Example with fast accounting:
+        >>> from finbot.services.execution.ledger import NumericMode
+        >>> simulator = ExecutionSimulator(
+        ...     initial_cash=Decimal("100000"),
+        ...     numeric_mode=NumericMode.FIXED_POINT,
+        ... )
+        >>> # cash/positions are reported as Decimal but tracked in micro-units
     """
 
     def __init__(
@@ -43,6 +61,7 @@ class ExecutionSimulator:
         latency_config: LatencyConfig = LATENCY_INSTANT,
         risk_config: RiskConfig | None = None,
         simulator_id: str | None = None,
+        numeric_mode: NumericMode = NumericMode.DECIMAL,
     ):
         """Initialize execution simulator.
 
@@ -53,16 +72,25 @@ class ExecutionSimulator:
             latency_config: Latency configuration (default: instant execution)
             risk_config: Risk control configuration (default: no risk controls)
             simulator_id: Unique simulator identifier (auto-generated if not provided)
+            numeric_mode: Accounting representation. DECIMAL (default) is exact;
+                FLOAT and FIXED_POINT avoid Decimal arithmetic and track
+                portfolio value incrementally, converting to Decimal only when
+                state is read or checkpointed.
         """
         self.simulator_id = simulator_id or f"sim-{uuid.uuid4().hex[:8]}"
-        self.cash = initial_cash
+        self.ledger = AccountLedger(initial_cash, numeric_mode)
         self.initial_cash = initial_cash
-        self.positions: dict[str, Decimal] = {}
         self.slippage_bps = slippage_bps
         self.commission_per_share = commission_per_share
         self.latency_config = latency_config
 
-        self.pending_orders: dict[str, Order] = {}
+        # Native-representation copies of the fill parameters
+        slippage = slippage_bps / Decimal("10000")
+        self._buy_multiplier = self.ledger.to_native(Decimal("1") + slippage)
+        self._sell_multiplier = self.ledger.to_native(Decimal("1") - slippage)
+        self._commission_native = self.ledger.to_native(commission_per_share)
+
+        self._pending_orders = PendingOrderBook()
         self.completed_orders: dict[str, Order] = {}
 
         self.validator = OrderValidator()
@@ -72,7 +100,55 @@ class ExecutionSimulator:
 
         # Initialize risk state if risk checker exists
         if self.risk_checker:
-            self.risk_checker.update_state(initial_cash, is_new_day=True)
+            self.risk_checker.update_state(self._risk_value(self.ledger.cash_native), is_new_day=True)
+            self.ledger.position_listener = self._on_position_set
+            self._track_risk_state()
+
+    @property
+    def numeric_mode(self) -> NumericMode:
+        """Accounting numeric representation."""
+        return self.ledger.numeric_mode
+
+    @property
+    def cash(self) -> Decimal:
+        """Cash balance."""
+        return self.ledger.cash
+
+    @cash.setter
+    def cash(self, value: Decimal) -> None:
+        """Set cash balance."""
+        self.ledger.cash = value
+        self._track_risk_state()
+
+    @property
+    def positions(self) -> Mapping[str, Decimal]:
+        """Positions {symbol: quantity}.
+
+        Mutable in DECIMAL mode; a read-only snapshot in the fast modes (assign
+        a new mapping to replace positions).
+        """
+        return self.ledger.positions()
+
+    @positions.setter
+    def positions(self, positions: Mapping[str, Decimal]) -> None:
+        """Replace all positions."""
+        self.ledger.set_positions(positions)
+        self._track_risk_state()
+
+    @property
+    def last_prices(self) -> Mapping[str, Decimal]:
+        """Latest market price per symbol (mark-to-market state)."""
+        return self.ledger.marks()
+
+    @property
+    def pending_orders(self) -> PendingOrderBook:
+        """Pending orders keyed by order ID, indexed by symbol."""
+        return self._pending_orders
+
+    @pending_orders.setter
+    def pending_orders(self, orders: Mapping[str, Order]) -> None:
+        """Replace pending orders, rebuilding the symbol index."""
+        self._pending_orders = PendingOrderBook(dict(orders))
 
     def submit_order(self, order: Order, timestamp: datetime | None = None) -> Order:
         """Submit order for execution with latency simulation.
@@ -89,10 +165,10 @@ class ExecutionSimulator:
 
         self.current_time = timestamp
 
-        # Risk checks first (if enabled)
-        current_prices: dict[str, Decimal] = {}
+        # Risk checks first (if enabled), marked at the latest known prices
+        positions, current_prices, cash = self.ledger.risk_view()
         if self.risk_checker:
-            risk_check = self.risk_checker.check_order(order, self.positions, current_prices, self.cash)
+            risk_check = self.risk_checker.check_order(order)
             if risk_check:
                 rejection_reason, rejection_message = risk_check
                 order.status = OrderStatus.REJECTED
@@ -103,7 +179,7 @@ class ExecutionSimulator:
                 return order
 
         # Validate order
-        validation = self.validator.validate(order, self.cash, self.positions, current_prices)
+        validation = self.validator.validate(order, cash, positions, current_prices)
 
         if not validation.is_valid:
             order.status = OrderStatus.REJECTED
@@ -135,6 +211,22 @@ class ExecutionSimulator:
 
         return order
 
+    def check_orders(self, orders: Sequence[Order]) -> RiskBatchResult:
+        """Run pre-trade risk checks on a basket of orders without submitting them.
+
+        See ``RiskChecker.check_orders``: accepted orders are assumed to fill at
+        the latest prices, so limits apply to the basket as a whole.
+
+        Args:
+            orders: Orders to check, in intended submission order
+
+        Returns:
+            RiskBatchResult (all accepted if risk controls are disabled)
+        """
+        if not self.risk_checker:
+            return RiskBatchResult(accepted=np.ones(len(orders), dtype=bool), rejections=[None] * len(orders))
+        return self.risk_checker.check_orders(orders)
+
     def process_market_data(
         self,
         symbol: str,
@@ -155,15 +247,85 @@ class ExecutionSimulator:
             timestamp = datetime.now()
 
         self.current_time = timestamp
+        self._set_mark(symbol, price)
 
         # Process all due actions (submissions, fills, cancellations)
         self._process_due_actions(timestamp)
 
+        return self._process_symbol_price(symbol, price, timestamp)
+
+    def process_market_data_batch(
+        self,
+        bars: Mapping[str, Decimal],
+        timestamp: datetime | None = None,
+    ) -> list[OrderExecution]:
+        """Process one timestamp of market data for many symbols.
+
+        Equivalent to calling ``process_market_data`` for each symbol at the
+        same timestamp, but due actions are processed once and symbols with no
+        pending orders only update the mark-to-market prices.
+
+        Args:
+            bars: Current market price per symbol
+            timestamp: Market data timestamp (defaults to now)
+
+        Returns:
+            List of executions generated, in symbol order of ``bars``
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        self.current_time = timestamp
+        for symbol, price in bars.items():
+            self._set_mark(symbol, price)
+
+        self._process_due_actions(timestamp)
+
         executions: list[OrderExecution] = []
+        for symbol, price in bars.items():
+            if self.pending_orders.has_symbol(symbol):
+                executions.extend(self._process_symbol_price(symbol, price, timestamp))
 
-        # Find pending orders for this symbol that can be filled
+        return executions
+
+    def process_quotes(
+        self,
+        quotes: Mapping[str, Quote],
+        timestamp: datetime | None = None,
+    ) -> list[OrderExecution]:
+        """Process a set of real-time quotes, e.g. from a ``QuoteSubscription``.
+
+        Args:
+            quotes: Latest quote per symbol
+            timestamp: Market data timestamp (defaults to now)
+
+        Returns:
+            List of executions generated, in symbol order of ``quotes``
+        """
+        bars = {symbol: Decimal(str(quote.price)) for symbol, quote in quotes.items()}
+        return self.process_market_data_batch(bars, timestamp)
+
+    def _process_symbol_price(
+        self,
+        symbol: str,
+        price: Decimal,
+        timestamp: datetime,
+    ) -> list[OrderExecution]:
+        """Fill or schedule fills for pending orders of one symbol.
+
+        Args:
+            symbol: Symbol for market data
+            price: Current market price
+            timestamp: Market data timestamp
+
+        Returns:
+            List of executions generated
+        """
+        executions: list[OrderExecution] = []
+
+        # Only orders that can fill at this price, via the per-symbol index
         orders_to_process = [
-            order for order in self.pending_orders.values() if order.symbol == symbol and not order.is_complete()
+            order for order in self.pending_orders.fillable_orders(symbol, price) if not order.is_complete()
         ]
 
         for order in orders_to_process:
@@ -240,18 +402,21 @@ class ExecutionSimulator:
 
         return order
 
-    def get_account_value(self, current_prices: dict[str, Decimal]) -> Decimal:
+    def get_account_value(self, current_prices: Mapping[str, Decimal] | None = None) -> Decimal:
         """Calculate total account value.
 
         Args:
             current_prices: Current market prices for all positions
+                (defaults to the latest processed market data prices)
 
         Returns:
             Total account value (cash + positions)
         """
-        position_value = sum(qty * current_prices.get(symbol, Decimal("0")) for symbol, qty in self.positions.items())
-
-        return self.cash + position_value
+        if current_prices is None:
+            return self.ledger.to_decimal(self.ledger.account_value())
+        to_native = self.ledger.to_native
+        marks = {symbol: to_native(price) for symbol, price in current_prices.items()}
+        return self.ledger.to_decimal(self.ledger.account_value(marks))
 
     def get_order(self, order_id: str) -> Order | None:
         """Get order by ID.
@@ -286,7 +451,7 @@ class ExecutionSimulator:
         Only effective if risk controls are enabled.
         """
         if self.risk_checker:
-            portfolio_value = self.get_account_value({})
+            portfolio_value = self._risk_value(self.ledger.account_value())
             self.risk_checker.reset_daily_tracking(portfolio_value)
 
     def _process_due_actions(self, current_time: datetime) -> None:
@@ -404,39 +569,45 @@ class ExecutionSimulator:
         Returns:
             Order execution record, or None if execution failed
         """
+        ledger = self.ledger
+
         # Apply slippage
-        slippage_multiplier = self.slippage_bps / Decimal("10000")
+        price_native = ledger.to_native(price)
         if order.side == OrderSide.BUY:
-            fill_price = price * (Decimal("1") + slippage_multiplier)
+            fill_price_native = ledger.mul(price_native, self._buy_multiplier)
         else:
-            fill_price = price * (Decimal("1") - slippage_multiplier)
+            fill_price_native = ledger.mul(price_native, self._sell_multiplier)
 
         # Calculate quantity to fill (for now, fill entire order)
         fill_quantity = order.remaining_quantity()
+        fill_quantity_native = ledger.to_native(fill_quantity)
         is_partial = False  # Full fills only for now
 
-        # Calculate commission
-        commission = fill_quantity * self.commission_per_share
+        # Calculate commission and notional
+        commission_native = ledger.mul(fill_quantity_native, self._commission_native)
+        notional_native = ledger.mul(fill_quantity_native, fill_price_native)
 
         # Check if we have enough cash for buy
         if order.side == OrderSide.BUY:
-            required_cash = fill_quantity * fill_price + commission
-            if required_cash > self.cash:
+            required_cash = notional_native + commission_native
+            if required_cash > ledger.cash_native:
                 # Reject order due to insufficient funds
                 order.status = OrderStatus.REJECTED
                 order.rejected_at = timestamp
                 order.rejection_reason = RejectionReason.INSUFFICIENT_FUNDS
-                order.rejection_message = f"Insufficient cash: need {required_cash}, have {self.cash}"
+                order.rejection_message = (
+                    f"Insufficient cash: need {ledger.to_decimal(required_cash)}, have {ledger.cash}"
+                )
                 return None
 
-        # Create execution
+        # Create execution (Decimal reporting boundary)
         execution = OrderExecution(
             execution_id=f"exec-{uuid.uuid4().hex[:16]}",
             order_id=order.order_id,
             timestamp=timestamp,
             quantity=fill_quantity,
-            price=fill_price,
-            commission=commission,
+            price=ledger.to_decimal(fill_price_native),
+            commission=ledger.to_decimal(commission_native),
             is_partial=is_partial,
         )
 
@@ -445,15 +616,62 @@ class ExecutionSimulator:
 
         # Update positions and cash
         if order.side == OrderSide.BUY:
-            self.positions[order.symbol] = self.positions.get(order.symbol, Decimal("0")) + fill_quantity
-            self.cash -= fill_quantity * fill_price + commission
+            ledger.apply_fill(order.symbol, fill_quantity_native, -(notional_native + commission_native))
         else:
-            self.positions[order.symbol] = self.positions.get(order.symbol, Decimal("0")) - fill_quantity
-            self.cash += fill_quantity * fill_price - commission
+            ledger.apply_fill(order.symbol, -fill_quantity_native, notional_native - commission_native)
 
-        # Update risk state
+        # Update risk state, marking the traded symbol at its fill price
         if self.risk_checker:
-            portfolio_value = self.get_account_value({order.symbol: fill_price})
-            self.risk_checker.update_state(portfolio_value)
+            positions, _, cash = ledger.risk_view()
+            self.risk_checker.on_fill(order.symbol, positions[order.symbol], cash)
+            portfolio_value = ledger.account_value_with_mark(order.symbol, fill_price_native)
+            self.risk_checker.update_state(self._risk_value(portfolio_value))
 
         return execution
+
+    def _set_mark(self, symbol: str, price: Decimal) -> None:
+        """Update the mark-to-market price in the ledger and tracked risk state.
+
+        Args:
+            symbol: Trading symbol
+            price: Market price
+        """
+        self.ledger.set_mark(symbol, self.ledger.to_native(price))
+        if self.risk_checker:
+            _, prices, _ = self.ledger.risk_view()
+            self.risk_checker.on_price(symbol, prices[symbol])
+
+    def _track_risk_state(self) -> None:
+        """(Re)start incremental risk tracking from the ledger.
+
+        Every account change goes through the ledger (in DECIMAL mode, edits
+        to ``positions`` via ``_on_position_set``), so checks never re-walk
+        all positions.
+        """
+        if self.risk_checker:
+            self.risk_checker.track_state(*self.ledger.risk_view(), zero=self._risk_value(self.ledger.zero))
+
+    def _on_position_set(self, symbol: str) -> None:
+        """Follow a position edited directly through ``positions`` (DECIMAL mode).
+
+        Args:
+            symbol: Edited symbol
+        """
+        if self.risk_checker:
+            positions, _, cash = self.ledger.risk_view()
+            self.risk_checker.on_fill(symbol, positions.get(symbol, self.ledger.zero), cash)
+
+    def _risk_value(self, value: Any) -> Any:
+        """Convert a native ledger value for the risk checker.
+
+        Risk state is Decimal in DECIMAL mode and float in the fast modes.
+
+        Args:
+            value: Native ledger value
+
+        Returns:
+            Decimal or float value
+        """
+        if self.ledger.numeric_mode == NumericMode.DECIMAL:
+            return value
+        return self.ledger.to_float(value)
@@ -0,0 +1,344 @@
+"""Account ledger with selectable numeric representation.
+
+``ExecutionSimulator`` keeps cash, positions and mark-to-market prices in an
+``AccountLedger``. The default ``NumericMode.DECIMAL`` stores ``Decimal``
+values exactly as before. For high-volume replay, two opt-in modes avoid
+``Decimal`` arithmetic in the hot path:
+
+- ``NumericMode.FLOAT``: float64 state
+- ``NumericMode.FIXED_POINT``: integer micro-units (1e-6), exact for sums;
+  products are rounded to the nearest micro-unit
+
+In the fast modes portfolio value is tracked incrementally per symbol, so
+``account_value`` is O(1) instead of re-summing all positions. ``Decimal`` is
+produced only at reporting boundaries (``cash``/``positions`` accessors,
+execution records, checkpoints).
+
+In DECIMAL mode ``positions()`` is a live, writable view; writes through it
+are reported to ``position_listener`` so state derived from positions (such
+as tracked risk exposure) can follow them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from decimal import Decimal
+from enum import StrEnum
+from types import MappingProxyType
+from typing import Any
+
+MICRO_UNITS = 1_000_000
+_HALF_MICRO = MICRO_UNITS // 2
+
+
+class NumericMode(StrEnum):
+    """Numeric representation for simulator accounting."""
+
+    DECIMAL = "decimal"
+    FLOAT = "float"
+    FIXED_POINT = "fixed_point"
+
+
+def coerce_like(value: Decimal, reference: Any) -> Any:
+    """Convert a Decimal order field to match the type of account values.
+
+    Lets risk and validation arithmetic run on either Decimal or float inputs.
+
+    Args:
+        value: Decimal value (e.g. order quantity or limit price)
+        reference: Value whose type should be matched
+
+    Returns:
+        ``float(value)`` if ``reference`` is a float, otherwise ``value``
+    """
+    return float(value) if isinstance(reference, float) else value
+
+
+class AccountLedger:
+    """Cash, positions and mark-to-market state in one numeric representation.
+
+    Values handled by ``cash_native``, ``positions_native``, ``marks_native``
+    and the arithmetic helpers are in the ledger's native representation
+    (``Decimal``, ``float`` or ``int`` micro-units). Use ``to_native`` and
+    ``to_decimal`` to cross the boundary.
+
+    Example:
+        >>> ledger = AccountLedger(Decimal("100000"), NumericMode.FIXED_POINT)
+        >>> ledger.set_mark("SPY", ledger.to_native(Decimal("450.25")))
+        >>> ledger.apply_fill("SPY", ledger.to_native(Decimal("10")), ledger.to_native(Decimal("-4502.5")))
+        >>> ledger.to_decimal(ledger.account_value())
+        Decimal('100000.000000')
+    """
+
+    def __init__(self, initial_cash: Decimal, numeric_mode: NumericMode = NumericMode.DECIMAL) -> None:
+        """Initialize ledger.
+
+        Args:
+            initial_cash: Starting cash balance
+            numeric_mode: Numeric representation for ledger state
+        """
+        self.numeric_mode = NumericMode(numeric_mode)
+        self.incremental = self.numeric_mode != NumericMode.DECIMAL
+        self.zero: Any = self.to_native(Decimal("0"))
+        self.cash_native: Any = self.to_native(initial_cash)
+        self.positions_native: dict[str, Any] = {}
+        self.marks_native: dict[str, Any] = {}
+        self._market_values: dict[str, Any] = {}
+        self._position_value: Any = self.zero
+
+        # Float views handed to risk checks in FIXED_POINT mode
+        self._positions_float: dict[str, float] = {}
+        self._marks_float: dict[str, float] = {}
+
+        # Called with the symbol after a write through the DECIMAL-mode positions view
+        self.position_listener: Callable[[str], None] | None = None
+        self._live_positions = _LivePositions(self)
+
+    def to_native(self, value: Decimal) -> Any:
+        """Convert a Decimal to the ledger's native representation.
+
+        Args:
+            value: Decimal value
+
+        Returns:
+            Native value
+        """
+        if self.numeric_mode == NumericMode.FLOAT:
+            return float(value)
+        if self.numeric_mode == NumericMode.FIXED_POINT:
+            return int((value * MICRO_UNITS).to_integral_value())
+        return value
+
+    def to_decimal(self, value: Any) -> Decimal:
+        """Convert a native value to Decimal.
+
+        Args:
+            value: Native value
+
+        Returns:
+            Decimal value
+        """
+        if self.numeric_mode == NumericMode.FLOAT:
+            return Decimal(repr(value))
+        if self.numeric_mode == NumericMode.FIXED_POINT:
+            return Decimal(value).scaleb(-6)
+        return value  # type: ignore[no-any-return]
+
+    def to_float(self, value: Any) -> float:
+        """Convert a native value to float.
+
+        Args:
+            value: Native value
+
+        Returns:
+            Float value
+        """
+        if self.numeric_mode == NumericMode.FIXED_POINT:
+            return value / MICRO_UNITS  # type: ignore[no-any-return]
+        return float(value)
+
+    def mul(self, a: Any, b: Any) -> Any:
+        """Multiply two native values (fixed point rounds to nearest micro-unit).
+
+        Args:
+            a: Native value
+            b: Native value
+
+        Returns:
+            Native product
+        """
+        if self.numeric_mode == NumericMode.FIXED_POINT:
+            return (a * b + _HALF_MICRO) // MICRO_UNITS
+        return a * b
+
+    @property
+    def cash(self) -> Decimal:
+        """Cash balance as Decimal."""
+        return self.to_decimal(self.cash_native)
+
+    @cash.setter
+    def cash(self, value: Decimal) -> None:
+        """Set cash balance from Decimal."""
+        self.cash_native = self.to_native(value)
+
+    def positions(self) -> Mapping[str, Decimal]:
+        """Get positions as Decimal.
+
+        In DECIMAL mode this is a live, writable view (see ``set_position``);
+        in the fast modes it is a read-only Decimal snapshot.
+
+        Returns:
+            Positions {symbol: quantity}
+        """
+        if not self.incremental:
+            return self._live_positions
+        return MappingProxyType({symbol: self.to_decimal(qty) for symbol, qty in self.positions_native.items()})
+
+    def marks(self) -> Mapping[str, Decimal]:
+        """Get mark-to-market prices as Decimal.
+
+        In DECIMAL mode this is a read-only live view; in the fast modes it is a
+        read-only Decimal snapshot. Marks change only through ``set_mark``.
+
+        Returns:
+            Prices {symbol: price}
+        """
+        if not self.incremental:
+            return MappingProxyType(self.marks_native)
+        return MappingProxyType({symbol: self.to_decimal(price) for symbol, price in self.marks_native.items()})
+
+    def set_positions(self, positions: Mapping[str, Decimal]) -> None:
+        """Replace all positions.
+
+        Args:
+            positions: Positions {symbol: quantity}
+        """
+        if not self.incremental:
+            self.positions_native = dict(positions)
+            return
+        self.positions_native = {}
+        self._positions_float = {}
+        self._market_values = {}
+        self._position_value = self.zero
+        for symbol, qty in positions.items():
+            self.apply_fill(symbol, self.to_native(qty), self.zero)
+
+    def set_position(self, symbol: str, quantity: Any | None) -> None:
+        """Set (or, with None, remove) one position without changing cash.
+
+        Notifies ``position_listener``.
+
+        Args:
+            symbol: Trading symbol
+            quantity: Native quantity, or None to remove the position
+        """
+        if quantity is None:
+            self.positions_native.pop(symbol, None)
+            self._positions_float.pop(symbol, None)
+            if self.incremental:
+                self._position_value -= self._market_values.pop(symbol, self.zero)
+        else:
+            self.positions_native[symbol] = quantity
+            if self.numeric_mode == NumericMode.FIXED_POINT:
+                self._positions_float[symbol] = quantity / MICRO_UNITS
+            if self.incremental:
+                self._revalue(symbol, quantity, self.marks_native.get(symbol, self.zero))
+        if self.position_listener is not None:
+            self.position_listener(symbol)
+
+    def set_mark(self, symbol: str, price: Any) -> None:
+        """Update the mark-to-market price for a symbol.
+
+        Args:
+            symbol: Trading symbol
+            price: Native price
+        """
+        self.marks_native[symbol] = price
+        if not self.incremental:
+            return
+        if self.numeric_mode == NumericMode.FIXED_POINT:
+            self._marks_float[symbol] = price / MICRO_UNITS
+        qty = self.positions_native.get(symbol)
+        if qty is not None:
+            self._revalue(symbol, qty, price)
+
+    def apply_fill(self, symbol: str, signed_quantity: Any, cash_delta: Any) -> None:
+        """Apply a fill to positions and cash.
+
+        Args:
+            symbol: Trading symbol
+            signed_quantity: Native quantity (positive buys, negative sells)
+            cash_delta: Native change in cash
+        """
+        qty = self.positions_native.get(symbol, self.zero) + signed_quantity
+        self.positions_native[symbol] = qty
+        self.cash_native += cash_delta
+        if not self.incremental:
+            return
+        if self.numeric_mode == NumericMode.FIXED_POINT:
+            self._positions_float[symbol] = qty / MICRO_UNITS
+        self._revalue(symbol, qty, self.marks_native.get(symbol, self.zero))
+
+    def account_value(self, marks: dict[str, Any] | None = None) -> Any:
+        """Get native cash plus marked position value.
+
+        Args:
+            marks: Native prices overriding the maintained marks. Forces a full
+                re-sum; omit to use the maintained (incremental) value.
+
+        Returns:
+            Native account value
+        """
+        if self.incremental and marks is None:
+            return self.cash_native + self._position_value
+        prices = self.marks_native if marks is None else marks
+        position_value = self.zero
+        for symbol, qty in self.positions_native.items():
+            position_value += self.mul(qty, prices.get(symbol, self.zero))
+        return self.cash_native + position_value
+
+    def account_value_with_mark(self, symbol: str, price: Any) -> Any:
+        """Get native account value with one symbol marked at a different price.
+
+        Args:
+            symbol: Trading symbol
+            price: Native price for ``symbol``
+
+        Returns:
+            Native account value
+        """
+        if not self.incremental:
+            marks = dict(self.marks_native)
+            marks[symbol] = price
+            return self.account_value(marks)
+        qty = self.positions_native.get(symbol, self.zero)
+        adjusted = self._position_value - self._market_values.get(symbol, self.zero) + self.mul(qty, price)
+        return self.cash_native + adjusted
+
+    def risk_view(self) -> tuple[dict[str, Any], dict[str, Any], Any]:
+        """Get (positions, prices, cash) for risk checks and validation.
+
+        DECIMAL mode returns Decimal state; the fast modes return float views
+        that are maintained incrementally, so no per-check conversion occurs.
+
+        Returns:
+            Tuple of positions, prices and cash
+        """
+        if self.numeric_mode == NumericMode.FIXED_POINT:
+            return self._positions_float, self._marks_float, self.cash_native / MICRO_UNITS
+        return self.positions_native, self.marks_native, self.cash_native
+
+    def _revalue(self, symbol: str, qty: Any, price: Any) -> None:
+        """Replace a symbol's contribution to the running position value."""
+        value = self.mul(qty, price)
+        self._position_value += value - self._market_values.get(symbol, self.zero)
+        self._market_values[symbol] = value
+
+
+class _LivePositions(MutableMapping[str, Any]):
+    """DECIMAL-mode positions: reads see the ledger, writes go through ``set_position``."""
+
+    __slots__ = ("_ledger",)
+
+    def __init__(self, ledger: AccountLedger) -> None:
+        self._ledger = ledger
+
+    def __getitem__(self, symbol: str) -> Any:
+        return self._ledger.positions_native[symbol]
+
+    def __setitem__(self, symbol: str, quantity: Any) -> None:
+        self._ledger.set_position(symbol, quantity)
+
+    def __delitem__(self, symbol: str) -> None:
+        if symbol not in self._ledger.positions_native:
+            raise KeyError(symbol)
+        self._ledger.set_position(symbol, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ledger.positions_native)
+
+    def __len__(self) -> int:
+        return len(self._ledger.positions_native)
+
+    def __repr__(self) -> str:
+        return repr(self._ledger.positions_native)
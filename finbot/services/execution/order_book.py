@@ -0,0 +1,201 @@
+"""Per-symbol index of pending orders for market data processing."""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import sys
+from collections.abc import Iterator, MutableMapping
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from finbot.core.contracts.models import OrderSide, OrderType
+from finbot.core.contracts.orders import Order
+
+# Limit book entries sort by (price key, sequence, order_id). Buy limits use the
+# negated limit price so both books are ascending and the fillable orders for a
+# given market price are always a prefix.
+_BookKey = tuple[Decimal, int, str]
+_MAX_SEQUENCE = sys.maxsize
+
+
+@dataclass
+class _SymbolBook:
+    """Pending orders for a single symbol."""
+
+    market: dict[str, Order] = field(default_factory=dict)
+    buy_limits: list[_BookKey] = field(default_factory=list)
+    sell_limits: list[_BookKey] = field(default_factory=list)
+    count: int = 0
+
+
+class PendingOrderBook(MutableMapping[str, Order]):
+    """Pending orders keyed by order ID with a per-symbol fill index.
+
+    Behaves like ``dict[str, Order]`` (insertion ordered) while maintaining,
+    for each symbol, the market orders and price-sorted limit books. This lets
+    ``fillable_orders`` return the orders that can fill at a price without
+    scanning every pending order:
+
+    - insert/remove: O(log m) search plus list shift within one symbol's book
+    - ``fillable_orders``: O(log m + k log k) for k fillable orders
+
+    Orders must not change ``symbol``, ``side``, ``order_type`` or
+    ``limit_price`` while they are in the book.
+
+    Example:
+        >>> book = PendingOrderBook()
+        >>> book[order.order_id] = order
+        >>> book.fillable_orders("SPY", Decimal("450"))
+    """
+
+    def __init__(self, orders: dict[str, Order] | None = None) -> None:
+        """Initialize order book.
+
+        Args:
+            orders: Initial orders keyed by order ID
+        """
+        self._orders: dict[str, Order] = {}
+        self._sequence: dict[str, int] = {}
+        self._limit_keys: dict[str, _BookKey] = {}
+        self._books: dict[str, _SymbolBook] = {}
+        self._counter = itertools.count()
+        if orders:
+            self.update(orders)
+
+    def __getitem__(self, order_id: str) -> Order:
+        """Get pending order by ID."""
+        return self._orders[order_id]
+
+    def __setitem__(self, order_id: str, order: Order) -> None:
+        """Add or replace a pending order."""
+        if order_id in self._orders:
+            self._unindex(order_id)
+        self._orders[order_id] = order
+        self._index(order_id, order)
+
+    def __delitem__(self, order_id: str) -> None:
+        """Remove a pending order."""
+        self._unindex(order_id)
+        del self._orders[order_id]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate order IDs in insertion order."""
+        return iter(self._orders)
+
+    def __len__(self) -> int:
+        """Number of pending orders."""
+        return len(self._orders)
+
+    def __contains__(self, order_id: object) -> bool:
+        """Check whether an order ID is pending."""
+        return order_id in self._orders
+
+    def __repr__(self) -> str:
+        """Represent as the underlying order dict."""
+        return f"{type(self).__name__}({self._orders!r})"
+
+    def has_symbol(self, symbol: str) -> bool:
+        """Check whether any pending orders exist for a symbol.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            True if at least one order for the symbol is pending
+        """
+        return symbol in self._books
+
+    def symbols(self) -> list[str]:
+        """Get symbols with pending orders.
+
+        Returns:
+            List of symbols
+        """
+        return list(self._books)
+
+    def orders_for_symbol(self, symbol: str) -> list[Order]:
+        """Get all pending orders for a symbol in insertion order.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Pending orders for the symbol
+        """
+        book = self._books.get(symbol)
+        if book is None:
+            return []
+        order_ids = list(book.market)
+        order_ids.extend(key[2] for key in book.buy_limits)
+        order_ids.extend(key[2] for key in book.sell_limits)
+        return self._in_sequence(order_ids)
+
+    def fillable_orders(self, symbol: str, price: Decimal) -> list[Order]:
+        """Get orders that can fill at a market price, in insertion order.
+
+        Market orders always qualify; buy limits qualify when
+        ``price <= limit_price`` and sell limits when ``price >= limit_price``.
+
+        Args:
+            symbol: Trading symbol
+            price: Current market price
+
+        Returns:
+            Fillable pending orders for the symbol
+        """
+        book = self._books.get(symbol)
+        if book is None:
+            return []
+
+        order_ids = list(book.market)
+        if book.buy_limits:
+            end = bisect.bisect_right(book.buy_limits, (-price, _MAX_SEQUENCE, ""))
+            order_ids.extend(key[2] for key in book.buy_limits[:end])
+        if book.sell_limits:
+            end = bisect.bisect_right(book.sell_limits, (price, _MAX_SEQUENCE, ""))
+            order_ids.extend(key[2] for key in book.sell_limits[:end])
+        return self._in_sequence(order_ids)
+
+    def _in_sequence(self, order_ids: list[str]) -> list[Order]:
+        """Resolve order IDs to orders, sorted by insertion sequence."""
+        order_ids.sort(key=self._sequence.__getitem__)
+        return [self._orders[order_id] for order_id in order_ids]
+
+    def _index(self, order_id: str, order: Order) -> None:
+        """Add order to its symbol book."""
+        sequence = next(self._counter)
+        self._sequence[order_id] = sequence
+        book = self._books.get(order.symbol)
+        if book is None:
+            book = self._books[order.symbol] = _SymbolBook()
+        book.count += 1
+
+        if order.order_type == OrderType.MARKET:
+            book.market[order_id] = order
+        elif order.order_type == OrderType.LIMIT and order.limit_price is not None:
+            if order.side == OrderSide.BUY:
+                key = (-order.limit_price, sequence, order_id)
+                bisect.insort(book.buy_limits, key)
+            else:
+                key = (order.limit_price, sequence, order_id)
+                bisect.insort(book.sell_limits, key)
+            self._limit_keys[order_id] = key
+        # Other order types are tracked but never returned as fillable
+
+    def _unindex(self, order_id: str) -> None:
+        """Remove order from its symbol book."""
+        order = self._orders[order_id]
+        del self._sequence[order_id]
+        book = self._books[order.symbol]
+
+        key = self._limit_keys.pop(order_id, None)
+        if key is not None:
+            limits = book.buy_limits if order.side == OrderSide.BUY else book.sell_limits
+            del limits[bisect.bisect_left(limits, key)]
+        else:
+            book.market.pop(order_id, None)
+
+        book.count -= 1
+        if book.count == 0:
+            del self._books[order.symbol]
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import Any
 
 from finbot.core.contracts.models import OrderSide
 from finbot.core.contracts.orders import Order, RejectionReason
+from finbot.services.execution.ledger import coerce_like
 
 
 @dataclass
@@ -32,6 +35,9 @@ class OrderValidator:
     - Buying power checks
     - Symbol validity
     - Position limits
+
+    Account values may be all Decimal or all float (the simulator's fast
+    numeric modes); order quantities and limit prices are converted to match.
     """
 
     def __init__(
@@ -51,9 +57,9 @@ class OrderValidator:
     def validate(
         self,
         order: Order,
-        account_balance: Decimal,
-        positions: dict[str, Decimal],
-        current_prices: dict[str, Decimal] | None = None,
+        account_balance: Any,
+        positions: Mapping[str, Any],
+        current_prices: Mapping[str, Any] | None = None,
     ) -> ValidationResult:
         """Validate order against account state.
 
@@ -90,7 +96,7 @@ class OrderValidator:
 
         # Check buying power for buy orders
         if order.side == OrderSide.BUY:
-            required_cash = self._calculate_required_cash(order, current_prices)
+            required_cash = self._calculate_required_cash(order, current_prices, account_balance)
             if required_cash is not None and required_cash > account_balance:
                 return ValidationResult(
                     is_valid=False,
@@ -100,8 +106,8 @@ class OrderValidator:
 
         # Check sell orders against positions
         if order.side == OrderSide.SELL:
-            current_position = positions.get(order.symbol, Decimal("0"))
-            if current_position < order.quantity:
+            current_position = positions.get(order.symbol, 0)
+            if current_position < coerce_like(order.quantity, account_balance):
                 return ValidationResult(
                     is_valid=False,
                     rejection_reason=RejectionReason.INVALID_QUANTITY,
@@ -114,24 +120,28 @@ class OrderValidator:
     def _calculate_required_cash(
         self,
         order: Order,
-        current_prices: dict[str, Decimal] | None,
-    ) -> Decimal | None:
+        current_prices: Mapping[str, Any] | None,
+        account_balance: Any = None,
+    ) -> Any:
         """Calculate required cash for order.
 
         Args:
             order: Order to calculate for
             current_prices: Current market prices
+            account_balance: Cash balance, used to match Decimal/float arithmetic
 
         Returns:
             Required cash amount, or None if cannot calculate
         """
+        quantity = coerce_like(order.quantity, account_balance)
+
         # For limit orders, use limit price
         if order.limit_price is not None:
-            return order.quantity * order.limit_price
+            return quantity * coerce_like(order.limit_price, account_balance)
 
         # For market orders, use current price if available
         if current_prices and order.symbol in current_prices:
-            return order.quantity * current_prices[order.symbol]
+            return quantity * current_prices[order.symbol]
 
         # Cannot calculate without price information
         return None
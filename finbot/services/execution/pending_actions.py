@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 from dataclasses import dataclass
 from datetime import datetime
 from enum import StrEnum
@@ -33,34 +35,56 @@ class PendingAction:
     data: dict[str, Any]
 
 
+# Heap entries are mutable lists ``[scheduled_time, sequence, action]`` so that a
+# cancelled entry can be tombstoned in place (action set to None) without
+# re-heapifying. The sequence number breaks ties between actions scheduled for
+# the same time, preserving FIFO order and keeping PendingAction out of the
+# comparison.
+_HeapEntry = list[Any]
+
+
 class PendingActionQueue:
     """Queue for time-based action processing.
 
-    Maintains actions in sorted order by scheduled_time for efficient
-    processing of due actions.
+    Backed by a binary heap keyed on ``(scheduled_time, sequence)`` with lazy
+    deletion and an ``order_id`` index:
+
+    - ``add_action``: O(log n)
+    - ``get_due_actions``: O(k log n) for k due actions
+    - ``cancel_order_actions`` / ``get_pending_for_order``: O(k) for the
+      k actions belonging to one order
+
+    Actions scheduled for the same time are returned in insertion order.
     """
 
+    # Rebuild the heap once tombstones outnumber live entries by this factor
+    _COMPACTION_RATIO = 2
+
     def __init__(self) -> None:
         """Initialize empty action queue."""
-        self.actions: list[PendingAction] = []
+        self._heap: list[_HeapEntry] = []
+        self._by_order: dict[str, list[_HeapEntry]] = {}
+        self._counter = itertools.count()
+        self._live_count = 0
+
+    @property
+    def actions(self) -> list[PendingAction]:
+        """Live actions in processing order (snapshot, O(n log n)).
+
+        Intended for inspection and tests; use ``get_due_actions`` to drain.
+        """
+        return [entry[2] for entry in sorted(self._heap) if entry[2] is not None]
 
     def add_action(self, action: PendingAction) -> None:
-        """Add action to queue, maintaining sorted order.
+        """Add action to queue.
 
         Args:
             action: Pending action to add
         """
-        # Insert in sorted order by scheduled_time
-        # Binary search for insertion point
-        left, right = 0, len(self.actions)
-        while left < right:
-            mid = (left + right) // 2
-            if self.actions[mid].scheduled_time <= action.scheduled_time:
-                left = mid + 1
-            else:
-                right = mid
-
-        self.actions.insert(left, action)
+        entry: _HeapEntry = [action.scheduled_time, next(self._counter), action]
+        heapq.heappush(self._heap, entry)
+        self._by_order.setdefault(action.order_id, []).append(entry)
+        self._live_count += 1
 
     def get_due_actions(self, current_time: datetime) -> list[PendingAction]:
         """Get and remove all actions due by current time.
@@ -69,13 +93,19 @@ class PendingActionQueue:
             current_time: Current simulation time
 
         Returns:
-            List of actions with scheduled_time <= current_time
+            List of actions with scheduled_time <= current_time, in scheduled order
         """
         due_actions: list[PendingAction] = []
+        heap = self._heap
 
-        # Actions are sorted, so we can stop at first future action
-        while self.actions and self.actions[0].scheduled_time <= current_time:
-            due_actions.append(self.actions.pop(0))
+        while heap and heap[0][0] <= current_time:
+            entry = heapq.heappop(heap)
+            action = entry[2]
+            if action is None:
+                continue
+            self._unindex(action.order_id, entry)
+            self._live_count -= 1
+            due_actions.append(action)
 
         return due_actions
 
@@ -88,9 +118,15 @@ class PendingActionQueue:
         Returns:
             Number of actions cancelled
         """
-        original_count = len(self.actions)
-        self.actions = [action for action in self.actions if action.order_id != order_id]
-        return original_count - len(self.actions)
+        entries = self._by_order.pop(order_id, None)
+        if not entries:
+            return 0
+
+        for entry in entries:
+            entry[2] = None
+        self._live_count -= len(entries)
+        self._maybe_compact()
+        return len(entries)
 
     def get_pending_count(self) -> int:
         """Get number of pending actions.
@@ -98,7 +134,7 @@ class PendingActionQueue:
         Returns:
             Number of actions in queue
         """
-        return len(self.actions)
+        return self._live_count
 
     def get_pending_for_order(self, order_id: str) -> list[PendingAction]:
         """Get all pending actions for an order without removing them.
@@ -107,10 +143,26 @@ class PendingActionQueue:
             order_id: Order ID to query
 
         Returns:
-            List of pending actions for this order
+            List of pending actions for this order, in scheduled order
         """
-        return [action for action in self.actions if action.order_id == order_id]
+        entries = self._by_order.get(order_id, [])
+        return [entry[2] for entry in sorted(entries, key=lambda e: (e[0], e[1]))]
 
     def clear(self) -> None:
         """Remove all pending actions."""
-        self.actions.clear()
+        self._heap.clear()
+        self._by_order.clear()
+        self._live_count = 0
+
+    def _unindex(self, order_id: str, entry: _HeapEntry) -> None:
+        """Drop a popped entry from the order index."""
+        entries = self._by_order[order_id]
+        entries.remove(entry)
+        if not entries:
+            del self._by_order[order_id]
+
+    def _maybe_compact(self) -> None:
+        """Drop tombstones once they dominate the heap."""
+        if len(self._heap) > self._COMPACTION_RATIO * max(self._live_count, 1):
+            self._heap = [entry for entry in self._heap if entry[2] is not None]
+            heapq.heapify(self._heap)
@@ -2,11 +2,80 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
 from decimal import Decimal
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
 
 from finbot.core.contracts.models import OrderSide
 from finbot.core.contracts.orders import Order, RejectionReason
 from finbot.core.contracts.risk import RiskConfig, RiskRuleType, RiskViolation
+from finbot.services.execution.ledger import coerce_like
+
+
+@dataclass
+class RiskBatchResult:
+    """Result of checking a basket of orders.
+
+    Attributes:
+        accepted: Boolean mask, True where the order passed all risk rules
+        rejections: Per-order ``(rejection_reason, message)``, None if accepted
+    """
+
+    accepted: npt.NDArray[np.bool_]
+    rejections: list[tuple[RejectionReason, str] | None] = field(default_factory=list)
+
+    @property
+    def rejected(self) -> npt.NDArray[np.bool_]:
+        """Boolean mask, True where the order was rejected."""
+        return ~self.accepted
+
+
+class _ExposureState:
+    """Positions, prices and cash with running per-symbol notional and exposure.
+
+    ``notional[symbol]`` is the signed ``quantity * price``; ``gross`` and
+    ``net`` are the sums of its absolute and signed values, and portfolio value
+    is ``cash + net``. Position and price updates adjust one symbol in O(1).
+    """
+
+    __slots__ = ("cash", "gross", "net", "notional", "positions", "prices", "zero")
+
+    def __init__(self, positions: Mapping[str, Any], prices: Mapping[str, Any], cash: Any, zero: Any) -> None:
+        self.positions: dict[str, Any] = dict(positions)
+        self.prices: dict[str, Any] = dict(prices)
+        self.cash = cash
+        self.zero = zero
+        self.notional: dict[str, Any] = {}
+        self.gross: Any = self.zero
+        self.net: Any = self.zero
+        for symbol, qty in self.positions.items():
+            self._revalue(symbol, qty, self.prices.get(symbol, self.zero))
+
+    @property
+    def portfolio_value(self) -> Any:
+        return self.cash + self.net
+
+    def set_price(self, symbol: str, price: Any) -> None:
+        self.prices[symbol] = price
+        qty = self.positions.get(symbol)
+        if qty is not None:
+            self._revalue(symbol, qty, price)
+
+    def set_position(self, symbol: str, quantity: Any, cash: Any) -> None:
+        self.positions[symbol] = quantity
+        self.cash = cash
+        self._revalue(symbol, quantity, self.prices.get(symbol, self.zero))
+
+    def _revalue(self, symbol: str, qty: Any, price: Any) -> None:
+        old = self.notional.get(symbol, self.zero)
+        new = qty * price
+        self.notional[symbol] = new
+        self.gross += abs(new) - abs(old)
+        self.net += new - old
 
 
 class RiskChecker:
@@ -17,6 +86,15 @@ class RiskChecker:
     - Portfolio exposure limits (gross and net)
     - Drawdown protection (daily and total from peak)
     - Kill-switch (emergency trading halt)
+    - Batch checks of order baskets (``check_orders``)
+
+    Account values may be all Decimal or all float (the simulator's fast
+    numeric modes); order quantities are converted to match.
+
+    Account state is either passed explicitly to each check, or tracked by the
+    checker: after ``track_state``, ``on_fill`` and ``on_price`` keep running
+    per-symbol notional and gross/net exposure, so checks called without
+    account state cost O(1) per order instead of re-walking all positions.
 
     Example:
         >>> from finbot.core.contracts.risk import RiskConfig, PositionLimitRule
@@ -34,19 +112,118 @@ class RiskChecker:
             risk_config: Risk control configuration
         """
         self.risk_config = risk_config
-        self.peak_value: Decimal = Decimal("0")
-        self.daily_start_value: Decimal = Decimal("0")
+        self.peak_value: Any = Decimal("0")
+        self.daily_start_value: Any = Decimal("0")
         self.trading_enabled = risk_config.trading_enabled
+        self._tracked: _ExposureState | None = None
+
+    @property
+    def is_tracking(self) -> bool:
+        """Whether account state is tracked incrementally (see ``track_state``)."""
+        return self._tracked is not None
+
+    @property
+    def gross_exposure(self) -> Any:
+        """Tracked gross exposure (sum of absolute position notionals).
+
+        Raises:
+            ValueError: If account state is not tracked
+        """
+        return self._require_tracked().gross
+
+    @property
+    def net_exposure(self) -> Any:
+        """Tracked net exposure (sum of signed position notionals).
+
+        Raises:
+            ValueError: If account state is not tracked
+        """
+        return self._require_tracked().net
+
+    @property
+    def portfolio_value(self) -> Any:
+        """Tracked portfolio value (cash plus net exposure).
+
+        Raises:
+            ValueError: If account state is not tracked
+        """
+        return self._require_tracked().portfolio_value
+
+    def symbol_notional(self, symbol: str) -> Any:
+        """Get the tracked signed notional (quantity * price) for a symbol.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Signed notional (zero if no position)
+
+        Raises:
+            ValueError: If account state is not tracked
+        """
+        tracked = self._require_tracked()
+        return tracked.notional.get(symbol, tracked.zero)
+
+    def track_state(
+        self,
+        positions: Mapping[str, Any],
+        prices: Mapping[str, Any],
+        cash: Any,
+        zero: Any = None,
+    ) -> None:
+        """Start (or restart) incremental tracking from a full account state.
+
+        Args:
+            positions: Current positions {symbol: quantity}
+            prices: Current market prices {symbol: price}
+            cash: Current cash balance
+            zero: Zero in the account values' numeric type; defaults to
+                ``Decimal("0")`` coerced like ``cash``
+        """
+        if zero is None:
+            zero = coerce_like(Decimal("0"), cash)
+        self._tracked = _ExposureState(positions, prices, cash, zero)
+
+    def on_fill(self, symbol: str, quantity: Any, cash: Any) -> None:
+        """Update tracked state after a fill.
+
+        Args:
+            symbol: Traded symbol
+            quantity: Position in ``symbol`` after the fill
+            cash: Cash balance after the fill
+
+        Raises:
+            ValueError: If account state is not tracked
+        """
+        self._require_tracked().set_position(symbol, quantity, cash)
+
+    def on_price(self, symbol: str, price: Any) -> None:
+        """Update tracked state after a price change, raising the peak value on a new high.
+
+        Args:
+            symbol: Trading symbol
+            price: New market price
+
+        Raises:
+            ValueError: If account state is not tracked
+        """
+        tracked = self._require_tracked()
+        tracked.set_price(symbol, price)
+        portfolio_value = tracked.portfolio_value
+        if portfolio_value > self.peak_value:
+            self.peak_value = portfolio_value
 
     def check_order(
         self,
         order: Order,
-        current_positions: dict[str, Decimal],
-        current_prices: dict[str, Decimal],
-        cash: Decimal,
+        current_positions: Mapping[str, Any] | None = None,
+        current_prices: Mapping[str, Any] | None = None,
+        cash: Any = None,
     ) -> tuple[RejectionReason, str] | None:
         """Check order against all risk rules.
 
+        Omit the account state to check against the tracked state.
+
         Args:
             order: Order to check
             current_positions: Current positions {symbol: quantity}
@@ -55,38 +232,75 @@ class RiskChecker:
 
         Returns:
             (rejection_reason, message) if violated, None if passed
+
+        Raises:
+            ValueError: If account state is omitted and not tracked
         """
-        # 1. Check kill-switch
-        if not self.trading_enabled:
-            return (
-                RejectionReason.RISK_TRADING_DISABLED,
-                "Trading is disabled (kill-switch active)",
-            )
+        state = self._resolve_state(current_positions, current_prices, cash)
+        held = state.positions.get(order.symbol, state.zero)
+        return self._check(order, state, held, state.gross, state.net)
 
-        # 2. Check position limits
-        if self.risk_config.position_limit:
-            violation = self._check_position_limits(order, current_positions, current_prices)
-            if violation:
-                return (RejectionReason.RISK_POSITION_LIMIT, violation.message)
+    def check_orders(
+        self,
+        orders: Sequence[Order],
+        current_positions: Mapping[str, Any] | None = None,
+        current_prices: Mapping[str, Any] | None = None,
+        cash: Any = None,
+    ) -> RiskBatchResult:
+        """Check a basket of orders together.
+
+        Orders are evaluated in sequence, each assuming the accepted orders
+        before it have filled at current prices. Position and exposure limits
+        therefore apply to the basket as a whole: put sells first in a
+        rebalance so the exposure they release is available to the buys.
+        Account state is walked once for the whole basket (not at all when
+        omitted, in which case the tracked state is used).
 
-        # 3. Check exposure limits
-        if self.risk_config.exposure_limit:
-            violation = self._check_exposure_limits(order, current_positions, current_prices, cash)
-            if violation:
-                return (RejectionReason.RISK_EXPOSURE_LIMIT, violation.message)
+        Args:
+            orders: Orders to check
+            current_positions: Current positions {symbol: quantity}
+            current_prices: Current market prices {symbol: price}
+            cash: Current cash balance
 
-        # 4. Check drawdown limits
-        if self.risk_config.drawdown_limit:
-            portfolio_value = self._calculate_portfolio_value(current_positions, current_prices, cash)
-            violation = self._check_drawdown_limits(portfolio_value)
-            if violation:
-                return (RejectionReason.RISK_DRAWDOWN_LIMIT, violation.message)
+        Returns:
+            RiskBatchResult with the accept mask and per-order rejections
 
-        return None
+        Raises:
+            ValueError: If account state is omitted and not tracked
+        """
+        state = self._resolve_state(current_positions, current_prices, cash)
+        accepted = np.zeros(len(orders), dtype=bool)
+        rejections: list[tuple[RejectionReason, str] | None] = []
+
+        # Hypothetical holdings and exposure after the accepted orders so far
+        held: dict[str, Any] = {}
+        gross, net = state.gross, state.net
+
+        for i, order in enumerate(orders):
+            symbol = order.symbol
+            current = held.get(symbol)
+            if current is None:
+                current = state.positions.get(symbol, state.zero)
+
+            rejection = self._check(order, state, current, gross, net)
+            rejections.append(rejection)
+            if rejection is not None:
+                continue
+
+            accepted[i] = True
+            quantity = coerce_like(order.quantity, state.cash)
+            signed = quantity if order.side == OrderSide.BUY else -quantity
+            price = state.prices.get(symbol, state.zero)
+            old, new = current * price, (current + signed) * price
+            gross += abs(new) - abs(old)
+            net += new - old
+            held[symbol] = current + signed
+
+        return RiskBatchResult(accepted=accepted, rejections=rejections)
 
     def update_state(
         self,
-        portfolio_value: Decimal,
+        portfolio_value: Any,
         is_new_day: bool = False,
     ) -> None:
         """Update risk state after trades.
@@ -111,7 +325,7 @@ class RiskChecker:
         """Disable trading (activate kill-switch)."""
         self.trading_enabled = False
 
-    def reset_daily_tracking(self, current_value: Decimal) -> None:
+    def reset_daily_tracking(self, current_value: Any) -> None:
         """Reset daily drawdown tracking.
 
         Args:
@@ -119,18 +333,69 @@ class RiskChecker:
         """
         self.daily_start_value = current_value
 
+    def _check(
+        self,
+        order: Order,
+        state: _ExposureState,
+        held: Any,
+        gross: Any,
+        net: Any,
+    ) -> tuple[RejectionReason, str] | None:
+        """Check one order given the holding in its symbol and portfolio exposure.
+
+        Args:
+            order: Order to check
+            state: Account state (prices, cash and portfolio value)
+            held: Current position in ``order.symbol``
+            gross: Current gross exposure
+            net: Current net exposure
+
+        Returns:
+            (rejection_reason, message) if violated, None if passed
+        """
+        # 1. Check kill-switch
+        if not self.trading_enabled:
+            return (
+                RejectionReason.RISK_TRADING_DISABLED,
+                "Trading is disabled (kill-switch active)",
+            )
+
+        quantity = coerce_like(order.quantity, state.cash)
+
+        # 2. Check position limits
+        if self.risk_config.position_limit:
+            violation = self._check_position_limits(order, quantity, held, state.prices.get(order.symbol))
+            if violation:
+                return (RejectionReason.RISK_POSITION_LIMIT, violation.message)
+
+        # 3. Check exposure limits
+        if self.risk_config.exposure_limit:
+            violation = self._check_exposure_limits(order, quantity, state, held, gross, net)
+            if violation:
+                return (RejectionReason.RISK_EXPOSURE_LIMIT, violation.message)
+
+        # 4. Check drawdown limits
+        if self.risk_config.drawdown_limit:
+            violation = self._check_drawdown_limits(state.portfolio_value)
+            if violation:
+                return (RejectionReason.RISK_DRAWDOWN_LIMIT, violation.message)
+
+        return None
+
     def _check_position_limits(
         self,
         order: Order,
-        current_positions: dict[str, Decimal],
-        current_prices: dict[str, Decimal],
+        quantity: Any,
+        held: Any,
+        price: Any,
     ) -> RiskViolation | None:
         """Check position size limits.
 
         Args:
             order: Order to check
-            current_positions: Current positions
-            current_prices: Current prices
+            quantity: Order quantity, matching the type of account values
+            held: Current position in ``order.symbol``
+            price: Current price of ``order.symbol`` (None if unknown)
 
         Returns:
             RiskViolation if limit exceeded, None otherwise
@@ -144,8 +409,7 @@ class RiskChecker:
             return None
 
         # Calculate new position after order
-        current_pos = current_positions.get(order.symbol, Decimal("0"))
-        new_pos = current_pos + order.quantity
+        new_pos = held + quantity
 
         # Check shares limit
         if rule.max_shares is not None and new_pos > rule.max_shares:
@@ -157,34 +421,39 @@ class RiskChecker:
             )
 
         # Check value limit
-        if rule.max_value is not None:
-            price = current_prices.get(order.symbol)
-            if price is not None:
-                new_value = new_pos * price
-                if new_value > rule.max_value:
-                    return RiskViolation(
-                        rule_type=RiskRuleType.POSITION_LIMIT,
-                        message=f"Position value would exceed limit: {new_value} > {rule.max_value}",
-                        current_value=new_value,
-                        limit_value=rule.max_value,
-                    )
+        if rule.max_value is not None and price is not None:
+            new_value = new_pos * price
+            if new_value > rule.max_value:
+                return RiskViolation(
+                    rule_type=RiskRuleType.POSITION_LIMIT,
+                    message=f"Position value would exceed limit: {new_value} > {rule.max_value}",
+                    current_value=new_value,
+                    limit_value=rule.max_value,
+                )
 
         return None
 
     def _check_exposure_limits(
         self,
         order: Order,
-        current_positions: dict[str, Decimal],
-        current_prices: dict[str, Decimal],
-        cash: Decimal,
+        quantity: Any,
+        state: _ExposureState,
+        held: Any,
+        gross: Any,
+        net: Any,
     ) -> RiskViolation | None:
         """Check portfolio exposure limits.
 
+        Only the order's symbol changes, so the new exposure is the current
+        exposure with that symbol's notional replaced.
+
         Args:
             order: Order to check
-            current_positions: Current positions
-            current_prices: Current prices
-            cash: Current cash
+            quantity: Order quantity, matching the type of account values
+            state: Account state (prices and portfolio value)
+            held: Current position in ``order.symbol``
+            gross: Current gross exposure
+            net: Current net exposure
 
         Returns:
             RiskViolation if limit exceeded, None otherwise
@@ -193,33 +462,20 @@ class RiskChecker:
         if not rule:
             return None
 
-        # Calculate current portfolio value
-        portfolio_value = self._calculate_portfolio_value(current_positions, current_prices, cash)
+        portfolio_value = state.portfolio_value
         if portfolio_value == 0:
             return None
 
-        # Simulate new positions after order
-        new_positions = current_positions.copy()
-        if order.side == OrderSide.BUY:
-            new_positions[order.symbol] = new_positions.get(order.symbol, Decimal("0")) + order.quantity
-        else:
-            new_positions[order.symbol] = new_positions.get(order.symbol, Decimal("0")) - order.quantity
-
-        # Calculate new exposure
-        gross_exposure = Decimal("0")
-        net_exposure = Decimal("0")
-
-        for symbol, qty in new_positions.items():
-            if qty == 0:
-                continue
-            price = current_prices.get(symbol, Decimal("0"))
-            position_value = abs(qty) * price
-            gross_exposure += position_value
-            net_exposure += qty * price  # Signed for net
+        # Exposure after the order, marked at the current price
+        signed = quantity if order.side == OrderSide.BUY else -quantity
+        price = state.prices.get(order.symbol, state.zero)
+        old, new = held * price, (held + signed) * price
+        gross_exposure = gross - abs(old) + abs(new)
+        net_exposure = net - old + new
 
         # Convert to percentages
-        gross_exposure_pct = (gross_exposure / portfolio_value) * Decimal("100")
-        net_exposure_pct = (abs(net_exposure) / portfolio_value) * Decimal("100")
+        gross_exposure_pct = (gross_exposure / portfolio_value) * 100
+        net_exposure_pct = (abs(net_exposure) / portfolio_value) * 100
 
         # Check limits
         if gross_exposure_pct > rule.max_gross_exposure_pct:
@@ -242,7 +498,7 @@ class RiskChecker:
 
     def _check_drawdown_limits(
         self,
-        portfolio_value: Decimal,
+        portfolio_value: Any,
     ) -> RiskViolation | None:
         """Check drawdown protection limits.
 
@@ -258,7 +514,7 @@ class RiskChecker:
 
         # Check daily drawdown
         if rule.max_daily_drawdown_pct is not None and self.daily_start_value > 0:
-            daily_return_pct = ((portfolio_value - self.daily_start_value) / self.daily_start_value) * Decimal("100")
+            daily_return_pct = ((portfolio_value - self.daily_start_value) / self.daily_start_value) * 100
             if daily_return_pct < -rule.max_daily_drawdown_pct:
                 return RiskViolation(
                     rule_type=RiskRuleType.DRAWDOWN_LIMIT,
@@ -269,7 +525,7 @@ class RiskChecker:
 
         # Check total drawdown from peak
         if rule.max_total_drawdown_pct is not None and self.peak_value > 0:
-            drawdown_pct = ((self.peak_value - portfolio_value) / self.peak_value) * Decimal("100")
+            drawdown_pct = ((self.peak_value - portfolio_value) / self.peak_value) * 100
             if drawdown_pct > rule.max_total_drawdown_pct:
                 return RiskViolation(
                     rule_type=RiskRuleType.DRAWDOWN_LIMIT,
@@ -280,22 +536,31 @@ class RiskChecker:
 
         return None
 
-    def _calculate_portfolio_value(
+    def _resolve_state(
         self,
-        positions: dict[str, Decimal],
-        prices: dict[str, Decimal],
-        cash: Decimal,
-    ) -> Decimal:
-        """Calculate total portfolio value.
-
-        Args:
-            positions: Current positions
-            prices: Current prices
-            cash: Cash balance
-
-        Returns:
-            Total portfolio value
+        positions: Mapping[str, Any] | None,
+        prices: Mapping[str, Any] | None,
+        cash: Any,
+    ) -> _ExposureState:
+        """Get the account state for a check: explicit if given, else tracked.
+
+        Raises:
+            ValueError: If account state is omitted and not tracked
         """
-        position_value = sum(qty * prices.get(symbol, Decimal("0")) for symbol, qty in positions.items())
-
-        return cash + position_value
+        if positions is None and prices is None and cash is None:
+            return self._require_tracked()
+        if positions is None or prices is None or cash is None:
+            msg = "current_positions, current_prices and cash must be given together"
+            raise ValueError(msg)
+        return _ExposureState(positions, prices, cash, coerce_like(Decimal("0"), cash))
+
+    def _require_tracked(self) -> _ExposureState:
+        """Get the tracked account state.
+
+        Raises:
+            ValueError: If account state is not tracked
+        """
+        if self._tracked is None:
+            msg = "Account state is not tracked; call track_state() or pass positions, prices and cash"
+            raise ValueError(msg)
+        return self._tracked
@@ -7,8 +7,11 @@ arrays or DataFrames and are engine-agnostic.
 
 from finbot.services.factor_analytics.factor_attribution import compute_factor_attribution
 from finbot.services.factor_analytics.factor_regression import (
+    FactorRegressionBatch,
     compute_factor_regression,
     compute_rolling_r_squared,
+    factor_regression_batch,
+    rolling_factor_regression,
 )
 from finbot.services.factor_analytics.factor_risk import compute_factor_risk
 from finbot.services.factor_analytics.viz import (
@@ -20,13 +23,16 @@ from finbot.services.factor_analytics.viz import (
 )
 
 __all__ = [
+    "FactorRegressionBatch",
     "compute_factor_attribution",
     "compute_factor_regression",
     "compute_factor_risk",
     "compute_rolling_r_squared",
+    "factor_regression_batch",
     "plot_factor_attribution",
     "plot_factor_correlation",
     "plot_factor_loadings",
     "plot_factor_risk_decomposition",
     "plot_rolling_r_squared",
+    "rolling_factor_regression",
 ]
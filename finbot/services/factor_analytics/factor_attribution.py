@@ -60,7 +60,9 @@ def compute_factor_attribution(
     Args:
         portfolio_returns: 1-D array of portfolio period returns.
         factor_returns: DataFrame with one column per factor.
-        regression_result: Pre-computed regression result.  If ``None``,
+        regression_result: Pre-computed regression result, e.g. one fit of
+            a batched or rolling regression via
+            ``FactorRegressionBatch.to_result``.  If ``None``,
             ``compute_factor_regression`` is called internally.
         annualization_factor: Trading periods per year.  Defaults to 252.
 
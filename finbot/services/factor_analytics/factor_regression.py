@@ -3,15 +3,23 @@
 Runs OLS regression of portfolio excess returns on a set of factor
 returns (e.g. Mkt-RF, SMB, HML, RMW, CMA) and reports loadings, alpha,
 R-squared, t-statistics, and p-values.
+
+``factor_regression_batch`` regresses many return series on the same
+factor matrix with a single SVD of the design, and
+``rolling_factor_regression`` fits every trailing window from cumulative
+``X'X`` / ``X'y`` sums (O(1) per window).  In both cases the decomposition
+that yields the coefficients also provides ``(X'X)^-1`` for the standard
+errors.  ``compute_factor_regression`` and ``compute_rolling_r_squared`` are
+thin wrappers over these kernels.
 """
 
 from __future__ import annotations
 
-import math
+from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
-from scipy import stats
+from scipy.special import stdtr
 
 from finbot.core.contracts.factor_analytics import (
     FactorModelType,
@@ -25,6 +33,113 @@ _DEFAULT_ANNUALIZATION = 252
 _FF3_FACTORS = {"Mkt-RF", "SMB", "HML"}
 _FF5_FACTORS = _FF3_FACTORS | {"RMW", "CMA"}
 
+# Rolling fits process series in chunks whose X'y sums hold at most this many floats
+_CHUNK_ELEMENTS = 1 << 22
+
+# Window sums of squares below this fraction of the window's sum of squares
+# are cumulative-sum rounding noise and are treated as zero.
+_SUM_SQUARES_RTOL = 1e-10
+
+# Standard errors are floored at this value when forming t-statistics
+_MIN_STANDARD_ERROR = 1e-12
+
+
+@dataclass(frozen=True, slots=True)
+class FactorRegressionBatch:
+    """OLS fits of one or more return series on a shared factor matrix.
+
+    Full-sample fits (``factor_regression_batch``) hold one row per series:
+    ``(n_series,)`` arrays.  Rolling fits (``rolling_factor_regression``) add
+    a leading ``n_obs`` axis whose first ``window - 1`` rows are NaN.
+    Coefficient arrays end in an axis over ``("alpha", *factor_names)``.
+
+    Attributes:
+        factor_names: Ordered factor names matching the regression columns.
+        alpha: Annualized intercepts.
+        loadings: Factor betas; last axis ordered as ``factor_names``.
+        standard_errors: Per-period standard errors of the intercept and
+            each loading.
+        r_squared: Coefficient of determination in [0, 1].
+        adj_r_squared: Adjusted R-squared.
+        residual_std: Standard deviation of the regression residuals.
+        n_observations: Observations per fit (``window`` for rolling fits).
+        annualization_factor: Trading periods per year used for alpha scaling.
+        window: Rolling window size, or ``None`` for full-sample fits.
+    """
+
+    factor_names: tuple[str, ...]
+    alpha: np.ndarray
+    loadings: np.ndarray
+    standard_errors: np.ndarray
+    r_squared: np.ndarray
+    adj_r_squared: np.ndarray
+    residual_std: np.ndarray
+    n_observations: int
+    annualization_factor: int
+    window: int | None = None
+
+    @property
+    def t_stats(self) -> np.ndarray:
+        """T-statistics of the intercept and each loading."""
+        return _t_statistics(self.alpha / self.annualization_factor, self.loadings, self.standard_errors)
+
+    @property
+    def p_values(self) -> np.ndarray:
+        """Two-sided p-values matching ``t_stats``."""
+        return _p_values(self.t_stats, self.n_observations - len(self.factor_names) - 1)
+
+    def to_result(
+        self,
+        series: int = 0,
+        index: int = -1,
+        model_type: FactorModelType | None = None,
+    ) -> FactorRegressionResult:
+        """Extract one fit as a ``FactorRegressionResult``.
+
+        The result can be passed to ``compute_factor_attribution`` and
+        ``compute_factor_risk`` as ``regression_result``.
+
+        Args:
+            series: Column of the regressed returns.
+            index: Row of a rolling fit (ignored for full-sample fits).
+                Defaults to the last window.
+            model_type: Override for model type.  If ``None``, inferred from
+                the factor names.
+
+        Returns:
+            ``FactorRegressionResult`` for the selected fit.
+        """
+        row = (index, series) if self.window is not None else (series,)
+        t_values = _t_statistics(
+            self.alpha[row] / self.annualization_factor, self.loadings[row], self.standard_errors[row]
+        )
+        p_vals = _p_values(t_values, self.n_observations - len(self.factor_names) - 1)
+        labels = ("alpha", *self.factor_names)
+        return FactorRegressionResult(
+            loadings=dict(zip(self.factor_names, self.loadings[row].tolist(), strict=True)),
+            alpha=float(self.alpha[row]),
+            r_squared=float(self.r_squared[row]),
+            adj_r_squared=float(self.adj_r_squared[row]),
+            residual_std=float(self.residual_std[row]),
+            t_stats=dict(zip(labels, t_values.tolist(), strict=True)),
+            p_values=dict(zip(labels, p_vals.tolist(), strict=True)),
+            factor_names=self.factor_names,
+            model_type=model_type if model_type is not None else _infer_model_type(self.factor_names),
+            n_observations=self.n_observations,
+            annualization_factor=self.annualization_factor,
+        )
+
+
+def _t_statistics(intercept: np.ndarray, loadings: np.ndarray, standard_errors: np.ndarray) -> np.ndarray:
+    """Coefficients over standard errors, with the intercept first."""
+    coefficients = np.concatenate([np.asarray(intercept)[..., np.newaxis], loadings], axis=-1)
+    return coefficients / np.where(standard_errors > 0, standard_errors, _MIN_STANDARD_ERROR)
+
+
+def _p_values(t_stats: np.ndarray, dof: int) -> np.ndarray:
+    """Two-sided Student-t p-values."""
+    return 2.0 * stdtr(max(dof, 1), -np.abs(t_stats))
+
 
 def _validate_inputs(
     portfolio_returns: np.ndarray,
@@ -36,6 +151,17 @@ def _validate_inputs(
         raise ValueError(
             f"portfolio_returns must have at least {_MIN_OBSERVATIONS} observations, got {len(portfolio_returns)}"
         )
+    _validate_alignment(portfolio_returns, factor_returns, annualization_factor)
+
+
+def _validate_alignment(
+    portfolio_returns: np.ndarray,
+    factor_returns: pd.DataFrame,
+    annualization_factor: int,
+) -> None:
+    """Raise ValueError on misaligned, non-finite, or non-numeric inputs."""
+    if portfolio_returns.ndim not in (1, 2):
+        raise ValueError(f"portfolio_returns must be 1-D or 2-D, got {portfolio_returns.ndim}-D")
     if len(portfolio_returns) != len(factor_returns):
         raise ValueError(
             f"portfolio_returns length ({len(portfolio_returns)}) must equal "
@@ -67,102 +193,261 @@ def _infer_model_type(factor_names: tuple[str, ...]) -> FactorModelType:
     return FactorModelType.CUSTOM
 
 
-def compute_factor_regression(
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Sum of each complete trailing window along axis 0."""
+    sums = np.cumsum(values, axis=0)
+    sums[window:] -= sums[:-window].copy()
+    return sums[window - 1 :]
+
+
+def _design(factor_matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """``[1 | F - mean(F)]`` design matrix and the factor means removed.
+
+    Centring keeps ``X'X`` well conditioned and the cumulative sums small;
+    ``_finish`` maps the intercept back to the uncentred model.
+    """
+    factor_mean = factor_matrix.mean(axis=0)
+    design = np.column_stack([np.ones(len(factor_matrix)), factor_matrix - factor_mean])
+    return design, factor_mean
+
+
+def _full_sample_fit(
+    returns: np.ndarray, factor_matrix: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Fit every column of ``returns`` with one SVD of the design.
+
+    Singular values below the ``np.linalg.lstsq`` cutoff are dropped, so
+    collinear factors get minimum-norm loadings and pseudo-inverse standard
+    errors.
+
+    Returns:
+        ``(coefficients, xtx_inv, ss_res, ss_tot, factor_mean)`` with
+        coefficients of shape ``(n_series, n_coef)`` in the centred model.
+    """
+    design, factor_mean = _design(factor_matrix)
+    centred = returns - returns.mean(axis=0)
+
+    u, singular, vt = np.linalg.svd(design, full_matrices=False)
+    cutoff = np.finfo(float).eps * max(design.shape) * singular[0]
+    inverse = np.divide(1.0, singular, out=np.zeros_like(singular), where=singular > cutoff)
+    projection = vt.T * inverse
+
+    coefficients = (projection @ (u.T @ centred)).T
+    residuals = centred - design @ coefficients.T
+    ss_res = np.einsum("ij,ij->j", residuals, residuals)
+    ss_tot = np.einsum("ij,ij->j", centred, centred)
+    return coefficients, projection @ projection.T, ss_res, ss_tot, factor_mean
+
+
+def _rolling_fit(
+    returns: np.ndarray, factor_matrix: np.ndarray, window: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Fit every trailing window of every column from cumulative sums.
+
+    ``X'X`` is accumulated once and pseudo-inverted per window; each chunk of
+    series then only needs its ``X'y`` and ``y'y`` window sums.
+
+    Returns:
+        ``(coefficients, xtx_inv, ss_res, ss_tot, factor_mean)`` for the
+        ``n_obs - window + 1`` complete windows; coefficients have shape
+        ``(n_windows, n_series, n_coef)``.
+    """
+    design, factor_mean = _design(factor_matrix)
+    centred = returns - returns.mean(axis=0)
+    n_obs, n_coef = design.shape
+    n_series = centred.shape[1]
+
+    xtx = _rolling_sum(design[:, :, np.newaxis] * design[:, np.newaxis, :], window)
+    xtx_inv = np.linalg.pinv(xtx, hermitian=True)
+
+    n_windows = n_obs - window + 1
+    coefficients = np.empty((n_windows, n_series, n_coef))
+    ss_res = np.empty((n_windows, n_series))
+    ss_tot = np.empty((n_windows, n_series))
+    chunk = max(1, _CHUNK_ELEMENTS // (n_obs * n_coef))
+    for start in range(0, n_series, chunk):
+        block = centred[:, start : start + chunk]
+        xty = _rolling_sum(design[:, :, np.newaxis] * block[:, np.newaxis, :], window)
+        yty = _rolling_sum(block * block, window)
+        fitted = xtx_inv @ xty
+        coefficients[:, start : start + chunk] = fitted.transpose(0, 2, 1)
+        explained = np.einsum("wcs,wcs->ws", fitted, xty)
+        ss_res[:, start : start + chunk] = _clean_sum_squares(yty - explained, yty)
+        ss_tot[:, start : start + chunk] = _clean_sum_squares(yty - xty[:, 0] ** 2 / window, yty)
+    return coefficients, xtx_inv, ss_res, ss_tot, factor_mean
+
+
+def _clean_sum_squares(sum_squares: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """Zero out negative or rounding-noise window sums of squares."""
+    return np.where(sum_squares > _SUM_SQUARES_RTOL * scale, sum_squares, 0.0)
+
+
+def _finish(
+    fit: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    returns: np.ndarray,
+    factor_names: tuple[str, ...],
+    n_obs: int,
+    annualization_factor: int,
+    window: int | None = None,
+) -> FactorRegressionBatch:
+    """Goodness of fit and standard errors from centred-model fit outputs."""
+    coefficients, xtx_inv, ss_res, ss_tot, factor_mean = fit
+    k = len(factor_names)
+    dof = n_obs - k - 1
+
+    # Intercept of the uncentred model: a = a_c + mean(y) - beta . mean(F)
+    loadings = coefficients[..., 1:]
+    intercept = coefficients[..., 0] + returns.mean(axis=0) - loadings @ factor_mean
+
+    # diag(T (X'X)^-1 T') with T = [[1, -mean(F)'], [0, I]] mapping to uncentred coefficients
+    variance = np.diagonal(xtx_inv, axis1=-2, axis2=-1).copy()
+    variance[..., 0] += factor_mean @ xtx_inv[..., 1:, 1:] @ factor_mean - 2.0 * xtx_inv[..., 0, 1:] @ factor_mean
+
+    unexplained = np.divide(ss_res, ss_tot, out=np.ones_like(ss_tot), where=ss_tot > 0)
+    r_squared = np.clip(1.0 - unexplained, 0.0, 1.0)
+    adj_r_squared = 1.0 - (1.0 - r_squared) * (n_obs - 1) / dof if dof > 0 else r_squared
+    residual_std = np.sqrt(ss_res / dof) if dof > 0 else np.zeros_like(ss_res)
+    standard_errors = residual_std[..., np.newaxis] * np.sqrt(np.maximum(variance, 0.0))[..., np.newaxis, :]
+
+    return FactorRegressionBatch(
+        factor_names=factor_names,
+        alpha=intercept * annualization_factor,
+        loadings=loadings,
+        standard_errors=standard_errors,
+        r_squared=r_squared,
+        adj_r_squared=adj_r_squared,
+        residual_std=residual_std,
+        n_observations=n_obs,
+        annualization_factor=annualization_factor,
+        window=window,
+    )
+
+
+def _as_columns(portfolio_returns: np.ndarray) -> np.ndarray:
+    """View 1-D returns as a single ``(n_obs, 1)`` column."""
+    return portfolio_returns[:, np.newaxis] if portfolio_returns.ndim == 1 else portfolio_returns
+
+
+def factor_regression_batch(
     portfolio_returns: np.ndarray,
     factor_returns: pd.DataFrame,
-    model_type: FactorModelType | None = None,
     annualization_factor: int = _DEFAULT_ANNUALIZATION,
-) -> FactorRegressionResult:
-    """Run OLS regression of portfolio returns on factor returns.
-
-    The regression model is ``r_p = alpha + beta_1*f_1 + ... + beta_k*f_k + eps``
-    where ``f_i`` are the factor return columns.
+) -> FactorRegressionBatch:
+    """Regress many return series on the same factors with one factorization.
 
     Args:
-        portfolio_returns: 1-D array of portfolio period returns.
-        factor_returns: DataFrame with one column per factor.  Column
-            names become the factor labels.
-        model_type: Override for model type.  If ``None``, inferred from
-            the column names (Mkt-RF/SMB/HML/RMW/CMA).
+        portfolio_returns: ``(n_obs,)`` or ``(n_obs, n_series)`` array of
+            period returns.
+        factor_returns: DataFrame with one column per factor.
         annualization_factor: Trading periods per year.  Defaults to 252.
 
     Returns:
-        ``FactorRegressionResult`` with loadings, alpha, R-squared,
-        t-statistics, and p-values.
+        ``FactorRegressionBatch`` with ``(n_series,)`` statistics.
 
     Raises:
-        ValueError: If fewer than 30 observations, length mismatch,
-            no factor columns, or NaN values are present.
+        ValueError: If fewer than 30 observations, length mismatch, no
+            factor columns, or NaN values are present.
     """
     portfolio_returns = np.asarray(portfolio_returns, dtype=float)
     _validate_inputs(portfolio_returns, factor_returns, annualization_factor)
 
+    returns = _as_columns(portfolio_returns)
     factor_names = tuple(str(c) for c in factor_returns.columns)
-    factor_matrix = factor_returns.to_numpy(dtype=float)
+    fit = _full_sample_fit(returns, factor_returns.to_numpy(dtype=float))
+    return _finish(fit, returns, factor_names, len(returns), annualization_factor)
 
-    n = len(portfolio_returns)
-    k = len(factor_names)
 
-    # Design matrix: [ones | factors]
-    x_mat = np.column_stack([np.ones(n), factor_matrix])
-    y = portfolio_returns
+def rolling_factor_regression(
+    portfolio_returns: np.ndarray,
+    factor_returns: pd.DataFrame,
+    window: int = 756,
+    annualization_factor: int = _DEFAULT_ANNUALIZATION,
+) -> FactorRegressionBatch:
+    """Fit the factor model over every trailing window of many series.
 
-    # OLS via least-squares
-    coeffs, _residuals_arr, _rank, _sv = np.linalg.lstsq(x_mat, y, rcond=None)
+    Window ``X'X`` and ``X'y`` come from cumulative sums, so each window
+    costs O(k^2) regardless of its length; ``X'X`` and its pseudo-inverse are
+    shared by all series.
 
-    intercept = float(coeffs[0])
-    betas = coeffs[1:]
+    Args:
+        portfolio_returns: ``(n_obs,)`` or ``(n_obs, n_series)`` array of
+            period returns.
+        factor_returns: DataFrame with one column per factor.
+        window: Rolling window size in bars.  Defaults to 756 (~3 years).
+        annualization_factor: Trading periods per year.  Defaults to 252.
 
-    # Predictions and residuals
-    y_hat = x_mat @ coeffs
-    residuals = y - y_hat
+    Returns:
+        ``FactorRegressionBatch`` with ``(n_obs, n_series)`` statistics; the
+        first ``window - 1`` rows are NaN.
 
-    # R-squared
-    ss_res = float(np.sum(residuals**2))
-    ss_tot = float(np.sum((y - np.mean(y)) ** 2))
-    r_squared = 1.0 - ss_res / ss_tot if ss_tot > 0 else 0.0
-    r_squared = max(0.0, min(1.0, r_squared))
+    Raises:
+        ValueError: If ``window < 2``, fewer than ``window`` observations,
+            length mismatch, no factor columns, or NaN values are present.
+    """
+    portfolio_returns = np.asarray(portfolio_returns, dtype=float)
+    if window < 2:
+        raise ValueError(f"window must be >= 2, got {window}")
+    if len(portfolio_returns) < window:
+        raise ValueError(f"Need at least {window} observations for window={window}, got {len(portfolio_returns)}")
+    _validate_alignment(portfolio_returns, factor_returns, annualization_factor)
 
-    # Adjusted R-squared
-    adj_r_squared = 1.0 - (1.0 - r_squared) * (n - 1) / (n - k - 1) if n > k + 1 else r_squared
+    returns = _as_columns(portfolio_returns)
+    factor_names = tuple(str(c) for c in factor_returns.columns)
+    fit = _rolling_fit(returns, factor_returns.to_numpy(dtype=float), window)
+    batch = _finish(fit, returns, factor_names, window, annualization_factor, window)
 
-    # Residual standard deviation
-    dof = n - k - 1
-    residual_std = math.sqrt(ss_res / dof) if dof > 0 else 0.0
+    def _pad(values: np.ndarray) -> np.ndarray:
+        padded = np.full((len(returns), *values.shape[1:]), np.nan)
+        padded[window - 1 :] = values
+        return padded
 
-    # Standard errors via pinv for collinearity safety
-    xtx_inv = np.linalg.pinv(x_mat.T @ x_mat)
-    se = residual_std * np.sqrt(np.diag(xtx_inv))
+    return FactorRegressionBatch(
+        factor_names=factor_names,
+        alpha=_pad(batch.alpha),
+        loadings=_pad(batch.loadings),
+        standard_errors=_pad(batch.standard_errors),
+        r_squared=_pad(batch.r_squared),
+        adj_r_squared=_pad(batch.adj_r_squared),
+        residual_std=_pad(batch.residual_std),
+        n_observations=window,
+        annualization_factor=annualization_factor,
+        window=window,
+    )
 
-    # T-statistics and p-values
-    t_values = coeffs / np.where(se > 0, se, 1e-12)
-    p_vals = 2.0 * (1.0 - stats.t.cdf(np.abs(t_values), df=max(dof, 1)))
 
-    # Build output dicts
-    loadings = {name: float(betas[i]) for i, name in enumerate(factor_names)}
-    alpha_annualized = intercept * annualization_factor
+def compute_factor_regression(
+    portfolio_returns: np.ndarray,
+    factor_returns: pd.DataFrame,
+    model_type: FactorModelType | None = None,
+    annualization_factor: int = _DEFAULT_ANNUALIZATION,
+) -> FactorRegressionResult:
+    """Run OLS regression of portfolio returns on factor returns.
 
-    t_stats: dict[str, float] = {"alpha": float(t_values[0])}
-    p_values: dict[str, float] = {"alpha": float(p_vals[0])}
-    for i, name in enumerate(factor_names):
-        t_stats[name] = float(t_values[i + 1])
-        p_values[name] = float(p_vals[i + 1])
+    The regression model is ``r_p = alpha + beta_1*f_1 + ... + beta_k*f_k + eps``
+    where ``f_i`` are the factor return columns.  Use
+    ``factor_regression_batch`` for many portfolios at once.
 
-    resolved_model = model_type if model_type is not None else _infer_model_type(factor_names)
+    Args:
+        portfolio_returns: 1-D array of portfolio period returns.
+        factor_returns: DataFrame with one column per factor.  Column
+            names become the factor labels.
+        model_type: Override for model type.  If ``None``, inferred from
+            the column names (Mkt-RF/SMB/HML/RMW/CMA).
+        annualization_factor: Trading periods per year.  Defaults to 252.
 
-    return FactorRegressionResult(
-        loadings=loadings,
-        alpha=alpha_annualized,
-        r_squared=r_squared,
-        adj_r_squared=adj_r_squared,
-        residual_std=residual_std,
-        t_stats=t_stats,
-        p_values=p_values,
-        factor_names=factor_names,
-        model_type=resolved_model,
-        n_observations=n,
-        annualization_factor=annualization_factor,
-    )
+    Returns:
+        ``FactorRegressionResult`` with loadings, alpha, R-squared,
+        t-statistics, and p-values.
+
+    Raises:
+        ValueError: If fewer than 30 observations, length mismatch,
+            no factor columns, or NaN values are present.
+    """
+    portfolio_returns = np.asarray(portfolio_returns, dtype=float)
+    if portfolio_returns.ndim != 1:
+        raise ValueError(f"portfolio_returns must be 1-D, got {portfolio_returns.ndim}-D")
+    batch = factor_regression_batch(portfolio_returns, factor_returns, annualization_factor)
+    return batch.to_result(model_type=model_type)
 
 
 def compute_rolling_r_squared(
@@ -190,44 +475,18 @@ def compute_rolling_r_squared(
         ValueError: If inputs are too short or have NaN.
     """
     portfolio_returns = np.asarray(portfolio_returns, dtype=float)
-    if window < 2:
-        raise ValueError(f"window must be >= 2, got {window}")
-    if len(portfolio_returns) < window:
-        raise ValueError(f"Need at least {window} observations for window={window}, got {len(portfolio_returns)}")
-    if len(portfolio_returns) != len(factor_returns):
-        raise ValueError(
-            f"portfolio_returns length ({len(portfolio_returns)}) must equal "
-            f"factor_returns length ({len(factor_returns)})"
-        )
-    if annualization_factor < 1:
-        raise ValueError(f"annualization_factor must be >= 1, got {annualization_factor}")
-    if not np.all(np.isfinite(portfolio_returns)):
-        raise ValueError("portfolio_returns must not contain NaN or infinite values")
-
-    factor_matrix = factor_returns.to_numpy(dtype=float)
-    if not np.all(np.isfinite(factor_matrix)):
-        raise ValueError("factor_returns must not contain NaN or infinite values")
+    batch = rolling_factor_regression(
+        portfolio_returns,
+        factor_returns,
+        window=window,
+        annualization_factor=annualization_factor,
+    )
     n = len(portfolio_returns)
 
-    values: list[float] = []
-    for i in range(n):
-        if i < window - 1:
-            values.append(float("nan"))
-        else:
-            start = i - window + 1
-            y_win = portfolio_returns[start : i + 1]
-            x_win = np.column_stack([np.ones(window), factor_matrix[start : i + 1]])
-            coeffs, _res, _rank, _sv = np.linalg.lstsq(x_win, y_win, rcond=None)
-            y_hat = x_win @ coeffs
-            ss_res = float(np.sum((y_win - y_hat) ** 2))
-            ss_tot = float(np.sum((y_win - np.mean(y_win)) ** 2))
-            r2 = 1.0 - ss_res / ss_tot if ss_tot > 0 else 0.0
-            values.append(max(0.0, min(1.0, r2)))
-
     # Build date labels
     try:
         dates = tuple(str(d) for d in factor_returns.index)
     except Exception:
         dates = tuple(str(i) for i in range(n))
 
-    return tuple(values), dates
+    return tuple(batch.r_squared[:, 0].tolist()), dates
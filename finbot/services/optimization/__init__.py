@@ -3,15 +3,23 @@
 Provides:
 - DCA (Dollar Cost Averaging) optimizer: grid search over DCA parameters.
 - Pareto-front optimizer: multi-objective Pareto analysis of backtest results.
+- Efficient frontier: exact long-only mean-variance frontier (critical line algorithm).
 """
 
 from __future__ import annotations
 
 from finbot.services.optimization.efficient_frontier import compute_efficient_frontier
-from finbot.services.optimization.pareto_optimizer import compute_pareto_front, plot_pareto_front
+from finbot.services.optimization.pareto_optimizer import (
+    compute_pareto_front,
+    non_dominated_ranks,
+    pareto_mask,
+    plot_pareto_front,
+)
 
 __all__ = [
     "compute_efficient_frontier",
     "compute_pareto_front",
+    "non_dominated_ranks",
+    "pareto_mask",
     "plot_pareto_front",
 ]
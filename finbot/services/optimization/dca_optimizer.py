@@ -9,12 +9,14 @@ Runs a series of backtests throughout the duration of a security to optimize:
 from __future__ import annotations
 
 import itertools
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
 from matplotlib import pyplot as plt
-from tqdm.contrib.concurrent import process_map
+from tqdm.auto import tqdm
 
 from finbot.config import logger
 from finbot.constants.path_constants import BACKTESTS_DATA_DIR
@@ -52,6 +54,7 @@ MPResult = tuple[TrialKey | None, TrialMetrics | None]
 DEFAULT_DCA_DURATIONS = tuple(round(value) for value in (1, 5, 252 / 12, 252 / 4, 252 / 2, 252, 252 * 2, 252 * 3))
 DEFAULT_DCA_STEPS = tuple(round(value) for value in (1, 5, 10, 252 / 12, 252 / 4))
 DEFAULT_TRIAL_DURATIONS = tuple(round(value) for value in (252 * 3, 252 * 5))
+_CHUNKSIZE = 1000
 
 
 def dca_optimizer(
@@ -65,6 +68,7 @@ def dca_optimizer(
     start_step: int = 5,
     save_df: bool = True,
     analyze_results: bool = True,
+    progress: Callable[[int, int], None] | None = None,
 ) -> pd.DataFrame | tuple[pd.DataFrame, pd.DataFrame]:
     """Run DCA optimization across many parameter combinations.
 
@@ -90,6 +94,8 @@ def dca_optimizer(
         Whether to save results to parquet.
     analyze_results : bool
         Whether to return analyzed results or raw DataFrame.
+    progress : callable, optional
+        Called with (trials done, total trials) after each chunk of trials.
 
     Raises
     ------
@@ -120,7 +126,13 @@ def dca_optimizer(
     ]
 
     n_combs = len(params_list)
-    data = process_map(_mp_helper, params_list, total=n_combs, chunksize=1000, desc=f"Running DCA Optimizer - {ticker}")
+    data: list[MPResult] = []
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(_mp_helper, params_list, chunksize=_CHUNKSIZE)
+        for result in tqdm(results, total=n_combs, desc=f"Running DCA Optimizer - {ticker}"):
+            data.append(result)
+            if progress is not None and (len(data) % _CHUNKSIZE == 0 or len(data) == n_combs):
+                progress(len(data), n_combs)
 
     price_hist_idxs = price_history.index
     df = _convert_to_df(data, price_hist_idxs)
@@ -1,4 +1,18 @@
-"""Efficient frontier helpers for long-only portfolio research."""
+"""Efficient frontier helpers for long-only portfolio research.
+
+The frontier is solved exactly with Markowitz's critical line algorithm (CLA)
+for fully invested portfolios with ``0 <= w <= max_weight``.  The CLA follows
+the solution of
+
+    min 0.5 * w' S w - lam * mu' w   s.t.   sum(w) = 1,  0 <= w <= max_weight
+
+as the risk-aversion parameter ``lam`` falls from infinity (the maximum-return
+portfolio) to zero (the minimum-variance portfolio).  Between consecutive
+*turning points* the set of assets strictly inside their bounds does not
+change, so the optimal weights are linear in ``lam`` and in the target
+return.  Frontier points at any target return, the maximum-Sharpe portfolio
+and the minimum-variance portfolio are therefore exact rather than sampled.
+"""
 
 from __future__ import annotations
 
@@ -7,15 +21,31 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+_ANNUALIZATION = 252.0
+_MIN_OBSERVATIONS = 30
+
+# Relative slack when comparing lambdas of successive CLA events
+_LAMBDA_RTOL = 1e-9
+
+# Weights within this distance of a bound are treated as sitting on it
+_WEIGHT_ATOL = 1e-12
+
+# A frontier has at most a few turning points per asset; more means cycling
+_MAX_EVENTS_PER_ASSET = 10
+
 
 @dataclass(frozen=True, slots=True)
 class FrontierPortfolio:
-    """A sampled portfolio on the efficient frontier surface."""
+    """A long-only portfolio on the efficient frontier.
+
+    ``weights`` is a read-only array aligned with
+    ``EfficientFrontierResult.tickers``.
+    """
 
     expected_return: float
     volatility: float
     sharpe_ratio: float
-    weights: dict[str, float]
+    weights: np.ndarray
 
 
 @dataclass(frozen=True, slots=True)
@@ -29,82 +59,120 @@ class AssetFrontierStats:
 
 @dataclass(frozen=True, slots=True)
 class EfficientFrontierResult:
-    """Complete efficient frontier output for web and notebook consumers."""
+    """Complete efficient frontier output for web and notebook consumers.
+
+    Attributes:
+        tickers: Asset order shared by every ``weights`` array.
+        frontier: Frontier portfolios at evenly spaced target returns, from
+            the minimum-variance return up to the maximum achievable return.
+        turning_points: CLA corner portfolios, ordered by increasing return.
+            The frontier is piecewise linear in weights between them.
+        max_sharpe: Exact maximum-Sharpe portfolio.
+        min_volatility: Exact minimum-variance portfolio.
+        asset_stats: Per-asset annualized return and volatility.
+        correlation_matrix: Pairwise correlation of daily returns.
+    """
 
-    portfolios: tuple[FrontierPortfolio, ...]
+    tickers: tuple[str, ...]
     frontier: tuple[FrontierPortfolio, ...]
+    turning_points: tuple[FrontierPortfolio, ...]
     max_sharpe: FrontierPortfolio
     min_volatility: FrontierPortfolio
     asset_stats: tuple[AssetFrontierStats, ...]
     correlation_matrix: dict[str, dict[str, float]]
 
+    def weight_map(self, portfolio: FrontierPortfolio) -> dict[str, float]:
+        """Return ``portfolio``'s weights keyed by ticker."""
+        return dict(zip(self.tickers, portfolio.weights.tolist(), strict=True))
+
 
 def compute_efficient_frontier(
     price_histories: dict[str, pd.DataFrame],
     *,
-    n_portfolios: int = 2500,
+    n_points: int = 50,
     risk_free_rate: float = 0.04,
-    seed: int = 42,
+    max_weight: float = 1.0,
 ) -> EfficientFrontierResult:
-    """Sample long-only portfolios and extract an approximate efficient frontier."""
+    """Solve the long-only efficient frontier of historical assets.
+
+    Args:
+        price_histories: Price history per ticker with ``Close`` or
+            ``Adj Close`` columns.  Returns are taken over common dates.
+        n_points: Number of frontier portfolios, at evenly spaced target
+            returns between the minimum-variance and maximum-return
+            portfolios.
+        risk_free_rate: Annual risk-free rate for Sharpe ratios.
+        max_weight: Upper bound on every asset weight (lower bound is 0).
 
-    if len(price_histories) < 2:
+    Returns:
+        EfficientFrontierResult with exact frontier, turning-point,
+        maximum-Sharpe and minimum-variance portfolios.
+
+    Raises:
+        ValueError: If fewer than two assets or 30 common return
+            observations are supplied, ``n_points < 2``, ``max_weight``
+            cannot hold a fully invested portfolio, or the return covariance
+            matrix is singular.
+    """
+    n_assets = len(price_histories)
+    if n_assets < 2:
         raise ValueError("At least two assets are required for efficient frontier analysis")
-    if n_portfolios < 10:
-        raise ValueError("n_portfolios must be at least 10")
+    if n_points < 2:
+        raise ValueError(f"n_points must be at least 2, got {n_points}")
+    if not 0.0 < max_weight <= 1.0 or max_weight * n_assets < 1.0 - _WEIGHT_ATOL:
+        raise ValueError(f"max_weight must be in (0, 1] and at least 1/{n_assets}, got {max_weight}")
 
     closes = {ticker: _extract_close_series(df).rename(ticker) for ticker, df in price_histories.items()}
     returns_df = pd.concat(closes.values(), axis=1).pct_change().dropna()
-    if len(returns_df) < 30:
+    if len(returns_df) < _MIN_OBSERVATIONS:
         raise ValueError(f"Insufficient overlapping data: only {len(returns_df)} common return observations")
 
-    tickers = [str(column) for column in returns_df.columns]
-    returns_df.columns = tickers
-    annual_returns = returns_df.mean() * 252.0
-    annual_cov = returns_df.cov() * 252.0
+    tickers = tuple(str(column) for column in returns_df.columns)
+    returns_df.columns = list(tickers)
+    annual_returns = returns_df.mean().to_numpy(dtype=float) * _ANNUALIZATION
+    annual_cov = returns_df.cov().to_numpy(dtype=float) * _ANNUALIZATION
     correlation = returns_df.corr().to_dict()
-    annual_return_values = annual_returns.to_numpy(dtype=float)
-    annual_cov_values = annual_cov.to_numpy(dtype=float)
-
-    rng = np.random.default_rng(seed)
-    weights = rng.dirichlet(np.ones(len(tickers)), size=n_portfolios)
-
-    expected_returns = weights @ annual_return_values
-    volatilities = np.sqrt(np.einsum("ij,jk,ik->i", weights, annual_cov_values, weights))
-    sharpe_ratios = np.divide(
-        expected_returns - risk_free_rate,
-        volatilities,
-        out=np.zeros_like(expected_returns),
-        where=volatilities > 0,
-    )
 
-    portfolios = tuple(
-        FrontierPortfolio(
-            expected_return=float(expected_returns[index]),
-            volatility=float(volatilities[index]),
-            sharpe_ratio=float(sharpe_ratios[index]),
-            weights={ticker: float(weights[index, asset_index]) for asset_index, ticker in enumerate(tickers)},
+    try:
+        corners = _critical_line(annual_returns, annual_cov, np.full(n_assets, max_weight))
+    except np.linalg.LinAlgError as exc:
+        raise ValueError("Return covariance matrix is singular; remove duplicate or collinear assets") from exc
+
+    # Turning points run from maximum return to minimum variance; flip to ascending return
+    corners = corners[::-1]
+    corner_returns = corners @ annual_returns
+    targets = np.linspace(corner_returns[0], corner_returns[-1], n_points)
+    frontier_weights = _interpolate(corners, corner_returns, targets)
+
+    def _portfolios(weights: np.ndarray) -> tuple[FrontierPortfolio, ...]:
+        weights = np.clip(weights, 0.0, max_weight)
+        weights.flags.writeable = False
+        expected = weights @ annual_returns
+        volatility = np.sqrt(np.maximum(np.einsum("ij,jk,ik->i", weights, annual_cov, weights), 0.0))
+        sharpe = _sharpe(expected, volatility, risk_free_rate)
+        return tuple(
+            FrontierPortfolio(expected_return=e, volatility=v, sharpe_ratio=s, weights=weights[index])
+            for index, (e, v, s) in enumerate(zip(expected.tolist(), volatility.tolist(), sharpe.tolist(), strict=True))
         )
-        for index in range(n_portfolios)
-    )
 
-    frontier = _extract_frontier(portfolios)
-    max_sharpe = max(portfolios, key=lambda portfolio: portfolio.sharpe_ratio)
-    min_volatility = min(portfolios, key=lambda portfolio: portfolio.volatility)
+    turning_points = _portfolios(corners)
+    frontier = _portfolios(frontier_weights)
+    max_sharpe = _portfolios(_max_sharpe_weights(corners, annual_returns, annual_cov, risk_free_rate)[np.newaxis])[0]
     asset_stats = tuple(
         AssetFrontierStats(
             ticker=ticker,
-            annual_return=float(annual_return_values[asset_index]),
-            annual_volatility=float(annual_cov_values[asset_index, asset_index] ** 0.5),
+            annual_return=float(annual_returns[asset_index]),
+            annual_volatility=float(annual_cov[asset_index, asset_index] ** 0.5),
         )
         for asset_index, ticker in enumerate(tickers)
     )
 
     return EfficientFrontierResult(
-        portfolios=portfolios,
+        tickers=tickers,
         frontier=frontier,
+        turning_points=turning_points,
         max_sharpe=max_sharpe,
-        min_volatility=min_volatility,
+        min_volatility=turning_points[0],
         asset_stats=asset_stats,
         correlation_matrix={
             str(row): {str(col): float(value) for col, value in values.items()} for row, values in correlation.items()
@@ -120,14 +188,170 @@ def _extract_close_series(df: pd.DataFrame) -> pd.Series:
     raise ValueError("Price history must contain 'Close' or 'Adj Close'")
 
 
-def _extract_frontier(portfolios: tuple[FrontierPortfolio, ...]) -> tuple[FrontierPortfolio, ...]:
-    ordered = sorted(portfolios, key=lambda portfolio: (portfolio.volatility, -portfolio.expected_return))
-    frontier: list[FrontierPortfolio] = []
-    best_return_so_far = float("-inf")
+def _sharpe(expected: np.ndarray, volatility: np.ndarray, risk_free_rate: float) -> np.ndarray:
+    """Sharpe ratios, 0.0 where volatility is zero."""
+    return np.divide(
+        expected - risk_free_rate,
+        volatility,
+        out=np.zeros_like(expected),
+        where=volatility > 0,
+    )
+
+
+def _max_return_portfolio(mean: np.ndarray, upper: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Fill assets by descending mean up to their bound until fully invested.
+
+    Returns:
+        ``(weights, free)`` where ``free`` marks the single asset that
+        completes the budget.
+    """
+    order = np.argsort(-mean, kind="stable")
+    filled = np.cumsum(upper[order])
+    last = min(int(np.searchsorted(filled, 1.0 - _WEIGHT_ATOL)), len(mean) - 1)
+
+    weights = np.zeros(len(mean))
+    weights[order[:last]] = upper[order[:last]]
+    weights[order[last]] = 1.0 - weights.sum()
+    free = np.zeros(len(mean), dtype=bool)
+    free[order[last]] = True
+    return weights, free
+
 
-    for portfolio in ordered:
-        if portfolio.expected_return > best_return_so_far:
-            frontier.append(portfolio)
-            best_return_so_far = portfolio.expected_return
+def _linear_solution(
+    mean: np.ndarray, cov: np.ndarray, weights: np.ndarray, free: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, float, float]:
+    """Optimal weights on a CLA segment as ``w(lam) = base + lam * slope``.
 
-    return tuple(frontier)
+    Bounded assets keep their current weights.  The free weights solve the
+    KKT system ``S_FF w_F + S_FB w_B - lam * mu_F - gamma = 0`` with
+    ``sum(w) = 1``, whose budget multiplier is ``gamma = gamma0 + lam * gamma1``.
+    """
+    bound = ~free
+    rhs = np.column_stack([np.ones(free.sum()), mean[free], cov[np.ix_(free, bound)] @ weights[bound]])
+    ones_solved, mean_solved, bound_solved = np.linalg.solve(cov[np.ix_(free, free)], rhs).T
+
+    budget = 1.0 - weights[bound].sum()
+    gamma0 = (budget + bound_solved.sum()) / ones_solved.sum()
+    gamma1 = -mean_solved.sum() / ones_solved.sum()
+
+    base = weights.copy()
+    slope = np.zeros_like(weights)
+    base[free] = gamma0 * ones_solved - bound_solved
+    slope[free] = mean_solved + gamma1 * ones_solved
+    return base, slope, gamma0, gamma1
+
+
+def _critical_line(mean: np.ndarray, cov: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """Turning points of the fully invested frontier with ``0 <= w <= upper``.
+
+    Each step lowers ``lam`` to the next event: a free weight reaching a bound
+    or a bounded weight whose KKT gradient changes sign (so it leaves its
+    bound).  Ties are handled one event at a time at the same ``lam``.
+
+    Returns:
+        ``(n_corners, n_assets)`` weights, ``n_corners >= 2``, from the
+        maximum-return portfolio (``lam = inf``) to the minimum-variance
+        portfolio (``lam = 0``).
+    """
+    n_assets = len(mean)
+    weights, free = _max_return_portfolio(mean, upper)
+    corners = [weights.copy()]
+    lam = np.inf
+    last_changed = -1
+
+    for _ in range(_MAX_EVENTS_PER_ASSET * n_assets):
+        base, slope, gamma0, gamma1 = _linear_solution(mean, cov, weights, free)
+        ceiling = lam * (1.0 + _LAMBDA_RTOL) if np.isfinite(lam) else np.inf
+        candidates = np.full(n_assets, -np.inf)
+
+        # a) a free weight reaches its lower (slope > 0) or upper (slope < 0) bound as lam falls
+        moving = free & (np.abs(slope) > 0)
+        hit = np.where(slope > 0, 0.0, upper)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            candidates[moving] = ((hit - base) / slope)[moving]
+
+        # b) a bounded weight leaves its bound where its gradient crosses zero;
+        #    with a flat gradient (tied means) it leaves at once if already violated
+        gradient_base = cov @ base - gamma0
+        gradient_slope = cov @ slope - mean - gamma1
+        at_lower = weights <= _WEIGHT_ATOL
+        sign = np.where(at_lower, 1.0, -1.0)
+        flat = np.abs(gradient_slope) <= _LAMBDA_RTOL * np.abs(mean).max()
+        leaving = ~free & ~flat & (sign * gradient_slope > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            candidates[leaving] = (-gradient_base / gradient_slope)[leaving]
+        candidates[~free & flat & (sign * gradient_base < 0)] = lam
+
+        if last_changed >= 0:
+            candidates[last_changed] = -np.inf
+        candidates[candidates > ceiling] = -np.inf
+        event = int(np.argmax(candidates))
+        if candidates[event] <= 0.0:
+            corners.append(np.clip(base, 0.0, upper))
+            break
+
+        previous_lam, lam = lam, min(float(candidates[event]), lam)
+        if lam < previous_lam:
+            weights = np.clip(base + lam * slope, 0.0, upper)
+        if free[event]:
+            weights[event] = 0.0 if slope[event] > 0 else upper[event]
+        free[event] = not free[event]
+        last_changed = event
+        # Events at the same lam (ties) refine a single turning point
+        if lam < previous_lam * (1.0 - _LAMBDA_RTOL):
+            corners.append(weights.copy())
+        else:
+            corners[-1] = weights.copy()
+    else:
+        raise RuntimeError("Critical line algorithm did not converge")
+
+    # Drop repeated corners (lam moved but no weight did); keep both ends of the frontier
+    stacked = np.array(corners)
+    distinct = np.r_[True, np.abs(np.diff(stacked, axis=0)).max(axis=1) > _WEIGHT_ATOL]
+    stacked = stacked[distinct]
+    return stacked if len(stacked) > 1 else np.repeat(stacked, 2, axis=0)
+
+
+def _interpolate(corners: np.ndarray, corner_returns: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Frontier weights at ``targets`` from turning points sorted by return.
+
+    Weights are linear in the target return between adjacent turning points.
+    """
+    upper = np.clip(np.searchsorted(corner_returns, targets), 1, len(corner_returns) - 1)
+    low_returns, high_returns = corner_returns[upper - 1], corner_returns[upper]
+    span = high_returns - low_returns
+    fraction = np.divide(targets - low_returns, span, out=np.zeros_like(targets), where=span > 0)
+    low, high = corners[upper - 1], corners[upper]
+    return low + np.clip(fraction, 0.0, 1.0)[:, np.newaxis] * (high - low)
+
+
+def _max_sharpe_weights(corners: np.ndarray, mean: np.ndarray, cov: np.ndarray, risk_free_rate: float) -> np.ndarray:
+    """Exact maximum-Sharpe weights along the piecewise-linear frontier.
+
+    On a segment ``w(t) = w0 + t * d`` the excess return is linear and the
+    variance quadratic in ``t``, so the Sharpe ratio has a single stationary
+    point ``t* = (e0 * c - de * v0) / (c * de - e0 * dv)``.  Each segment is
+    evaluated at its ends and at ``t*`` clipped to ``[0, 1]``.
+    """
+    start = corners[:-1]
+    step = corners[1:] - start
+    excess = start @ mean - risk_free_rate
+    excess_step = step @ mean
+    variance = np.einsum("ij,jk,ik->i", start, cov, start)
+    cross = np.einsum("ij,jk,ik->i", start, cov, step)
+    variance_step = np.einsum("ij,jk,ik->i", step, cov, step)
+
+    denominator = cross * excess_step - excess * variance_step
+    stationary = np.divide(
+        excess * cross - excess_step * variance,
+        denominator,
+        out=np.zeros_like(excess),
+        where=denominator != 0,
+    )
+    t = np.column_stack([np.zeros_like(excess), np.ones_like(excess), np.clip(stationary, 0.0, 1.0)])
+    volatility = np.sqrt(
+        np.maximum(variance[:, np.newaxis] + 2.0 * t * cross[:, np.newaxis] + t**2 * variance_step[:, np.newaxis], 0.0)
+    )
+    sharpe = _sharpe(excess[:, np.newaxis] + t * excess_step[:, np.newaxis], volatility, 0.0)
+    segment, position = np.unravel_index(int(np.argmax(sharpe)), sharpe.shape)
+    return start[segment] + t[segment, position] * step[segment]
@@ -4,8 +4,12 @@ Given a collection of ``BacktestRunResult`` objects (one per strategy/parameter
 combination), this module identifies the Pareto-optimal subset — strategies
 where no other strategy is simultaneously better on *all* chosen objectives.
 
-Algorithm: O(n²) pairwise dominance checking. Suitable for strategy counts
-encountered in typical grid-search sweeps (≤ 10 000 points).
+Algorithm: for two objectives, an O(n log n) skyline — points are sorted on
+the first objective and the running best of the second is swept with a prefix
+maximum.  For three or more objectives, points are sorted lexicographically
+by rank sum (so every dominator precedes the points it dominates) and filtered in blocks
+against the front found so far with vectorized NumPy comparisons.
+``non_dominated_ranks`` assigns NSGA-style fronts (1 = Pareto front).
 
 Typical usage::
 
@@ -21,14 +25,23 @@ Typical usage::
 from __future__ import annotations
 
 import dataclasses
-from collections.abc import Sequence
+from bisect import bisect_right
+from collections.abc import Mapping, Sequence
 from typing import Any
 
+import numpy as np
 import plotly.graph_objects as go
 
-from finbot.core.contracts import BacktestRunResult
+from finbot.core.contracts import BacktestRunMetadata, BacktestRunResult
 from finbot.core.contracts.optimization import ParetoPoint, ParetoResult
 
+# Upper bound on elements in one vectorized dominance comparison
+_BLOCK_ELEMENTS = 1 << 22
+_BLOCK_SIZE = 512
+
+# Metadata fields are immutable scalars, so a shallow dict equals dataclasses.asdict
+_METADATA_FIELDS = tuple(field.name for field in dataclasses.fields(BacktestRunMetadata))
+
 
 def compute_pareto_front(
     results: Sequence[BacktestRunResult],
@@ -37,18 +50,22 @@ def compute_pareto_front(
     *,
     maximize_a: bool = True,
     maximize_b: bool = False,
+    objectives: Mapping[str, bool] | None = None,
+    compute_ranks: bool = False,
 ) -> ParetoResult:
     """Identify Pareto-optimal strategies from a set of backtest results.
 
     A point P *dominates* Q when:
 
-    - P is at least as good as Q on **both** objectives, AND
+    - P is at least as good as Q on **every** objective, AND
     - P is strictly better than Q on **at least one** objective.
 
     "Better" depends on whether the objective is maximised or minimised:
     - Maximised: higher value is better.
     - Minimised: lower value is better.
 
+    A point with a NaN objective neither dominates nor is dominated.
+
     Parameters
     ----------
     results:
@@ -63,6 +80,13 @@ def compute_pareto_front(
     maximize_b:
         When ``True``, higher values of ``objective_b`` are preferred.
         Defaults to ``False`` (e.g. ``max_drawdown`` — lower is better).
+    objectives:
+        Optional ordered mapping of metric key → maximise flag for two or
+        more objectives.  Overrides ``objective_a``/``objective_b`` and
+        their flags; the first two keys become ``objective_a``/``objective_b``.
+    compute_ranks:
+        When ``True``, assign every point its non-dominated sorting front
+        (``ParetoPoint.pareto_rank``).
 
     Returns
     -------
@@ -72,45 +96,44 @@ def compute_pareto_front(
     Raises
     ------
     ValueError
-        If ``results`` is empty.
+        If ``results`` is empty or ``objectives`` has fewer than two keys.
     KeyError
-        If ``objective_a`` or ``objective_b`` is not present in a result's
-        metrics dict.
+        If an objective is not present in a result's metrics dict.
     """
     if not results:
         raise ValueError("results must be non-empty")
 
+    if objectives is None:
+        objectives = {objective_a: maximize_a, objective_b: maximize_b}
+    elif len(objectives) < 2:
+        raise ValueError(f"objectives must name at least 2 metrics, got {len(objectives)}")
+    names = tuple(objectives)
+    maximize = tuple(objectives.values())
+
     # Validate objectives exist in every result (raises KeyError on first miss).
     for result in results:
-        if objective_a not in result.metrics:
-            raise KeyError(f"Objective '{objective_a}' not found in metrics")
-        if objective_b not in result.metrics:
-            raise KeyError(f"Objective '{objective_b}' not found in metrics")
+        for name in names:
+            if name not in result.metrics:
+                raise KeyError(f"Objective '{name}' not found in metrics")
 
-    # Build raw (a, b) tuples for the dominance check.
-    raw_values: list[tuple[float, float]] = [
-        (result.metrics[objective_a], result.metrics[objective_b]) for result in results
-    ]
-
-    maximize: tuple[bool, bool] = (maximize_a, maximize_b)
-
-    # Determine dominance for each point.
-    dominated_flags: list[bool] = [
-        _is_dominated(raw_values[i], [raw_values[j] for j in range(len(raw_values)) if j != i], maximize=maximize)
-        for i in range(len(results))
-    ]
+    values = np.array([[result.metrics[name] for name in names] for result in results], dtype=float)
+    optimal = pareto_mask(values, maximize)
+    rank_array = non_dominated_ranks(values, maximize) if compute_ranks else None
+    ranks: list[int | None] = rank_array.tolist() if rank_array is not None else [None] * len(results)
 
     # Build ParetoPoint objects.
     all_points: list[ParetoPoint] = []
-    for result, (val_a, val_b), is_dominated in zip(results, raw_values, dominated_flags, strict=True):
+    for result, row, is_optimal, rank in zip(results, values.tolist(), optimal.tolist(), ranks, strict=True):
         all_points.append(
             ParetoPoint(
                 strategy_name=result.metadata.strategy_name,
-                params=dataclasses.asdict(result.metadata),
+                params={name: getattr(result.metadata, name) for name in _METADATA_FIELDS},
                 metrics=dict(result.metrics),
-                objective_a=val_a,
-                objective_b=val_b,
-                is_pareto_optimal=not is_dominated,
+                objective_a=row[0],
+                objective_b=row[1],
+                is_pareto_optimal=is_optimal,
+                objective_values=tuple(row),
+                pareto_rank=rank,
             )
         )
 
@@ -118,58 +141,204 @@ def compute_pareto_front(
     dominated_points = tuple(p for p in all_points if not p.is_pareto_optimal)
 
     return ParetoResult(
-        objective_a_name=objective_a,
-        objective_b_name=objective_b,
+        objective_a_name=names[0],
+        objective_b_name=names[1],
         all_points=tuple(all_points),
         pareto_front=pareto_front,
         dominated_points=dominated_points,
         n_evaluated=len(all_points),
+        objective_names=names,
+        n_fronts=int(rank_array.max()) if rank_array is not None else None,
     )
 
 
-def _is_dominated(
-    point: tuple[float, float],
-    candidates: Sequence[tuple[float, float]],
-    *,
-    maximize: tuple[bool, bool],
-) -> bool:
-    """Return ``True`` if *point* is dominated by at least one candidate.
+def pareto_mask(values: np.ndarray, maximize: Sequence[bool] | None = None) -> np.ndarray:
+    """Boolean mask of the non-dominated rows of an objective matrix.
+
+    Parameters
+    ----------
+    values:
+        ``(n_points, n_objectives)`` objective values.
+    maximize:
+        Per-objective flag; ``True`` prefers higher values.  Defaults to
+        maximising every objective.
+
+    Returns
+    -------
+    np.ndarray
+        ``(n_points,)`` bool array, ``True`` for Pareto-optimal rows.  Rows
+        containing NaN are always ``True`` (they cannot be compared).
+
+    Raises
+    ------
+    ValueError
+        If ``values`` is not 2-D or ``maximize`` has the wrong length.
+    """
+    oriented, comparable = _oriented(values, maximize)
+    mask = np.ones(len(oriented), dtype=bool)
+    points = oriented[comparable]
+    if len(points):
+        mask[comparable] = _skyline_2d(points) if points.shape[1] == 2 else _non_dominated(points)
+    return mask
+
 
-    Point P dominates Q when P is at least as good on both objectives AND
-    strictly better on at least one.
+def non_dominated_ranks(values: np.ndarray, maximize: Sequence[bool] | None = None) -> np.ndarray:
+    """Non-dominated sorting front of every row (NSGA-II style).
+
+    Rank 1 is the Pareto front; rank ``r + 1`` is the Pareto front of the
+    points left after removing ranks ``1..r``.  Equivalently, a point's rank
+    is one more than the highest rank among the points dominating it.
 
     Parameters
     ----------
-    point:
-        ``(objective_a, objective_b)`` values for the point under test.
-    candidates:
-        All other points to check against.
+    values:
+        ``(n_points, n_objectives)`` objective values.
     maximize:
-        ``(maximize_a, maximize_b)`` — which objectives to maximise.
+        Per-objective flag; ``True`` prefers higher values.  Defaults to
+        maximising every objective.
+
+    Returns
+    -------
+    np.ndarray
+        ``(n_points,)`` int array of ranks starting at 1.  Rows containing
+        NaN get rank 1.
+
+    Raises
+    ------
+    ValueError
+        If ``values`` is not 2-D or ``maximize`` has the wrong length.
     """
-    pa, pb = point
-    max_a, max_b = maximize
-
-    for ca, cb in candidates:
-        # Check "at least as good on both objectives"
-        if max_a:
-            at_least_a = ca >= pa
-            strictly_a = ca > pa
+    oriented, comparable = _oriented(values, maximize)
+    ranks = np.ones(len(oriented), dtype=np.int64)
+    points = oriented[comparable]
+    if len(points) == 0:
+        return ranks
+    if points.shape[1] == 2:
+        ranks[comparable] = _ranks_2d(points)
+        return ranks
+
+    point_ranks = np.zeros(len(points), dtype=np.int64)
+    remaining = np.arange(len(points))
+    rank = 0
+    while len(remaining):
+        rank += 1
+        front = _non_dominated(points[remaining])
+        point_ranks[remaining[front]] = rank
+        remaining = remaining[~front]
+    ranks[comparable] = point_ranks
+    return ranks
+
+
+def _oriented(values: np.ndarray, maximize: Sequence[bool] | None) -> tuple[np.ndarray, np.ndarray]:
+    """Objective matrix with minimised columns negated, and its NaN-free row mask."""
+    matrix = np.asarray(values, dtype=float)
+    if matrix.ndim != 2:
+        raise ValueError(f"values must be 2-D (n_points, n_objectives), got {matrix.ndim}-D")
+    n_objectives = matrix.shape[1]
+    flags = np.ones(n_objectives, dtype=bool) if maximize is None else np.asarray(maximize, dtype=bool)
+    if flags.shape != (n_objectives,):
+        raise ValueError(f"maximize must have one flag per objective ({n_objectives}), got {len(flags)}")
+    oriented = np.where(flags, matrix, -matrix)
+    return oriented, ~np.isnan(oriented).any(axis=1)
+
+
+def _skyline_2d(points: np.ndarray) -> np.ndarray:
+    """Non-dominated mask for two maximised objectives in O(n log n).
+
+    After sorting by ``a`` then ``b`` (both descending), a point is
+    non-dominated iff it has the best ``b`` among points with equal ``a``
+    and a strictly better ``b`` than every point with a larger ``a``.
+    """
+    order = np.lexsort((-points[:, 1], -points[:, 0]))
+    a = points[order, 0]
+    b = points[order, 1]
+
+    new_group = np.empty(len(a), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = a[1:] != a[:-1]
+    group = np.cumsum(new_group) - 1
+    group_best = b[new_group]
+    best_before = np.empty_like(group_best)
+    best_before[0] = -np.inf
+    best_before[1:] = np.maximum.accumulate(group_best)[:-1]
+
+    optimal = (b == group_best[group]) & ((b > best_before[group]) | (group == 0))
+    mask = np.empty(len(a), dtype=bool)
+    mask[order] = optimal
+    return mask
+
+
+def _ranks_2d(points: np.ndarray) -> np.ndarray:
+    """Non-dominated sorting ranks for two maximised objectives in O(n log n).
+
+    Distinct points are swept in descending ``(a, b)`` order, so every
+    earlier point with ``b >= b_p`` dominates ``p``.  Each front's best
+    ``b`` is non-increasing in the front number, which lets a binary search
+    find the first front without a dominator.
+    """
+    unique, inverse = np.unique(points, axis=0, return_inverse=True)
+    n_unique = len(unique)
+    ranks = np.empty(n_unique, dtype=np.int64)
+    front_best: list[float] = []  # negated best b per front (non-decreasing)
+    for position, neg_b in enumerate((-unique[::-1, 1]).tolist()):
+        front = bisect_right(front_best, neg_b)
+        if front == len(front_best):
+            front_best.append(neg_b)
         else:
-            at_least_a = ca <= pa
-            strictly_a = ca < pa
+            front_best[front] = neg_b
+        ranks[n_unique - 1 - position] = front + 1
+    return ranks[inverse.reshape(-1)]
 
-        if max_b:
-            at_least_b = cb >= pb
-            strictly_b = cb > pb
-        else:
-            at_least_b = cb <= pb
-            strictly_b = cb < pb
 
-        if at_least_a and at_least_b and (strictly_a or strictly_b):
-            return True
+def _non_dominated(points: np.ndarray) -> np.ndarray:
+    """Non-dominated mask for any number of maximised objectives.
 
-    return False
+    Points are processed in descending order of their summed per-column
+    ranks (ties broken lexicographically).  A dominator has a strictly
+    larger rank sum, so a point can only be dominated by earlier points —
+    and then also by an earlier member of the front.  Strong points come
+    first, so most blocks are eliminated by a small front.
+    """
+    n_points, n_objectives = points.shape
+    column_ranks = np.empty((n_points, n_objectives), dtype=np.int64)
+    for column in range(n_objectives):
+        column_ranks[:, column] = np.unique(points[:, column], return_inverse=True)[1].reshape(-1)
+    order = np.lexsort((*(-points[:, ::-1].T), -column_ranks.sum(axis=1)))
+    candidates = points[order]
+
+    keep = np.zeros(n_points, dtype=bool)
+    front = candidates[:0]
+    for start in range(0, n_points, _BLOCK_SIZE):
+        block = candidates[start : start + _BLOCK_SIZE]
+        index = np.arange(start, start + len(block))
+        alive = ~_dominated_by(front, block)
+        block, index = block[alive], index[alive]
+        alive = ~_dominated_by(block, block)
+        keep[index[alive]] = True
+        front = np.concatenate([front, block[alive]])
+
+    mask = np.empty(n_points, dtype=bool)
+    mask[order] = keep
+    return mask
+
+
+def _dominated_by(front: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """For each of ``points``, whether any row of ``front`` dominates it."""
+    dominated = np.zeros(len(points), dtype=bool)
+    if len(front) == 0 or len(points) == 0:
+        return dominated
+    step = max(1, _BLOCK_ELEMENTS // len(points))
+    for start in range(0, len(front), step):
+        rows = front[start : start + step]
+        # (n_rows, n_points) comparisons, accumulated one objective at a time
+        at_least = np.ones((len(rows), len(points)), dtype=bool)
+        better = np.zeros((len(rows), len(points)), dtype=bool)
+        for column in range(points.shape[1]):
+            row_values = rows[:, column, np.newaxis]
+            at_least &= row_values >= points[:, column]
+            better |= row_values > points[:, column]
+        dominated |= (at_least & better).any(axis=0)
+    return dominated
 
 
 def plot_pareto_front(
@@ -7,8 +7,8 @@ functions work on raw returns arrays or DataFrames and are engine-agnostic.
 
 from finbot.services.portfolio_analytics.benchmark import compute_benchmark_comparison
 from finbot.services.portfolio_analytics.correlation import compute_diversification_metrics
-from finbot.services.portfolio_analytics.drawdown import compute_drawdown_analysis
-from finbot.services.portfolio_analytics.rolling import compute_rolling_metrics
+from finbot.services.portfolio_analytics.drawdown import compute_drawdown_analysis, compute_drawdown_analysis_batch
+from finbot.services.portfolio_analytics.rolling import RollingStatistics, compute_rolling_metrics, rolling_statistics
 from finbot.services.portfolio_analytics.viz import (
     plot_benchmark_scatter,
     plot_correlation_heatmap,
@@ -19,9 +19,11 @@ from finbot.services.portfolio_analytics.viz import (
 )
 
 __all__ = [
+    "RollingStatistics",
     "compute_benchmark_comparison",
     "compute_diversification_metrics",
     "compute_drawdown_analysis",
+    "compute_drawdown_analysis_batch",
     "compute_rolling_metrics",
     "plot_benchmark_scatter",
     "plot_correlation_heatmap",
@@ -29,4 +31,5 @@ __all__ = [
     "plot_drawdown_periods",
     "plot_rolling_metrics",
     "plot_underwater_curve",
+    "rolling_statistics",
 ]
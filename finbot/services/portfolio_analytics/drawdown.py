@@ -6,10 +6,17 @@ underwater curve, and returns aggregate statistics.
 Unlike ``quantstats.max_drawdown()`` (a single scalar), this module
 identifies every distinct drawdown period including its depth, duration,
 and recovery time — giving a complete picture of tail-risk episodes.
+
+Episodes are extracted with array operations: drawdown runs are found from
+the boundaries of the ``underwater < 0`` mask and troughs with a segment-wise
+``fmin.reduceat``.  ``compute_drawdown_analysis_batch`` applies the same
+kernel to a 2-D ``(n_obs, n_series)`` array of returns in one pass.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 import numpy as np
 
 from finbot.core.contracts.portfolio_analytics import DrawdownAnalysisResult, DrawdownPeriod
@@ -17,6 +24,156 @@ from finbot.core.contracts.portfolio_analytics import DrawdownAnalysisResult, Dr
 _RECOVERY_THRESHOLD = -1e-14  # treat uw >= this as "back to peak"
 
 
+@dataclass(frozen=True, slots=True)
+class _Episodes:
+    """Drawdown episodes of many series as parallel arrays.
+
+    Episodes are ordered by series, then chronologically.  ``end`` is -1
+    for an episode still open at the last bar.
+    """
+
+    series: np.ndarray
+    start: np.ndarray
+    trough: np.ndarray
+    end: np.ndarray
+    depth: np.ndarray
+
+
+def _underwater(returns: np.ndarray) -> np.ndarray:
+    """Underwater curves for ``(n_series, n_obs)`` returns (non-positive)."""
+    wealth = np.cumprod(1.0 + returns, axis=1)
+    peak = np.maximum.accumulate(wealth, axis=1)
+    return (wealth - peak) / peak
+
+
+def _in_drawdown(uw: np.ndarray) -> np.ndarray:
+    """Boolean drawdown state per bar.
+
+    A drawdown starts where ``uw`` drops below the recovery threshold and
+    lasts until it is back at the threshold.  NaN bars (e.g. after a
+    non-finite return) keep the state of the previous bar.
+    """
+    state = uw < _RECOVERY_THRESHOLD
+    decided = state | (uw >= _RECOVERY_THRESHOLD)
+    if decided.all():
+        return state
+    last_decided = np.where(decided, np.arange(uw.shape[1]), 0)
+    np.maximum.accumulate(last_decided, axis=1, out=last_decided)
+    return np.take_along_axis(state, last_decided, axis=1)
+
+
+def _find_episodes(uw: np.ndarray) -> _Episodes:
+    """Extract every drawdown episode from ``(n_series, n_obs)`` underwater curves.
+
+    Each row is padded with one out-of-drawdown bar so runs never cross
+    series and a run reaching the pad is an unrecovered episode.
+    """
+    n_series, n_obs = uw.shape
+    width = n_obs + 1
+
+    state = np.zeros((n_series, width), dtype=np.int8)
+    state[:, :n_obs] = _in_drawdown(uw)
+    edges = np.diff(state.ravel(), prepend=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    if len(starts) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return _Episodes(empty, empty, empty, empty, np.empty(0))
+
+    # Bars between runs are at or above the threshold (the pad is 0.0), so the
+    # minimum over [start_k, start_{k+1}) is the minimum of run k.
+    flat_uw = np.zeros((n_series, width))
+    flat_uw[:, :n_obs] = uw
+    flat_uw = flat_uw.ravel()
+    troughs_uw = np.fmin.reduceat(flat_uw, starts)
+
+    # First bar of each run that attains the run minimum
+    lengths = np.diff(np.append(starts, len(flat_uw)))
+    hits = np.flatnonzero(flat_uw[starts[0] :] == np.repeat(troughs_uw, lengths)) + starts[0]
+    troughs = hits[np.searchsorted(hits, starts)]
+
+    series, start = np.divmod(starts, width)
+    end = ends % width
+    return _Episodes(
+        series=series,
+        start=start - 1,  # last bar at the prior peak
+        trough=troughs % width,
+        end=np.where(end == n_obs, -1, end),
+        depth=-troughs_uw,
+    )
+
+
+def _as_returns_matrix(returns: np.ndarray) -> np.ndarray:
+    """Validate ``(n_obs, n_series)`` returns and transpose to series-major."""
+    matrix = np.asarray(returns, dtype=float)
+    if matrix.ndim != 2:
+        raise ValueError(f"returns must be 2-D (n_obs, n_series), got {matrix.ndim}-D")
+    n_obs = matrix.shape[0]
+    if n_obs < 2:
+        raise ValueError(f"returns must have at least 2 observations, got {n_obs}")
+    return np.ascontiguousarray(matrix.T)
+
+
+def _analyse(returns: np.ndarray, top_n: int) -> list[DrawdownAnalysisResult]:
+    """Drawdown analysis for each row of series-major ``returns``."""
+    if top_n < 1:
+        raise ValueError(f"top_n must be >= 1, got {top_n}")
+
+    n_series, n_obs = returns.shape
+    uw = _underwater(returns)
+    uw.flags.writeable = False
+    ep = _find_episodes(uw)
+
+    # ── Aggregate stats from all detected periods ─────────────────────
+    recovered = ep.end >= 0
+    count = np.bincount(ep.series, minlength=n_series)
+    n_recovered = np.bincount(ep.series[recovered], minlength=n_series)
+    depth_sum = np.bincount(ep.series, weights=ep.depth, minlength=n_series)
+    duration_sum = np.bincount(ep.series, weights=ep.trough - ep.start, minlength=n_series)
+    recovery_sum = np.bincount(ep.series[recovered], weights=(ep.end - ep.trough)[recovered], minlength=n_series)
+
+    # ── Top-N periods sorted by depth descending (ties chronological) ─
+    order = np.lexsort((np.arange(len(ep.depth)), -ep.depth, ep.series))
+    first = np.searchsorted(ep.series[order], np.arange(n_series))
+
+    results = []
+    for i in range(n_series):
+        top = order[first[i] : first[i] + min(top_n, count[i])]
+        top_periods = tuple(
+            DrawdownPeriod(
+                start_idx=start,
+                trough_idx=trough,
+                end_idx=end if end >= 0 else None,
+                depth=depth,
+                duration_bars=trough - start,
+                recovery_bars=end - trough if end >= 0 else None,
+            )
+            for start, trough, end, depth in zip(
+                ep.start[top].tolist(),
+                ep.trough[top].tolist(),
+                ep.end[top].tolist(),
+                ep.depth[top].tolist(),
+                strict=True,
+            )
+        )
+        n = int(count[i])
+        results.append(
+            DrawdownAnalysisResult(
+                periods=top_periods,
+                underwater_curve=uw[i],
+                n_periods=len(top_periods),
+                max_depth=top_periods[0].depth if top_periods else 0.0,
+                avg_depth=float(depth_sum[i] / n) if n else 0.0,
+                avg_duration_bars=float(duration_sum[i] / n) if n else 0.0,
+                avg_recovery_bars=float(recovery_sum[i] / n_recovered[i]) if n_recovered[i] else None,
+                current_drawdown=float(max(-uw[i, -1], 0.0)),
+                n_observations=n_obs,
+            )
+        )
+    return results
+
+
 def compute_drawdown_analysis(
     returns: np.ndarray,
     top_n: int = 5,
@@ -38,8 +195,8 @@ def compute_drawdown_analysis(
             result, sorted by depth (deepest first).  Defaults to 5.
 
     Returns:
-        DrawdownAnalysisResult with the underwater curve, top-N
-        periods, and aggregate statistics.
+        DrawdownAnalysisResult with the underwater curve (a read-only
+        NumPy array), top-N periods, and aggregate statistics.
 
     Raises:
         ValueError: If fewer than 2 observations are supplied or
@@ -50,90 +207,30 @@ def compute_drawdown_analysis(
 
     if n < 2:
         raise ValueError(f"returns must have at least 2 observations, got {n}")
-    if top_n < 1:
-        raise ValueError(f"top_n must be >= 1, got {top_n}")
 
-    wealth = np.cumprod(1.0 + returns)
-    peak = np.maximum.accumulate(wealth)
-    uw = (wealth - peak) / peak  # underwater curve (non-positive)
-
-    # ── State-machine scan ────────────────────────────────────────────
-    all_periods: list[DrawdownPeriod] = []
-    in_drawdown = False
-    peak_idx = 0
-    trough_idx = 0
-
-    for i in range(n):
-        if not in_drawdown:
-            if uw[i] < _RECOVERY_THRESHOLD:
-                in_drawdown = True
-                trough_idx = i
-            else:
-                peak_idx = i
-        else:
-            if uw[i] < uw[trough_idx]:
-                trough_idx = i
-            if uw[i] >= _RECOVERY_THRESHOLD:
-                depth = float(-uw[trough_idx])
-                dur = trough_idx - peak_idx
-                rec = i - trough_idx
-                all_periods.append(
-                    DrawdownPeriod(
-                        start_idx=peak_idx,
-                        trough_idx=trough_idx,
-                        end_idx=i,
-                        depth=depth,
-                        duration_bars=dur,
-                        recovery_bars=rec,
-                    )
-                )
-                in_drawdown = False
-                peak_idx = i
-
-    if in_drawdown:
-        depth = float(-uw[trough_idx])
-        dur = trough_idx - peak_idx
-        all_periods.append(
-            DrawdownPeriod(
-                start_idx=peak_idx,
-                trough_idx=trough_idx,
-                end_idx=None,
-                depth=depth,
-                duration_bars=dur,
-                recovery_bars=None,
-            )
-        )
+    return _analyse(returns.reshape(1, n), top_n)[0]
 
-    # ── Aggregate stats from all detected periods ─────────────────────
-    if all_periods:
-        max_depth = max(p.depth for p in all_periods)
-        avg_depth = sum(p.depth for p in all_periods) / len(all_periods)
-        avg_duration = sum(p.duration_bars for p in all_periods) / len(all_periods)
-        recovered = [p for p in all_periods if p.recovery_bars is not None]
-        avg_recovery: float | None = (
-            sum(p.recovery_bars for p in recovered) / len(recovered)  # type: ignore[misc]
-            if recovered
-            else None
-        )
-    else:
-        max_depth = 0.0
-        avg_depth = 0.0
-        avg_duration = 0.0
-        avg_recovery = None
-
-    current_drawdown = float(max(-uw[-1], 0.0))
-
-    # ── Top-N periods sorted by depth descending ──────────────────────
-    top_periods = tuple(sorted(all_periods, key=lambda p: p.depth, reverse=True)[:top_n])
-
-    return DrawdownAnalysisResult(
-        periods=top_periods,
-        underwater_curve=tuple(float(x) for x in uw),
-        n_periods=len(top_periods),
-        max_depth=max_depth,
-        avg_depth=avg_depth,
-        avg_duration_bars=avg_duration,
-        avg_recovery_bars=avg_recovery,
-        current_drawdown=current_drawdown,
-        n_observations=n,
-    )
+
+def compute_drawdown_analysis_batch(
+    returns: np.ndarray,
+    top_n: int = 5,
+) -> list[DrawdownAnalysisResult]:
+    """Drawdown analysis for many return series at once.
+
+    Equivalent to calling ``compute_drawdown_analysis`` on every column,
+    but the underwater curves and episode boundaries for all series are
+    computed in a single vectorized pass.
+
+    Args:
+        returns: 2-D ``(n_obs, n_series)`` array of period returns, e.g.
+            the equity-curve returns of a ``backtest_batch`` run.
+        top_n: Maximum number of drawdown periods to retain per series.
+
+    Returns:
+        One DrawdownAnalysisResult per column, in column order.
+
+    Raises:
+        ValueError: If ``returns`` is not 2-D, has fewer than 2 rows, or
+            ``top_n < 1``.
+    """
+    return _analyse(_as_returns_matrix(returns), top_n)
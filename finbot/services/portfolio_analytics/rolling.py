@@ -1,8 +1,13 @@
 """Rolling performance metrics for a returns series.
 
-Computes rolling Sharpe ratio, annualized volatility, and (optionally)
-rolling beta relative to a benchmark — all as full-length time-series
-using a sliding window.
+Computes rolling Sharpe ratio, annualized volatility, Sortino ratio,
+drawdown and (optionally) rolling beta and correlation relative to a
+benchmark — all as full-length time-series using a sliding window.
+
+All window statistics come from ``rolling_statistics``, an O(n) kernel built
+on cumulative sums of column-centred values (so each window costs O(1)
+regardless of its length) that accepts a 2-D ``(n_obs, n_series)`` array to
+evaluate many series at once.
 
 The first ``window - 1`` positions contain ``NaN`` (insufficient history).
 """
@@ -11,8 +16,10 @@ from __future__ import annotations
 
 import math
 from collections.abc import Sequence
+from dataclasses import dataclass
 
 import numpy as np
+from scipy.ndimage import maximum_filter1d
 
 from finbot.core.contracts.portfolio_analytics import RollingMetricsResult
 
@@ -20,6 +27,36 @@ _MIN_OBSERVATIONS = 30
 _DEFAULT_WINDOW = 63  # ~1 quarter of trading days
 _DEFAULT_ANNUALIZATION = 252
 
+# Window variances below this fraction of the window's mean squared deviation
+# are cumulative-sum rounding noise and are treated as zero.
+_VARIANCE_RTOL = 1e-10
+
+
+@dataclass(frozen=True, slots=True)
+class RollingStatistics:
+    """Rolling metrics for one or more return series.
+
+    Every array has shape ``(n_obs, n_series)``; the first ``window - 1`` rows
+    are ``NaN``.
+
+    Attributes:
+        window: Rolling window size in bars.
+        sharpe: Annualized Sharpe ratio of excess returns.
+        volatility: Annualized volatility.
+        sortino: Annualized Sortino ratio (downside deviation of excess returns).
+        drawdown: Drawdown from the highest wealth reached within the window.
+        beta: Beta vs benchmark; ``None`` when no benchmark was supplied.
+        correlation: Correlation with benchmark; ``None`` without benchmark.
+    """
+
+    window: int
+    sharpe: np.ndarray
+    volatility: np.ndarray
+    sortino: np.ndarray
+    drawdown: np.ndarray
+    beta: np.ndarray | None = None
+    correlation: np.ndarray | None = None
+
 
 def _validate_returns(returns: np.ndarray, label: str = "returns") -> None:
     """Raise ValueError if the returns array is too short."""
@@ -29,6 +66,147 @@ def _validate_returns(returns: np.ndarray, label: str = "returns") -> None:
         raise ValueError(f"{label} must not contain NaN or infinite values")
 
 
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Sum of each trailing window along axis 0.
+
+    Rows before ``window - 1`` hold partial sums; callers overwrite them.
+    """
+    sums = np.cumsum(values, axis=0)
+    sums[window:] -= sums[:-window].copy()
+    return sums
+
+
+def _rolling_moments(
+    x: np.ndarray,
+    window: int,
+    y: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None, np.ndarray | None]:
+    """Rolling mean and sample variance of ``x`` (and covariance with ``y``).
+
+    Columns are centred on their full-sample mean before accumulating, which
+    keeps the cumulative sums small and avoids cancellation in
+    ``sum(x**2) - sum(x)**2 / window``.
+
+    Returns:
+        ``(mean_x, var_x, var_y, cov_xy)``; the ``y`` terms are ``None`` when
+        ``y`` is omitted.
+    """
+    x_offset = x.mean(axis=0)
+    xc = x - x_offset
+    sx = _rolling_sum(xc, window)
+    sxx = _rolling_sum(xc * xc, window)
+    mean_x = sx / window + x_offset
+    var_x = _clean_variance(sxx - sx * sx / window, sxx) / (window - 1)
+
+    if y is None:
+        return mean_x, var_x, None, None
+
+    yc = y - y.mean(axis=0)
+    sy = _rolling_sum(yc, window)
+    syy = _rolling_sum(yc * yc, window)
+    var_y = _clean_variance(syy - sy * sy / window, syy) / (window - 1)
+    cov_xy = (_rolling_sum(xc * yc, window) - sx * sy / window) / (window - 1)
+    return mean_x, var_x, var_y, cov_xy
+
+
+def _clean_variance(sum_sq_dev: np.ndarray, sum_sq: np.ndarray) -> np.ndarray:
+    """Zero out negative or rounding-noise sums of squared deviations."""
+    return np.where(sum_sq_dev > _VARIANCE_RTOL * sum_sq, sum_sq_dev, 0.0)
+
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """``numerator / denominator``, 0.0 where the denominator is not positive."""
+    positive = denominator > 0
+    return np.divide(numerator, denominator, out=np.zeros(np.broadcast(numerator, denominator).shape), where=positive)
+
+
+def _mask_warmup(values: np.ndarray, window: int) -> np.ndarray:
+    """Set the first ``window - 1`` rows (insufficient history) to NaN."""
+    values[: window - 1] = np.nan
+    return values
+
+
+def rolling_statistics(
+    returns: np.ndarray,
+    window: int = _DEFAULT_WINDOW,
+    benchmark_returns: np.ndarray | None = None,
+    risk_free_rate: float = 0.0,
+    annualization_factor: int = _DEFAULT_ANNUALIZATION,
+) -> RollingStatistics:
+    """Compute rolling metrics for many return series at once in O(n).
+
+    Args:
+        returns: ``(n_obs,)`` or ``(n_obs, n_series)`` array of period returns.
+        window: Rolling window size in bars.
+        benchmark_returns: Optional ``(n_obs,)`` benchmark shared by all series,
+            or ``(n_obs, n_series)`` with one benchmark per series.
+        risk_free_rate: Annual risk-free rate as a fraction.
+        annualization_factor: Trading periods per year.
+
+    Returns:
+        RollingStatistics with ``(n_obs, n_series)`` arrays (``n_series`` is 1
+        for 1-D input).
+
+    Raises:
+        ValueError: If ``window`` is not in ``[2, n_obs]``, inputs are not
+            finite, or ``benchmark_returns`` has an incompatible shape.
+    """
+    x = np.asarray(returns, dtype=float)
+    if x.ndim == 1:
+        x = x[:, np.newaxis]
+    if x.ndim != 2:
+        raise ValueError(f"returns must be 1-D or 2-D, got {x.ndim}-D")
+    n = x.shape[0]
+    if window < 2 or window > n:
+        raise ValueError(f"window must be between 2 and the number of observations ({n}), got {window}")
+    if not np.all(np.isfinite(x)):
+        raise ValueError("returns must not contain NaN or infinite values")
+
+    bench: np.ndarray | None = None
+    if benchmark_returns is not None:
+        bench = np.asarray(benchmark_returns, dtype=float)
+        if bench.ndim == 1:
+            bench = bench[:, np.newaxis]
+        if bench.shape[0] != n or bench.shape[1] not in (1, x.shape[1]):
+            raise ValueError(f"benchmark_returns shape {bench.shape} is incompatible with returns shape {x.shape}")
+        if not np.all(np.isfinite(bench)):
+            raise ValueError("benchmark_returns must not contain NaN or infinite values")
+        bench = np.broadcast_to(bench, x.shape)
+
+    sqrt_ann = math.sqrt(annualization_factor)
+    excess = x - risk_free_rate / annualization_factor
+
+    mean, var, bench_var, cov = _rolling_moments(excess, window, bench)
+    sigma = np.sqrt(var)
+    sharpe = _safe_ratio(mean, sigma) * sqrt_ann
+    volatility = sigma * sqrt_ann
+
+    # Downside deviation: root mean square of negative excess returns
+    downside = np.sqrt(_rolling_sum(np.minimum(excess, 0.0) ** 2, window) / window)
+    sortino = _safe_ratio(mean, downside) * sqrt_ann
+
+    # Drawdown from the peak wealth within the trailing window (O(n) running max)
+    wealth = np.cumprod(1.0 + x, axis=0)
+    window_peak = maximum_filter1d(wealth, size=window, axis=0, origin=(window - 1) // 2)
+    drawdown = wealth / window_peak - 1.0
+
+    beta: np.ndarray | None = None
+    correlation: np.ndarray | None = None
+    if bench_var is not None and cov is not None:
+        beta = _mask_warmup(_safe_ratio(cov, bench_var), window)
+        correlation = _mask_warmup(np.clip(_safe_ratio(cov, np.sqrt(var * bench_var)), -1.0, 1.0), window)
+
+    return RollingStatistics(
+        window=window,
+        sharpe=_mask_warmup(sharpe, window),
+        volatility=_mask_warmup(volatility, window),
+        sortino=_mask_warmup(sortino, window),
+        drawdown=_mask_warmup(drawdown, window),
+        beta=beta,
+        correlation=correlation,
+    )
+
+
 def compute_rolling_metrics(
     returns: np.ndarray,
     window: int = _DEFAULT_WINDOW,
@@ -37,17 +215,18 @@ def compute_rolling_metrics(
     annualization_factor: int = _DEFAULT_ANNUALIZATION,
     dates: Sequence[str] | None = None,
 ) -> RollingMetricsResult:
-    """Compute rolling Sharpe ratio, volatility, and beta.
+    """Compute rolling Sharpe ratio, volatility, Sortino, drawdown, and beta.
 
     For each bar ``i >= window - 1`` the metrics are calculated over the
     window ``returns[i - window + 1 : i + 1]``.  Earlier positions hold
-    ``float('nan')``.
+    ``float('nan')``.  Use ``rolling_statistics`` for many series at once.
 
     Args:
         returns: 1-D array of period returns (e.g. 0.01 = 1% gain).
         window: Rolling window size in bars.  Defaults to 63 (~1 quarter).
         benchmark_returns: Optional 1-D benchmark returns array of the same
-            length as ``returns``.  When supplied, rolling beta is computed.
+            length as ``returns``.  When supplied, rolling beta and
+            correlation are computed.
         risk_free_rate: Annual risk-free rate as a fraction (e.g. 0.04 = 4%).
             Converted to a per-bar rate internally.
         annualization_factor: Trading periods per year.  Defaults to 252.
@@ -55,8 +234,9 @@ def compute_rolling_metrics(
             ordinal string indices when omitted.
 
     Returns:
-        RollingMetricsResult with ``sharpe``, ``volatility``, and optionally
-        ``beta`` series, each of length ``n``.
+        RollingMetricsResult with ``sharpe``, ``volatility``, ``sortino``,
+        ``drawdown`` and optionally ``beta``/``correlation`` series, each of
+        length ``n``.
 
     Raises:
         ValueError: If fewer than 30 observations are supplied, ``window < 2``,
@@ -82,41 +262,25 @@ def compute_rolling_metrics(
     if dates is not None and len(dates) != n:
         raise ValueError(f"dates length ({len(dates)}) must equal returns length ({n})")
 
-    rf_per_bar = risk_free_rate / annualization_factor
-    excess = returns - rf_per_bar
-    sqrt_ann = math.sqrt(annualization_factor)
-
-    sharpe_arr = np.full(n, float("nan"))
-    vol_arr = np.full(n, float("nan"))
-    beta_arr: np.ndarray | None = np.full(n, float("nan")) if benchmark_returns is not None else None
-
-    for i in range(window - 1, n):
-        start = i - window + 1
-        window_excess = excess[start : i + 1]
-        mu = float(np.mean(window_excess))
-        sigma = float(np.std(window_excess, ddof=1))
-
-        sharpe_arr[i] = (mu / sigma * sqrt_ann) if sigma > 0 else 0.0
-        vol_arr[i] = sigma * sqrt_ann
-
-        if benchmark_returns is not None and beta_arr is not None:
-            window_bench = benchmark_returns[start : i + 1]
-            bench_var = float(np.var(window_bench, ddof=1))
-            if bench_var > 0:
-                cov_val = float(np.cov(window_excess, window_bench, ddof=1)[0, 1])
-                beta_arr[i] = cov_val / bench_var
-            else:
-                beta_arr[i] = 0.0
+    stats = rolling_statistics(
+        returns,
+        window=window,
+        benchmark_returns=benchmark_returns,
+        risk_free_rate=risk_free_rate,
+        annualization_factor=annualization_factor,
+    )
 
     date_labels = tuple(dates) if dates is not None else tuple(str(i) for i in range(n))
-    beta_tuple: tuple[float, ...] | None = tuple(float(x) for x in beta_arr) if beta_arr is not None else None
 
     return RollingMetricsResult(
         window=window,
         n_obs=n,
-        sharpe=tuple(float(x) for x in sharpe_arr),
-        volatility=tuple(float(x) for x in vol_arr),
-        beta=beta_tuple,
+        sharpe=tuple(stats.sharpe[:, 0].tolist()),
+        volatility=tuple(stats.volatility[:, 0].tolist()),
+        beta=tuple(stats.beta[:, 0].tolist()) if stats.beta is not None else None,
         dates=date_labels,
         annualization_factor=annualization_factor,
+        sortino=tuple(stats.sortino[:, 0].tolist()),
+        drawdown=tuple(stats.drawdown[:, 0].tolist()),
+        correlation=tuple(stats.correlation[:, 0].tolist()) if stats.correlation is not None else None,
     )
@@ -35,10 +35,11 @@ def plot_rolling_metrics(
     *,
     title: str | None = None,
 ) -> go.Figure:
-    """Subplot of rolling Sharpe ratio, annualized volatility, and beta.
+    """Subplot of rolling Sharpe/Sortino, volatility, drawdown, and beta.
 
-    Produces 2 rows (Sharpe + Vol) when no beta series is present, or
-    3 rows (Sharpe + Vol + Beta) when a benchmark was supplied.
+    Rows: Sharpe (with Sortino when present), annualized volatility, window
+    drawdown (when present), and beta with correlation (when a benchmark was
+    supplied).
 
     Args:
         result: ``RollingMetricsResult`` from ``compute_rolling_metrics``.
@@ -47,11 +48,14 @@ def plot_rolling_metrics(
     Returns:
         Plotly ``Figure`` with shared x-axis subplots.
     """
+    has_drawdown = result.drawdown is not None
     has_beta = result.beta is not None
-    n_rows = 3 if has_beta else 2
     subplot_titles = ["Rolling Sharpe Ratio", f"Rolling Volatility (Ann., window={result.window})"]
+    if has_drawdown:
+        subplot_titles.append("Rolling Drawdown (from window peak)")
     if has_beta:
         subplot_titles.append("Rolling Beta vs Benchmark")
+    n_rows = len(subplot_titles)
 
     fig = make_subplots(
         rows=n_rows,
@@ -68,6 +72,12 @@ def plot_rolling_metrics(
         row=1,
         col=1,
     )
+    if result.sortino is not None:
+        fig.add_trace(
+            go.Scatter(x=x, y=list(result.sortino), mode="lines", name="Sortino", line={"color": _PINK}),
+            row=1,
+            col=1,
+        )
     fig.add_hline(y=0, line_dash="dash", line_color="gray", row=1, col=1)
 
     fig.add_trace(
@@ -82,6 +92,23 @@ def plot_rolling_metrics(
         col=1,
     )
 
+    row = 3
+    if has_drawdown and result.drawdown is not None:
+        fig.add_trace(
+            go.Scatter(
+                x=x,
+                y=list(result.drawdown),
+                mode="lines",
+                name="Drawdown",
+                fill="tozeroy",
+                line={"color": _RED},
+            ),
+            row=row,
+            col=1,
+        )
+        fig.update_yaxes(title_text="Drawdown", tickformat=".0%", row=row, col=1)
+        row += 1
+
     if has_beta and result.beta is not None:
         fig.add_trace(
             go.Scatter(
@@ -91,20 +118,31 @@ def plot_rolling_metrics(
                 name="Beta",
                 line={"color": _GREEN},
             ),
-            row=3,
+            row=row,
             col=1,
         )
-        fig.add_hline(y=1, line_dash="dash", line_color="gray", row=3, col=1)
+        if result.correlation is not None:
+            fig.add_trace(
+                go.Scatter(
+                    x=x,
+                    y=list(result.correlation),
+                    mode="lines",
+                    name="Correlation",
+                    line={"color": _GREEN, "dash": "dot"},
+                ),
+                row=row,
+                col=1,
+            )
+        fig.add_hline(y=1, line_dash="dash", line_color="gray", row=row, col=1)
+        fig.update_yaxes(title_text="Beta", row=row, col=1)
 
     fig.update_layout(
         title=title or f"Rolling Metrics (window = {result.window} bars)",
-        height=400 if not has_beta else 550,
+        height=250 + 150 * n_rows,
         showlegend=True,
     )
     fig.update_yaxes(title_text="Sharpe", row=1, col=1)
     fig.update_yaxes(title_text="Vol (ann.)", row=2, col=1)
-    if has_beta:
-        fig.update_yaxes(title_text="Beta", row=3, col=1)
 
     return fig
 
@@ -201,7 +239,7 @@ def plot_underwater_curve(
         Plotly ``Figure`` with the full underwater time-series.
     """
     x = list(range(result.n_observations))
-    y = list(result.underwater_curve)
+    y = np.asarray(result.underwater_curve)
 
     fig = go.Figure()
     fig.add_trace(
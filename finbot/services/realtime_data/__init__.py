@@ -2,11 +2,15 @@
 
 Provides real-time stock/ETF quotes from multiple providers (Alpaca,
 Twelve Data, yfinance) with automatic fallback, symbol routing for
-Canadian markets, and thread-safe caching.
+Canadian markets, and a thread-safe, stale-while-revalidate cache that a
+``QuotePrefetcher`` can keep warm for a watchlist.  A ``QuoteHub`` pushes
+changed quotes to many subscribers from one shared poll.
 """
 
 from finbot.services.realtime_data.composite_provider import CompositeQuoteProvider
-from finbot.services.realtime_data.quote_cache import QuoteCache
+from finbot.services.realtime_data.prefetcher import QuotePrefetcher
+from finbot.services.realtime_data.quote_cache import CachedQuote, QuoteCache, QuoteCacheStats
+from finbot.services.realtime_data.quote_hub import QuoteHub, QuoteHubStats, QuoteSubscription
 from finbot.services.realtime_data.viz import (
     plot_provider_status,
     plot_quote_table,
@@ -14,8 +18,14 @@ from finbot.services.realtime_data.viz import (
 )
 
 __all__ = [
+    "CachedQuote",
     "CompositeQuoteProvider",
     "QuoteCache",
+    "QuoteCacheStats",
+    "QuoteHub",
+    "QuoteHubStats",
+    "QuotePrefetcher",
+    "QuoteSubscription",
     "plot_provider_status",
     "plot_quote_table",
     "plot_sparkline",
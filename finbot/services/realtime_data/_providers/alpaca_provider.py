@@ -3,6 +3,9 @@
 Uses the IEX feed (free tier) via ``data.alpaca.markets/v2/stocks/snapshots``
 to fetch real-time US equity snapshots.  Requires ``ALPACA_API_KEY`` and
 ``ALPACA_SECRET_KEY`` environment variables.
+
+``aget_quotes`` is the asyncio variant used by the composite provider; it
+sends the same request through a caller-owned, pooled ``httpx.AsyncClient``.
 """
 
 from __future__ import annotations
@@ -11,12 +14,18 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
+import httpx
+
 from finbot.core.contracts.realtime_data import Exchange, Quote, QuoteProvider
 from finbot.utils.request_utils.request_handler import RequestHandler
 
 logger = logging.getLogger(__name__)
 
 _BASE_URL = "https://data.alpaca.markets"
+_SNAPSHOTS_PATH = "/v2/stocks/snapshots"
+
+# Symbols per snapshots request; keeps the query string well under URL limits
+MAX_BATCH_SIZE = 200
 
 
 def is_available() -> bool:
@@ -68,17 +77,46 @@ def get_quotes(symbols: list[str]) -> dict[str, Quote]:
     if not symbols:
         return {}
 
-    url = f"{_BASE_URL}/v2/stocks/snapshots"
-    params = {"symbols": ",".join(symbols), "feed": "iex"}
+    url = f"{_BASE_URL}{_SNAPSHOTS_PATH}"
     headers = _get_headers()
 
     handler = RequestHandler()
     try:
-        data = handler.make_json_request(url, headers=headers, payload_kwargs={"params": params})
+        data = handler.make_json_request(url, headers=headers, payload_kwargs={"params": _snapshot_params(symbols)})
     except Exception:
         logger.warning("Alpaca: failed to fetch snapshots for %s", symbols)
         return {}
 
+    return _parse_snapshots(symbols, data)
+
+
+async def aget_quotes(client: httpx.AsyncClient, symbols: list[str]) -> dict[str, Quote]:
+    """Fetch snapshots for multiple US equities without blocking the event loop.
+
+    Args:
+        client: Pooled client whose ``base_url`` is the Alpaca data API.
+        symbols: List of US equity tickers.
+
+    Returns:
+        Mapping of symbol to ``Quote`` for successful fetches.
+
+    Raises:
+        httpx.HTTPError: If the request fails or Alpaca returns an error status.
+    """
+    if not symbols:
+        return {}
+
+    response = await client.get(_SNAPSHOTS_PATH, params=_snapshot_params(symbols), headers=_get_headers())
+    response.raise_for_status()
+    return _parse_snapshots(symbols, response.json())
+
+
+def _snapshot_params(symbols: list[str]) -> dict[str, str]:
+    return {"symbols": ",".join(symbols), "feed": "iex"}
+
+
+def _parse_snapshots(symbols: list[str], data: dict[str, Any]) -> dict[str, Quote]:
+    """Convert a snapshots response to quotes, skipping missing or malformed entries."""
     results: dict[str, Quote] = {}
     for sym in symbols:
         snap = data.get(sym)
@@ -3,6 +3,10 @@
 Supports US and Canadian (TSX/TSXV) equities via
 ``api.twelvedata.com/quote``.  Requires ``TWELVEDATA_API_KEY``
 environment variable.
+
+``aget_quotes`` is the asyncio variant used by the composite provider; it
+sends the same batch request through a caller-owned, pooled
+``httpx.AsyncClient``.
 """
 
 from __future__ import annotations
@@ -11,12 +15,19 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
+import httpx
+
 from finbot.core.contracts.realtime_data import Exchange, Quote, QuoteProvider
 from finbot.utils.request_utils.request_handler import RequestHandler
 
 logger = logging.getLogger(__name__)
 
 _BASE_URL = "https://api.twelvedata.com"
+_QUOTE_PATH = "/quote"
+
+# Twelve Data accepts at most 120 symbols per batch request; every symbol
+# costs one API credit
+MAX_BATCH_SIZE = 120
 
 
 def is_available() -> bool:
@@ -94,9 +105,8 @@ def get_quotes(symbols: list[str]) -> dict[str, Quote]:
     if not symbols:
         return {}
 
-    td_symbols = [transform_symbol(s) for s in symbols]
-    url = f"{_BASE_URL}/quote"
-    params = {"symbol": ",".join(td_symbols), "apikey": _get_api_key()}
+    url = f"{_BASE_URL}{_QUOTE_PATH}"
+    params = _batch_params(symbols)
 
     handler = RequestHandler()
     try:
@@ -106,6 +116,36 @@ def get_quotes(symbols: list[str]) -> dict[str, Quote]:
         logger.warning("Twelve Data: batch request failed for %s", symbols)
         return {}
 
+    return _parse_batch(symbols, data)
+
+
+async def aget_quotes(client: httpx.AsyncClient, symbols: list[str]) -> dict[str, Quote]:
+    """Fetch quotes for multiple symbols without blocking the event loop.
+
+    Args:
+        client: Pooled client whose ``base_url`` is the Twelve Data API.
+        symbols: List of ticker symbols.
+
+    Returns:
+        Mapping of symbol to ``Quote`` for successful fetches.
+
+    Raises:
+        httpx.HTTPError: If the request fails or Twelve Data returns an error status.
+    """
+    if not symbols:
+        return {}
+
+    response = await client.get(_QUOTE_PATH, params=_batch_params(symbols))
+    response.raise_for_status()
+    return _parse_batch(symbols, response.json())
+
+
+def _batch_params(symbols: list[str]) -> dict[str, str]:
+    return {"symbol": ",".join(transform_symbol(s) for s in symbols), "apikey": _get_api_key()}
+
+
+def _parse_batch(symbols: list[str], data: object) -> dict[str, Quote]:
+    """Convert a single or batch quote response to quotes, skipping failed entries."""
     results: dict[str, Quote] = {}
     items: list[dict[str, Any]]
     # Single symbol returns a dict; multiple returns a list
@@ -2,12 +2,16 @@
 
 Wraps the existing ``get_current_price()`` utility to produce ``Quote``
 contract objects.  Always available (no API key required), but slower
-than the dedicated providers.
+than the dedicated providers.  yfinance has no batch quote call, so
+``get_quotes`` and ``aget_quotes`` run one ``get_quote`` per symbol in worker
+threads, at most ``MAX_CONCURRENCY`` at a time.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC
 
 import yfinance as yf
@@ -16,6 +20,15 @@ from finbot.core.contracts.realtime_data import Exchange, Quote, QuoteProvider
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENCY = 8
+
+# Symbols handed to one ``aget_quotes`` call by the composite provider
+MAX_BATCH_SIZE = 50
+
+# Semaphores belong to the event loop they are first used on
+_semaphore: asyncio.Semaphore | None = None
+_semaphore_loop: asyncio.AbstractEventLoop | None = None
+
 
 def is_available() -> bool:
     """yfinance is always available (no API key required)."""
@@ -68,13 +81,52 @@ def get_quotes(symbols: list[str]) -> dict[str, Quote]:
     Returns:
         Mapping of symbol to ``Quote`` for successful fetches.
     """
-    results: dict[str, Quote] = {}
-    for sym in symbols:
-        try:
-            results[sym] = get_quote(sym)
-        except (ValueError, Exception):
-            logger.warning("yfinance: failed to fetch quote for %s", sym)
-    return results
+    if not symbols:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(symbols))) as pool:
+        fetched = list(pool.map(_get_quote_or_none, symbols))
+    return {sym: quote for sym, quote in zip(symbols, fetched, strict=True) if quote is not None}
+
+
+async def aget_quotes(symbols: list[str]) -> dict[str, Quote]:
+    """Fetch quotes for multiple symbols without blocking the event loop.
+
+    Args:
+        symbols: List of ticker symbols.
+
+    Returns:
+        Mapping of symbol to ``Quote`` for successful fetches.
+    """
+    semaphore = _loop_semaphore()
+
+    async def fetch(sym: str) -> Quote | None:
+        async with semaphore:
+            return await asyncio.to_thread(_get_quote_or_none, sym)
+
+    fetched = await asyncio.gather(*(fetch(sym) for sym in symbols))
+    return {sym: quote for sym, quote in zip(symbols, fetched, strict=True) if quote is not None}
+
+
+def _loop_semaphore() -> asyncio.Semaphore:
+    """The provider-wide concurrency limit, rebuilt when the running event loop changes.
+
+    Sharing one semaphore caps concurrent yfinance calls across all overlapping
+    ``aget_quotes`` calls instead of per call.
+    """
+    global _semaphore, _semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _semaphore is None or _semaphore_loop is not loop:
+        _semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        _semaphore_loop = loop
+    return _semaphore
+
+
+def _get_quote_or_none(symbol: str) -> Quote | None:
+    try:
+        return get_quote(symbol)
+    except Exception:
+        logger.warning("yfinance: failed to fetch quote for %s", symbol)
+        return None
 
 
 def _detect_exchange(symbol: str) -> Exchange:
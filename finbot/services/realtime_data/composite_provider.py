@@ -6,17 +6,44 @@ Routes requests through available providers in priority order:
 
 Skips providers silently when their ``is_available()`` returns ``False``
 (i.e. API key not configured).
+
+``aget_quotes`` is the asyncio path used by the API.  It fetches the US and
+Canadian partitions, and every ``MAX_BATCH_SIZE`` chunk of a tier,
+concurrently over one pooled ``httpx.AsyncClient`` per provider.  Each
+provider has a ``TokenBucket`` built from its API resource group, and a tier
+whose bucket would make the caller wait longer than ``max_rate_limit_wait``
+is skipped in favour of the next one.  Concurrent callers missing the cache
+for the same symbol share one upstream fetch (single-flight).
+
+With ``stale_grace_seconds`` > 0 the cache serves stale-while-revalidate:
+a quote up to that far past its TTL is returned immediately and refreshed
+in the background (a worker thread for the sync methods, a task for the
+async ones), so callers only wait on upstream for symbols never seen or long
+expired.  ``refresh`` and ``arefresh`` fetch regardless of the cache;
+``QuotePrefetcher`` and ``QuoteHub`` use ``arefresh``, so their polls share
+the rate limits and in-flight fetches of the async path.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Callable
+import threading
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
 
+import httpx
+
 from finbot.core.contracts.realtime_data import ProviderStatus, Quote, QuoteBatch, QuoteProvider
+from finbot.libs.api_manager._resource_groups.api_resource_groups import (
+    alpaca_api_resource_group,
+    twelvedata_api_resource_group,
+)
 from finbot.services.realtime_data._providers import alpaca_provider, twelvedata_provider, yfinance_provider
-from finbot.services.realtime_data.quote_cache import QuoteCache
+from finbot.services.realtime_data.quote_cache import QuoteCache, QuoteCacheStats
+from finbot.utils.request_utils.token_bucket import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +52,23 @@ _SingleChain = list[tuple[QuoteProvider, Callable[[str], Quote], Callable[[], bo
 _BatchChain = list[tuple[QuoteProvider, Callable[[list[str]], dict[str, Quote]], Callable[[], bool]]]
 
 _DEFAULT_CACHE_TTL = 15.0
+_DEFAULT_MAX_CACHE_ENTRIES = 10_000
+_NO_DATA_ERROR = "No provider returned data"
+_DEFAULT_MAX_RATE_LIMIT_WAIT = 1.0
+_HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+
+@dataclass(frozen=True, slots=True)
+class _AsyncTier:
+    """One provider in an async fallback chain."""
+
+    provider: QuoteProvider
+    fetch: Callable[[httpx.AsyncClient, list[str]], Awaitable[dict[str, Quote]]]
+    is_available: Callable[[], bool]
+    batch_size: int
+    base_url: str | None = None
+    credits_per_symbol: bool = False
 
 
 class CompositeQuoteProvider:
@@ -32,15 +76,54 @@ class CompositeQuoteProvider:
 
     Args:
         cache_ttl: Cache TTL in seconds. Defaults to 15.
+        stale_grace_seconds: How long past the TTL a cached quote is still
+            served while it is refreshed in the background.  Defaults to 0
+            (expired quotes are always fetched before returning).
+        max_cache_entries: Maximum number of symbols cached.
+        rate_limits: Token bucket per provider for ``aget_quotes``.  Defaults
+            to buckets built from the Alpaca and Twelve Data resource groups;
+            yfinance is not throttled.
+        max_rate_limit_wait: Longest wait, in seconds, for a provider's
+            tokens before ``aget_quotes`` falls back to the next provider.
     """
 
-    def __init__(self, cache_ttl: float = _DEFAULT_CACHE_TTL) -> None:
-        self._cache = QuoteCache(ttl_seconds=cache_ttl)
+    def __init__(
+        self,
+        cache_ttl: float = _DEFAULT_CACHE_TTL,
+        *,
+        stale_grace_seconds: float = 0.0,
+        max_cache_entries: int = _DEFAULT_MAX_CACHE_ENTRIES,
+        rate_limits: dict[QuoteProvider, TokenBucket] | None = None,
+        max_rate_limit_wait: float = _DEFAULT_MAX_RATE_LIMIT_WAIT,
+    ) -> None:
+        self._cache = QuoteCache(
+            ttl_seconds=cache_ttl,
+            stale_grace_seconds=stale_grace_seconds,
+            max_entries=max_cache_entries,
+        )
         self._stats: dict[QuoteProvider, _ProviderStats] = {
             QuoteProvider.ALPACA: _ProviderStats(),
             QuoteProvider.TWELVEDATA: _ProviderStats(),
             QuoteProvider.YFINANCE: _ProviderStats(),
         }
+        self._buckets = (
+            rate_limits
+            if rate_limits is not None
+            else {
+                QuoteProvider.ALPACA: TokenBucket.from_rate_limiter(alpaca_api_resource_group.rate_limit),
+                QuoteProvider.TWELVEDATA: TokenBucket.from_rate_limiter(twelvedata_api_resource_group.rate_limit),
+            }
+        )
+        self._max_rate_limit_wait = max_rate_limit_wait
+        # Clients and in-flight futures belong to the event loop that created them
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._clients: dict[QuoteProvider, httpx.AsyncClient] = {}
+        self._inflight: dict[str, asyncio.Future[Quote | None]] = {}
+        self._background_tasks: set[asyncio.Task[dict[str, Quote]]] = set()
+        # Background refresh for the sync methods
+        self._refresh_lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._refresh_executor: ThreadPoolExecutor | None = None
 
     @property
     def cache(self) -> QuoteCache:
@@ -59,9 +142,11 @@ class CompositeQuoteProvider:
         Raises:
             ValueError: If no provider can supply a quote for *symbol*.
         """
-        cached = self._cache.get(symbol)
+        cached = self._cache.lookup(symbol)
         if cached is not None:
-            return cached
+            if cached.stale:
+                self._refresh_in_background([symbol])
+            return cached.quote
 
         providers = self._provider_chain(symbol)
         last_error: Exception | None = None
@@ -73,6 +158,7 @@ class CompositeQuoteProvider:
                 self._stats[provider_name].total_requests += 1
                 quote = get_fn(symbol)
                 self._stats[provider_name].last_success = datetime.now(tz=UTC)
+                self._stats[provider_name].cache_misses += 1
                 self._cache.put(symbol, quote)
                 return quote
             except Exception as exc:
@@ -98,89 +184,206 @@ class CompositeQuoteProvider:
         Returns:
             A ``QuoteBatch`` with all successful quotes and any errors.
         """
-        results: dict[str, Quote] = {}
-        errors: dict[str, str] = {}
+        results, uncached, stale = self._lookup_cached(symbols)
+        if stale:
+            self._refresh_in_background(stale)
 
-        # Check cache first
-        uncached: list[str] = []
-        for sym in symbols:
-            cached = self._cache.get(sym)
-            if cached is not None:
-                results[sym] = cached
-            else:
-                uncached.append(sym)
+        fetched = self._fetch_partitions(uncached)
+        self._record_misses(fetched)
+        results.update(fetched)
+        return _make_batch(symbols, results, uncached)
 
-        # Partition uncached symbols
-        canadian = [s for s in uncached if _is_canadian(s)]
-        us = [s for s in uncached if not _is_canadian(s)]
+    def refresh(self, symbols: Iterable[str]) -> dict[str, Quote]:
+        """Fetch *symbols* from upstream regardless of the cache, and cache them.
 
-        # Fetch US symbols
-        if us:
-            fetched = self._fetch_batch_with_fallback(us, canadian=False)
-            results.update(fetched)
-            for sym in us:
-                if sym not in fetched:
-                    errors[sym] = "No provider returned data"
+        Args:
+            symbols: Ticker symbols to refresh.
 
-        # Fetch Canadian symbols
-        if canadian:
-            fetched = self._fetch_batch_with_fallback(canadian, canadian=True)
-            results.update(fetched)
-            for sym in canadian:
-                if sym not in fetched:
-                    errors[sym] = "No provider returned data"
-
-        # Cache all new results
-        new_results = {k: v for k, v in results.items() if k not in {s for s in symbols if self._cache.get(s)}}
-        self._cache.put_many(new_results)
-
-        # Determine primary provider from results
-        primary = QuoteProvider.YFINANCE
-        if results:
-            first_quote = next(iter(results.values()))
-            primary = first_quote.provider
-
-        return QuoteBatch(
-            quotes=results,
-            requested_symbols=tuple(symbols),
-            provider=primary,
-            fetched_at=datetime.now(tz=UTC),
-            errors=errors,
-        )
+        Returns:
+            Mapping of symbol to ``Quote`` for the symbols that were fetched.
+        """
+        return self._fetch_partitions(list(dict.fromkeys(symbols)))
+
+    def cache_stats(self) -> QuoteCacheStats:
+        """Return the quote cache counters."""
+        return self._cache.stats()
+
+    def close(self) -> None:
+        """Stop the background refresh worker used by the sync methods."""
+        with self._refresh_lock:
+            executor, self._refresh_executor = self._refresh_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    async def aget_quote(self, symbol: str) -> Quote:
+        """Async variant of ``get_quote`` using the pooled, rate-limited fetch path.
+
+        Raises:
+            ValueError: If no provider can supply a quote for *symbol*.
+        """
+        batch = await self.aget_quotes([symbol])
+        if symbol not in batch.quotes:
+            raise ValueError(f"All providers failed for {symbol}")
+        return batch.quotes[symbol]
+
+    async def aget_quotes(self, symbols: list[str]) -> QuoteBatch:
+        """Fetch quotes for multiple symbols concurrently, with caching and fallback.
+
+        Symbols already being fetched by another caller are awaited rather
+        than requested again.
+
+        Args:
+            symbols: List of ticker symbols.
+
+        Returns:
+            A ``QuoteBatch`` with all successful quotes and any errors.
+        """
+        self._bind_loop()
+        results, uncached, stale = self._lookup_cached(symbols)
+        if stale:
+            self._arefresh_in_background(stale)
+
+        fetched = await self._afetch_coalesced(uncached)
+        self._record_misses(fetched)
+        results.update(fetched)
+        return _make_batch(symbols, results, uncached)
+
+    async def arefresh(self, symbols: Iterable[str]) -> dict[str, Quote]:
+        """Async variant of ``refresh``; joins fetches already in flight."""
+        self._bind_loop()
+        return await self._afetch_coalesced(list(dict.fromkeys(symbols)))
+
+    async def _afetch_coalesced(self, symbols: list[str]) -> dict[str, Quote]:
+        """Fetch and cache *symbols*, awaiting any already being fetched (single-flight)."""
+        waiting = {sym: self._inflight[sym] for sym in symbols if sym in self._inflight}
+        owned = [sym for sym in symbols if sym not in waiting]
+        loop = asyncio.get_running_loop()
+        futures = {sym: loop.create_future() for sym in owned}
+        self._inflight.update(futures)
+
+        fetched: dict[str, Quote] = {}
+        try:
+            if owned:
+                canadian = [s for s in owned if _is_canadian(s)]
+                us = [s for s in owned if not _is_canadian(s)]
+                for partition in await asyncio.gather(
+                    self._afetch_batch_with_fallback(us, canadian=False),
+                    self._afetch_batch_with_fallback(canadian, canadian=True),
+                ):
+                    fetched.update(partition)
+                self._cache.put_many(fetched)
+        finally:
+            # Release waiters even if this fetch failed or was cancelled
+            for sym, future in futures.items():
+                if self._inflight.get(sym) is future:
+                    del self._inflight[sym]
+                if not future.done():
+                    future.set_result(fetched.get(sym))
+
+        results = dict(fetched)
+        for sym, future in waiting.items():
+            quote = await asyncio.shield(future)
+            if quote is not None:
+                results[sym] = quote
+        return results
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients used by ``aget_quotes``."""
+        clients, self._clients = self._clients, {}
+        # Clients from another (finished) loop cannot be awaited; they are just dropped
+        if self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*(client.aclose() for client in clients.values()))
 
     def get_provider_status(self) -> list[ProviderStatus]:
         """Return the current health status of all providers.
 
+        Cache hits are attributed to the provider of the quote served;
+        cache misses to the provider that then supplied the quote.
+
         Returns:
             List of ``ProviderStatus`` for each provider.
         """
+        cache_stats = self._cache.stats()
+        availability = (
+            (QuoteProvider.ALPACA, alpaca_provider.is_available),
+            (QuoteProvider.TWELVEDATA, twelvedata_provider.is_available),
+            (QuoteProvider.YFINANCE, yfinance_provider.is_available),
+        )
         return [
             ProviderStatus(
-                provider=QuoteProvider.ALPACA,
-                is_available=alpaca_provider.is_available(),
-                last_success=self._stats[QuoteProvider.ALPACA].last_success,
-                last_error=self._stats[QuoteProvider.ALPACA].last_error,
-                total_requests=self._stats[QuoteProvider.ALPACA].total_requests,
-                total_errors=self._stats[QuoteProvider.ALPACA].total_errors,
-            ),
-            ProviderStatus(
-                provider=QuoteProvider.TWELVEDATA,
-                is_available=twelvedata_provider.is_available(),
-                last_success=self._stats[QuoteProvider.TWELVEDATA].last_success,
-                last_error=self._stats[QuoteProvider.TWELVEDATA].last_error,
-                total_requests=self._stats[QuoteProvider.TWELVEDATA].total_requests,
-                total_errors=self._stats[QuoteProvider.TWELVEDATA].total_errors,
-            ),
-            ProviderStatus(
-                provider=QuoteProvider.YFINANCE,
-                is_available=yfinance_provider.is_available(),
-                last_success=self._stats[QuoteProvider.YFINANCE].last_success,
-                last_error=self._stats[QuoteProvider.YFINANCE].last_error,
-                total_requests=self._stats[QuoteProvider.YFINANCE].total_requests,
-                total_errors=self._stats[QuoteProvider.YFINANCE].total_errors,
-            ),
+                provider=provider,
+                is_available=is_available(),
+                last_success=self._stats[provider].last_success,
+                last_error=self._stats[provider].last_error,
+                total_requests=self._stats[provider].total_requests,
+                total_errors=self._stats[provider].total_errors,
+                cache_hits=cache_stats.provider_hits.get(provider, 0),
+                cache_stale_hits=cache_stats.provider_stale_hits.get(provider, 0),
+                cache_misses=self._stats[provider].cache_misses,
+            )
+            for provider, is_available in availability
         ]
 
+    def _lookup_cached(self, symbols: list[str]) -> tuple[dict[str, Quote], list[str], list[str]]:
+        """Split *symbols* into cached quotes, symbols to fetch, and stale symbols to refresh."""
+        results: dict[str, Quote] = {}
+        uncached: list[str] = []
+        stale: list[str] = []
+        for sym in dict.fromkeys(symbols):
+            cached = self._cache.lookup(sym)
+            if cached is None:
+                uncached.append(sym)
+                continue
+            results[sym] = cached.quote
+            if cached.stale:
+                stale.append(sym)
+        return results, uncached, stale
+
+    def _record_misses(self, fetched: dict[str, Quote]) -> None:
+        for quote in fetched.values():
+            self._stats[quote.provider].cache_misses += 1
+
+    def _fetch_partitions(self, symbols: list[str]) -> dict[str, Quote]:
+        """Fetch US and Canadian symbols through their provider chains and cache them."""
+        fetched: dict[str, Quote] = {}
+        us = [s for s in symbols if not _is_canadian(s)]
+        canadian = [s for s in symbols if _is_canadian(s)]
+        if us:
+            fetched.update(self._fetch_batch_with_fallback(us, canadian=False))
+        if canadian:
+            fetched.update(self._fetch_batch_with_fallback(canadian, canadian=True))
+        self._cache.put_many(fetched)
+        return fetched
+
+    def _refresh_in_background(self, symbols: list[str]) -> None:
+        """Refresh stale *symbols* on the worker thread, skipping any already queued."""
+        with self._refresh_lock:
+            pending = [s for s in symbols if s not in self._refreshing]
+            if not pending:
+                return
+            self._refreshing.update(pending)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quote-refresh")
+            self._refresh_executor.submit(self._refresh_pending, pending)
+
+    def _refresh_pending(self, symbols: list[str]) -> None:
+        try:
+            self._fetch_partitions(symbols)
+        except Exception:
+            logger.exception("Background quote refresh failed for %s", symbols)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.difference_update(symbols)
+
+    def _arefresh_in_background(self, symbols: list[str]) -> None:
+        """Refresh stale *symbols* in a task, skipping any already in flight."""
+        pending = [s for s in symbols if s not in self._inflight]
+        if not pending:
+            return
+        task = asyncio.get_running_loop().create_task(self._afetch_coalesced(pending))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     def _fetch_batch_with_fallback(self, symbols: list[str], *, canadian: bool) -> dict[str, Quote]:
         """Try each provider in priority order, collecting as many quotes as possible."""
         results: dict[str, Quote] = {}
@@ -204,6 +407,95 @@ class CompositeQuoteProvider:
 
         return results
 
+    def _bind_loop(self) -> None:
+        """Drop clients and in-flight futures left over from another event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._clients = {}
+            self._inflight = {}
+            self._background_tasks = set()
+
+    def _client(self, tier: _AsyncTier) -> httpx.AsyncClient:
+        client = self._clients.get(tier.provider)
+        if client is None:
+            client = httpx.AsyncClient(base_url=tier.base_url or "", timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+            self._clients[tier.provider] = client
+        return client
+
+    async def _afetch_batch_with_fallback(self, symbols: list[str], *, canadian: bool) -> dict[str, Quote]:
+        """Try each provider in priority order, fetching all chunks of a tier concurrently."""
+        results: dict[str, Quote] = {}
+        remaining = list(symbols)
+
+        for tier in self._async_provider_chain(canadian=canadian):
+            if not remaining:
+                break
+            if not tier.is_available():
+                continue
+            batch_size = self._batch_size(tier)
+            chunks = [remaining[i : i + batch_size] for i in range(0, len(remaining), batch_size)]
+            for fetched in await asyncio.gather(*(self._afetch_chunk(tier, chunk) for chunk in chunks)):
+                results.update(fetched)
+            remaining = [s for s in remaining if s not in results]
+
+        return results
+
+    def _batch_size(self, tier: _AsyncTier) -> int:
+        """Symbols per request, capped so a per-symbol-credit request fits in the bucket."""
+        bucket = self._buckets.get(tier.provider)
+        if tier.credits_per_symbol and bucket is not None:
+            return max(1, min(tier.batch_size, int(bucket.capacity)))
+        return tier.batch_size
+
+    async def _afetch_chunk(self, tier: _AsyncTier, symbols: list[str]) -> dict[str, Quote]:
+        stats = self._stats[tier.provider]
+        bucket = self._buckets.get(tier.provider)
+        if bucket is not None:
+            cost = len(symbols) if tier.credits_per_symbol else 1
+            if not await bucket.acquire(cost, max_wait=self._max_rate_limit_wait):
+                stats.last_error = "Rate limit reached"
+                logger.debug("%s rate limited; skipping %d symbols", tier.provider, len(symbols))
+                return {}
+        try:
+            stats.total_requests += 1
+            fetched = await tier.fetch(self._client(tier), symbols)
+            stats.last_success = datetime.now(tz=UTC)
+            return fetched
+        except Exception as exc:
+            stats.total_errors += 1
+            stats.last_error = str(exc)
+            logger.debug("%s async batch failed: %s", tier.provider, exc)
+            return {}
+
+    @staticmethod
+    def _async_provider_chain(*, canadian: bool) -> list[_AsyncTier]:
+        """Return the async batch provider chain."""
+        twelvedata = _AsyncTier(
+            QuoteProvider.TWELVEDATA,
+            twelvedata_provider.aget_quotes,
+            twelvedata_provider.is_available,
+            twelvedata_provider.MAX_BATCH_SIZE,
+            base_url=twelvedata_provider._BASE_URL,
+            credits_per_symbol=True,
+        )
+        yfinance = _AsyncTier(
+            QuoteProvider.YFINANCE,
+            lambda _client, chunk: yfinance_provider.aget_quotes(chunk),
+            yfinance_provider.is_available,
+            yfinance_provider.MAX_BATCH_SIZE,
+        )
+        if canadian:
+            return [twelvedata, yfinance]
+        alpaca = _AsyncTier(
+            QuoteProvider.ALPACA,
+            alpaca_provider.aget_quotes,
+            alpaca_provider.is_available,
+            alpaca_provider.MAX_BATCH_SIZE,
+            base_url=alpaca_provider._BASE_URL,
+        )
+        return [alpaca, twelvedata, yfinance]
+
     @staticmethod
     def _provider_chain(symbol: str) -> _SingleChain:
         """Return the provider chain for a single symbol fetch."""
@@ -241,6 +533,19 @@ class _ProviderStats:
         self.last_error: str | None = None
         self.total_requests: int = 0
         self.total_errors: int = 0
+        self.cache_misses: int = 0
+
+
+def _make_batch(symbols: list[str], results: dict[str, Quote], fetched_for: list[str]) -> QuoteBatch:
+    """Build a batch, reporting symbols in *fetched_for* that got no quote as errors."""
+    primary = next(iter(results.values())).provider if results else QuoteProvider.YFINANCE
+    return QuoteBatch(
+        quotes=results,
+        requested_symbols=tuple(symbols),
+        provider=primary,
+        fetched_at=datetime.now(tz=UTC),
+        errors={sym: _NO_DATA_ERROR for sym in fetched_for if sym not in results},
+    )
 
 
 def _is_canadian(symbol: str) -> bool:
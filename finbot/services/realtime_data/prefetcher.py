@@ -0,0 +1,207 @@
+"""Background prefetcher that keeps subscribed symbols warm in the quote cache.
+
+Symbols are kept warm in one of two ways:
+
+- ``subscribe`` is reference-counted: every call needs a matching
+  ``unsubscribe`` before a symbol stops being refreshed.  Use it for
+  long-lived consumers such as a configured watchlist.
+- ``renew`` takes a lease on behalf of an owner (e.g. a dashboard session)
+  that lapses unless renewed within ``lease_ttl`` seconds, so consumers that
+  disappear without saying goodbye stop costing upstream calls.
+
+The refresh loop re-fetches all symbols every ``interval`` seconds, by
+default 80% of the cache TTL, so reads never find them expired.  It goes
+through ``CompositeQuoteProvider.arefresh`` and therefore shares the
+provider's rate limits and single-flight fetches with every other caller on
+the same event loop.
+
+Typical usage:
+    ```python
+    provider = CompositeQuoteProvider(stale_grace_seconds=15)
+    prefetcher = QuotePrefetcher(provider)
+    prefetcher.subscribe(["SPY", "QQQ", "RY.TO"])
+    prefetcher.start()  # a task on the running loop; start_in_thread() otherwise
+    ...
+    await prefetcher.stop()
+    ```
+
+As with ``QuoteHub``, give a prefetcher started with ``start_in_thread`` its
+own provider rather than sharing one used from another event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterable
+from types import TracebackType
+from typing import Self
+
+from finbot.core.contracts.realtime_data import Quote
+from finbot.services.realtime_data.composite_provider import CompositeQuoteProvider
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_INTERVAL_FRACTION = 0.8
+_DEFAULT_LEASE_TTL_SECONDS = 300.0
+
+
+class QuotePrefetcher:
+    """Periodically refreshes subscribed symbols through a ``CompositeQuoteProvider``.
+
+    Args:
+        provider: Provider whose cache is kept warm.
+        interval: Seconds between refreshes.  Defaults to 80% of the
+            provider's cache TTL.
+        lease_ttl: Seconds a ``renew`` lease lasts without being renewed.
+        clock: Monotonic time source, for tests.
+    """
+
+    def __init__(
+        self,
+        provider: CompositeQuoteProvider,
+        *,
+        interval: float | None = None,
+        lease_ttl: float = _DEFAULT_LEASE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        interval = provider.cache.ttl_seconds * _DEFAULT_INTERVAL_FRACTION if interval is None else interval
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        if lease_ttl <= 0:
+            raise ValueError(f"lease_ttl must be positive, got {lease_ttl}")
+        self._provider = provider
+        self._interval = interval
+        self._lease_ttl = lease_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._subscriptions: Counter[str] = Counter()
+        # owner -> (symbols, expiry on self._clock)
+        self._leases: dict[Hashable, tuple[tuple[str, ...], float]] = {}
+        self._stopping = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def interval(self) -> float:
+        """Seconds between refreshes."""
+        return self._interval
+
+    @property
+    def symbols(self) -> list[str]:
+        """Symbols currently kept warm: subscriptions first, then unexpired leases."""
+        now = self._clock()
+        with self._lock:
+            self._leases = {owner: lease for owner, lease in self._leases.items() if lease[1] > now}
+            leased = [sym for symbols, _ in self._leases.values() for sym in symbols]
+            return list(dict.fromkeys([*self._subscriptions, *leased]))
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the refresh loop is running."""
+        return (self._task is not None and not self._task.done()) or (
+            self._thread is not None and self._thread.is_alive()
+        )
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        """Add one subscription to each of *symbols*."""
+        with self._lock:
+            self._subscriptions.update(symbols)
+
+    def unsubscribe(self, symbols: Iterable[str]) -> None:
+        """Remove one subscription from each of *symbols*; unknown symbols are ignored."""
+        with self._lock:
+            for sym in symbols:
+                if self._subscriptions[sym] <= 1:
+                    self._subscriptions.pop(sym, None)
+                else:
+                    self._subscriptions[sym] -= 1
+
+    def renew(self, owner: Hashable, symbols: Iterable[str]) -> None:
+        """Keep *symbols* warm for *owner* for another ``lease_ttl`` seconds, replacing its previous lease."""
+        lease = (tuple(symbols), self._clock() + self._lease_ttl)
+        with self._lock:
+            self._leases[owner] = lease
+
+    def release(self, owner: Hashable) -> None:
+        """Drop *owner*'s lease before it expires; unknown owners are ignored."""
+        with self._lock:
+            self._leases.pop(owner, None)
+
+    async def refresh_now(self) -> dict[str, Quote]:
+        """Refresh every symbol kept warm once.
+
+        Returns:
+            Mapping of symbol to ``Quote`` for the symbols that were fetched.
+        """
+        symbols = self.symbols
+        return await self._provider.arefresh(symbols) if symbols else {}
+
+    async def run(self) -> None:
+        """Refresh until ``stop``; the first refresh runs immediately."""
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        while not self._stopping:
+            try:
+                await self.refresh_now()
+            except Exception:
+                logger.exception("Quote prefetch failed")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self._interval)
+            self._wake.clear()
+
+    def start(self) -> asyncio.Task[None]:
+        """Start the refresh loop as a task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.get_running_loop().create_task(self.run())
+        return self._task
+
+    def start_in_thread(self) -> None:
+        """Start the refresh loop on its own event loop in a daemon thread."""
+        if self.is_running:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=asyncio.run, args=(self.run(),), name="quote-prefetcher", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stop the refresh loop and wait for it to finish."""
+        self._request_stop()
+        task, self._task = self._task, None
+        if task is not None:
+            await task
+        self._join_thread()
+
+    def stop_in_thread(self, timeout: float | None = None) -> None:
+        """Stop a loop started with ``start_in_thread``, waiting up to *timeout* seconds."""
+        self._request_stop()
+        self._join_thread(timeout)
+
+    def _request_stop(self) -> None:
+        self._stopping = True
+        if self._loop is not None and self._wake is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def _join_thread(self, timeout: float | None = None) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+
+    def __enter__(self) -> Self:
+        self.start_in_thread()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.stop_in_thread()
@@ -1,39 +1,138 @@
-"""Thread-safe TTL cache for real-time quotes.
+"""Thread-safe, bounded TTL cache for real-time quotes.
 
 Stores ``Quote`` objects in memory with a configurable time-to-live.
 Uses ``threading.Lock`` for thread safety — no asyncio required.
+
+- **Bounded**: at most ``max_entries`` symbols are kept; writes evict the
+  least recently used symbol.
+- **Stale-while-revalidate**: with ``stale_grace_seconds`` > 0, ``lookup``
+  keeps serving an expired quote for that long, flagged ``stale`` so the
+  caller can refresh it in the background.  ``get`` only returns fresh quotes.
+- **Swept**: entries past the grace period are removed on lookup, by
+  writes (at most once per TTL) and by ``purge_expired``, so ``size`` never
+  counts dead entries.
+- **Instrumented**: fresh hits, stale hits, misses, evictions and
+  expirations are counted, hits and stale hits also per provider.
 """
 
 from __future__ import annotations
 
 import threading
 import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
 
-from finbot.core.contracts.realtime_data import Quote
+from finbot.core.contracts.realtime_data import Quote, QuoteProvider
 
 _DEFAULT_TTL_SECONDS = 15.0
+_DEFAULT_MAX_ENTRIES = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class CachedQuote:
+    """A quote served from the cache.
+
+    Attributes:
+        quote: The cached quote.
+        age_seconds: Seconds since the quote was stored.
+        stale: Whether the quote is past its TTL (served within the grace period).
+    """
+
+    quote: Quote
+    age_seconds: float
+    stale: bool
+
+
+@dataclass(frozen=True, slots=True)
+class QuoteCacheStats:
+    """Snapshot of quote cache counters.
+
+    Attributes:
+        hits: Lookups answered with a fresh quote.
+        stale_hits: Lookups answered with a stale quote.
+        misses: Lookups with no servable quote.
+        evictions: Entries dropped to stay within ``max_entries``.
+        expirations: Entries dropped after the grace period.
+        entries: Entries currently stored.
+        max_entries: Capacity.
+        provider_hits: Fresh hits by the provider of the served quote.
+        provider_stale_hits: Stale hits by the provider of the served quote.
+    """
+
+    hits: int
+    stale_hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    max_entries: int
+    provider_hits: dict[QuoteProvider, int] = field(default_factory=dict)
+    provider_stale_hits: dict[QuoteProvider, int] = field(default_factory=dict)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache, fresh or stale."""
+        total = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / total if total else 0.0
 
 
 class QuoteCache:
-    """In-memory quote cache with per-entry TTL expiry.
+    """In-memory quote cache with per-entry TTL expiry and LRU eviction.
 
     Args:
         ttl_seconds: Time-to-live for each cache entry in seconds.
             Defaults to 15 seconds.
+        stale_grace_seconds: How long past its TTL an entry may still be
+            served by ``lookup`` as stale.  Defaults to 0 (never stale).
+        max_entries: Maximum number of symbols held.
+        clock: Monotonic time source, for tests.
     """
 
-    def __init__(self, ttl_seconds: float = _DEFAULT_TTL_SECONDS) -> None:
+    def __init__(
+        self,
+        ttl_seconds: float = _DEFAULT_TTL_SECONDS,
+        *,
+        stale_grace_seconds: float = 0.0,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         if ttl_seconds <= 0:
             raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        if stale_grace_seconds < 0:
+            raise ValueError(f"stale_grace_seconds must be >= 0, got {stale_grace_seconds}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
         self._ttl = ttl_seconds
+        self._grace = stale_grace_seconds
+        self._max_entries = max_entries
+        self._clock = clock
         self._lock = threading.Lock()
-        self._store: dict[str, tuple[Quote, float]] = {}
+        self._store: OrderedDict[str, tuple[Quote, float]] = OrderedDict()
+        self._last_sweep = clock()
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._provider_hits: Counter[QuoteProvider] = Counter()
+        self._provider_stale_hits: Counter[QuoteProvider] = Counter()
 
     @property
     def ttl_seconds(self) -> float:
         """Current TTL setting in seconds."""
         return self._ttl
 
+    @property
+    def stale_grace_seconds(self) -> float:
+        """How long past its TTL an entry may be served as stale."""
+        return self._grace
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of symbols held."""
+        return self._max_entries
+
     def get(self, symbol: str) -> Quote | None:
         """Return a cached quote if still valid, else ``None``.
 
@@ -43,15 +142,46 @@ class QuoteCache:
         Returns:
             The cached ``Quote`` or ``None`` if expired or missing.
         """
+        cached = self._lookup(symbol, allow_stale=False)
+        return cached.quote if cached is not None else None
+
+    def lookup(self, symbol: str) -> CachedQuote | None:
+        """Return a fresh or stale-but-servable quote, else ``None``.
+
+        Args:
+            symbol: Ticker symbol to look up.
+
+        Returns:
+            The cached quote with its age and staleness, or ``None`` if
+            missing or past the grace period.
+        """
+        return self._lookup(symbol, allow_stale=True)
+
+    def _lookup(self, symbol: str, *, allow_stale: bool) -> CachedQuote | None:
         with self._lock:
             entry = self._store.get(symbol)
             if entry is None:
+                self._misses += 1
                 return None
             quote, stored_at = entry
-            if time.monotonic() - stored_at > self._ttl:
+            age = self._clock() - stored_at
+            if age > self._ttl + self._grace:
                 del self._store[symbol]
+                self._expirations += 1
+                self._misses += 1
                 return None
-            return quote
+            stale = age > self._ttl
+            if stale and not allow_stale:
+                self._misses += 1
+                return None
+            self._store.move_to_end(symbol)
+            if stale:
+                self._stale_hits += 1
+                self._provider_stale_hits[quote.provider] += 1
+            else:
+                self._hits += 1
+                self._provider_hits[quote.provider] += 1
+            return CachedQuote(quote=quote, age_seconds=age, stale=stale)
 
     def put(self, symbol: str, quote: Quote) -> None:
         """Store a quote in the cache.
@@ -60,8 +190,7 @@ class QuoteCache:
             symbol: Ticker symbol key.
             quote: Quote to cache.
         """
-        with self._lock:
-            self._store[symbol] = (quote, time.monotonic())
+        self.put_many({symbol: quote})
 
     def put_many(self, quotes: dict[str, Quote]) -> None:
         """Store multiple quotes in the cache.
@@ -69,10 +198,34 @@ class QuoteCache:
         Args:
             quotes: Mapping of symbol to ``Quote``.
         """
-        now = time.monotonic()
         with self._lock:
+            now = self._clock()
             for sym, q in quotes.items():
                 self._store[sym] = (q, now)
+                self._store.move_to_end(sym)
+            while len(self._store) > self._max_entries:
+                self._store.popitem(last=False)
+                self._evictions += 1
+            if now - self._last_sweep >= self._ttl:
+                self._purge_expired_locked(now)
+
+    def purge_expired(self) -> int:
+        """Remove every entry past its TTL and grace period.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            return self._purge_expired_locked(self._clock())
+
+    def _purge_expired_locked(self, now: float) -> int:
+        cutoff = now - self._ttl - self._grace
+        expired = [sym for sym, (_, stored_at) in self._store.items() if stored_at < cutoff]
+        for sym in expired:
+            del self._store[sym]
+        self._expirations += len(expired)
+        self._last_sweep = now
+        return len(expired)
 
     def invalidate(self, symbol: str) -> None:
         """Remove a single symbol from the cache.
@@ -89,6 +242,22 @@ class QuoteCache:
             self._store.clear()
 
     def size(self) -> int:
-        """Return the number of entries currently in the cache (including expired)."""
+        """Return the number of servable entries (expired entries are purged first)."""
         with self._lock:
+            self._purge_expired_locked(self._clock())
             return len(self._store)
+
+    def stats(self) -> QuoteCacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return QuoteCacheStats(
+                hits=self._hits,
+                stale_hits=self._stale_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._store),
+                max_entries=self._max_entries,
+                provider_hits=dict(self._provider_hits),
+                provider_stale_hits=dict(self._provider_stale_hits),
+            )
@@ -0,0 +1,401 @@
+"""Push-based fan-out of real-time quotes to many subscribers.
+
+``QuoteHub`` polls the union of all subscribed symbols once per tick, with
+one batched (and rate-limited, single-flight) ``CompositeQuoteProvider``
+refresh, and pushes only the quotes that changed to the subscribers watching
+them.  N dashboards watching the same 100 symbols therefore cost one
+upstream poll per tick, not N.
+
+Each ``QuoteSubscription`` has a conflating mailbox holding at most the
+latest quote per symbol.  A consumer slower than the tick interval gets
+the newest value for each symbol on its next read and the intermediate ones
+are counted as ``dropped``, so memory per subscriber stays bounded by its
+symbol count (backpressure without blocking the hub).
+
+Subscriptions can be read from asyncio (``await sub.get()`` or
+``async for``) or from plain threads (``sub.poll(timeout)``), e.g. to drive
+live paper trading:
+    ```python
+    hub = QuoteHub(CompositeQuoteProvider())
+    hub.start_in_thread()
+    with hub.subscribe(["SPY", "QQQ"]) as sub:
+        while trading:
+            simulator.process_quotes(sub.poll(timeout=5.0))
+    hub.stop()
+    ```
+
+The hub's poll loop runs on one event loop; give a hub started with
+``start_in_thread`` its own provider rather than sharing the API's.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import threading
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from types import TracebackType
+from typing import Self
+
+from finbot.core.contracts.realtime_data import Quote
+from finbot.services.realtime_data.composite_provider import CompositeQuoteProvider
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_INTERVAL_SECONDS = 2.0
+
+
+@dataclass(frozen=True, slots=True)
+class QuoteHubStats:
+    """Snapshot of hub activity.
+
+    Attributes:
+        subscribers: Open subscriptions.
+        symbols: Distinct symbols polled each tick.
+        polls: Upstream refreshes made.
+        published: Changed quotes delivered into subscriber mailboxes.
+        dropped: Quotes overwritten in a mailbox before being read.
+    """
+
+    subscribers: int
+    symbols: int
+    polls: int
+    published: int
+    dropped: int
+
+
+class QuoteSubscription:
+    """A subscriber's view of the hub: a conflating mailbox of changed quotes.
+
+    Created by ``QuoteHub.subscribe``; close it (or use it as a context
+    manager) to stop receiving updates.
+    """
+
+    def __init__(self, hub: QuoteHub, symbols: frozenset[str]) -> None:
+        self._hub = hub
+        self._symbols = symbols
+        self._cond = threading.Condition()
+        self._pending: dict[str, Quote] = {}
+        self._closed = False
+        self._dropped = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._event: asyncio.Event | None = None
+
+    @property
+    def symbols(self) -> frozenset[str]:
+        """Symbols this subscription receives."""
+        return self._symbols
+
+    @property
+    def closed(self) -> bool:
+        """Whether the subscription has been closed."""
+        return self._closed
+
+    @property
+    def dropped(self) -> int:
+        """Quotes replaced by a newer one before this subscriber read them."""
+        return self._dropped
+
+    def set_symbols(self, symbols: Iterable[str]) -> None:
+        """Replace the subscribed symbols.
+
+        Newly added symbols get their last known quote; unread quotes for
+        removed symbols are discarded.
+        """
+        self._hub._resubscribe(self, frozenset(symbols))
+
+    def poll(self, timeout: float | None = None) -> dict[str, Quote]:
+        """Block until quotes are available (or *timeout* elapses) and take them.
+
+        Returns:
+            Changed quotes since the last read, or an empty dict on timeout
+            or once closed.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending or self._closed, timeout)
+            return self._take_locked()
+
+    async def get(self) -> dict[str, Quote]:
+        """Wait for quotes without blocking the event loop and take them.
+
+        Returns:
+            Changed quotes since the last read, or an empty dict once closed.
+        """
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            if self._loop is not loop:
+                self._loop, self._event = loop, asyncio.Event()
+            event = self._event
+        assert event is not None
+        while True:
+            with self._cond:
+                if self._pending or self._closed:
+                    event.clear()
+                    return self._take_locked()
+            await event.wait()
+            event.clear()
+
+    def close(self) -> None:
+        """Stop receiving updates and wake any waiting reader."""
+        if self._closed:
+            return
+        self._hub._remove(self)
+        with self._cond:
+            self._closed = True
+            self._notify_locked()
+
+    def _offer(self, quotes: Mapping[str, Quote]) -> int:
+        """Merge *quotes* into the mailbox; return how many it accepted."""
+        with self._cond:
+            if self._closed:
+                return 0
+            accepted = 0
+            for sym, quote in quotes.items():
+                if sym in self._symbols:
+                    if sym in self._pending:
+                        self._dropped += 1
+                    self._pending[sym] = quote
+                    accepted += 1
+            if accepted:
+                self._notify_locked()
+            return accepted
+
+    def _retain(self, symbols: frozenset[str]) -> None:
+        """Switch to *symbols*, dropping unread quotes for any other symbol."""
+        with self._cond:
+            self._symbols = symbols
+            self._pending = {sym: quote for sym, quote in self._pending.items() if sym in symbols}
+
+    def _take_locked(self) -> dict[str, Quote]:
+        taken, self._pending = self._pending, {}
+        return taken
+
+    def _notify_locked(self) -> None:
+        self._cond.notify_all()
+        if self._loop is not None and self._event is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._event.set)
+
+    def __aiter__(self) -> AsyncIterator[dict[str, Quote]]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[dict[str, Quote]]:
+        while not self._closed:
+            quotes = await self.get()
+            if quotes:
+                yield quotes
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class QuoteHub:
+    """Polls subscribed symbols once per tick and pushes changed quotes to subscribers.
+
+    Args:
+        provider: Provider used for the batched refreshes.
+        interval: Seconds between polls (the tick).  Updates within a tick
+            are coalesced into one delivery per subscriber.
+    """
+
+    def __init__(self, provider: CompositeQuoteProvider, *, interval: float = _DEFAULT_INTERVAL_SECONDS) -> None:
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        self._provider = provider
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._subscriptions: set[QuoteSubscription] = set()
+        self._symbol_counts: Counter[str] = Counter()
+        self._last: dict[str, Quote] = {}
+        self._polls = 0
+        self._published = 0
+        self._stopping = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def interval(self) -> float:
+        """Seconds between polls."""
+        return self._interval
+
+    @property
+    def symbols(self) -> list[str]:
+        """Distinct symbols with at least one subscriber."""
+        with self._lock:
+            return list(self._symbol_counts)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the poll loop is running."""
+        return (self._task is not None and not self._task.done()) or (
+            self._thread is not None and self._thread.is_alive()
+        )
+
+    def subscribe(self, symbols: Iterable[str]) -> QuoteSubscription:
+        """Subscribe to *symbols*; their last known quotes are delivered immediately."""
+        subscription = QuoteSubscription(self, frozenset(symbols))
+        with self._lock:
+            self._subscriptions.add(subscription)
+            new = [s for s in subscription.symbols if s not in self._symbol_counts]
+            self._symbol_counts.update(subscription.symbols)
+            snapshot = {s: self._last[s] for s in subscription.symbols if s in self._last}
+        subscription._offer(snapshot)
+        if new:
+            self._wake_up()
+        return subscription
+
+    def publish(self, quotes: Mapping[str, Quote]) -> int:
+        """Push the quotes that changed since the last publish to their subscribers.
+
+        Called by the poll loop; can also be fed from another source (e.g. a
+        provider's streaming API).
+
+        Returns:
+            Number of quotes delivered into subscriber mailboxes.
+        """
+        with self._lock:
+            changed = {sym: quote for sym, quote in quotes.items() if self._last.get(sym) != quote}
+            self._last.update(changed)
+            subscriptions = list(self._subscriptions)
+        if not changed:
+            return 0
+        delivered = sum(subscription._offer(changed) for subscription in subscriptions)
+        with self._lock:
+            self._published += delivered
+        return delivered
+
+    async def run(self) -> None:
+        """Poll until ``stop``; one upstream refresh per tick for all subscribed symbols."""
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        while not self._stopping:
+            symbols = self.symbols
+            if symbols:
+                try:
+                    self.publish(await self._provider.arefresh(symbols))
+                except Exception:
+                    logger.exception("Quote hub poll failed")
+                with self._lock:
+                    self._polls += 1
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self._interval)
+            self._wake.clear()
+
+    def start(self) -> asyncio.Task[None]:
+        """Start the poll loop as a task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.get_running_loop().create_task(self.run())
+        return self._task
+
+    def start_in_thread(self) -> None:
+        """Start the poll loop on its own event loop in a daemon thread."""
+        if self.is_running:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=asyncio.run, args=(self.run(),), name="quote-hub", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stop the poll loop and wait for it to finish."""
+        self._request_stop()
+        task, self._task = self._task, None
+        if task is not None:
+            await task
+        self._join_thread()
+
+    def stop_in_thread(self, timeout: float | None = None) -> None:
+        """Stop a loop started with ``start_in_thread``."""
+        self._request_stop()
+        self._join_thread(timeout)
+
+    def stats(self) -> QuoteHubStats:
+        """Return a snapshot of hub activity."""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+            stats = (len(subscriptions), len(self._symbol_counts), self._polls, self._published)
+        return QuoteHubStats(*stats, dropped=sum(sub.dropped for sub in subscriptions))
+
+    def _request_stop(self) -> None:
+        self._stopping = True
+        self._wake_up()
+
+    def _join_thread(self, timeout: float | None = None) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+
+    def _wake_up(self) -> None:
+        if self._loop is not None and self._wake is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def _resubscribe(self, subscription: QuoteSubscription, symbols: frozenset[str]) -> None:
+        with self._lock:
+            if subscription not in self._subscriptions:
+                return
+            added = symbols - subscription.symbols
+            self._symbol_counts.subtract(subscription.symbols - symbols)
+            self._symbol_counts.update(added)
+            self._symbol_counts = +self._symbol_counts
+            new = [s for s in added if self._symbol_counts[s] == 1]
+            subscription._retain(symbols)
+            snapshot = {s: self._last[s] for s in added if s in self._last}
+        subscription._offer(snapshot)
+        if new:
+            self._wake_up()
+
+    def _remove(self, subscription: QuoteSubscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.discard(subscription)
+                self._symbol_counts.subtract(subscription.symbols)
+                self._symbol_counts = +self._symbol_counts
+
+
+def quote_fields(quote: Quote) -> dict[str, object]:
+    """JSON-ready fields of *quote*, without the symbol (used as the message key)."""
+    return {
+        field.name: _json_value(getattr(quote, field.name))
+        for field in dataclasses.fields(quote)
+        if field.name != "symbol"
+    }
+
+
+def diff_quotes(sent: Mapping[str, Quote], quotes: Mapping[str, Quote]) -> dict[str, dict[str, object]]:
+    """Fields of *quotes* that differ from what was *sent* to a client, keyed by symbol.
+
+    Symbols never sent get every field; unchanged symbols are omitted.
+    """
+    diff: dict[str, dict[str, object]] = {}
+    for sym, quote in quotes.items():
+        current = quote_fields(quote)
+        previous = sent.get(sym)
+        if previous is not None:
+            before = quote_fields(previous)
+            current = {name: value for name, value in current.items() if before[name] != value}
+        if current:
+            diff[sym] = current
+    return diff
+
+
+def _json_value(value: object) -> object:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.name
+    return value
@@ -6,7 +6,14 @@ from finbot.services.risk_analytics.kelly import (
     compute_multi_asset_kelly,
 )
 from finbot.services.risk_analytics.stress import SCENARIOS, run_all_scenarios, run_stress_test
-from finbot.services.risk_analytics.var import compute_cvar, compute_var, var_backtest
+from finbot.services.risk_analytics.var import (
+    VaRSurface,
+    compute_cvar,
+    compute_var,
+    rolling_var,
+    var_backtest,
+    var_surface,
+)
 from finbot.services.risk_analytics.viz import (
     plot_kelly_correlation_heatmap,
     plot_kelly_fractions,
@@ -18,6 +25,7 @@ from finbot.services.risk_analytics.viz import (
 
 __all__ = [
     "SCENARIOS",
+    "VaRSurface",
     "compute_cvar",
     "compute_kelly_criterion",
     "compute_kelly_from_returns",
@@ -29,7 +37,9 @@ __all__ = [
     "plot_stress_path",
     "plot_var_comparison",
     "plot_var_distribution",
+    "rolling_var",
     "run_all_scenarios",
     "run_stress_test",
     "var_backtest",
+    "var_surface",
 ]
@@ -11,10 +11,19 @@ All VaR values are expressed as **positive loss magnitudes**
 
 Square-root-of-time scaling is used for multi-day horizons, which
 assumes i.i.d. returns and is standard for daily VaR calculations.
+
+``var_surface`` and ``rolling_var`` evaluate a grid of confidence levels
+and horizons for many return series at once.  Rolling and expanding
+windows are served from shared sorted blocks (historical) and cumulative
+moments (parametric, Monte Carlo) instead of re-estimating every window,
+which is what keeps ``var_backtest`` fast on long histories.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
 import numpy as np
 from scipy import stats
 
@@ -22,6 +31,47 @@ from finbot.core.contracts.risk_analytics import CVaRResult, VaRBacktestResult,
 
 _MIN_OBSERVATIONS = 30
 
+# Consecutive windows sharing one sorted core in the order-statistics kernel
+_BLOCK = 32
+
+# Upper bound on elements materialized per order-statistics step
+_CHUNK_ELEMENTS = 1 << 22
+
+# Window variances below this fraction of the window's mean squared deviation
+# are cumulative-sum rounding noise and are treated as zero.
+_VARIANCE_RTOL = 1e-10
+
+_MONTECARLO_SEED = 42
+
+
+@dataclass(frozen=True, slots=True)
+class VaRSurface:
+    """VaR and CVaR over a grid of confidence levels and horizons.
+
+    ``var_surface`` returns arrays of shape
+    ``(n_series, n_confidences, n_horizons)``.  ``rolling_var`` adds a
+    leading ``n_obs`` axis where row ``t`` is the forecast for bar ``t``
+    made from the window of returns before it; rows without a forecast are
+    ``NaN``.
+
+    Attributes:
+        confidences: Confidence levels, shape ``(n_confidences,)``.
+        horizons: Holding periods in trading days, shape ``(n_horizons,)``.
+        method: Computation method used.
+        var: Positive loss magnitudes, as returned by ``compute_var``.
+        cvar: Historical expected shortfall (``compute_cvar`` scaled by
+            ``sqrt(horizon)``); ``None`` for the other methods.
+        window: Rolling window length; ``None`` for expanding windows and
+            full-sample surfaces.
+    """
+
+    confidences: np.ndarray
+    horizons: np.ndarray
+    method: VaRMethod
+    var: np.ndarray
+    cvar: np.ndarray | None = None
+    window: int | None = None
+
 
 def _validate_returns(returns: np.ndarray, label: str = "returns") -> None:
     """Raise ValueError if the returns array is too short."""
@@ -37,6 +87,329 @@ def _validate_confidence(confidence: float) -> None:
         raise ValueError(f"confidence must be in (0, 1), got {confidence}")
 
 
+def _validate_grid(confidences: Sequence[float], horizons: Sequence[int]) -> tuple[np.ndarray, np.ndarray]:
+    """Return confidence levels and horizons as validated 1-D arrays."""
+    levels = np.atleast_1d(np.asarray(confidences, dtype=float))
+    days = np.atleast_1d(np.asarray(horizons))
+    if levels.ndim != 1 or levels.size == 0:
+        raise ValueError("confidences must be a non-empty 1-D sequence")
+    if days.ndim != 1 or days.size == 0 or not np.issubdtype(days.dtype, np.integer):
+        raise ValueError("horizons must be a non-empty 1-D sequence of integers")
+    for confidence in levels:
+        _validate_confidence(float(confidence))
+    if days.min() < 1:
+        raise ValueError(f"horizons must be >= 1, got {int(days.min())}")
+    return levels, days.astype(int)
+
+
+def _as_series_matrix(returns: np.ndarray) -> np.ndarray:
+    """Validate ``(n_obs,)`` or ``(n_obs, n_series)`` returns as ``(n_series, n_obs)``."""
+    values = np.asarray(returns, dtype=float)
+    if values.ndim not in (1, 2):
+        raise ValueError(f"returns must be 1-D or 2-D, got {values.ndim}-D")
+    _validate_returns(values)
+    return np.ascontiguousarray(values.reshape(len(values), -1).T)
+
+
+def _percentile_positions(lengths: np.ndarray, levels: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Order-statistic ranks and weights of ``np.percentile(..., (1 - c) * 100)``.
+
+    Mirrors NumPy's linear method step for step, so interpolating the
+    returned order statistics with ``_lerp`` reproduces ``np.percentile``.
+
+    Returns:
+        ``(lower, upper, gamma)`` of shape ``(n_windows, n_levels)``.
+    """
+    q = np.true_divide((1 - levels) * 100, 100)
+    n = lengths[:, np.newaxis]
+    virtual = (n - 1) * q
+    lower = np.floor(virtual)
+    gamma = virtual - lower
+    lower = np.clip(lower, 0, n - 1).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    return lower, upper, gamma
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Linear interpolation with NumPy's percentile rounding."""
+    diff = b - a
+    return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
+
+
+def _window_blocks(
+    values: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> Iterator[tuple[slice, np.ndarray, np.ndarray, np.ndarray]]:
+    """Split windows ``values[:, start:end]`` into blocks sharing a sorted core.
+
+    Starts and ends must be non-decreasing.  Within a block of consecutive
+    windows the core is the overlap of all of them; each window is the core
+    plus at most ``2 * _BLOCK`` extra values.
+
+    Yields:
+        ``(block, core, extras, n_extra)``: the slice of windows, the sorted
+        core with a trailing ``inf`` sentinel, the extras padded with ``inf``
+        (``(n_series, n_block, n_extra.max())``) and each window's extra count.
+    """
+    n_series, n_obs = values.shape
+    for first in range(0, len(ends), _BLOCK):
+        block = slice(first, first + _BLOCK)
+        start, end = starts[block], ends[block]
+        core_end = int(end[0])
+        core_start = min(int(start[-1]), core_end)
+        core = np.sort(values[:, core_start:core_end], axis=1)
+        core = np.concatenate([core, np.full((n_series, 1), np.inf)], axis=1)
+
+        n_before = core_start - start
+        n_extra = n_before + end - core_end
+        offsets = np.arange(n_extra.max())
+        index = np.where(
+            offsets < n_before[:, np.newaxis],
+            start[:, np.newaxis] + offsets,
+            core_end - n_before[:, np.newaxis] + offsets,
+        )
+        extras = np.where(offsets < n_extra[:, np.newaxis], values[:, np.minimum(index, n_obs - 1)], np.inf)
+        yield block, core, extras, n_extra
+
+
+def _block_order_statistics(core: np.ndarray, extras: np.ndarray, n_extra: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """Order statistics of core-plus-extras windows.
+
+    The ``r``-th smallest value of a window lies between ``core[r - n_extra]``
+    and ``core[r]``, so only that slice of the core is sorted with the extras.
+
+    Args:
+        core: Sorted shared values with an ``inf`` sentinel, ``(n_series, n_core + 1)``.
+        extras: Per-window extra values, ``(n_series, n_block, width)``.
+        n_extra: Number of real extras per window, ``(n_block,)``.
+        ranks: 0-based ranks within each window, ``(n_block, n_ranks)``.
+
+    Returns:
+        Order statistics of shape ``(n_series, n_block, n_ranks)``.
+    """
+    n_core = core.shape[1] - 1
+    width = extras.shape[2]
+    low = np.maximum(ranks - n_extra[:, np.newaxis], 0)
+    core_index = low[..., np.newaxis] + np.arange(width + 1)
+    core_index = np.where(core_index <= ranks[..., np.newaxis], np.minimum(core_index, n_core), n_core)
+    candidates = np.concatenate(
+        [core[:, core_index], np.broadcast_to(extras[:, :, np.newaxis, :], (len(core), *ranks.shape, width))],
+        axis=-1,
+    )
+    candidates.sort(axis=-1)
+    return np.take_along_axis(candidates, (ranks - low)[np.newaxis, ..., np.newaxis], axis=-1)[..., 0]
+
+
+def _block_tail_sums(core: np.ndarray, extras: np.ndarray, thresholds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Sum and count of window values ``<= thresholds`` (``(n_series, n_block, k)``)."""
+    counts = np.empty(thresholds.shape, dtype=np.intp)
+    for row in range(len(core)):
+        counts[row] = np.searchsorted(core[row], thresholds[row], side="right")
+    # Only the lowest values of the core can fall in the tail
+    core_sums = np.zeros((len(core), counts.max() + 1))
+    np.cumsum(core[:, : counts.max()], axis=1, out=core_sums[:, 1:])
+    sums = np.take_along_axis(core_sums, counts.reshape(len(core), -1), axis=1).reshape(thresholds.shape)
+
+    in_tail = extras[:, :, np.newaxis, :] <= thresholds[..., np.newaxis]
+    sums += np.where(in_tail, extras[:, :, np.newaxis, :], 0.0).sum(axis=-1)
+    return sums, counts + in_tail.sum(axis=-1)
+
+
+def _historical_var(
+    values: np.ndarray, starts: np.ndarray, ends: np.ndarray, levels: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """1-day historical VaR and CVaR of every window, ``(n_series, n_windows, n_levels)``."""
+    lower, upper, gamma = _percentile_positions(ends - starts, levels)
+    ranks = np.concatenate([lower, upper], axis=1)
+    n_levels = len(levels)
+
+    var = np.empty((len(values), len(ends), n_levels))
+    cvar = np.empty_like(var)
+    chunk = max(1, _CHUNK_ELEMENTS // (4 * _BLOCK * _BLOCK * ranks.shape[1]))
+    for first in range(0, len(values), chunk):
+        rows = slice(first, first + chunk)
+        for block, core, extras, n_extra in _window_blocks(values[rows], starts, ends):
+            order = _block_order_statistics(core, extras, n_extra, ranks[block])
+            quantile = _lerp(order[..., :n_levels], order[..., n_levels:], gamma[block])
+            block_var = np.maximum(-quantile, 0.0)
+            tail_sum, tail_count = _block_tail_sums(core, extras, -block_var)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                tail_mean = np.where(tail_count > 0, -tail_sum / tail_count, block_var)
+            var[rows, block] = block_var
+            cvar[rows, block] = np.maximum(tail_mean, block_var)
+    return var, cvar
+
+
+def _window_moments(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Mean and sample standard deviation of every window, ``(n_series, n_windows)``.
+
+    Series are centred on their full-sample mean before accumulating, as in
+    the rolling portfolio statistics.
+    """
+    offset = values.mean(axis=1, keepdims=True)
+    centred = values - offset
+    zero = np.zeros((len(values), 1))
+    sums = np.concatenate([zero, np.cumsum(centred, axis=1)], axis=1)
+    squares = np.concatenate([zero, np.cumsum(centred * centred, axis=1)], axis=1)
+
+    n = ends - starts
+    sx = sums[:, ends] - sums[:, starts]
+    sxx = squares[:, ends] - squares[:, starts]
+    sum_sq_dev = sxx - sx * sx / n
+    sum_sq_dev = np.where(sum_sq_dev > _VARIANCE_RTOL * sxx, sum_sq_dev, 0.0)
+    return sx / n + offset, np.sqrt(sum_sq_dev / (n - 1))
+
+
+def _montecarlo_var(mean: np.ndarray, std: np.ndarray, levels: np.ndarray, n_simulations: int) -> np.ndarray:
+    """1-day Monte Carlo VaR, ``(n_series, n_windows, n_levels)``.
+
+    ``compute_var`` draws ``mean + std * z`` from fixed-seed standard normals
+    ``z``.  That map is monotone, so the simulated percentile is the same
+    interpolation between the same two draws for every window and only
+    those two draws need transforming.
+    """
+    draws = np.sort(np.random.default_rng(seed=_MONTECARLO_SEED).standard_normal(n_simulations))
+    lower, upper, gamma = _percentile_positions(np.array([n_simulations]), levels)
+    mean, std = mean[..., np.newaxis], std[..., np.newaxis]
+    low = (1 + (mean + std * draws[lower[0]])) - 1
+    high = (1 + (mean + std * draws[upper[0]])) - 1
+    return np.maximum(-_lerp(low, high, gamma[0]), 0.0)
+
+
+def _window_var(
+    values: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    levels: np.ndarray,
+    method: VaRMethod,
+    n_simulations: int,
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """1-day VaR (and historical CVaR) of every window and confidence level."""
+    if method == VaRMethod.HISTORICAL:
+        return _historical_var(values, starts, ends, levels)
+
+    mean, std = _window_moments(values, starts, ends)
+    if method == VaRMethod.PARAMETRIC:
+        z = -stats.norm.ppf(1 - levels)
+        return np.maximum(z * std[..., np.newaxis], 0.0), None
+    return _montecarlo_var(mean, std, levels, n_simulations), None
+
+
+def var_surface(
+    returns: np.ndarray,
+    confidences: Sequence[float] = (0.95, 0.99),
+    horizons: Sequence[int] = (1,),
+    method: str | VaRMethod = VaRMethod.HISTORICAL,
+    n_simulations: int = 10_000,
+) -> VaRSurface:
+    """Compute VaR for every confidence level and horizon in one call.
+
+    Each cell equals ``compute_var(returns, confidence, method, horizon)``
+    (and, for historical VaR, ``compute_cvar`` scaled by ``sqrt(horizon)``).
+
+    Args:
+        returns: ``(n_obs,)`` daily returns or ``(n_obs, n_series)`` for many
+            portfolios.
+        confidences: Confidence levels in (0, 1).
+        horizons: Holding periods in trading days.
+        method: ``"historical"``, ``"parametric"``, or ``"montecarlo"``.
+        n_simulations: Monte Carlo paths.  Only used when ``method="montecarlo"``.
+
+    Returns:
+        VaRSurface with ``(n_series, n_confidences, n_horizons)`` arrays.
+
+    Raises:
+        ValueError: If the returns, confidence levels or horizons are invalid.
+    """
+    values = _as_series_matrix(returns)
+    levels, days = _validate_grid(confidences, horizons)
+    method = VaRMethod(method)
+    if method == VaRMethod.MONTECARLO and n_simulations < 1:
+        raise ValueError(f"n_simulations must be >= 1, got {n_simulations}")
+
+    if method == VaRMethod.MONTECARLO:
+        # Multi-day paths compound, so each horizon is simulated like compute_var
+        mean = values.mean(axis=1)[:, np.newaxis, np.newaxis]
+        std = values.std(axis=1, ddof=1)[:, np.newaxis, np.newaxis]
+        var = np.empty((len(values), len(levels), len(days)))
+        for column, horizon in enumerate(days):
+            draws = np.random.default_rng(seed=_MONTECARLO_SEED).standard_normal((n_simulations, horizon))
+            cumulative = np.prod(1 + (mean + std * draws), axis=2) - 1
+            var[:, :, column] = np.maximum(-np.percentile(cumulative, (1 - levels) * 100, axis=1).T, 0.0)
+        return VaRSurface(confidences=levels, horizons=days, method=method, var=var)
+
+    full_sample = np.array([0]), np.array([values.shape[1]])
+    one_day, one_day_cvar = _window_var(values, *full_sample, levels, method, n_simulations)
+    scale = np.sqrt(days)
+    var = one_day[:, 0, :, np.newaxis] * scale
+    cvar = None if one_day_cvar is None else one_day_cvar[:, 0, :, np.newaxis] * scale
+    return VaRSurface(confidences=levels, horizons=days, method=method, var=var, cvar=cvar)
+
+
+def rolling_var(
+    returns: np.ndarray,
+    confidences: Sequence[float] = (0.95,),
+    horizons: Sequence[int] = (1,),
+    method: str | VaRMethod = VaRMethod.HISTORICAL,
+    window: int | None = None,
+    min_history: int = 252,
+    n_simulations: int = 10_000,
+) -> VaRSurface:
+    """Forecast VaR for every bar from the returns before it.
+
+    Row ``t`` equals ``var_surface(returns[start:t], ...)`` with
+    ``start = 0`` (expanding) or ``t - window`` (rolling).  Forecasts start
+    at bar ``min_history`` (or ``window`` if larger).
+
+    Args:
+        returns: ``(n_obs,)`` daily returns or ``(n_obs, n_series)`` for many
+            portfolios.
+        confidences: Confidence levels in (0, 1).
+        horizons: Holding periods in trading days.  Monte Carlo forecasts
+            support 1-day horizons only.
+        method: ``"historical"``, ``"parametric"``, or ``"montecarlo"``.
+        window: Rolling window length; ``None`` for expanding windows.
+        min_history: Minimum observations before the first forecast.
+        n_simulations: Monte Carlo paths.  Only used when ``method="montecarlo"``.
+
+    Returns:
+        VaRSurface with ``(n_obs, n_series, n_confidences, n_horizons)``
+        arrays, ``NaN`` before the first forecast.
+
+    Raises:
+        ValueError: If the inputs are invalid or leave no bar to forecast.
+    """
+    values = _as_series_matrix(returns)
+    levels, days = _validate_grid(confidences, horizons)
+    method = VaRMethod(method)
+    if min_history < _MIN_OBSERVATIONS:
+        raise ValueError(f"min_history must be >= {_MIN_OBSERVATIONS}, got {min_history}")
+    if window is not None and window < _MIN_OBSERVATIONS:
+        raise ValueError(f"window must be >= {_MIN_OBSERVATIONS}, got {window}")
+    if method == VaRMethod.MONTECARLO:
+        if n_simulations < 1:
+            raise ValueError(f"n_simulations must be >= 1, got {n_simulations}")
+        if days.max() > 1:
+            raise ValueError("rolling Monte Carlo VaR supports 1-day horizons only")
+
+    n_series, n_obs = values.shape
+    first = min_history if window is None else max(min_history, window)
+    if n_obs <= first:
+        raise ValueError(f"Need more than {first} observations for rolling VaR, got {n_obs}")
+
+    ends = np.arange(first, n_obs)
+    starts = np.zeros_like(ends) if window is None else ends - window
+    one_day, one_day_cvar = _window_var(values, starts, ends, levels, method, n_simulations)
+
+    scale = np.sqrt(days)
+    var = np.full((n_obs, n_series, len(levels), len(days)), np.nan)
+    var[first:] = one_day.transpose(1, 0, 2)[..., np.newaxis] * scale
+    cvar = None
+    if one_day_cvar is not None:
+        cvar = np.full_like(var, np.nan)
+        cvar[first:] = one_day_cvar.transpose(1, 0, 2)[..., np.newaxis] * scale
+    return VaRSurface(confidences=levels, horizons=days, method=method, var=var, cvar=cvar, window=window)
+
+
 def compute_var(
     returns: np.ndarray,
     confidence: float = 0.95,
@@ -160,12 +533,14 @@ def var_backtest(
     confidence: float = 0.95,
     method: str | VaRMethod = VaRMethod.HISTORICAL,
     min_history: int = 252,
+    window: int | None = None,
 ) -> VaRBacktestResult:
-    """Backtest a VaR model via expanding-window violation analysis.
+    """Backtest a VaR model via expanding- or rolling-window violation analysis.
 
     For each day after the initial ``min_history`` training window, a
-    1-day VaR is predicted from the preceding observations.  A violation
-    occurs when the actual return falls below ``-var``.
+    1-day VaR is predicted from the preceding observations (all of them,
+    or the last ``window``).  A violation occurs when the actual return
+    falls below ``-var``.  Forecasts come from ``rolling_var``.
 
     A model is considered **calibrated** when
     ``|violation_rate - (1 - confidence)| < 0.02``.
@@ -175,6 +550,7 @@ def var_backtest(
         confidence: Confidence level in (0, 1).
         method: VaR computation method.
         min_history: Minimum training observations before the first forecast.
+        window: Rolling training window; ``None`` (default) expands it.
 
     Returns:
         VaRBacktestResult with violation statistics.
@@ -192,16 +568,11 @@ def var_backtest(
     if len(returns) <= min_history:
         raise ValueError(f"Need more than {min_history} observations for backtest, got {len(returns)}")
 
-    violations = 0
-    test_count = 0
-
-    for i in range(min_history, len(returns)):
-        train = returns[:i]
-        predicted_var = compute_var(train, confidence=confidence, method=method, horizon_days=1).var
-        actual_return = returns[i]
-        if actual_return < -predicted_var:
-            violations += 1
-        test_count += 1
+    forecasts = rolling_var(returns, (confidence,), (1,), method, window=window, min_history=min_history)
+    predicted = forecasts.var[:, 0, 0, 0]
+    tested = ~np.isnan(predicted)
+    test_count = int(tested.sum())
+    violations = int(np.sum(returns[tested] < -predicted[tested]))
 
     violation_rate = violations / test_count if test_count > 0 else 0.0
     expected_rate = 1.0 - confidence
@@ -3,6 +3,7 @@ import pandas as pd
 from finbot.constants.path_constants import FRED_DATA_DIR, LONGTERMTRENDS_DATA_DIR, SIMULATIONS_DATA_DIR
 from finbot.utils.data_collection_utils.fred.get_fred_data import get_fred_data
 from finbot.utils.data_collection_utils.yfinance.get_history import get_history
+from finbot.utils.pandas_utils.save_dataframe import save_dataframe
 
 
 def get_yields() -> pd.DataFrame:
@@ -52,5 +53,7 @@ def approximate_overnight_libor(save: bool = True) -> pd.Series:
     libor_hist = libor_hist.bfill()
 
     if save:
-        libor_hist.to_frame().to_parquet(SIMULATIONS_DATA_DIR / "overnight_libor_sim.parquet")
+        save_dataframe(
+            libor_hist, SIMULATIONS_DATA_DIR / "overnight_libor_sim.parquet", compression="snappy", smart_backup=False
+        )
     return libor_hist
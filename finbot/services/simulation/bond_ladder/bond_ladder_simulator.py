@@ -10,6 +10,7 @@ from finbot.services.simulation.bond_ladder.get_yield_history import get_yield_h
 from finbot.services.simulation.bond_ladder.ladder import make_annual_ladder
 from finbot.services.simulation.bond_ladder.loop import loop
 from finbot.utils.finance_utils.get_periods_per_year import get_periods_per_year
+from finbot.utils.pandas_utils.save_dataframe import save_dataframe
 
 
 def bond_ladder_simulator(
@@ -68,4 +69,4 @@ def bond_ladder_simulator(
 def _save_fund_to_db(df: pd.DataFrame) -> None:
     file_name = "ltt_bond_index_simulation.parquet"
     print(f"Saving {file_name} to simulations db")
-    df.to_parquet(SIMULATIONS_DATA_DIR / file_name)
+    save_dataframe(df, SIMULATIONS_DATA_DIR / file_name, compression="snappy", smart_backup=False)
@@ -14,6 +14,7 @@ def monte_carlo_simulator(
     sim_periods: int = 252,
     n_sims: int = 10000,
     start_price: float | None = None,
+    seed: int | None = None,
 ) -> pd.DataFrame:
     if equity_end is None:
         equity_end = pd.Timestamp.now()
@@ -26,6 +27,8 @@ def monte_carlo_simulator(
     )
     mu = changes.dropna().mean()
     sigma = changes.dropna().std()
+    # A seed makes the trials reproducible; otherwise NumPy's global state is used
+    rng = np.random.default_rng(seed) if seed is not None else None
 
     trials = np.array(
         [
@@ -36,6 +39,7 @@ def monte_carlo_simulator(
                 mu=mu,
                 sigma=sigma,
                 cov_matrix=None,
+                rng=rng,
             )
             for _ in tqdm(range(n_sims), desc="Performing monte carlo simulation")
         ]
@@ -9,8 +9,9 @@ def sim_type_nd(**kwargs: Any) -> np.ndarray:
     start_price = kwargs["start_price"]
     mu = kwargs["mu"]
     sigma = kwargs["sigma"]
+    rng = kwargs.get("rng") or np.random
 
-    daily_changes = np.random.normal(loc=mu + 1, scale=sigma, size=sim_periods)
+    daily_changes = rng.normal(loc=mu + 1, scale=sigma, size=sim_periods)
     daily_changes[0] = 1
     cum_changes = np.cumprod(daily_changes)
     price_array = cum_changes * start_price
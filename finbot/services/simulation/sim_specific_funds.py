@@ -11,6 +11,7 @@ from finbot.services.simulation.sim_specific_bond_indexes import sim_idcot1tr, s
 from finbot.services.simulation.sim_specific_stock_indexes import sim_nd100tr, sim_sp500tr
 from finbot.utils.data_collection_utils.yfinance.get_history import get_history
 from finbot.utils.finance_utils.merge_price_histories import merge_price_histories
+from finbot.utils.pandas_utils.save_dataframe import save_dataframe
 
 # Additive constants for curve fitting (empirically determined)
 # These constants adjust simulated returns to better match actual fund performance
@@ -119,7 +120,7 @@ def _sim_fund(
             logger.warning(f"Could not overwrite {fund_name} simulation with actual fund data for ticker {ticker}: {e}")
 
     if save_sim:
-        fund.to_parquet(fund_path)
+        save_dataframe(fund, fund_path, compression="snappy", smart_backup=False)
     return fund
 
 
@@ -447,5 +448,5 @@ def sim_ntsx(
             logger.warning(f"Could not overwrite NTSX simulation with actual fund data: {e}")
 
     if save_sim:
-        fund.to_parquet(fund_path)
+        save_dataframe(fund, fund_path, compression="snappy", smart_backup=False)
     return fund
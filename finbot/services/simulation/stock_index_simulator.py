@@ -3,6 +3,7 @@ import pandas as pd
 from finbot.constants.path_constants import SIMULATIONS_DATA_DIR
 from finbot.services.simulation.is_sufficiently_updated import is_sufficiently_updated
 from finbot.utils.finance_utils.merge_price_histories import merge_price_histories
+from finbot.utils.pandas_utils.save_dataframe import save_dataframe
 
 
 def stock_index_simulator(
@@ -39,6 +40,6 @@ def stock_index_simulator(
 
     if save_index:
         print(f"Saving {fund_name} to simulations db")
-        sim_df.to_parquet(fund_path)
+        save_dataframe(sim_df, fund_path, compression="snappy", smart_backup=False)
 
     return sim_df
@@ -4,6 +4,7 @@ Provides base functionality for all yfinance API calls including:
     - Batch fetching of price histories and ticker info
     - Multithreaded data retrieval for performance
     - Automatic caching to parquet files
+    - Shared in-memory cache of decoded files (read-only views)
     - Update detection based on data freshness
     - Date and time filtering (including pre/post market)
     - MultiIndex DataFrame handling for multi-symbol data
@@ -37,8 +38,8 @@ from tqdm import tqdm
 from finbot.config import logger, settings_accessors
 from finbot.constants.path_constants import YFINANCE_DATA_DIR
 from finbot.utils.file_utils.are_files_outdated import are_files_outdated
+from finbot.utils.pandas_utils.dataframe_cache import price_history_cache
 from finbot.utils.pandas_utils.filter_by_date import filter_by_date
-from finbot.utils.pandas_utils.load_dataframes import load_dataframes
 from finbot.utils.pandas_utils.save_dataframes import save_dataframes
 from finbot.utils.pandas_utils.sort_dataframe_columns import sort_dataframe_multiindex
 
@@ -301,7 +302,7 @@ def _load_yfinance_data(symbols_to_load: Sequence[str], file_paths: dict[str, Pa
     try:
         symbol_names = tuple(sorted(symbols_to_load))  # immutable
         symbol_paths = tuple(file_paths[s] for s in symbol_names)  # immutable
-        symbol_data = load_dataframes(list(symbol_paths))
+        symbol_data = price_history_cache.get_many(symbol_paths)
 
         # check to make sure the order of the loaded_dfs matches the order of the immutable_ids
         if any(
@@ -370,8 +371,12 @@ def _filter_yfinance_data(
     if not isinstance(df.index, pd.DatetimeIndex):
         return df
 
-    # Filter the data based on the start and end dates
-    df = pd.DataFrame(filter_by_date(df, start_date, end_date))
+    # Filter the data based on the start and end dates; a sorted tz-naive
+    # index is sliced, which keeps the result a view of the loaded data
+    if df.index.is_monotonic_increasing and df.index.tz is None:
+        df = df.loc[pd.Timestamp(start_date) : pd.Timestamp(end_date)].copy(deep=False)
+    else:
+        df = pd.DataFrame(filter_by_date(df, start_date, end_date))
 
     # Filter the data based on prepost if the interval shorted than daily
     if not prepost and interval.endswith(("s", "m", "h")):
@@ -405,6 +410,11 @@ def _get_files_to_update(
     return [s for s, o in zip(symbols, outdated, strict=False) if o]
 
 
+def get_data_file_path(symbol: str, request_type: str = "history", interval: str = "1d") -> Path:
+    """Parquet file storing one symbol's data for a request type and interval."""
+    return YFINANCE_DATA_DIR / request_type / f"{symbol.upper()}_{request_type}_{interval}.parquet"
+
+
 def get_yfinance_base(
     symbols: Sequence[str] | str,
     request_type: str = "history",
@@ -441,7 +451,7 @@ def get_yfinance_base(
     )
 
     # Determine which symbols need to be updated
-    file_paths = {s: YFINANCE_DATA_DIR / request_type / f"{s}_{request_type}_{interval}.parquet" for s in symbols}
+    file_paths = {s: get_data_file_path(s, request_type, interval) for s in symbols}
 
     if force_update:
         to_update = symbols
@@ -469,6 +479,11 @@ def get_yfinance_base(
 
     # Load data for symbols that don't need to be updated
     symbols_to_load = sorted(set(symbols) - set(to_update))
+    if request_type == "history" and len(symbols) == 1 and symbols_to_load:
+        # A single stored history needs no merging: filter a view of the cached frame
+        history = price_history_cache.get(file_paths[symbols[0]])
+        return _filter_yfinance_data(history, start_date, end_date, interval, prepost)
+
     loaded_data = _load_yfinance_data(
         symbols_to_load,
         file_paths,
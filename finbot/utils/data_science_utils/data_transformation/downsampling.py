@@ -0,0 +1,215 @@
+"""Downsampling of long series for charts and API payloads.
+
+A chart a few thousand pixels wide cannot show more than a few thousand
+points per line, yet 100-year simulations have ~25,000 daily values and fan
+charts draw hundreds of such paths.  These helpers pick a subset of the
+points that keeps the shape of the line:
+
+- **LTTB** (largest-triangle-three-buckets): splits the interior points into
+  equal buckets and keeps, per bucket, the point forming the largest triangle
+  with the previously kept point and the mean of the next bucket.  Best for
+  price and value lines.
+- **Min/max**: keeps the lowest and highest point of every bucket, so peaks
+  and troughs (e.g. the maximum drawdown) survive exactly.  Best for
+  drawdowns and ranges.
+
+Both always keep the first and last points, return positions in increasing
+order, and return every position when the input already fits.  NaN values
+are only kept when a whole bucket is NaN, which preserves gaps.
+
+Typical usage:
+    ```python
+    chart_series = downsample_series(value_series, max_points=2000)
+    troughs_kept = downsample_series(drawdown, max_points=2000, method=DownsampleMethod.MINMAX)
+    bands = downsample_frame(percentile_bands, max_points=500)
+    ```
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+
+import numpy as np
+import pandas as pd
+
+MIN_POINTS = 4
+
+
+class DownsampleMethod(StrEnum):
+    """Point selection algorithm."""
+
+    LTTB = "lttb"
+    MINMAX = "minmax"
+
+
+def _validate_max_points(max_points: int) -> None:
+    if max_points < MIN_POINTS:
+        raise ValueError(f"max_points must be >= {MIN_POINTS}, got {max_points}")
+
+
+def _buckets(n_obs: int, n_buckets: int) -> tuple[np.ndarray, np.ndarray]:
+    """Split positions ``1..n_obs-2`` into ``n_buckets`` near-equal buckets.
+
+    Returns:
+        Positions as an ``(n_buckets, width)`` array padded with each bucket's
+        last position, and the mask of real (non-padding) entries.
+    """
+    edges = np.linspace(1, n_obs - 1, n_buckets + 1).astype(np.int64)
+    starts, stops = edges[:-1], edges[1:]
+    positions = starts[:, None] + np.arange(int((stops - starts).max()))
+    valid = positions < stops[:, None]
+    return np.minimum(positions, stops[:, None] - 1), valid
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Positions of the points kept by largest-triangle-three-buckets.
+
+    Args:
+        x: Increasing x coordinates (e.g. int64 timestamps or periods).
+        y: Values, same length as ``x``.
+        max_points: Number of points to keep (at least ``MIN_POINTS``).
+
+    Raises:
+        ValueError: If ``max_points`` is too small or ``x`` and ``y`` differ in length.
+    """
+    _validate_max_points(max_points)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if x.shape != y.shape:
+        raise ValueError(f"x and y must have the same length, got {len(x)} and {len(y)}")
+    n_obs = len(y)
+    if n_obs <= max_points:
+        return np.arange(n_obs)
+
+    # Relative x keeps the area terms small enough for float64
+    x = x - x[0]
+    n_buckets = max_points - 2
+    positions, valid = _buckets(n_obs, n_buckets)
+    bucket_x, bucket_y = x[positions], y[positions]
+    usable = valid & ~np.isnan(bucket_y)
+
+    # Each bucket's mean is the third vertex for the bucket before it; the last
+    # bucket uses the final point
+    counts = np.maximum(usable.sum(axis=1), 1)
+    next_x = np.append((np.where(usable, bucket_x, 0.0).sum(axis=1) / counts)[1:], x[-1])[:, None]
+    next_y = np.append((np.where(usable, bucket_y, 0.0).sum(axis=1) / counts)[1:], y[-1])[:, None]
+
+    # Twice the triangle area with anchor (ax, ay) is |ax*p + ay*q + r|, so the
+    # loop over buckets only needs one small product per bucket.  Padding
+    # repeats a real point and NaN points score zero.
+    coefficients = np.stack(
+        [bucket_y - next_y, next_x - bucket_x, bucket_x * next_y - next_x * bucket_y],
+        axis=-1,
+    )
+    coefficients[~usable] = 0.0
+
+    kept = np.empty(max_points, dtype=np.int64)
+    kept[0], kept[-1] = 0, n_obs - 1
+    anchor = 0
+    for bucket in range(n_buckets):
+        anchor_vertex = np.array([x[anchor], y[anchor], 1.0])
+        anchor = positions[bucket, np.abs(coefficients[bucket] @ anchor_vertex).argmax()]
+        kept[bucket + 1] = anchor
+    return kept
+
+
+def minmax_indices(y: np.ndarray, max_points: int) -> np.ndarray:
+    """Positions of the minimum and maximum of each bucket, plus both ends.
+
+    Args:
+        y: Values.
+        max_points: Upper bound on the number of points kept (at least ``MIN_POINTS``).
+
+    Raises:
+        ValueError: If ``max_points`` is too small.
+    """
+    _validate_max_points(max_points)
+    y = np.asarray(y, dtype=np.float64)
+    n_obs = len(y)
+    if n_obs <= max_points:
+        return np.arange(n_obs)
+
+    positions, valid = _buckets(n_obs, (max_points - 2) // 2)
+    values = y[positions]
+    usable = valid & ~np.isnan(values)
+    rows = np.arange(len(positions))
+    lows = positions[rows, np.where(usable, values, np.inf).argmin(axis=1)]
+    highs = positions[rows, np.where(usable, values, -np.inf).argmax(axis=1)]
+    return np.unique(np.concatenate(([0, n_obs - 1], lows, highs)))
+
+
+def _x_coordinates(index: pd.Index) -> np.ndarray:
+    if isinstance(index, pd.DatetimeIndex):
+        return index.to_numpy(dtype="int64").astype(np.float64)
+    if pd.api.types.is_numeric_dtype(index.dtype):
+        return index.to_numpy(dtype=np.float64)
+    return np.arange(len(index), dtype=np.float64)
+
+
+def downsample_indices(
+    values: pd.Series,
+    max_points: int,
+    method: DownsampleMethod = DownsampleMethod.LTTB,
+) -> np.ndarray:
+    """Positions of the points of ``values`` to keep.
+
+    The x coordinates are the index (timestamps or numbers), or the positions
+    for any other index.
+    """
+    if DownsampleMethod(method) is DownsampleMethod.MINMAX:
+        return minmax_indices(values.to_numpy(dtype=np.float64, na_value=np.nan), max_points)
+    return lttb_indices(
+        _x_coordinates(values.index),
+        values.to_numpy(dtype=np.float64, na_value=np.nan),
+        max_points,
+    )
+
+
+def downsample_series(
+    series: pd.Series,
+    max_points: int,
+    method: DownsampleMethod = DownsampleMethod.LTTB,
+) -> pd.Series:
+    """Return at most ``max_points`` points of ``series`` that keep its shape."""
+    if len(series) <= max_points:
+        _validate_max_points(max_points)
+        return series
+    return series.iloc[downsample_indices(series, max_points, method)]
+
+
+def downsample_frame_indices(
+    frame: pd.DataFrame,
+    max_points: int,
+    method: DownsampleMethod = DownsampleMethod.LTTB,
+) -> np.ndarray:
+    """Row positions to keep so that every numeric column keeps its shape.
+
+    Each numeric column gets an equal share of ``max_points`` (at least
+    ``MIN_POINTS``) and the union of their selections is returned, so a frame
+    with more than ``max_points / MIN_POINTS`` columns can exceed the bound.
+    Frames without numeric columns get evenly spaced rows.
+    """
+    _validate_max_points(max_points)
+    n_obs = len(frame)
+    if n_obs <= max_points:
+        return np.arange(n_obs)
+
+    numeric = frame.select_dtypes(include=["number", "bool"])
+    if numeric.empty:
+        return np.unique(np.linspace(0, n_obs - 1, max_points).round().astype(np.int64))
+    share = max(MIN_POINTS, max_points // len(numeric.columns))
+    return np.unique(
+        np.concatenate([downsample_indices(numeric.iloc[:, i], share, method) for i in range(len(numeric.columns))])
+    )
+
+
+def downsample_frame(
+    frame: pd.DataFrame,
+    max_points: int,
+    method: DownsampleMethod = DownsampleMethod.LTTB,
+) -> pd.DataFrame:
+    """Return the rows of ``frame`` selected by ``downsample_frame_indices``."""
+    if len(frame) <= max_points:
+        _validate_max_points(max_points)
+        return frame
+    return frame.iloc[downsample_frame_indices(frame, max_points, method)]
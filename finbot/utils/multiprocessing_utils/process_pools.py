@@ -0,0 +1,50 @@
+"""Process pools for work started from multi-threaded hosts.
+
+The web server, its route and job workers and walk-forward analysis all
+start worker processes while other threads are running.  ``fork()`` copies
+only the calling thread, so locks held by the others (logging, imports,
+BLAS thread pools) can be inherited locked.  Every finbot process pool
+therefore starts its workers with the ``forkserver`` method, chosen here.
+
+Typical usage:
+    ```python
+    from finbot.utils.multiprocessing_utils.process_pools import new_process_pool
+
+    with new_process_pool(4, initializer=load_engine, initargs=(engine,)) as executor:
+        results = list(executor.map(run_window, requests))
+    ```
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Any
+
+# forkserver avoids fork() from multi-threaded hosts such as the web server
+POOL_START_METHOD = "forkserver"
+
+
+def pool_context() -> BaseContext:
+    """Multiprocessing context that finbot worker processes are started from."""
+    return multiprocessing.get_context(POOL_START_METHOD)
+
+
+def new_process_pool(
+    max_workers: int,
+    *,
+    initializer: Callable[..., object] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> ProcessPoolExecutor:
+    """Create a ``ProcessPoolExecutor`` whose workers start from ``pool_context()``.
+
+    Args:
+        max_workers: Number of worker processes.
+        initializer: Called in each worker when it starts.
+        initargs: Arguments for ``initializer``.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=pool_context(), initializer=initializer, initargs=initargs
+    )
@@ -0,0 +1,193 @@
+"""Process-wide LRU cache of decoded parquet DataFrames.
+
+Reading and decoding a parquet file costs far more than handing out a frame
+that is already in memory.  ``DataFrameCache`` keeps decoded frames keyed by
+``(path, mtime, size)``, so a file rewritten on disk is reloaded on its next
+read, and evicts the least recently used frames once their total memory
+exceeds a byte budget.
+
+Callers get read-only views: shallow copies that share the cached arrays,
+which are flagged non-writeable.  Adding or replacing columns on a view is
+free and private to the caller; writing into existing values in place raises
+``ValueError`` instead of silently corrupting every later reader.
+
+Typical usage:
+    - Share price histories between API routes, the dashboard and the CLI
+    - Avoid re-decoding the same benchmark file several times per request
+    - Report cache hit rates on health endpoints
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from finbot.config import settings_accessors
+from finbot.utils.pandas_utils.load_dataframe import load_dataframe
+from finbot.utils.pandas_utils.load_dataframes import load_dataframes
+
+CacheKey = tuple[str, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class DataFrameCacheStats:
+    """Snapshot of cache counters.
+
+    Attributes:
+        hits: Reads served from memory.
+        misses: Reads that decoded the file.
+        evictions: Frames dropped to stay within the byte budget.
+        entries: Frames currently cached.
+        size_bytes: Memory used by the cached frames.
+        max_bytes: Byte budget.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of reads served from memory (0.0 before any read)."""
+        reads = self.hits + self.misses
+        return self.hits / reads if reads else 0.0
+
+
+def _freeze(frame: pd.DataFrame) -> pd.DataFrame:
+    """Flag the frame's data arrays non-writeable."""
+    for block in frame._mgr.blocks:
+        values = block.values
+        # Datetime and timedelta blocks wrap their ndarray
+        array = values if isinstance(values, np.ndarray) else getattr(values, "_ndarray", None)
+        if isinstance(array, np.ndarray):
+            array.flags.writeable = False
+    return frame
+
+
+def read_only_view(frame: pd.DataFrame) -> pd.DataFrame:
+    """Shallow copy of a frozen frame; new columns do not touch the original."""
+    return frame.copy(deep=False)
+
+
+class DataFrameCache:
+    """Thread-safe LRU cache of decoded parquet files bounded by memory.
+
+    Args:
+        max_bytes: Memory budget of the cached frames (index included).
+            Files larger than the budget are read but not cached.
+    """
+
+    def __init__(self, max_bytes: int):
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[CacheKey, pd.DataFrame, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(file_path: Path | str) -> CacheKey:
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        return path, stat.st_mtime_ns, stat.st_size
+
+    def _lookup(self, key: CacheKey) -> pd.DataFrame | None:
+        """Return the cached frame for ``key`` and count the read (lock held)."""
+        entry = self._entries.get(key[0])
+        if entry is not None and entry[0] == key:
+            self._entries.move_to_end(key[0])
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def _store(self, key: CacheKey, frame: pd.DataFrame) -> pd.DataFrame:
+        """Freeze and cache a decoded frame, evicting old ones (lock not held)."""
+        frame = _freeze(frame)
+        nbytes = int(frame.memory_usage(index=True, deep=True).sum())
+        with self._lock:
+            stale = self._entries.pop(key[0], None)
+            if stale is not None:
+                self._size_bytes -= stale[2]
+            if nbytes <= self._max_bytes:
+                self._entries[key[0]] = (key, frame, nbytes)
+                self._size_bytes += nbytes
+            while self._size_bytes > self._max_bytes:
+                _, (_, _, evicted_bytes) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_bytes
+                self.evictions += 1
+        return frame
+
+    def get(self, file_path: Path | str) -> pd.DataFrame:
+        """Return a read-only view of a parquet file, decoding it on a miss.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        key = self._key(file_path)
+        with self._lock:
+            frame = self._lookup(key)
+        if frame is None:
+            frame = self._store(key, load_dataframe(key[0]))
+        return read_only_view(frame)
+
+    def get_many(self, file_paths: Sequence[Path | str]) -> list[pd.DataFrame]:
+        """Return read-only views of several files; misses are decoded in parallel.
+
+        Raises:
+            FileNotFoundError: If a file does not exist.
+        """
+        keys = [self._key(path) for path in file_paths]
+        with self._lock:
+            frames = [self._lookup(key) for key in keys]
+        missing = [i for i, frame in enumerate(frames) if frame is None]
+        if missing:
+            loaded = load_dataframes([keys[i][0] for i in missing])
+            for i, data in zip(missing, loaded, strict=True):
+                frames[i] = self._store(keys[i], data if isinstance(data, pd.DataFrame) else data.to_frame())
+        views: list[pd.DataFrame] = []
+        for frame in frames:
+            assert frame is not None
+            views.append(read_only_view(frame))
+        return views
+
+    def stats(self) -> DataFrameCacheStats:
+        """Return the current counters."""
+        with self._lock:
+            return DataFrameCacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop all frames and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by every consumer of get_history (API routes, dashboard, CLI)
+price_history_cache = DataFrameCache(settings_accessors.get_price_history_cache_bytes())
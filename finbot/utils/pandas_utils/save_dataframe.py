@@ -6,6 +6,7 @@ Saves pandas data structures to parquet format with intelligent features:
     - Smart backup of existing files when safety checks fail
     - Configurable compression (default: zstd)
     - Automatic directory creation
+    - Atomic replacement of existing files
 
 Parquet format provides:
     - Fast I/O compared to CSV
@@ -24,6 +25,8 @@ Typical usage:
 
 from __future__ import annotations
 
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -210,14 +213,20 @@ def save_dataframe(
     if smart_backup and not _df_save_safety_check(df=df, file_path=file_path):
         backup_file(file_path)
 
+    # Write a sibling temp file and swap it in, so readers never see a partial
+    # file and directory watchers (the data catalog) see the change
+    tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
     try:
         logger.info(f"Saving DataFrame to {file_path}...")
         if isinstance(df, pd.Series):
             df = df.to_frame()
-        df.to_parquet(path=file_path, compression=compression)  # type: ignore
+        df.to_parquet(path=tmp_path, compression=compression)  # type: ignore
+        os.replace(tmp_path, file_path)
         logger.info(f"Successfully saved DataFrame to {file_path}")
     except OSError as e:
         logger.error(f"Error saving DataFrame to {file_path}: {e}")
         raise
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
     return file_path
@@ -0,0 +1,130 @@
+"""Token-bucket throttling for outbound API requests.
+
+``RateLimiter`` only records the limits an API publishes; ``TokenBucket``
+enforces one.  The bucket refills continuously at ``rate`` tokens per second
+up to ``capacity``, so short bursts pass immediately and sustained traffic is
+spread out to the configured rate.
+
+Reservations are made under a ``threading.Lock`` and never block, which lets
+the same bucket throttle threads and asyncio tasks on any event loop: the
+caller reserves tokens, then sleeps for the returned delay.
+
+Typical usage:
+    ```python
+    bucket = TokenBucket.from_rate_limiter(RateLimiter("200/minute"))
+    await bucket.acquire()  # waits only once the burst is spent
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+
+from finbot.utils.request_utils.rate_limiter import RateLimiter
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum tokens held, i.e. the largest burst.  Defaults to
+            ``rate`` (one second of traffic).
+        clock: Monotonic time source, for tests.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        capacity = rate if capacity is None else capacity
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self._rate = rate
+        self._capacity = capacity
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated = clock()
+
+    @classmethod
+    def from_rate_limiter(cls, limiter: RateLimiter) -> TokenBucket:
+        """Build a bucket enforcing the strictest of ``limiter``'s limits.
+
+        ``"8/minute;800/day"`` becomes a bucket of 8 tokens refilled at the
+        daily rate, since 800/day is the lower sustained rate.
+        """
+        items = sorted(limiter.parsed_limits, key=lambda item: item.amount / item.get_expiry())
+        strictest = items[0]
+        return cls(
+            rate=strictest.amount / strictest.get_expiry(),
+            capacity=min(item.amount for item in items),
+        )
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self._rate
+
+    @property
+    def capacity(self) -> float:
+        """Maximum tokens held."""
+        return self._capacity
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available (negative while reservations are queued)."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0, *, max_wait: float | None = None) -> float | None:
+        """Take ``tokens`` and return how long to wait before using them.
+
+        Args:
+            tokens: Tokens to take; more than ``capacity`` can never be granted.
+            max_wait: Give up instead of queueing when the wait would exceed
+                this many seconds.  ``None`` always queues.
+
+        Returns:
+            Seconds to wait (0.0 when tokens are available now), or ``None``
+            when nothing was reserved because of ``max_wait``.
+
+        Raises:
+            ValueError: If ``tokens`` exceeds the bucket capacity.
+        """
+        if tokens > self._capacity:
+            raise ValueError(f"cannot reserve {tokens} tokens from a bucket of {self._capacity}")
+        with self._lock:
+            self._refill()
+            wait = max(0.0, (tokens - self._tokens) / self._rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= tokens
+            return wait
+
+    async def acquire(self, tokens: float = 1.0, *, max_wait: float | None = None) -> bool:
+        """Wait until ``tokens`` are available and take them.
+
+        Returns:
+            ``False`` without waiting when ``max_wait`` would be exceeded.
+        """
+        wait = self.reserve(tokens, max_wait=max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
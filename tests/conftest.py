@@ -7,6 +7,20 @@ finbot.config loads without raising ValueError on the missing ENV var.
 from __future__ import annotations
 
 import os
+import sys
+
+import pytest
 
 # Must be set before any finbot.config import happens.
 os.environ.setdefault("DYNACONF_ENV", "development")
+# Run API route handlers in the test process, where tests can monkeypatch them
+os.environ.setdefault("FINBOT_API_ROUTE_OFFLOAD_ENABLED", "false")
+
+
+@pytest.fixture(autouse=True)
+def _clear_api_result_cache():
+    """Keep API results cached by one test from answering another."""
+    yield
+    module = sys.modules.get("web.backend.services.result_cache")
+    if module is not None and module._cache is not None:
+        module._cache.clear()
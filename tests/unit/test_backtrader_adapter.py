@@ -6,8 +6,9 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from finbot.core.contracts import BACKTEST_RESULT_SCHEMA_VERSION, BacktestRunRequest
+from finbot.core.contracts import BACKTEST_RESULT_SCHEMA_VERSION, BacktestRunRequest, MissingDataPolicy
 from finbot.services.backtesting.adapters import BacktraderAdapter
+from finbot.services.backtesting.costs import FlatCommission
 from finbot.services.backtesting.snapshot_registry import DataSnapshotRegistry
 
 
@@ -63,6 +64,16 @@ def test_backtrader_adapter_runs_contract_output(
     assert "max_drawdown" in result.metrics
 
 
+def test_backtrader_adapter_cache_key_tracks_engine_settings() -> None:
+    histories = {"SPY": _make_price_df()}
+    baseline = BacktraderAdapter(histories).cache_key()
+
+    assert BacktraderAdapter({"SPY": _make_price_df(seed=7)}).cache_key() == baseline
+    assert BacktraderAdapter(histories, commission_model=FlatCommission()).cache_key() != baseline
+    assert BacktraderAdapter(histories, sizer_kwargs={"percents": 50}).cache_key() != baseline
+    assert BacktraderAdapter(histories, missing_data_policy=MissingDataPolicy.DROP).cache_key() != baseline
+
+
 def test_backtrader_adapter_rejects_unknown_strategy() -> None:
     adapter = BacktraderAdapter({"SPY": _make_price_df()})
     request = BacktestRunRequest(
@@ -15,7 +15,11 @@ from finbot.core.contracts.models import OrderSide, OrderType
 from finbot.core.contracts.orders import Order, OrderStatus
 from finbot.core.contracts.risk import DrawdownLimitRule, ExposureLimitRule, PositionLimitRule, RiskConfig
 from finbot.services.execution.checkpoint_manager import CheckpointManager
-from finbot.services.execution.checkpoint_serialization import deserialize_checkpoint, serialize_checkpoint
+from finbot.services.execution.checkpoint_serialization import (
+    decode_compact,
+    deserialize_checkpoint,
+    serialize_checkpoint,
+)
 from finbot.services.execution.execution_simulator import ExecutionSimulator
 
 
@@ -507,3 +511,89 @@ class TestCheckpointIntegration:
         assert restored.commission_per_share == Decimal("0.01")
         assert restored.latency_config == LATENCY_NORMAL
         assert restored.risk_checker is not None
+
+
+def _limit_order(order_id: str, limit_price: str = "300") -> Order:
+    return Order(
+        order_id=order_id,
+        symbol="SPY",
+        side=OrderSide.BUY,
+        order_type=OrderType.LIMIT,
+        quantity=Decimal("10"),
+        limit_price=Decimal(limit_price),
+        created_at=datetime.now(),
+    )
+
+
+class TestIncrementalCheckpoints:
+    """Test compact delta checkpoints."""
+
+    def test_deltas_record_only_changes(self, tmp_path: Path):
+        """Each delta stores only newly completed and changed pending orders."""
+        manager = CheckpointManager(tmp_path, incremental=True)
+        simulator = ExecutionSimulator(initial_cash=Decimal("100000"), simulator_id="test-delta")
+        simulator.submit_order(_limit_order("resting-1"))
+        simulator.submit_order(_limit_order("resting-2"))
+
+        first = manager.save_checkpoint(manager.create_checkpoint(simulator))
+
+        simulator.submit_order(_limit_order("filled", limit_price="500"))
+        simulator.process_market_data("SPY", Decimal("450"))
+        simulator.cancel_order("resting-2")
+        simulator.submit_order(_limit_order("resting-3"))
+
+        second = manager.save_checkpoint(manager.create_checkpoint(simulator))
+        delta = decode_compact(second.read_bytes())
+
+        assert first.name.endswith(".full.ckpt")
+        assert second.name.endswith(".delta.ckpt")
+        assert delta["previous"] == first.name
+        assert [order["order_id"] for order in delta["completed_added"]] == ["filled", "resting-2"]
+        assert [order["order_id"] for order in delta["pending_upserted"]] == ["resting-3"]
+        assert delta["pending_removed"] == ["resting-2"]
+        assert (tmp_path / "test-delta" / "LATEST").read_text() == second.name
+
+    def test_load_replays_deltas(self, tmp_path: Path):
+        """Loading the latest checkpoint replays all deltas onto the full snapshot."""
+        manager = CheckpointManager(tmp_path, incremental=True)
+        simulator = ExecutionSimulator(initial_cash=Decimal("100000"), simulator_id="test-replay")
+
+        for step in range(5):
+            simulator.submit_order(_limit_order(f"resting-{step}"))
+            simulator.submit_order(_limit_order(f"filled-{step}", limit_price="500"))
+            simulator.process_market_data("SPY", Decimal(450 + step))
+            manager.save_checkpoint(manager.create_checkpoint(simulator))
+
+        restored = manager.restore_simulator(CheckpointManager(tmp_path).load_checkpoint("test-replay"))
+
+        assert restored.cash == simulator.cash
+        assert dict(restored.positions) == dict(simulator.positions)
+        assert list(restored.pending_orders) == list(simulator.pending_orders)
+        assert list(restored.completed_orders) == list(simulator.completed_orders)
+        assert len(manager.list_checkpoints("test-replay")) == 5
+
+    def test_full_snapshot_interval(self, tmp_path: Path):
+        """A full snapshot is written after full_snapshot_interval deltas."""
+        manager = CheckpointManager(tmp_path, incremental=True, full_snapshot_interval=2)
+        simulator = ExecutionSimulator(initial_cash=Decimal("100000"), simulator_id="test-interval")
+
+        paths = [manager.save_checkpoint(manager.create_checkpoint(simulator)) for _ in range(4)]
+
+        assert [path.name.split(".", 1)[1] for path in paths] == ["full.ckpt", "delta.ckpt", "delta.ckpt", "full.ckpt"]
+
+    def test_load_by_timestamp(self, tmp_path: Path):
+        """A specific delta checkpoint can be loaded by timestamp."""
+        manager = CheckpointManager(tmp_path, incremental=True)
+        simulator = ExecutionSimulator(initial_cash=Decimal("100000"), simulator_id="test-ts")
+
+        manager.save_checkpoint(manager.create_checkpoint(simulator))
+        simulator.submit_order(_limit_order("resting"))
+        middle = manager.create_checkpoint(simulator)
+        manager.save_checkpoint(middle)
+        simulator.cancel_order("resting")
+        manager.save_checkpoint(manager.create_checkpoint(simulator))
+
+        loaded = manager.load_checkpoint("test-ts", middle.checkpoint_timestamp)
+
+        assert [order.order_id for order in loaded.pending_orders] == ["resting"]
+        assert loaded.completed_orders == []
@@ -82,3 +82,27 @@ def test_drawdown_chart():
     fig = create_drawdown_chart(s, "Test Drawdown")
     assert isinstance(fig, go.Figure)
     assert len(fig.data) == 1
+
+
+def test_time_series_chart_downsamples_long_series():
+    s = _make_price_series(length=25_000)
+    fig = create_time_series_chart({"TEST": s}, "Century", max_points=1000)
+    assert len(fig.data[0].y) == 1000
+    assert len(create_time_series_chart({"TEST": s}, "Full", max_points=None).data[0].y) == 25_000
+
+
+def test_fan_chart_downsamples_periods():
+    rng = np.random.default_rng(42)
+    trials = pd.DataFrame(100 * np.cumprod(1 + rng.normal(0, 0.01, (300, 5000)), axis=1))
+    fig = create_fan_chart(trials, "Long Fan", max_paths=10, max_points=500)
+    assert all(len(trace.x) <= 500 for trace in fig.data)
+    assert fig.data[0].x[-1] == 4999
+    assert len(fig.data[0].y) == len(fig.data[-1].y)
+
+
+def test_drawdown_chart_keeps_max_drawdown_when_downsampled():
+    s = _make_price_series(length=25_000)
+    drawdown = s / s.cummax() - 1
+    fig = create_drawdown_chart(s, "Long Drawdown", max_points=500)
+    assert len(fig.data[0].y) <= 500
+    assert min(fig.data[0].y) == drawdown.min()
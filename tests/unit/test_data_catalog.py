@@ -0,0 +1,209 @@
+"""Tests for the incrementally maintained data source catalog."""
+
+from __future__ import annotations
+
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from finbot.services.data_quality import check_data_freshness, data_catalog
+from finbot.services.data_quality.data_catalog import DataCatalog
+from finbot.services.data_quality.data_source_registry import DataSource
+from finbot.utils.pandas_utils.save_dataframe import save_dataframe
+from web.backend.main import app
+
+
+def _frame(end: str, periods: int = 3) -> pd.DataFrame:
+    index = pd.date_range(end=end, periods=periods, freq="D", name="Date")
+    return pd.DataFrame({"Close": range(periods)}, index=index, dtype=float)
+
+
+def _age(path: Path, seconds: float = 60.0) -> None:
+    """Backdate *path*'s mtime so the catalog trusts it (outside the racy window)."""
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> DataSource:
+    directory = tmp_path / "prices"
+    directory.mkdir()
+    return DataSource(
+        name="Prices", directory=directory, pattern="*.parquet", max_age_days=3, description="Test prices"
+    )
+
+
+def _catalog(source: DataSource, **kwargs) -> DataCatalog:
+    return DataCatalog([source], full_rescan_seconds=None, **kwargs)
+
+
+class TestDataCatalog:
+    """Tests for DataCatalog."""
+
+    def test_summarizes_matching_files(self, source: DataSource) -> None:
+        save_dataframe(_frame("2026-02-20"), source.directory / "SPY.parquet", smart_backup=False)
+        save_dataframe(_frame("2026-02-24"), source.directory / "QQQ.parquet", smart_backup=False)
+        (source.directory / "notes.txt").write_text("ignored")
+
+        status = _catalog(source).status(source)
+
+        sizes = [(source.directory / name).stat().st_size for name in ("SPY.parquet", "QQQ.parquet")]
+        assert status.file_count == 2
+        assert status.total_size_bytes == sum(sizes)
+        assert status.oldest_file <= status.newest_file
+        assert status.last_data_timestamp == datetime(2026, 2, 24)
+
+    def test_missing_directory_is_empty(self, tmp_path: Path) -> None:
+        missing = DataSource(
+            name="Missing", directory=tmp_path / "nope", pattern="*.parquet", max_age_days=1, description=""
+        )
+
+        status = _catalog(missing).status(missing)
+
+        assert status.file_count == 0
+        assert status.is_stale
+
+    def test_unchanged_directory_is_not_listed(self, source: DataSource) -> None:
+        save_dataframe(_frame("2026-02-24"), source.directory / "SPY.parquet", smart_backup=False)
+        _age(source.directory)
+        catalog = _catalog(source)
+        catalog.statuses()
+
+        catalog.statuses()
+        catalog.statuses()
+
+        stats = catalog.stats()
+        assert stats.directory_scans == 1
+        assert stats.skipped_scans == 2
+        assert stats.files_statted == 1
+
+    def test_only_new_and_replaced_files_are_statted(self, source: DataSource) -> None:
+        for name in ("A", "B", "C"):
+            save_dataframe(_frame("2026-02-20"), source.directory / f"{name}.parquet", smart_backup=False)
+        _age(source.directory)
+        catalog = _catalog(source)
+        catalog.statuses()
+
+        save_dataframe(_frame("2026-02-25"), source.directory / "B.parquet", smart_backup=False)
+        save_dataframe(_frame("2026-02-21"), source.directory / "D.parquet", smart_backup=False)
+        (source.directory / "A.parquet").unlink()
+        status = catalog.statuses()[0]
+
+        assert status.file_count == 3
+        assert status.last_data_timestamp == datetime(2026, 2, 25)
+        stats = catalog.stats()
+        assert stats.files_statted == 3 + 2
+        assert stats.footers_read == 3 + 2
+
+    def test_racy_directory_mtime_is_not_trusted(self, source: DataSource) -> None:
+        catalog = _catalog(source)
+        catalog.statuses()
+        before = os.stat(source.directory)
+
+        save_dataframe(_frame("2026-02-24"), source.directory / "SPY.parquet", smart_backup=False)
+        # A coarse filesystem clock can leave the directory mtime unchanged
+        os.utime(source.directory, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+        assert catalog.statuses()[0].file_count == 1
+
+    def test_in_place_rewrite_needs_a_rescan(self, source: DataSource) -> None:
+        path = source.directory / "SPY.parquet"
+        _frame("2026-02-20").to_parquet(path)
+        _age(path, 120)
+        _age(source.directory)
+        catalog = _catalog(source)
+        catalog.statuses()
+
+        _frame("2026-02-26").to_parquet(path)
+        assert catalog.statuses()[0].last_data_timestamp == datetime(2026, 2, 20)
+        assert catalog.statuses(rescan=True)[0].last_data_timestamp == datetime(2026, 2, 26)
+
+    def test_periodic_full_rescan(self, source: DataSource) -> None:
+        path = source.directory / "SPY.parquet"
+        _frame("2026-02-20").to_parquet(path)
+        _age(path, 120)
+        _age(source.directory)
+        now = [time.time()]
+        catalog = DataCatalog([source], full_rescan_seconds=3600, clock=lambda: now[0])
+        catalog.statuses()
+
+        _frame("2026-02-26").to_parquet(path)
+        now[0] += 3600
+
+        assert catalog.statuses()[0].last_data_timestamp == datetime(2026, 2, 26)
+
+    def test_index_is_persisted_between_runs(self, source: DataSource, tmp_path: Path) -> None:
+        save_dataframe(_frame("2026-02-24"), source.directory / "SPY.parquet", smart_backup=False)
+        _age(source.directory)
+        catalog_path = tmp_path / "catalog.json"
+        first = _catalog(source, path=catalog_path).statuses()[0]
+
+        warm = _catalog(source, path=catalog_path)
+        second = warm.statuses()[0]
+
+        assert second == first
+        assert warm.stats().files_statted == 0
+        assert warm.stats().skipped_scans == 1
+
+    def test_unreadable_persisted_index_is_ignored(self, source: DataSource, tmp_path: Path) -> None:
+        save_dataframe(_frame("2026-02-24"), source.directory / "SPY.parquet", smart_backup=False)
+        catalog_path = tmp_path / "catalog.json"
+        catalog_path.write_text("{not json")
+
+        assert _catalog(source, path=catalog_path).statuses()[0].file_count == 1
+
+    def test_changed_source_definition_discards_persisted_index(self, source: DataSource, tmp_path: Path) -> None:
+        save_dataframe(_frame("2026-02-24"), source.directory / "SPY.parquet", smart_backup=False)
+        _age(source.directory)
+        catalog_path = tmp_path / "catalog.json"
+        _catalog(source, path=catalog_path).statuses()
+
+        narrowed = DataSource(source.name, source.directory, "QQQ*.parquet", source.max_age_days, source.description)
+
+        assert _catalog(narrowed, path=catalog_path).statuses()[0].file_count == 0
+
+
+def test_save_dataframe_replaces_atomically(tmp_path: Path) -> None:
+    path = tmp_path / "SPY.parquet"
+    save_dataframe(_frame("2026-02-20"), path, smart_backup=False)
+    inode = path.stat().st_ino
+
+    save_dataframe(_frame("2026-02-24"), path, smart_backup=False)
+
+    assert path.stat().st_ino != inode
+    assert pd.read_parquet(path).index[-1] == pd.Timestamp("2026-02-24")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["SPY.parquet"]
+
+
+def test_save_dataframe_failure_keeps_original(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "SPY.parquet"
+    save_dataframe(_frame("2026-02-20"), path, smart_backup=False)
+
+    def fail(*_args, **_kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError, match="disk full"):
+        save_dataframe(_frame("2026-02-24"), path, smart_backup=False)
+
+    assert pd.read_parquet(path).index[-1] == pd.Timestamp("2026-02-20")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["SPY.parquet"]
+
+
+def test_freshness_checks_and_endpoint_use_the_catalog(source: DataSource, monkeypatch: pytest.MonkeyPatch) -> None:
+    save_dataframe(_frame("2026-02-24"), source.directory / "SPY.parquet", smart_backup=False)
+    catalog = _catalog(source)
+    monkeypatch.setattr(data_catalog, "_catalog", catalog)
+
+    statuses = check_data_freshness.check_all_freshness()
+    body = TestClient(app).get("/api/data-status/", params={"rescan": True}).json()
+
+    assert [s.source for s in statuses] == [source]
+    assert body["sources"][0]["name"] == "Prices"
+    assert body["sources"][0]["last_data_timestamp"] == "2026-02-24T00:00:00"
+    assert catalog.stats().refreshes == 2
@@ -0,0 +1,160 @@
+"""Tests for the process-wide parquet DataFrame cache."""
+
+from __future__ import annotations
+
+import datetime
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from finbot.utils.data_collection_utils.yfinance import _yfinance_utils
+from finbot.utils.pandas_utils.dataframe_cache import DataFrameCache, price_history_cache
+from web.backend.main import app
+
+
+def _history(n_obs: int = 500, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    # Parquet does not keep the index frequency
+    index = pd.DatetimeIndex(pd.bdate_range("2015-01-01", periods=n_obs).to_numpy(), name="Date")
+    close = 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, n_obs))
+    return pd.DataFrame({"Close": close, "Volume": rng.integers(0, 10**6, n_obs)}, index=index)
+
+
+def _write(path: Path, frame: pd.DataFrame) -> Path:
+    frame.to_parquet(path)
+    return path
+
+
+class TestDataFrameCache:
+    """Test hits, invalidation, eviction and read-only views."""
+
+    def test_second_read_is_hit(self, tmp_path: Path):
+        path = _write(tmp_path / "a.parquet", _history())
+        cache = DataFrameCache(max_bytes=10**8)
+
+        first = cache.get(path)
+        second = cache.get(path)
+
+        pd.testing.assert_frame_equal(first, _history())
+        assert np.shares_memory(first["Close"].to_numpy(), second["Close"].to_numpy())
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_views_are_read_only(self, tmp_path: Path):
+        cache = DataFrameCache(max_bytes=10**8)
+        path = _write(tmp_path / "a.parquet", _history())
+
+        view = cache.get(path)
+        view["Return"] = view["Close"].pct_change()
+        view["Close"] = view["Close"] * 2.0
+
+        other = cache.get(path)
+        with pytest.raises(ValueError, match="read-only"):
+            other.iloc[0, 0] = 0.0
+        pd.testing.assert_frame_equal(cache.get(path), _history())
+
+    def test_rewritten_file_is_reloaded(self, tmp_path: Path):
+        cache = DataFrameCache(max_bytes=10**8)
+        path = _write(tmp_path / "a.parquet", _history(seed=0))
+        cache.get(path)
+
+        _write(path, _history(n_obs=600, seed=1))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        pd.testing.assert_frame_equal(cache.get(path), _history(n_obs=600, seed=1))
+        stats = cache.stats()
+        assert (stats.misses, stats.entries) == (2, 1)
+        assert stats.size_bytes == _history(n_obs=600).memory_usage(deep=True).sum()
+
+    def test_evicts_least_recently_used_within_byte_budget(self, tmp_path: Path):
+        paths = [_write(tmp_path / f"{name}.parquet", _history()) for name in "abc"]
+        frame_bytes = int(_history().memory_usage(deep=True).sum())
+        cache = DataFrameCache(max_bytes=2 * frame_bytes)
+
+        cache.get(paths[0])
+        cache.get(paths[1])
+        cache.get(paths[0])
+        cache.get(paths[2])
+
+        stats = cache.stats()
+        assert (stats.entries, stats.evictions, stats.size_bytes) == (2, 1, 2 * frame_bytes)
+        cache.get(paths[0])
+        assert cache.stats().hits == 2
+
+    def test_oversized_frame_is_not_cached(self, tmp_path: Path):
+        cache = DataFrameCache(max_bytes=100)
+        path = _write(tmp_path / "a.parquet", _history())
+
+        pd.testing.assert_frame_equal(cache.get(path), _history())
+        assert len(cache) == 0
+
+    def test_get_many_loads_only_misses(self, tmp_path: Path):
+        paths = [_write(tmp_path / f"{seed}.parquet", _history(seed=seed)) for seed in range(3)]
+        cache = DataFrameCache(max_bytes=10**8)
+        cache.get(paths[1])
+
+        frames = cache.get_many(paths)
+
+        for seed, frame in enumerate(frames):
+            pd.testing.assert_frame_equal(frame, _history(seed=seed))
+        assert (cache.stats().hits, cache.stats().misses) == (1, 3)
+
+    def test_missing_file_raises(self, tmp_path: Path):
+        with pytest.raises(FileNotFoundError):
+            DataFrameCache(max_bytes=10**8).get(tmp_path / "missing.parquet")
+
+    def test_rejects_non_positive_budget(self):
+        with pytest.raises(ValueError, match="max_bytes"):
+            DataFrameCache(max_bytes=0)
+
+
+class TestPriceHistoryCache:
+    """Test that get_history reads stored histories through the shared cache."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        (tmp_path / "history").mkdir()
+        _write(tmp_path / "history" / "SPY_history_1d.parquet", _history(seed=0))
+        _write(tmp_path / "history" / "QQQ_history_1d.parquet", _history(seed=1))
+        monkeypatch.setattr(_yfinance_utils, "YFINANCE_DATA_DIR", tmp_path)
+        price_history_cache.clear()
+        yield tmp_path
+        price_history_cache.clear()
+
+    def test_single_symbol_is_filtered_view(self, data_dir: Path):
+        start, end = datetime.date(2016, 1, 1), datetime.date(2016, 6, 30)
+
+        first = _yfinance_utils.get_yfinance_base("spy", start_date=start, end_date=end)
+        second = _yfinance_utils.get_yfinance_base("SPY")
+
+        expected = _history(seed=0)
+        pd.testing.assert_frame_equal(first, expected.loc[pd.Timestamp(start) : pd.Timestamp(end)])
+        pd.testing.assert_frame_equal(second, expected)
+        assert np.shares_memory(first["Close"].to_numpy(), second["Close"].to_numpy())
+        assert (price_history_cache.stats().hits, price_history_cache.stats().misses) == (1, 1)
+
+    def test_multiple_symbols_use_cache(self, data_dir: Path):
+        _yfinance_utils.get_yfinance_base("SPY")
+
+        merged = _yfinance_utils.get_yfinance_base(["QQQ", "SPY"])
+
+        assert list(merged.columns.get_level_values(0).unique()) == ["QQQ", "SPY"]
+        pd.testing.assert_frame_equal(merged["SPY"], _history(seed=0))
+        assert (price_history_cache.stats().hits, price_history_cache.stats().misses) == (1, 2)
+
+    def test_health_reports_cache_metrics(self, data_dir: Path):
+        _yfinance_utils.get_yfinance_base("SPY")
+        _yfinance_utils.get_yfinance_base("SPY")
+
+        body = TestClient(app).get("/api/health").json()
+
+        assert body["status"] == "ok"
+        assert body["price_history_cache"]["hits"] == 1
+        assert body["price_history_cache"]["misses"] == 1
+        assert body["price_history_cache"]["hit_rate"] == 0.5
@@ -0,0 +1,130 @@
+"""Tests for LTTB and min/max downsampling."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from finbot.utils.data_science_utils.data_transformation.downsampling import (
+    DownsampleMethod,
+    downsample_frame,
+    downsample_series,
+    lttb_indices,
+    minmax_indices,
+)
+
+
+def _prices(n_obs: int = 5000, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("1990-01-01", periods=n_obs)
+    return pd.Series(100.0 * np.cumprod(1.0 + rng.normal(0.0003, 0.012, n_obs)), index=index, name="Close")
+
+
+def _reference_lttb(x: np.ndarray, y: np.ndarray, max_points: int) -> list[int]:
+    """Straightforward loop version of LTTB."""
+    n_obs = len(y)
+    edges = np.linspace(1, n_obs - 1, max_points - 1).astype(int)
+    kept, anchor = [0], 0
+    for bucket in range(max_points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_x, next_y = x[stop : edges[bucket + 2]].mean(), y[stop : edges[bucket + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        areas = [
+            abs((x[anchor] - next_x) * (y[i] - y[anchor]) - (x[anchor] - x[i]) * (next_y - y[anchor]))
+            for i in range(start, stop)
+        ]
+        anchor = start + int(np.argmax(areas))
+        kept.append(anchor)
+    return [*kept, n_obs - 1]
+
+
+class TestLttb:
+    """Test largest-triangle-three-buckets selection."""
+
+    def test_matches_reference(self):
+        series = _prices(3000)
+        x = np.arange(len(series), dtype=float)
+
+        result = lttb_indices(x, series.to_numpy(), 250)
+
+        assert result.tolist() == _reference_lttb(x, series.to_numpy(), 250)
+
+    def test_keeps_ends_and_order(self):
+        series = _prices()
+
+        result = downsample_series(series, 500)
+
+        assert len(result) == 500
+        assert result.index[0] == series.index[0]
+        assert result.index[-1] == series.index[-1]
+        assert result.index.is_monotonic_increasing
+
+    def test_keeps_isolated_spike(self):
+        series = pd.Series(np.zeros(10_000))
+        series.iloc[4321] = 50.0
+
+        assert 4321 in downsample_series(series, 100).index
+
+    def test_short_input_is_unchanged(self):
+        series = _prices(100)
+
+        assert downsample_series(series, 100) is series
+
+    def test_nan_points_only_kept_for_all_nan_buckets(self):
+        series = _prices()
+        series.iloc[1000:1500] = np.nan
+
+        result = downsample_series(series, 200)
+
+        assert len(result) == 200
+        assert result.iloc[:30].notna().all()
+        assert result.isna().any()
+
+    def test_rejects_mismatched_lengths(self):
+        with pytest.raises(ValueError, match="same length"):
+            lttb_indices(np.arange(10.0), np.arange(9.0), 5)
+
+
+class TestMinMax:
+    """Test min/max per bucket selection."""
+
+    def test_keeps_global_extremes(self):
+        series = _prices(20_000)
+        drawdown = series / series.cummax() - 1.0
+
+        result = downsample_series(drawdown, 300, DownsampleMethod.MINMAX)
+
+        assert len(result) <= 300
+        assert result.min() == drawdown.min()
+        assert result.idxmin() == drawdown.idxmin()
+        assert downsample_series(series, 300, "minmax").max() == series.max()
+
+    def test_ignores_nan_unless_bucket_is_all_nan(self):
+        values = np.arange(100.0)
+        values[10:20] = np.nan
+
+        result = minmax_indices(values, 10)
+
+        assert result[0] == 0
+        assert result[-1] == 99
+        assert np.isnan(values[result]).sum() == 0
+
+    @pytest.mark.parametrize("max_points", [0, 3])
+    def test_rejects_too_few_points(self, max_points: int):
+        with pytest.raises(ValueError, match="max_points"):
+            minmax_indices(np.arange(10.0), max_points)
+
+
+def test_downsample_frame_keeps_shape_of_every_column():
+    frame = pd.DataFrame({"A": _prices(seed=1), "B": _prices(seed=2), "Label": "x"})
+
+    result = downsample_frame(frame, 400, DownsampleMethod.MINMAX)
+
+    assert len(result) <= 400
+    assert list(result.columns) == ["A", "B", "Label"]
+    for column in ["A", "B"]:
+        assert result[column].max() == frame[column].max()
+        assert result[column].min() == frame[column].min()
@@ -6,7 +6,7 @@ import numpy as np
 import pytest
 
 from finbot.core.contracts.portfolio_analytics import DrawdownAnalysisResult, DrawdownPeriod
-from finbot.services.portfolio_analytics.drawdown import compute_drawdown_analysis
+from finbot.services.portfolio_analytics.drawdown import compute_drawdown_analysis, compute_drawdown_analysis_batch
 
 RNG = np.random.default_rng(seed=42)
 # Series with some positive and negative returns to produce drawdowns
@@ -24,6 +24,30 @@ DECLINING = np.concatenate(
 )
 
 
+def _state_machine_periods(returns: np.ndarray) -> list[tuple]:
+    """Reference per-bar scan (the previous implementation) as (start, trough, end, depth) tuples."""
+    wealth = np.cumprod(1.0 + returns)
+    peak = np.maximum.accumulate(wealth)
+    uw = (wealth - peak) / peak
+    periods: list[tuple] = []
+    in_drawdown, peak_idx, trough_idx = False, 0, 0
+    for i in range(len(uw)):
+        if not in_drawdown:
+            if uw[i] < -1e-14:
+                in_drawdown, trough_idx = True, i
+            else:
+                peak_idx = i
+        else:
+            if uw[i] < uw[trough_idx]:
+                trough_idx = i
+            if uw[i] >= -1e-14:
+                periods.append((peak_idx, trough_idx, i, float(-uw[trough_idx])))
+                in_drawdown, peak_idx = False, i
+    if in_drawdown:
+        periods.append((peak_idx, trough_idx, None, float(-uw[trough_idx])))
+    return periods
+
+
 class TestComputeDrawdownAnalysis:
     """Tests for compute_drawdown_analysis function."""
 
@@ -116,3 +140,64 @@ class TestComputeDrawdownAnalysis:
         for p in result.periods:
             assert isinstance(p, DrawdownPeriod)
             assert p.depth >= 0
+
+    def test_matches_state_machine_scan(self) -> None:
+        """Vectorized episodes and aggregates match the per-bar scan, including ties."""
+        rng = np.random.default_rng(7)
+        # Rounded returns include zeros, so troughs repeat within an episode
+        returns = np.round(rng.normal(0.001, 0.01, 3000), 2)
+        returns[-40:] = -0.002  # end in an open drawdown
+
+        expected = _state_machine_periods(returns)
+        result = compute_drawdown_analysis(returns, top_n=len(expected))
+
+        assert len(expected) > 50
+        ranked = sorted(expected, key=lambda p: p[3], reverse=True)
+        assert [(p.start_idx, p.trough_idx, p.end_idx, p.depth) for p in result.periods] == ranked
+        assert result.avg_depth == pytest.approx(np.mean([p[3] for p in expected]), rel=1e-12)
+        assert result.avg_duration_bars == pytest.approx(np.mean([p[1] - p[0] for p in expected]))
+        recoveries = [p[2] - p[1] for p in expected if p[2] is not None]
+        assert result.avg_recovery_bars == pytest.approx(np.mean(recoveries))
+
+    def test_nan_tail_keeps_drawdown_open(self) -> None:
+        """Bars after a NaN return keep the drawdown state, as the scan did."""
+        returns = np.concatenate([DECLINING[:60], [np.nan], np.full(10, 0.05)])
+
+        result = compute_drawdown_analysis(returns)
+
+        assert [(p.start_idx, p.trough_idx, p.end_idx) for p in result.periods] == [
+            p[:3] for p in _state_machine_periods(returns)
+        ]
+
+    def test_underwater_curve_is_read_only_array(self) -> None:
+        """The underwater curve is returned as a read-only float64 array."""
+        result = compute_drawdown_analysis(MIXED_RETURNS)
+
+        assert isinstance(result.underwater_curve, np.ndarray)
+        assert result.underwater_curve.dtype == np.float64
+        with pytest.raises(ValueError, match="read-only"):
+            result.underwater_curve[0] = 1.0
+
+
+class TestComputeDrawdownAnalysisBatch:
+    """Tests for compute_drawdown_analysis_batch."""
+
+    def test_matches_per_series_analysis(self) -> None:
+        """Each column gives the same result as the 1-D function."""
+        rng = np.random.default_rng(11)
+        returns = rng.normal(0.0003, [0.005, 0.01, 0.02, 0.0], (750, 4))
+        returns[:, 3] = 0.001  # no drawdowns at all
+
+        results = compute_drawdown_analysis_batch(returns, top_n=3)
+
+        assert len(results) == 4
+        for column, result in enumerate(results):
+            single = compute_drawdown_analysis(returns[:, column], top_n=3)
+            assert result == single
+            np.testing.assert_array_equal(result.underwater_curve, single.underwater_curve)
+        assert results[3].periods == ()
+
+    def test_rejects_1d_input(self) -> None:
+        """Batch input must be (n_obs, n_series)."""
+        with pytest.raises(ValueError, match="2-D"):
+            compute_drawdown_analysis_batch(MIXED_RETURNS)
@@ -0,0 +1,165 @@
+"""Tests for the critical-line efficient frontier."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.optimize import minimize
+
+from finbot.services.optimization.efficient_frontier import _critical_line, compute_efficient_frontier
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+
+def _price_histories(n_assets: int, seed: int, n_obs: int = 500) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0.0004, 0.01, (n_obs, 1))
+    drift = rng.uniform(-0.0003, 0.0008, n_assets)
+    returns = market * rng.uniform(0.2, 1.5, n_assets) + rng.normal(drift, 0.01, (n_obs, n_assets))
+    index = pd.bdate_range("2020-01-01", periods=n_obs)
+    return {
+        f"A{asset}": pd.DataFrame({"Close": 100.0 * np.cumprod(1.0 + returns[:, asset])}, index=index)
+        for asset in range(n_assets)
+    }
+
+
+def _moments(histories: dict[str, pd.DataFrame]) -> tuple[np.ndarray, np.ndarray]:
+    returns = pd.concat([df["Close"].rename(name) for name, df in histories.items()], axis=1).pct_change().dropna()
+    return returns.mean().to_numpy() * 252.0, returns.cov().to_numpy() * 252.0
+
+
+def _slsqp(objective, n_assets: int, max_weight: float, target_return: float | None = None, mean=None) -> np.ndarray:
+    """Reference long-only solution from a general-purpose solver."""
+    constraints = [{"type": "eq", "fun": lambda w: w.sum() - 1.0}]
+    if target_return is not None:
+        constraints.append({"type": "eq", "fun": lambda w: w @ mean - target_return})
+    solution = minimize(
+        objective,
+        np.full(n_assets, 1.0 / n_assets),
+        bounds=[(0.0, max_weight)] * n_assets,
+        constraints=constraints,
+        method="SLSQP",
+        options={"ftol": 1e-15, "maxiter": 1000},
+    )
+    return solution.x
+
+
+# ── compute_efficient_frontier ────────────────────────────────────────────────
+
+
+class TestComputeEfficientFrontier:
+    """Test the exact long-only frontier."""
+
+    @pytest.mark.parametrize(("n_assets", "max_weight", "seed"), [(3, 1.0, 0), (8, 0.3, 2), (12, 0.15, 3)])
+    def test_matches_general_solver(self, n_assets: int, max_weight: float, seed: int):
+        """Frontier, max-Sharpe and min-variance portfolios match SLSQP optima."""
+        histories = _price_histories(n_assets, seed)
+        mean, cov = _moments(histories)
+
+        result = compute_efficient_frontier(histories, n_points=9, risk_free_rate=0.02, max_weight=max_weight)
+
+        for portfolio in result.frontier:
+            reference = _slsqp(lambda w: w @ cov @ w, n_assets, max_weight, portfolio.expected_return, mean)
+            assert portfolio.volatility == pytest.approx(np.sqrt(reference @ cov @ reference), rel=1e-6)
+
+        sharpe = _slsqp(lambda w: -(w @ mean - 0.02) / np.sqrt(w @ cov @ w), n_assets, max_weight)
+        assert result.max_sharpe.sharpe_ratio == pytest.approx((sharpe @ mean - 0.02) / np.sqrt(sharpe @ cov @ sharpe))
+        min_variance = _slsqp(lambda w: w @ cov @ w, n_assets, max_weight)
+        np.testing.assert_allclose(result.min_volatility.weights, min_variance, atol=1e-6)
+
+    def test_weights_are_feasible_arrays(self):
+        """Every portfolio is fully invested, within bounds and read-only."""
+        result = compute_efficient_frontier(_price_histories(6, 1), n_points=20, max_weight=0.4)
+
+        weights = np.array([portfolio.weights for portfolio in result.frontier + result.turning_points])
+        np.testing.assert_allclose(weights.sum(axis=1), 1.0)
+        assert weights.min() >= 0.0
+        assert weights.max() <= 0.4
+        assert not result.frontier[0].weights.flags.writeable
+        assert result.weight_map(result.max_sharpe).keys() == set(result.tickers)
+
+    def test_frontier_spans_min_variance_to_max_return(self):
+        """Target returns are evenly spaced from min variance to max return."""
+        histories = _price_histories(5, 4)
+        mean, _ = _moments(histories)
+
+        result = compute_efficient_frontier(histories, n_points=11)
+
+        returns = np.array([portfolio.expected_return for portfolio in result.frontier])
+        np.testing.assert_allclose(np.diff(returns), np.diff(returns)[0])
+        assert returns[0] == pytest.approx(result.min_volatility.expected_return)
+        assert returns[-1] == pytest.approx(mean.max())
+        assert np.all(np.diff([portfolio.volatility for portfolio in result.frontier]) >= -1e-12)
+
+    def test_no_random_portfolio_beats_frontier(self):
+        """Random long-only portfolios never lie above the frontier."""
+        histories = _price_histories(10, 5)
+        mean, cov = _moments(histories)
+        result = compute_efficient_frontier(histories, n_points=200)
+
+        samples = np.random.default_rng(0).dirichlet(np.ones(10), size=2000)
+        sample_returns = samples @ mean
+        sample_vols = np.sqrt(np.einsum("ij,jk,ik->i", samples, cov, samples))
+        frontier_returns = [portfolio.expected_return for portfolio in result.frontier]
+        frontier_vols = [portfolio.volatility for portfolio in result.frontier]
+        in_range = sample_returns >= frontier_returns[0]
+
+        # Frontier volatility is convex in return, so interpolation over-estimates it
+        assert np.all(
+            sample_vols[in_range] >= np.interp(sample_returns[in_range], frontier_returns, frontier_vols) - 1e-3
+        )
+        assert np.all(sample_vols >= result.min_volatility.volatility - 1e-12)
+        assert np.max((sample_returns - 0.04) / sample_vols) <= result.max_sharpe.sharpe_ratio
+
+    def test_equal_weight_cap_fixes_portfolio(self):
+        """max_weight = 1/n leaves the equal-weight portfolio as the only one."""
+        result = compute_efficient_frontier(_price_histories(4, 6), n_points=5, max_weight=0.25)
+
+        for portfolio in result.frontier:
+            np.testing.assert_allclose(portfolio.weights, 0.25)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"n_points": 1}, "n_points"),
+            ({"max_weight": 0.2}, "max_weight"),
+            ({"max_weight": 1.5}, "max_weight"),
+        ],
+    )
+    def test_rejects_invalid_arguments(self, kwargs: dict, match: str):
+        """Invalid point counts and infeasible weight caps raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            compute_efficient_frontier(_price_histories(3, 0), **kwargs)
+
+    def test_requires_two_assets(self):
+        """A single asset has no frontier."""
+        with pytest.raises(ValueError, match="At least two assets"):
+            compute_efficient_frontier(_price_histories(1, 0))
+
+
+class TestCriticalLine:
+    """Test the turning-point solver on hand-built inputs."""
+
+    def test_tied_means_reach_min_variance(self):
+        """Assets with equal means are freed at once instead of staying at zero."""
+        cov = np.diag([0.04, 0.09, 0.01])
+
+        corners = _critical_line(np.full(3, 0.1), cov, np.ones(3))
+
+        inverse_variance = 1.0 / np.diag(cov)
+        np.testing.assert_allclose(corners[-1], inverse_variance / inverse_variance.sum())
+
+    def test_turning_points_satisfy_bounds(self):
+        """Corners step from the max-return to the min-variance portfolio within bounds."""
+        mean = np.array([0.1, 0.1, 0.05, 0.05])
+        cov = np.array([[0.04, 0.01, 0, 0], [0.01, 0.09, 0, 0], [0, 0, 0.01, 0.002], [0, 0, 0.002, 0.02]])
+
+        corners = _critical_line(mean, cov, np.full(4, 0.4))
+
+        np.testing.assert_allclose(corners[0], [0.4, 0.4, 0.2, 0.0])
+        np.testing.assert_allclose(corners.sum(axis=1), 1.0)
+        assert corners.max() <= 0.4
+        assert np.all(np.diff(corners @ mean) <= 1e-15)
+        reference = _slsqp(lambda w: w @ cov @ w, 4, 0.4)
+        np.testing.assert_allclose(corners[-1], reference, atol=1e-6)
@@ -0,0 +1,196 @@
+"""Parity tests for ExecutionSimulator numeric modes (Decimal vs float vs fixed point)."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from finbot.core.contracts.models import OrderSide, OrderType
+from finbot.core.contracts.orders import Order, OrderStatus
+from finbot.core.contracts.risk import DrawdownLimitRule, ExposureLimitRule, PositionLimitRule, RiskConfig
+from finbot.services.execution.checkpoint_manager import CheckpointManager
+from finbot.services.execution.execution_simulator import ExecutionSimulator
+from finbot.services.execution.ledger import AccountLedger, NumericMode
+
+SYMBOLS = ["SPY", "QQQ", "IWM", "TLT", "GLD"]
+
+
+def _run_scenario(
+    numeric_mode: NumericMode,
+    slippage_bps: Decimal = Decimal("5"),
+    n_steps: int = 300,
+) -> ExecutionSimulator:
+    """Replay a seeded random order/price stream through a simulator."""
+    rng = random.Random(7)
+    simulator = ExecutionSimulator(
+        initial_cash=Decimal("1000000"),
+        slippage_bps=slippage_bps,
+        commission_per_share=Decimal("0.005"),
+        risk_config=RiskConfig(
+            position_limit=PositionLimitRule(max_shares=Decimal("2000"), max_value=Decimal("400000")),
+            exposure_limit=ExposureLimitRule(max_gross_exposure_pct=Decimal("95")),
+            drawdown_limit=DrawdownLimitRule(max_total_drawdown_pct=Decimal("30")),
+        ),
+        simulator_id=f"parity-{numeric_mode}",
+        numeric_mode=numeric_mode,
+    )
+    prices = {symbol: Decimal(rng.randint(5000, 50000)) / 100 for symbol in SYMBOLS}
+    timestamp = datetime(2024, 1, 15, 9, 30)
+
+    for step in range(n_steps):
+        timestamp += timedelta(minutes=1)
+        for symbol in SYMBOLS:
+            prices[symbol] = max(Decimal("1"), prices[symbol] + Decimal(rng.randint(-150, 150)) / 100)
+
+        symbol = rng.choice(SYMBOLS)
+        side = OrderSide.BUY if rng.random() < 0.6 else OrderSide.SELL
+        is_limit = rng.random() < 0.3
+        offset = Decimal(rng.randint(-100, 100)) / 100
+        simulator.submit_order(
+            Order(
+                order_id=f"ord-{step:05d}",
+                symbol=symbol,
+                side=side,
+                order_type=OrderType.LIMIT if is_limit else OrderType.MARKET,
+                quantity=Decimal(rng.randint(1, 200)),
+                limit_price=prices[symbol] + offset if is_limit else None,
+                created_at=timestamp,
+            ),
+            timestamp,
+        )
+        simulator.process_market_data_batch(dict(prices), timestamp)
+
+    return simulator
+
+
+def _statuses(simulator: ExecutionSimulator) -> dict[str, OrderStatus]:
+    orders = {**simulator.completed_orders, **dict(simulator.pending_orders)}
+    return {order_id: order.status for order_id, order in orders.items()}
+
+
+@pytest.fixture(scope="module")
+def reference() -> ExecutionSimulator:
+    """Decimal-mode run of the parity scenario."""
+    return _run_scenario(NumericMode.DECIMAL)
+
+
+class TestNumericModeParity:
+    """Fast numeric modes reproduce the Decimal reference path."""
+
+    def test_scenario_exercises_fills_and_rejections(self, reference: ExecutionSimulator):
+        """The scenario is non-trivial: it fills, rejects and leaves orders pending."""
+        statuses = set(_statuses(reference).values())
+        assert {OrderStatus.FILLED, OrderStatus.REJECTED} <= statuses
+        assert reference.pending_orders
+
+    def test_fixed_point_is_exact_for_cent_prices(self, reference: ExecutionSimulator):
+        """Cent prices with 5 bps slippage fit in micro-units, so fixed point is exact."""
+        fast = _run_scenario(NumericMode.FIXED_POINT)
+
+        assert _statuses(fast) == _statuses(reference)
+        assert fast.cash == reference.cash
+        assert dict(fast.positions) == dict(reference.positions)
+        assert fast.get_account_value() == reference.get_account_value()
+        for order_id, order in reference.completed_orders.items():
+            assert fast.completed_orders[order_id].avg_fill_price == order.avg_fill_price
+
+    def test_float_matches_within_tolerance(self, reference: ExecutionSimulator):
+        """Float mode matches the Decimal path to float64 precision."""
+        fast = _run_scenario(NumericMode.FLOAT)
+
+        assert _statuses(fast) == _statuses(reference)
+        assert float(fast.cash) == pytest.approx(float(reference.cash), rel=1e-12)
+        assert dict(fast.positions) == dict(reference.positions)
+        assert float(fast.get_account_value()) == pytest.approx(float(reference.get_account_value()), rel=1e-12)
+        for order_id, order in reference.completed_orders.items():
+            fast_price = float(fast.completed_orders[order_id].avg_fill_price)
+            assert fast_price == pytest.approx(float(order.avg_fill_price), rel=1e-12)
+
+    def test_fixed_point_rounds_to_micro_units(self):
+        """Sub-micro slippage is rounded per fill, staying within a micro-unit per share."""
+        reference = _run_scenario(NumericMode.DECIMAL, slippage_bps=Decimal("3.7"), n_steps=100)
+        fast = _run_scenario(NumericMode.FIXED_POINT, slippage_bps=Decimal("3.7"), n_steps=100)
+
+        assert _statuses(fast) == _statuses(reference)
+        traded_shares = sum(order.filled_quantity for order in reference.completed_orders.values())
+        assert abs(fast.cash - reference.cash) <= traded_shares * Decimal("0.000001")
+
+    @pytest.mark.parametrize("numeric_mode", [NumericMode.FLOAT, NumericMode.FIXED_POINT])
+    def test_risk_state_tracks_reference(self, reference: ExecutionSimulator, numeric_mode: NumericMode):
+        """Peak equity seen by the risk checker matches the Decimal path."""
+        fast = _run_scenario(numeric_mode)
+
+        assert float(fast.risk_checker.peak_value) == pytest.approx(float(reference.risk_checker.peak_value))
+
+
+class TestAccountLedger:
+    """Test AccountLedger incremental accounting."""
+
+    @pytest.mark.parametrize("numeric_mode", list(NumericMode))
+    def test_incremental_value_matches_full_resum(self, numeric_mode: NumericMode):
+        """Running position value equals a full re-sum after fills and price moves."""
+        ledger = AccountLedger(Decimal("10000"), numeric_mode)
+        to_native = ledger.to_native
+
+        ledger.apply_fill("SPY", to_native(Decimal("10")), to_native(Decimal("-4500")))
+        ledger.set_mark("SPY", to_native(Decimal("451.25")))
+        ledger.set_mark("QQQ", to_native(Decimal("380.10")))
+        ledger.apply_fill("QQQ", to_native(Decimal("5")), to_native(Decimal("-1900.5")))
+        ledger.set_mark("SPY", to_native(Decimal("449.99")))
+        ledger.apply_fill("SPY", to_native(Decimal("-4")), to_native(Decimal("1799.96")))
+
+        resummed = ledger.account_value(dict(ledger.marks_native))
+        expected = (
+            Decimal("10000")
+            - Decimal("4500")
+            - Decimal("1900.5")
+            + Decimal("1799.96")
+            + Decimal("6") * Decimal("449.99")
+            + Decimal("5") * Decimal("380.10")
+        )
+
+        if numeric_mode == NumericMode.FLOAT:
+            assert ledger.account_value() == pytest.approx(resummed, rel=1e-12)
+            assert float(ledger.to_decimal(resummed)) == pytest.approx(float(expected), rel=1e-12)
+        else:
+            assert ledger.account_value() == resummed
+            assert ledger.to_decimal(resummed) == expected
+
+    def test_fast_mode_positions_are_read_only(self):
+        """Fast modes expose positions as a read-only Decimal snapshot."""
+        simulator = ExecutionSimulator(initial_cash=Decimal("100000"), numeric_mode=NumericMode.FLOAT)
+        simulator.positions = {"SPY": Decimal("10")}
+
+        assert simulator.positions == {"SPY": Decimal("10.0")}
+        with pytest.raises(TypeError):
+            simulator.positions["SPY"] = Decimal("20")  # type: ignore[index]
+
+    def test_fixed_point_conversion_round_trips(self):
+        """Micro-unit values convert back to the same Decimal."""
+        ledger = AccountLedger(Decimal("0"), NumericMode.FIXED_POINT)
+
+        assert ledger.to_native(Decimal("123.456789")) == 123_456_789
+        assert ledger.to_decimal(123_456_789) == Decimal("123.456789")
+        assert ledger.mul(ledger.to_native(Decimal("3")), ledger.to_native(Decimal("0.3333335"))) == 1_000_002
+
+
+class TestNumericModeCheckpoint:
+    """Checkpoints store Decimal state and restore the numeric mode."""
+
+    def test_fixed_point_checkpoint_round_trip(self, tmp_path):
+        """Fixed-point simulator survives a save/load/restore cycle."""
+        simulator = _run_scenario(NumericMode.FIXED_POINT, n_steps=50)
+        manager = CheckpointManager(tmp_path)
+
+        checkpoint = manager.create_checkpoint(simulator)
+        manager.save_checkpoint(checkpoint)
+        restored = manager.restore_simulator(manager.load_checkpoint(simulator.simulator_id))
+
+        assert isinstance(checkpoint.peak_value, Decimal)
+        assert restored.numeric_mode == NumericMode.FIXED_POINT
+        assert restored.cash == simulator.cash
+        assert dict(restored.positions) == dict(simulator.positions)
+        assert restored.risk_checker.peak_value == pytest.approx(simulator.risk_checker.peak_value)
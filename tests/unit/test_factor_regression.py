@@ -7,9 +7,12 @@ import pandas as pd
 import pytest
 
 from finbot.core.contracts.factor_analytics import FactorModelType, FactorRegressionResult
+from finbot.services.factor_analytics.factor_attribution import compute_factor_attribution
 from finbot.services.factor_analytics.factor_regression import (
     compute_factor_regression,
     compute_rolling_r_squared,
+    factor_regression_batch,
+    rolling_factor_regression,
 )
 
 
@@ -18,6 +21,25 @@ def rng() -> np.random.Generator:
     return np.random.default_rng(42)
 
 
+@pytest.fixture()
+def fund_panel(rng: np.random.Generator) -> tuple[np.ndarray, pd.DataFrame]:
+    """Twelve funds with distinct loadings on three factors."""
+    n = 300
+    factors = pd.DataFrame(rng.normal(0.0003, 0.01, (n, 3)), columns=["Mkt-RF", "SMB", "HML"])
+    betas = rng.normal(1.0, 0.4, (3, 12))
+    funds = 0.0002 + factors.to_numpy() @ betas + rng.normal(0, 0.003, (n, 12))
+    return funds, factors
+
+
+def _lstsq_fit(returns: np.ndarray, factors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Reference coefficients and standard errors from lstsq + pinv."""
+    x_mat = np.column_stack([np.ones(len(factors)), factors])
+    coeffs = np.linalg.lstsq(x_mat, returns, rcond=None)[0]
+    dof = len(returns) - x_mat.shape[1]
+    residual_std = np.sqrt(np.sum((returns - x_mat @ coeffs) ** 2) / dof)
+    return coeffs, residual_std * np.sqrt(np.diag(np.linalg.pinv(x_mat.T @ x_mat)))
+
+
 @pytest.fixture()
 def synthetic_data(rng: np.random.Generator) -> tuple[np.ndarray, pd.DataFrame]:
     """Generate synthetic portfolio returns driven by known factor loadings.
@@ -267,3 +289,88 @@ class TestComputeRollingRSquared:
         portfolio, factors = synthetic_data
         with pytest.raises(ValueError, match="annualization_factor must be >= 1"):
             compute_rolling_r_squared(portfolio, factors, annualization_factor=0)
+
+
+class TestFactorRegressionBatch:
+    """Tests for factor_regression_batch."""
+
+    def test_matches_single_regressions(self, fund_panel: tuple[np.ndarray, pd.DataFrame]) -> None:
+        """Each column reproduces compute_factor_regression."""
+        funds, factors = fund_panel
+        batch = factor_regression_batch(funds, factors)
+
+        assert batch.loadings.shape == (12, 3)
+        for column in range(funds.shape[1]):
+            single = compute_factor_regression(funds[:, column], factors)
+            result = batch.to_result(column)
+            assert result.alpha == pytest.approx(single.alpha, rel=1e-10)
+            assert result.r_squared == pytest.approx(single.r_squared, rel=1e-12)
+            for name in ("alpha", *factors.columns):
+                assert result.t_stats[name] == pytest.approx(single.t_stats[name], rel=1e-10)
+                assert result.p_values[name] == pytest.approx(single.p_values[name], rel=1e-8, abs=1e-300)
+
+    def test_standard_errors_match_reference(self, fund_panel: tuple[np.ndarray, pd.DataFrame]) -> None:
+        """Standard errors from the shared SVD equal the pinv(X'X) formula."""
+        funds, factors = fund_panel
+        batch = factor_regression_batch(funds, factors)
+
+        coeffs, standard_errors = _lstsq_fit(funds[:, 4], factors.to_numpy())
+        np.testing.assert_allclose(batch.loadings[4], coeffs[1:], rtol=1e-10)
+        np.testing.assert_allclose(batch.alpha[4], coeffs[0] * 252, rtol=1e-10)
+        np.testing.assert_allclose(batch.standard_errors[4], standard_errors, rtol=1e-10)
+
+    def test_result_feeds_attribution(self, fund_panel: tuple[np.ndarray, pd.DataFrame]) -> None:
+        """to_result output is accepted by compute_factor_attribution."""
+        funds, factors = fund_panel
+        batch = factor_regression_batch(funds, factors)
+
+        attribution = compute_factor_attribution(funds[:, 2], factors, regression_result=batch.to_result(2))
+        expected = compute_factor_attribution(funds[:, 2], factors)
+
+        assert attribution.explained_return == pytest.approx(expected.explained_return, rel=1e-10)
+
+
+class TestRollingFactorRegression:
+    """Tests for rolling_factor_regression."""
+
+    def test_matches_window_lstsq(self, fund_panel: tuple[np.ndarray, pd.DataFrame]) -> None:
+        """Every window matches a direct lstsq fit of that window."""
+        funds, factors = fund_panel
+        window = 60
+        batch = rolling_factor_regression(funds, factors, window=window)
+
+        assert batch.loadings.shape == (300, 12, 3)
+        assert np.isnan(batch.loadings[: window - 1]).all()
+        for end in (window - 1, 150, 299):
+            rows = slice(end - window + 1, end + 1)
+            for column in (0, 7):
+                coeffs, standard_errors = _lstsq_fit(funds[rows, column], factors.to_numpy()[rows])
+                np.testing.assert_allclose(batch.loadings[end, column], coeffs[1:], rtol=1e-8)
+                np.testing.assert_allclose(batch.alpha[end, column], coeffs[0] * 252, rtol=1e-6)
+                np.testing.assert_allclose(batch.standard_errors[end, column], standard_errors, rtol=1e-8)
+                window_fit = compute_factor_regression(funds[rows, column], factors.iloc[rows])
+                assert batch.to_result(column, end).r_squared == pytest.approx(window_fit.r_squared, rel=1e-9)
+
+    def test_chunked_series_match(self, fund_panel: tuple[np.ndarray, pd.DataFrame], monkeypatch) -> None:
+        """Processing series in small chunks does not change the fit."""
+        funds, factors = fund_panel
+        expected = rolling_factor_regression(funds, factors, window=40)
+        monkeypatch.setattr("finbot.services.factor_analytics.factor_regression._CHUNK_ELEMENTS", 1)
+
+        chunked = rolling_factor_regression(funds, factors, window=40)
+
+        np.testing.assert_allclose(chunked.loadings, expected.loadings, rtol=1e-12)
+
+    def test_rolling_r_squared_uses_engine(self, synthetic_data: tuple[np.ndarray, pd.DataFrame]) -> None:
+        """compute_rolling_r_squared returns the engine's R-squared column."""
+        portfolio, factors = synthetic_data
+        values, _dates = compute_rolling_r_squared(portfolio, factors, window=63)
+
+        batch = rolling_factor_regression(portfolio, factors, window=63)
+
+        np.testing.assert_array_equal(values, batch.r_squared[:, 0])
+
+    def test_rejects_3d_returns(self, fund_panel: tuple[np.ndarray, pd.DataFrame]) -> None:
+        funds, factors = fund_panel
+        with pytest.raises(ValueError, match="1-D or 2-D"):
+            rolling_factor_regression(funds[:, :, np.newaxis], factors, window=40)
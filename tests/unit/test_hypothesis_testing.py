@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from itertools import combinations
 from uuid import uuid4
 
 import numpy as np
 import pytest
+import scipy.stats as stats
 
 from finbot.core.contracts.costs import CostSummary
 from finbot.core.contracts.models import BacktestRunMetadata, BacktestRunResult
 from finbot.core.contracts.versioning import BACKTEST_RESULT_SCHEMA_VERSION
+from finbot.services.backtesting import hypothesis_testing
 from finbot.services.backtesting.hypothesis_testing import (
     BootstrapCI,
+    BootstrapMethod,
     HypothesisTestResult,
     bootstrap_confidence_interval,
+    bootstrap_means,
     compare_strategies,
     mannwhitney_test,
     paired_t_test,
@@ -172,6 +177,19 @@ def test_permutation_test_structure():
     assert res.test_name == "permutation_test"
 
 
+def test_permutation_test_matches_exact_enumeration():
+    vals_a = [0.10, 0.13, 0.09, 0.12]
+    vals_b = [0.08, 0.09, 0.11, 0.07]
+    combined = np.array(vals_a + vals_b)
+    observed = abs(np.mean(vals_a) - np.mean(vals_b))
+    splits = [np.array(idx) for idx in combinations(range(8), 4)]
+    exact = np.mean([abs(combined[idx].mean() - np.delete(combined, idx).mean()) >= observed - 1e-12 for idx in splits])
+
+    res = permutation_test(_make_results(vals_a), _make_results(vals_b), n_permutations=50_000)
+
+    assert res.p_value == pytest.approx(exact, abs=0.01)
+
+
 # ── bootstrap_confidence_interval ─────────────────────────────────────────────
 
 
@@ -208,6 +226,73 @@ def test_bootstrap_ci_custom_confidence():
     assert (ci_99.upper - ci_99.lower) >= (ci_95.upper - ci_95.lower)
 
 
+def test_bootstrap_ci_block_methods_widen_for_autocorrelated_results():
+    rng = np.random.default_rng(0)
+    noise = rng.normal(0, 0.01, 200)
+    values = np.empty(200)
+    values[0] = noise[0]
+    for i in range(1, 200):
+        values[i] = 0.8 * values[i - 1] + noise[i]
+    results = _make_results(list(values))
+
+    iid = bootstrap_confidence_interval(results, n_bootstrap=4_000)
+    block = bootstrap_confidence_interval(results, n_bootstrap=4_000, method="block", block_length=20)
+    stationary = bootstrap_confidence_interval(results, n_bootstrap=4_000, method="stationary", block_length=20)
+
+    assert iid.method == BootstrapMethod.IID and iid.block_length is None
+    assert block.block_length == 20
+    assert (block.upper - block.lower) > 1.5 * (iid.upper - iid.lower)
+    assert (stationary.upper - stationary.lower) > 1.5 * (iid.upper - iid.lower)
+
+
+def test_bootstrap_ci_default_block_length():
+    results = _make_results([0.10, 0.12, 0.08, 0.11, 0.09, 0.10, 0.13, 0.07, 0.12])
+    ci = bootstrap_confidence_interval(results, method="stationary")
+    assert ci.block_length == 3
+
+
+def test_bootstrap_ci_unknown_method_raises():
+    with pytest.raises(ValueError, match="not a valid BootstrapMethod"):
+        bootstrap_confidence_interval(_make_results([0.10, 0.12, 0.08]), method="jackknife")
+
+
+# ── bootstrap_means ───────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("method", list(BootstrapMethod))
+def test_bootstrap_means_moments(method: BootstrapMethod):
+    values = np.random.default_rng(3).normal(0.05, 0.02, 400)
+    means = bootstrap_means(values, 4_000, method=method, block_length=5)
+
+    assert means.shape == (4_000, 1)
+    assert means.mean() == pytest.approx(values.mean(), abs=2e-4)
+    assert means.std() == pytest.approx(values.std() / np.sqrt(len(values)), rel=0.15)
+
+
+def test_bootstrap_means_resamples_columns_jointly():
+    values = np.random.default_rng(4).normal(size=(30, 1))
+    means = bootstrap_means(np.hstack([values, 2 * values]), 500, method="stationary")
+    np.testing.assert_allclose(means[:, 1], 2 * means[:, 0])
+
+
+def test_bootstrap_means_chunked_is_deterministic(monkeypatch):
+    values = np.random.default_rng(5).normal(size=50)
+    monkeypatch.setattr(hypothesis_testing, "_CHUNK_ELEMENTS", 120)
+    first = bootstrap_means(values, 1_000, method="block", random_seed=7)
+    second = bootstrap_means(values, 1_000, method="block", random_seed=7)
+    np.testing.assert_array_equal(first, second)
+    assert first.shape == (1_000, 1)
+
+
+def test_bootstrap_means_invalid_inputs_raise():
+    with pytest.raises(ValueError, match="at least 2 observations"):
+        bootstrap_means(np.array([0.1]))
+    with pytest.raises(ValueError, match="n_bootstrap must be >= 1"):
+        bootstrap_means(np.array([0.1, 0.2]), 0)
+    with pytest.raises(ValueError, match="block_length must be >= 1"):
+        bootstrap_means(np.array([0.1, 0.2]), method="block", block_length=0)
+
+
 # ── compare_strategies ────────────────────────────────────────────────────────
 
 
@@ -239,6 +324,31 @@ def test_compare_strategies_winner_column():
     assert row["winner"] == "Strong"
 
 
+def test_compare_strategies_multi_metric_matches_pairwise_t_tests():
+    rng = np.random.default_rng(11)
+    strategies = {
+        name: [_make_result(cagr=float(c), sharpe=float(sh)) for c, sh in rng.normal(0.08, 0.04, (10, 2))]
+        for name in ("A", "B", "C", "D")
+    }
+
+    df = compare_strategies(strategies, ["cagr", "sharpe"])
+
+    assert len(df) == 6 * 2
+    assert list(df.columns[:3]) == ["metric", "strategy_a", "strategy_b"]
+    for row in df.itertuples():
+        vals_a = [r.metrics[row.metric] for r in strategies[row.strategy_a]]
+        vals_b = [r.metrics[row.metric] for r in strategies[row.strategy_b]]
+        expected = stats.ttest_rel(vals_a, vals_b)
+        assert row.statistic == pytest.approx(expected.statistic, rel=1e-10)
+        assert row.p_value == pytest.approx(expected.pvalue, rel=1e-10)
+        assert row.mean_a == pytest.approx(np.mean(vals_a))
+
+
+def test_compare_strategies_mismatched_lengths_raises():
+    with pytest.raises(ValueError, match="equal-length"):
+        compare_strategies({"A": _make_results([0.10, 0.11, 0.12]), "B": _make_results([0.10, 0.11])})
+
+
 def test_compare_strategies_too_few_raises():
     with pytest.raises(ValueError, match="≥2 strategies"):
         compare_strategies({"OnlyOne": _make_results([0.10, 0.11])})
@@ -151,6 +151,126 @@ class TestPendingActionQueue:
         assert queue.get_pending_count() == 1
         assert queue.actions[0].order_id == "order-002"
 
+    def test_same_time_actions_keep_insertion_order(self):
+        """Actions scheduled for the same time drain in FIFO order."""
+        queue = PendingActionQueue()
+
+        base_time = datetime(2024, 1, 15, 10, 0, 0)
+
+        for i in range(5):
+            queue.add_action(
+                PendingAction(
+                    action_type=ActionType.FILL,
+                    order_id=f"order-{i:03d}",
+                    scheduled_time=base_time,
+                    data={},
+                )
+            )
+
+        due_actions = queue.get_due_actions(base_time)
+
+        assert [action.order_id for action in due_actions] == [f"order-{i:03d}" for i in range(5)]
+
+    def test_cancelled_actions_are_skipped_when_draining(self):
+        """Cancelled actions never come back out of get_due_actions."""
+        queue = PendingActionQueue()
+
+        base_time = datetime(2024, 1, 15, 10, 0, 0)
+
+        for i in range(10):
+            queue.add_action(
+                PendingAction(
+                    action_type=ActionType.FILL,
+                    order_id=f"order-{i % 2}",
+                    scheduled_time=base_time + timedelta(seconds=i),
+                    data={},
+                )
+            )
+
+        assert queue.cancel_order_actions("order-0") == 5
+        assert queue.cancel_order_actions("order-0") == 0
+        assert queue.get_pending_count() == 5
+
+        due_actions = queue.get_due_actions(base_time + timedelta(seconds=60))
+
+        assert len(due_actions) == 5
+        assert all(action.order_id == "order-1" for action in due_actions)
+        assert queue.get_pending_count() == 0
+        assert queue.actions == []
+
+    def test_get_pending_for_order(self):
+        """Pending actions for one order are returned in scheduled order without removal."""
+        queue = PendingActionQueue()
+
+        base_time = datetime(2024, 1, 15, 10, 0, 0)
+
+        queue.add_action(
+            PendingAction(
+                action_type=ActionType.CANCEL,
+                order_id="order-001",
+                scheduled_time=base_time + timedelta(seconds=20),
+                data={},
+            )
+        )
+        queue.add_action(
+            PendingAction(
+                action_type=ActionType.SUBMIT,
+                order_id="order-001",
+                scheduled_time=base_time,
+                data={},
+            )
+        )
+        queue.add_action(
+            PendingAction(
+                action_type=ActionType.SUBMIT,
+                order_id="order-002",
+                scheduled_time=base_time,
+                data={},
+            )
+        )
+
+        pending = queue.get_pending_for_order("order-001")
+
+        assert [action.action_type for action in pending] == [ActionType.SUBMIT, ActionType.CANCEL]
+        assert queue.get_pending_count() == 3
+
+        queue.get_due_actions(base_time)
+
+        assert [action.action_type for action in queue.get_pending_for_order("order-001")] == [ActionType.CANCEL]
+        assert queue.get_pending_for_order("order-002") == []
+
+    def test_interleaved_add_cancel_drain_matches_sorted_reference(self):
+        """Heap queue drains the same sequence as a naive sorted reference."""
+        queue = PendingActionQueue()
+        reference: list[PendingAction] = []
+
+        base_time = datetime(2024, 1, 15, 10, 0, 0)
+
+        for i in range(200):
+            action = PendingAction(
+                action_type=ActionType.FILL,
+                order_id=f"order-{i % 17}",
+                scheduled_time=base_time + timedelta(milliseconds=(i * 37) % 101),
+                data={"seq": i},
+            )
+            queue.add_action(action)
+            reference.append(action)
+            if i % 23 == 0:
+                cancelled_id = f"order-{(i * 7) % 17}"
+                expected = sum(1 for a in reference if a.order_id == cancelled_id)
+                assert queue.cancel_order_actions(cancelled_id) == expected
+                reference = [a for a in reference if a.order_id != cancelled_id]
+
+        reference.sort(key=lambda a: (a.scheduled_time, a.data["seq"]))
+
+        assert queue.get_pending_count() == len(reference)
+        assert queue.actions == reference
+
+        drained = queue.get_due_actions(base_time + timedelta(milliseconds=50))
+        drained += queue.get_due_actions(base_time + timedelta(seconds=1))
+
+        assert drained == reference
+
 
 class TestSubmissionLatency:
     """Test order submission latency."""
@@ -0,0 +1,172 @@
+"""Tests for the per-symbol pending order book and batched market data."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from finbot.core.contracts.latency import LATENCY_NORMAL
+from finbot.core.contracts.models import OrderSide, OrderType
+from finbot.core.contracts.orders import Order, OrderStatus, RejectionReason
+from finbot.core.contracts.risk import PositionLimitRule, RiskConfig
+from finbot.services.execution.execution_simulator import ExecutionSimulator
+from finbot.services.execution.order_book import PendingOrderBook
+
+
+def _order(
+    order_id: str,
+    symbol: str = "SPY",
+    side: OrderSide = OrderSide.BUY,
+    limit_price: str | None = None,
+    quantity: str = "10",
+) -> Order:
+    return Order(
+        order_id=order_id,
+        symbol=symbol,
+        side=side,
+        order_type=OrderType.LIMIT if limit_price is not None else OrderType.MARKET,
+        quantity=Decimal(quantity),
+        limit_price=Decimal(limit_price) if limit_price is not None else None,
+        created_at=datetime(2024, 1, 15, 9, 30),
+    )
+
+
+class TestPendingOrderBook:
+    """Test PendingOrderBook indexing."""
+
+    def test_behaves_like_dict(self):
+        """Book supports the dict operations the simulator and checkpoints use."""
+        book = PendingOrderBook({"a": _order("a"), "b": _order("b", symbol="QQQ")})
+
+        book["c"] = _order("c")
+        del book["a"]
+
+        assert list(book) == ["b", "c"]
+        assert "c" in book
+        assert "a" not in book
+        assert len(book) == 2
+        assert book.get("missing") is None
+        assert [order.order_id for order in book.values()] == ["b", "c"]
+
+    def test_fillable_orders_uses_limit_books(self):
+        """Only market orders and limits crossed by the price are fillable."""
+        book = PendingOrderBook()
+        book["buy-449"] = _order("buy-449", limit_price="449")
+        book["mkt"] = _order("mkt")
+        book["buy-451"] = _order("buy-451", limit_price="451")
+        book["sell-450"] = _order("sell-450", side=OrderSide.SELL, limit_price="450")
+        book["sell-452"] = _order("sell-452", side=OrderSide.SELL, limit_price="452")
+        book["other"] = _order("other", symbol="QQQ")
+
+        fillable = book.fillable_orders("SPY", Decimal("450"))
+
+        # Insertion order is preserved across market and limit books
+        assert [order.order_id for order in fillable] == ["mkt", "buy-451", "sell-450"]
+        assert book.fillable_orders("IWM", Decimal("450")) == []
+
+    def test_removal_keeps_index_consistent(self):
+        """Removed orders disappear from the symbol index."""
+        book = PendingOrderBook()
+        book["a"] = _order("a", limit_price="450")
+        book["b"] = _order("b", limit_price="450")
+
+        del book["a"]
+
+        assert [order.order_id for order in book.fillable_orders("SPY", Decimal("440"))] == ["b"]
+
+        book.pop("b")
+
+        assert not book.has_symbol("SPY")
+        assert book.symbols() == []
+
+    def test_orders_for_symbol(self):
+        """All orders for a symbol are returned regardless of price."""
+        book = PendingOrderBook()
+        book["a"] = _order("a", limit_price="400")
+        book["b"] = _order("b", symbol="QQQ")
+        book["c"] = _order("c")
+
+        assert [order.order_id for order in book.orders_for_symbol("SPY")] == ["a", "c"]
+
+
+class TestMarketDataBatch:
+    """Test ExecutionSimulator per-symbol processing and batch API."""
+
+    def test_batch_matches_sequential_processing(self):
+        """Batch processing produces the same fills as per-symbol calls."""
+        prices = {"SPY": Decimal("450"), "QQQ": Decimal("380"), "IWM": Decimal("200")}
+        timestamp = datetime(2024, 1, 15, 9, 31)
+
+        def build() -> ExecutionSimulator:
+            simulator = ExecutionSimulator(initial_cash=Decimal("1000000"))
+            simulator.submit_order(_order("spy-mkt"), timestamp)
+            simulator.submit_order(_order("spy-lim", limit_price="440"), timestamp)
+            simulator.submit_order(_order("qqq-lim", symbol="QQQ", limit_price="385"), timestamp)
+            simulator.submit_order(_order("iwm-mkt", symbol="IWM"), timestamp)
+            return simulator
+
+        sequential = build()
+        sequential_fills = []
+        for symbol, price in prices.items():
+            sequential_fills.extend(sequential.process_market_data(symbol, price, timestamp))
+
+        batched = build()
+        batched_fills = batched.process_market_data_batch(prices, timestamp)
+
+        assert [(e.order_id, e.price) for e in batched_fills] == [(e.order_id, e.price) for e in sequential_fills]
+        assert batched.positions == sequential.positions
+        assert batched.cash == sequential.cash
+        assert list(batched.pending_orders) == ["spy-lim"]
+
+    def test_batch_updates_marks_for_symbols_without_orders(self):
+        """Batch updates last prices even for symbols with no pending orders."""
+        simulator = ExecutionSimulator(initial_cash=Decimal("100000"))
+        simulator.positions["TLT"] = Decimal("10")
+
+        simulator.process_market_data_batch({"TLT": Decimal("95"), "SPY": Decimal("450")})
+
+        assert simulator.last_prices == {"TLT": Decimal("95"), "SPY": Decimal("450")}
+        assert simulator.get_account_value() == Decimal("100950")
+
+    def test_batch_processes_due_actions_with_latency(self):
+        """Delayed submissions become fillable in a later batch."""
+        simulator = ExecutionSimulator(initial_cash=Decimal("100000"), latency_config=LATENCY_NORMAL)
+        start = datetime(2024, 1, 15, 9, 30)
+
+        simulator.submit_order(_order("spy-mkt"), start)
+        assert simulator.process_market_data_batch({"SPY": Decimal("450")}, start) == []
+
+        simulator.process_market_data_batch({"SPY": Decimal("450")}, start + timedelta(milliseconds=60))
+        assert simulator.get_order("spy-mkt").status == OrderStatus.SUBMITTED
+
+        simulator.process_market_data_batch({"SPY": Decimal("451")}, start + timedelta(seconds=1))
+
+        assert simulator.get_order("spy-mkt").status == OrderStatus.FILLED
+        assert simulator.positions["SPY"] == Decimal("10")
+
+    def test_submit_uses_latest_prices_for_risk_checks(self):
+        """Position value limits see the last processed market price."""
+        simulator = ExecutionSimulator(
+            initial_cash=Decimal("100000"),
+            risk_config=RiskConfig(position_limit=PositionLimitRule(max_value=Decimal("10000"))),
+        )
+
+        simulator.submit_order(_order("first", quantity="10"))
+        simulator.process_market_data("SPY", Decimal("450"))
+
+        result = simulator.submit_order(_order("second", quantity="50"))
+
+        assert result.status == OrderStatus.REJECTED
+        assert result.rejection_reason == RejectionReason.RISK_POSITION_LIMIT
+
+    def test_restored_pending_orders_are_indexed(self):
+        """Assigning pending_orders rebuilds the symbol index."""
+        simulator = ExecutionSimulator(initial_cash=Decimal("100000"))
+        order = _order("restored")
+        order.status = OrderStatus.SUBMITTED
+
+        simulator.pending_orders = {order.order_id: order}
+        executions = simulator.process_market_data("SPY", Decimal("450"))
+
+        assert [e.order_id for e in executions] == ["restored"]
+        assert "restored" in simulator.completed_orders
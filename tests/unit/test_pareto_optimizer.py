@@ -6,13 +6,20 @@ import dataclasses
 from datetime import UTC, datetime
 from uuid import uuid4
 
+import numpy as np
 import plotly.graph_objects as go
 import pytest
 
 from finbot.core.contracts.costs import CostSummary
 from finbot.core.contracts.models import BacktestRunMetadata, BacktestRunResult
 from finbot.core.contracts.versioning import BACKTEST_RESULT_SCHEMA_VERSION
-from finbot.services.optimization.pareto_optimizer import compute_pareto_front, plot_pareto_front
+from finbot.services.optimization import pareto_optimizer
+from finbot.services.optimization.pareto_optimizer import (
+    compute_pareto_front,
+    non_dominated_ranks,
+    pareto_mask,
+    plot_pareto_front,
+)
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
@@ -219,6 +226,113 @@ def test_large_set_returns_correct_front():
     assert len(pareto.pareto_front) + len(pareto.dominated_points) == 100
 
 
+# ── Array kernels ─────────────────────────────────────────────────────────────
+
+
+def _brute_force_mask(values: np.ndarray) -> np.ndarray:
+    """Reference O(n²) dominance check (all objectives maximised)."""
+    return np.array([not ((values >= row).all(axis=1) & (values > row).any(axis=1)).any() for row in values])
+
+
+def _brute_force_ranks(values: np.ndarray) -> np.ndarray:
+    """Reference non-dominated sorting by repeatedly peeling the front."""
+    ranks = np.zeros(len(values), dtype=int)
+    remaining = np.arange(len(values))
+    rank = 0
+    while len(remaining):
+        rank += 1
+        front = _brute_force_mask(values[remaining])
+        ranks[remaining[front]] = rank
+        remaining = remaining[~front]
+    return ranks
+
+
+@pytest.mark.parametrize("n_objectives", [1, 2, 3, 4])
+@pytest.mark.parametrize("seed", range(5))
+def test_pareto_mask_and_ranks_match_brute_force(n_objectives: int, seed: int):
+    """Kernels match brute force, including heavy ties and infinite values."""
+    rng = np.random.default_rng(seed)
+    values = rng.integers(0, 4, (120, n_objectives)).astype(float)  # many ties and duplicates
+    values[:60] += rng.normal(0, 0.1, (60, n_objectives))
+    values[7] = -np.inf
+
+    np.testing.assert_array_equal(pareto_mask(values), _brute_force_mask(values))
+    np.testing.assert_array_equal(non_dominated_ranks(values), _brute_force_ranks(values))
+
+
+def test_pareto_mask_small_blocks(monkeypatch: pytest.MonkeyPatch):
+    """Blocked filtering gives the same front for any block and chunk size."""
+    monkeypatch.setattr(pareto_optimizer, "_BLOCK_SIZE", 7)
+    monkeypatch.setattr(pareto_optimizer, "_BLOCK_ELEMENTS", 16)
+    values = np.random.default_rng(9).normal(size=(300, 3))
+
+    np.testing.assert_array_equal(pareto_mask(values), _brute_force_mask(values))
+
+
+def test_pareto_mask_respects_minimized_objectives():
+    values = np.array([[0.10, 0.20], [0.08, 0.05], [0.07, 0.25]])
+    np.testing.assert_array_equal(pareto_mask(values, [True, False]), [True, True, False])
+    np.testing.assert_array_equal(non_dominated_ranks(values, [True, False]), [1, 1, 2])
+
+
+def test_pareto_mask_nan_rows_are_incomparable():
+    values = np.array([[1.0, 1.0], [np.nan, 0.0], [0.5, 0.5]])
+    np.testing.assert_array_equal(pareto_mask(values), [True, True, False])
+    np.testing.assert_array_equal(non_dominated_ranks(values), [1, 1, 2])
+
+
+def test_pareto_mask_invalid_inputs_raise():
+    with pytest.raises(ValueError, match="2-D"):
+        pareto_mask(np.ones(3))
+    with pytest.raises(ValueError, match="one flag per objective"):
+        pareto_mask(np.ones((3, 2)), [True])
+
+
+# ── N objectives and ranks ────────────────────────────────────────────────────
+
+
+def test_three_objectives():
+    """A point dominated on cagr/drawdown survives when it wins on a third objective."""
+    results = [
+        _make_result(0.12, 0.10, "A", sharpe=0.9),
+        _make_result(0.10, 0.12, "B", sharpe=1.2),
+        _make_result(0.09, 0.15, "C", sharpe=0.5),
+    ]
+    pareto = compute_pareto_front(results, objectives={"cagr": True, "max_drawdown": False, "sharpe": True})
+
+    assert pareto.objective_names == ("cagr", "max_drawdown", "sharpe")
+    assert pareto.objective_a_name == "cagr"
+    assert pareto.objective_b_name == "max_drawdown"
+    assert {p.strategy_name for p in pareto.pareto_front} == {"A", "B"}
+    assert pareto.all_points[1].objective_values == (0.10, 0.12, 1.2)
+
+
+def test_objectives_requires_two_metrics():
+    with pytest.raises(ValueError, match="at least 2"):
+        compute_pareto_front([_make_result(0.1, 0.1)], objectives={"cagr": True})
+
+
+def test_missing_extra_objective_raises():
+    with pytest.raises(KeyError, match="sharpe"):
+        compute_pareto_front([_make_result(0.1, 0.1)], objectives={"cagr": True, "sharpe": True})
+
+
+def test_compute_ranks():
+    results = [
+        _make_result(0.12, 0.10, "front"),
+        _make_result(0.10, 0.12, "second"),
+        _make_result(0.08, 0.14, "third"),
+        _make_result(0.11, 0.13, "second_too"),
+    ]
+    ranked = compute_pareto_front(results, compute_ranks=True)
+    unranked = compute_pareto_front(results)
+
+    assert [p.pareto_rank for p in ranked.all_points] == [1, 2, 3, 2]
+    assert ranked.n_fronts == 3
+    assert all(p.pareto_rank is None for p in unranked.all_points)
+    assert unranked.n_fronts is None
+
+
 # ── Plot tests ────────────────────────────────────────────────────────────────
 
 
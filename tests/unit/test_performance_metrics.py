@@ -0,0 +1,97 @@
+"""Tests for the single-pass performance metrics kernel."""
+
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+import quantstats as qs
+
+from finbot.services.backtesting.performance_metrics import PerformanceMetrics, compute_performance_metrics
+
+N_OBS = 1500
+RNG = np.random.default_rng(1)
+_GAPPED = 100_000 * np.cumprod(1 + RNG.normal(0.0004, 0.01, N_OBS))
+_GAPPED[[100, 101, 500, 900]] = np.nan
+
+VALUE_HISTORIES = {
+    "random_walk": 100_000 * np.cumprod(1 + RNG.normal(0.0004, 0.01, N_OBS)),
+    "autocorrelated": 100_000 * np.cumprod(1 + np.convolve(RNG.normal(0.0004, 0.01, N_OBS), [1, 0.5, 0.3], "same")),
+    "no_losses": np.linspace(100_000, 200_000, N_OBS),
+    "flat_start": np.r_[np.full(700, 100_000.0), 100_000 * np.cumprod(1 + RNG.normal(0, 0.01, N_OBS - 700))],
+    "with_gaps": _GAPPED,
+}
+
+# compute_stats field -> quantstats Series method
+QUANTSTATS_METHODS = {
+    "cagr": "cagr",
+    "sharpe": "sharpe",
+    "smart_sharpe": "smart_sharpe",
+    "smart_sortino": "smart_sortino",
+    "calmar": "calmar",
+    "common_sense_ratio": "common_sense_ratio",
+    "profit_factor": "profit_factor",
+    "kelly_criterion": "kelly_criterion",
+    "volatility": "volatility",
+    "risk_of_ruin": "risk_of_ruin",
+    "expected_shortfall": "expected_shortfall",
+    "best": "best",
+    "worst": "worst",
+    "win_rate": "win_rate",
+}
+
+
+def _quantstats_metrics(values: np.ndarray) -> dict[str, float]:
+    qs.extend_pandas()
+    series = pd.Series(values, index=pd.bdate_range("2015-01-01", periods=len(values)))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return {field: float(getattr(series, method)()) for field, method in QUANTSTATS_METHODS.items()}
+
+
+class TestComputePerformanceMetrics:
+    """Test compute_performance_metrics."""
+
+    @pytest.mark.parametrize("name", list(VALUE_HISTORIES))
+    def test_matches_quantstats(self, name: str):
+        """Every metric matches the quantstats definition used by compute_stats."""
+        values = VALUE_HISTORIES[name]
+
+        expected = _quantstats_metrics(values)
+        metrics = compute_performance_metrics(values)
+
+        for field, value in expected.items():
+            actual = float(getattr(metrics, field)[0])
+            assert actual == pytest.approx(value, rel=1e-10, nan_ok=True), field
+
+    def test_max_drawdown_follows_values(self):
+        """Max drawdown is measured on the value path, skipping missing values."""
+        values = np.array([100.0, 125.0, np.nan, 80.0, 120.0])
+
+        metrics = compute_performance_metrics(values)
+
+        assert metrics.max_drawdown[0] == pytest.approx(-0.36)
+
+    def test_batch_matches_single_series(self):
+        """2-D input evaluates each column like the 1-D call, with NaN-padded tails."""
+        columns = [VALUE_HISTORIES["random_walk"], VALUE_HISTORIES["with_gaps"], VALUE_HISTORIES["no_losses"]]
+        batch_values = np.column_stack(columns)
+        batch_values[1200:, 0] = np.nan  # shorter series padded with NaN
+
+        batch = compute_performance_metrics(batch_values)
+        truncated = compute_performance_metrics(batch_values[:1200, 0])
+
+        for field in PerformanceMetrics.__dataclass_fields__:
+            for column in range(batch_values.shape[1]):
+                single = compute_performance_metrics(batch_values[:, column])
+                np.testing.assert_allclose(
+                    getattr(batch, field)[column], getattr(single, field)[0], rtol=1e-12, err_msg=field
+                )
+            np.testing.assert_allclose(getattr(batch, field)[0], getattr(truncated, field)[0], rtol=1e-12)
+
+    def test_rejects_3d_input(self):
+        """Only 1-D and 2-D value arrays are accepted."""
+        with pytest.raises(ValueError, match="1-D or 2-D"):
+            compute_performance_metrics(np.ones((3, 3, 3)))
@@ -84,6 +84,20 @@ class TestRollingMetricsResult:
                 annualization_factor=252,
             )
 
+    def test_sortino_length_mismatch_raises(self) -> None:
+        """Optional series must match the sharpe length."""
+        with pytest.raises(ValueError, match="sortino length"):
+            RollingMetricsResult(
+                window=5,
+                n_obs=10,
+                sharpe=tuple([1.0] * 10),
+                volatility=tuple([0.1] * 10),
+                beta=None,
+                dates=tuple(str(i) for i in range(10)),
+                annualization_factor=252,
+                sortino=tuple([1.2] * 9),  # wrong length
+            )
+
     def test_invalid_annualization_raises(self) -> None:
         """annualization_factor < 1 raises ValueError."""
         with pytest.raises(ValueError, match="annualization_factor"):
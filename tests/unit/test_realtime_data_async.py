@@ -0,0 +1,336 @@
+"""Tests for the async, rate-limited, single-flight quote fetch path.
+
+Alpaca and Twelve Data are replaced by a local HTTP stub server so the real
+``httpx`` clients, pooling and request encoding are exercised.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from fastapi.testclient import TestClient
+
+from finbot.core.contracts.realtime_data import Quote, QuoteProvider
+from finbot.services.realtime_data._providers import alpaca_provider, twelvedata_provider, yfinance_provider
+from finbot.services.realtime_data.composite_provider import CompositeQuoteProvider
+from finbot.services.realtime_data.prefetcher import QuotePrefetcher
+from finbot.utils.request_utils.rate_limiter import RateLimiter
+from finbot.utils.request_utils.token_bucket import TokenBucket
+from web.backend.main import app
+from web.backend.routers import realtime_quotes as realtime_quotes_router
+
+
+class _StubQuoteServer(ThreadingHTTPServer):
+    """Serves Alpaca snapshots and Twelve Data quotes, recording every request."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.requests: list[tuple[str, list[str]]] = []
+        self.failing_paths: set[str] = set()
+        self.delay = 0.0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: _StubQuoteServer
+
+    def do_GET(self) -> None:
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        with self.server.lock:
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+        try:
+            time.sleep(self.server.delay)
+            if parsed.path == "/v2/stocks/snapshots":
+                symbols = query["symbols"][0].split(",")
+                body: object = {sym: _snapshot(sym) for sym in symbols}
+            else:
+                symbols = query["symbol"][0].split(",")
+                items = [
+                    {"symbol": sym, "close": "50.0", "exchange": "TSX", "datetime": "2026-02-24"} for sym in symbols
+                ]
+                body = items[0] if len(items) == 1 else items
+            with self.server.lock:
+                self.server.requests.append((parsed.path, symbols))
+            status = 500 if parsed.path in self.server.failing_paths else 200
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+    def log_message(self, *_args: object) -> None:
+        pass
+
+
+def _snapshot(symbol: str) -> dict[str, object]:
+    return {
+        "latestTrade": {"p": 100.0, "t": "2026-02-24T15:30:00Z"},
+        "latestQuote": {"bp": 99.9, "ap": 100.1},
+        "dailyBar": {"o": 98.0, "h": 101.0, "l": 97.5, "v": 1000},
+        "prevDailyBar": {"c": 99.0},
+    }
+
+
+@pytest.fixture
+def stub_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[_StubQuoteServer]:
+    server = _StubQuoteServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(alpaca_provider, "_BASE_URL", server.url)
+    monkeypatch.setattr(alpaca_provider, "_get_headers", lambda: {})
+    monkeypatch.setattr(twelvedata_provider, "_BASE_URL", server.url)
+    monkeypatch.setattr(twelvedata_provider, "_get_api_key", lambda: "key")
+
+    def no_yfinance(symbol: str) -> Quote:
+        raise ValueError(f"no yfinance data for {symbol}")
+
+    monkeypatch.setattr(yfinance_provider, "get_quote", no_yfinance)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _provider(**buckets: TokenBucket) -> CompositeQuoteProvider:
+    rate_limits = {QuoteProvider(name): bucket for name, bucket in buckets.items()}
+    return CompositeQuoteProvider(rate_limits=rate_limits, max_rate_limit_wait=0.0)
+
+
+def _run(provider: CompositeQuoteProvider, coroutine_factory):
+    async def main():
+        try:
+            return await coroutine_factory()
+        finally:
+            await provider.aclose()
+
+    return asyncio.run(main())
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_waits_at_rate(self) -> None:
+        now = [0.0]
+        bucket = TokenBucket(rate=2.0, capacity=3, clock=lambda: now[0])
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.5)
+        now[0] = 2.0
+        assert bucket.available == pytest.approx(3.0)
+
+    def test_max_wait_does_not_consume(self) -> None:
+        now = [0.0]
+        bucket = TokenBucket(rate=1.0, capacity=1, clock=lambda: now[0])
+        bucket.reserve()
+
+        assert bucket.reserve(max_wait=0.5) is None
+        assert bucket.available == pytest.approx(0.0)
+        assert asyncio.run(bucket.acquire(max_wait=0.0)) is False
+
+    def test_rejects_more_than_capacity(self) -> None:
+        with pytest.raises(ValueError, match="cannot reserve"):
+            TokenBucket(rate=1.0, capacity=2).reserve(3)
+
+    def test_from_rate_limiter_uses_strictest_rate(self) -> None:
+        bucket = TokenBucket.from_rate_limiter(RateLimiter("8/minute;800/day"))
+
+        assert bucket.capacity == 8
+        assert bucket.rate == pytest.approx(800 / 86400)
+
+
+class TestAsyncGetQuotes:
+    """Tests for CompositeQuoteProvider.aget_quotes()."""
+
+    def test_large_watchlist_is_chunked_and_fetched_concurrently(self, stub_server: _StubQuoteServer) -> None:
+        stub_server.delay = 0.1
+        symbols = [f"S{i:03d}" for i in range(500)]
+        provider = _provider(alpaca=TokenBucket(rate=100, capacity=10))
+
+        batch = _run(provider, lambda: provider.aget_quotes(symbols))
+
+        assert sorted(batch.quotes) == symbols
+        assert batch.errors == {}
+        assert sorted(len(syms) for _, syms in stub_server.requests) == [100, 200, 200]
+        assert stub_server.max_active == 3
+
+    def test_concurrent_misses_share_one_upstream_call(self, stub_server: _StubQuoteServer) -> None:
+        stub_server.delay = 0.05
+        provider = _provider()
+
+        async def many_callers():
+            return await asyncio.gather(*(provider.aget_quotes(["SPY", "QQQ"]) for _ in range(20)))
+
+        batches = _run(provider, many_callers)
+
+        assert all(set(batch.quotes) == {"SPY", "QQQ"} for batch in batches)
+        assert stub_server.requests == [("/v2/stocks/snapshots", ["SPY", "QQQ"])]
+        assert provider.cache.get("SPY") is not None
+
+    def test_partitions_route_to_their_providers(self, stub_server: _StubQuoteServer) -> None:
+        provider = _provider(twelvedata=TokenBucket(rate=100, capacity=2))
+
+        batch = _run(provider, lambda: provider.aget_quotes(["SPY", "RY.TO", "TD.TO", "ABC.V"]))
+
+        assert batch.quotes["SPY"].provider == QuoteProvider.ALPACA
+        assert batch.quotes["RY.TO"].provider == QuoteProvider.TWELVEDATA
+        requests = sorted(stub_server.requests)
+        # Twelve Data charges a credit per symbol, so chunks fit the bucket
+        assert requests == [
+            ("/quote", ["ABC:TSXV"]),
+            ("/quote", ["RY:TSX", "TD:TSX"]),
+            ("/v2/stocks/snapshots", ["SPY"]),
+        ]
+
+    def test_http_error_falls_back_to_next_tier(self, stub_server: _StubQuoteServer) -> None:
+        stub_server.failing_paths.add("/v2/stocks/snapshots")
+        provider = _provider()
+
+        batch = _run(provider, lambda: provider.aget_quotes(["SPY"]))
+
+        assert batch.quotes["SPY"].provider == QuoteProvider.TWELVEDATA
+        alpaca_status = provider.get_provider_status()[0]
+        assert alpaca_status.total_errors == 1
+        assert "500" in alpaca_status.last_error
+
+    def test_exhausted_bucket_skips_provider(self, stub_server: _StubQuoteServer) -> None:
+        provider = _provider(alpaca=TokenBucket(rate=0.001, capacity=1))
+
+        async def two_rounds():
+            await provider.aget_quotes(["SPY"])
+            provider.cache.clear()
+            return await provider.aget_quotes(["SPY"])
+
+        batch = _run(provider, two_rounds)
+
+        assert batch.quotes["SPY"].provider == QuoteProvider.TWELVEDATA
+        assert provider.get_provider_status()[0].last_error == "Rate limit reached"
+
+    def test_unavailable_symbols_are_reported(self, stub_server: _StubQuoteServer, monkeypatch) -> None:
+        monkeypatch.setattr(alpaca_provider, "is_available", lambda: False)
+        monkeypatch.setattr(twelvedata_provider, "is_available", lambda: False)
+        provider = _provider()
+
+        batch = _run(provider, lambda: provider.aget_quotes(["SPY"]))
+
+        assert batch.quotes == {}
+        assert batch.errors == {"SPY": "No provider returned data"}
+
+
+def test_prefetcher_shares_rate_limits_and_inflight_fetches(stub_server: _StubQuoteServer) -> None:
+    stub_server.delay = 0.05
+    provider = _provider(alpaca=TokenBucket(rate=0.001, capacity=1))
+    prefetcher = QuotePrefetcher(provider, interval=60.0)
+    prefetcher.subscribe(["SPY"])
+
+    async def api_then_prefetch():
+        api_call = asyncio.create_task(provider.aget_quotes(["SPY"]))
+        await asyncio.sleep(0.01)
+        joined = await prefetcher.refresh_now()
+        await api_call
+        return joined, await prefetcher.refresh_now()
+
+    joined, refreshed = _run(provider, api_then_prefetch)
+
+    assert joined["SPY"].provider == QuoteProvider.ALPACA
+    # The API call spent Alpaca's only token, so the next prefetch falls back
+    assert refreshed["SPY"].provider == QuoteProvider.TWELVEDATA
+    assert stub_server.requests == [("/v2/stocks/snapshots", ["SPY"]), ("/quote", ["SPY"])]
+
+
+def test_yfinance_fetches_symbols_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def slow_quote(symbol: str) -> Quote:
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        if symbol == "BAD":
+            raise ValueError("no data")
+        return Quote(symbol=symbol, price=1.0, timestamp=datetime.now(tz=UTC), provider=QuoteProvider.YFINANCE)
+
+    monkeypatch.setattr(yfinance_provider, "get_quote", slow_quote)
+    symbols = [f"S{i}" for i in range(20)] + ["BAD"]
+
+    assert sorted(asyncio.run(yfinance_provider.aget_quotes(symbols))) == sorted(symbols[:-1])
+    assert sorted(yfinance_provider.get_quotes(symbols)) == sorted(symbols[:-1])
+    assert 1 < peak[0] <= yfinance_provider.MAX_CONCURRENCY
+
+
+def test_yfinance_concurrency_limit_spans_overlapping_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def slow_quote(symbol: str) -> Quote:
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return Quote(symbol=symbol, price=1.0, timestamp=datetime.now(tz=UTC), provider=QuoteProvider.YFINANCE)
+
+    monkeypatch.setattr(yfinance_provider, "get_quote", slow_quote)
+    monkeypatch.setattr(yfinance_provider, "MAX_CONCURRENCY", 2)
+    limit = 2
+
+    async def overlapping() -> list[dict[str, Quote]]:
+        calls = [yfinance_provider.aget_quotes([f"C{c}S{i}" for i in range(limit)]) for c in range(3)]
+        return await asyncio.gather(*calls)
+
+    assert [len(quotes) for quotes in asyncio.run(overlapping())] == [limit] * 3
+    assert peak[0] == limit
+
+
+def test_quotes_endpoint_uses_async_provider(stub_server: _StubQuoteServer, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(realtime_quotes_router, "_provider", _provider())
+
+    response = TestClient(app).post("/api/realtime-quotes/quotes", json={"symbols": ["SPY", "RY.TO"]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert {quote["symbol"]: quote["provider"] for quote in body["quotes"]} == {"SPY": "ALPACA", "RY.TO": "TWELVEDATA"}
+    assert body["errors"] == {}
+
+
+def test_async_stale_quote_is_refreshed_in_background(stub_server: _StubQuoteServer) -> None:
+    provider = CompositeQuoteProvider(cache_ttl=0.05, stale_grace_seconds=60.0, rate_limits={})
+
+    async def stale_read():
+        await provider.aget_quotes(["SPY"])
+        await asyncio.sleep(0.1)
+        batch = await provider.aget_quotes(["SPY"])
+        requests_before_refresh = len(stub_server.requests)
+        await asyncio.gather(*provider._background_tasks)
+        return batch, requests_before_refresh
+
+    batch, requests_before_refresh = _run(provider, stale_read)
+
+    assert "SPY" in batch.quotes
+    assert requests_before_refresh == 1
+    assert len(stub_server.requests) == 2
+    assert provider.cache.get("SPY") is not None
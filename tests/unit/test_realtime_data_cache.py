@@ -12,6 +12,14 @@ from finbot.core.contracts.realtime_data import Quote, QuoteProvider
 from finbot.services.realtime_data.quote_cache import QuoteCache
 
 
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
 def _make_quote(symbol: str = "SPY", price: float = 500.0) -> Quote:
     return Quote(
         symbol=symbol,
@@ -93,14 +101,13 @@ class TestQuoteCacheTTL:
         time.sleep(0.1)
         assert cache.get("SPY") is None
 
-    def test_size_includes_expired_until_lookup_prunes(self) -> None:
+    def test_size_excludes_expired_entries(self) -> None:
         cache = QuoteCache(ttl_seconds=0.05)
         cache.put("SPY", _make_quote())
         time.sleep(0.1)
 
-        assert cache.size() == 1
-        assert cache.get("SPY") is None
         assert cache.size() == 0
+        assert cache.get("SPY") is None
 
     def test_expired_lookup_preserves_other_entries(self) -> None:
         cache = QuoteCache(ttl_seconds=0.05)
@@ -177,3 +184,80 @@ class TestQuoteCacheThreadSafety:
 
         assert len(errors) == 0
         assert cache.size() == 200
+
+
+class TestQuoteCacheBounds:
+    """LRU eviction and expired-entry sweeping."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = QuoteCache(max_entries=2)
+        cache.put("SPY", _make_quote("SPY"))
+        cache.put("QQQ", _make_quote("QQQ"))
+        cache.get("SPY")
+        cache.put("TLT", _make_quote("TLT"))
+
+        assert cache.get("QQQ") is None
+        assert cache.get("SPY") is not None
+        assert cache.stats().evictions == 1
+
+    def test_writes_sweep_expired_entries_once_per_ttl(self) -> None:
+        clock = _Clock()
+        cache = QuoteCache(ttl_seconds=10.0, clock=clock)
+        cache.put_many({f"SYM{i}": _make_quote(f"SYM{i}") for i in range(100)})
+        clock.now = 11.0
+        cache.put("SPY", _make_quote())
+
+        assert cache.stats().entries == 1
+        assert cache.stats().expirations == 100
+
+    def test_purge_expired_keeps_entries_within_grace(self) -> None:
+        clock = _Clock()
+        cache = QuoteCache(ttl_seconds=10.0, stale_grace_seconds=5.0, clock=clock)
+        cache.put("SPY", _make_quote())
+        clock.now = 12.0
+        cache.put("QQQ", _make_quote("QQQ"))
+        clock.now = 16.0
+
+        assert cache.purge_expired() == 1
+        assert cache.lookup("QQQ") is not None
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"), [({"max_entries": 0}, "max_entries"), ({"stale_grace_seconds": -1}, "stale")]
+    )
+    def test_rejects_invalid_bounds(self, kwargs: dict[str, float], match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            QuoteCache(**kwargs)
+
+
+class TestQuoteCacheStaleWhileRevalidate:
+    """Stale lookups and counters."""
+
+    def test_lookup_serves_stale_within_grace_but_get_does_not(self) -> None:
+        clock = _Clock()
+        cache = QuoteCache(ttl_seconds=10.0, stale_grace_seconds=5.0, clock=clock)
+        cache.put("SPY", _make_quote())
+
+        clock.now = 12.0
+        cached = cache.lookup("SPY")
+        assert cached is not None
+        assert cached.stale
+        assert cached.age_seconds == pytest.approx(12.0)
+        assert cache.get("SPY") is None
+
+        clock.now = 15.5
+        assert cache.lookup("SPY") is None
+
+    def test_counters(self) -> None:
+        clock = _Clock()
+        cache = QuoteCache(ttl_seconds=10.0, stale_grace_seconds=5.0, clock=clock)
+        cache.put("SPY", _make_quote())
+        cache.lookup("SPY")
+        cache.lookup("QQQ")
+        clock.now = 12.0
+        cache.lookup("SPY")
+
+        stats = cache.stats()
+        assert (stats.hits, stats.stale_hits, stats.misses) == (1, 1, 1)
+        assert stats.hit_rate == pytest.approx(2 / 3)
+        assert stats.provider_hits == {QuoteProvider.ALPACA: 1}
+        assert stats.provider_stale_hits == {QuoteProvider.ALPACA: 1}
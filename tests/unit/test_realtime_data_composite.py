@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from dataclasses import replace
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from finbot.core.contracts.realtime_data import Quote, QuoteBatch, QuoteProvider
 from finbot.services.realtime_data.composite_provider import CompositeQuoteProvider, _is_canadian
+from finbot.services.realtime_data.prefetcher import QuotePrefetcher
+from finbot.services.realtime_data.quote_cache import QuoteCache
 
 
 def _make_quote(symbol: str = "SPY", provider: QuoteProvider = QuoteProvider.ALPACA) -> Quote:
@@ -227,3 +233,116 @@ class TestCompositeProviderStatus:
         statuses = provider.get_provider_status()
         alpaca_status = next(s for s in statuses if s.provider == QuoteProvider.ALPACA)
         assert alpaca_status.total_requests == 2
+
+
+class TestStaleWhileRevalidate:
+    """Tests for serving stale quotes while refreshing them in the background."""
+
+    @patch("finbot.services.realtime_data.composite_provider.alpaca_provider")
+    @patch("finbot.services.realtime_data.composite_provider.twelvedata_provider")
+    @patch("finbot.services.realtime_data.composite_provider.yfinance_provider")
+    def test_stale_quote_is_served_then_refreshed(
+        self, mock_yf: MagicMock, mock_td: MagicMock, mock_alpaca: MagicMock
+    ) -> None:
+        mock_alpaca.is_available.return_value = True
+        first, second = _make_quote("SPY"), replace(_make_quote("SPY"), price=501.0)
+        mock_alpaca.get_quotes.side_effect = [{"SPY": first}, {"SPY": second}]
+
+        provider = CompositeQuoteProvider(cache_ttl=0.05, stale_grace_seconds=60.0)
+        provider.get_quotes(["SPY"])
+        time.sleep(0.1)
+
+        stale = provider.get_quotes(["SPY"])
+        provider.close()  # waits for the background refresh
+
+        assert stale.quotes["SPY"] is first
+        assert stale.errors == {}
+        assert provider.get_quotes(["SPY"]).quotes["SPY"] is second
+        assert mock_alpaca.get_quotes.call_count == 2
+        alpaca_status = provider.get_provider_status()[0]
+        assert (alpaca_status.cache_hits, alpaca_status.cache_stale_hits, alpaca_status.cache_misses) == (1, 1, 1)
+
+    @patch("finbot.services.realtime_data.composite_provider.alpaca_provider")
+    @patch("finbot.services.realtime_data.composite_provider.twelvedata_provider")
+    @patch("finbot.services.realtime_data.composite_provider.yfinance_provider")
+    def test_without_grace_expired_quotes_are_fetched(
+        self, mock_yf: MagicMock, mock_td: MagicMock, mock_alpaca: MagicMock
+    ) -> None:
+        mock_alpaca.is_available.return_value = True
+        mock_alpaca.get_quote.return_value = _make_quote("SPY")
+
+        provider = CompositeQuoteProvider(cache_ttl=0.05)
+        provider.get_quote("SPY")
+        time.sleep(0.1)
+        provider.get_quote("SPY")
+
+        assert mock_alpaca.get_quote.call_count == 2
+
+
+class TestQuotePrefetcher:
+    """Tests for QuotePrefetcher subscriptions and refresh loop."""
+
+    def test_subscriptions_are_reference_counted(self) -> None:
+        prefetcher = QuotePrefetcher(MagicMock(cache=QuoteCache(ttl_seconds=10.0)))
+        prefetcher.subscribe(["SPY", "QQQ"])
+        prefetcher.subscribe(["SPY"])
+        prefetcher.unsubscribe(["SPY", "QQQ", "TLT"])
+
+        assert prefetcher.symbols == ["SPY"]
+        assert prefetcher.interval == pytest.approx(8.0)
+
+    def test_refresh_loop_refreshes_subscribed_symbols(self) -> None:
+        refreshed = threading.Event()
+        provider = MagicMock(cache=QuoteCache(ttl_seconds=10.0))
+        provider.arefresh = AsyncMock(side_effect=lambda symbols: refreshed.set() or {})
+
+        with QuotePrefetcher(provider, interval=0.01) as prefetcher:
+            prefetcher.subscribe(["SPY"])
+            assert refreshed.wait(timeout=2.0)
+        assert not prefetcher.is_running
+        provider.arefresh.assert_called_with(["SPY"])
+
+    def test_refresh_loop_runs_as_task(self) -> None:
+        provider = MagicMock(cache=QuoteCache(ttl_seconds=10.0))
+        provider.arefresh = AsyncMock(return_value={})
+        prefetcher = QuotePrefetcher(provider, interval=60.0)
+        prefetcher.subscribe(["SPY"])
+
+        async def start_and_stop() -> None:
+            prefetcher.start()
+            await asyncio.sleep(0.01)
+            assert prefetcher.is_running
+            await prefetcher.stop()
+
+        asyncio.run(start_and_stop())
+
+        assert not prefetcher.is_running
+        provider.arefresh.assert_awaited_once_with(["SPY"])
+
+    def test_refresh_now_skips_empty_watchlist(self) -> None:
+        provider = MagicMock(cache=QuoteCache())
+        provider.arefresh = AsyncMock()
+
+        assert asyncio.run(QuotePrefetcher(provider).refresh_now()) == {}
+        provider.arefresh.assert_not_called()
+
+    def test_leases_expire_unless_renewed(self) -> None:
+        now = [0.0]
+        prefetcher = QuotePrefetcher(MagicMock(cache=QuoteCache()), lease_ttl=60.0, clock=lambda: now[0])
+        prefetcher.subscribe(["SPY"])
+        prefetcher.renew("session-a", ["SPY", "QQQ"])
+        prefetcher.renew("session-b", ["TLT"])
+
+        now[0] = 50.0
+        prefetcher.renew("session-a", ["QQQ"])
+        assert prefetcher.symbols == ["SPY", "QQQ", "TLT"]
+
+        now[0] = 70.0
+        assert prefetcher.symbols == ["SPY", "QQQ"]
+
+        prefetcher.release("session-a")
+        assert prefetcher.symbols == ["SPY"]
+
+    def test_rejects_non_positive_lease_ttl(self) -> None:
+        with pytest.raises(ValueError, match="lease_ttl must be positive"):
+            QuotePrefetcher(MagicMock(cache=QuoteCache()), lease_ttl=0)
@@ -0,0 +1,255 @@
+"""Tests for push-based quote streaming: QuoteHub, subscriptions and the SSE/WebSocket endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+
+from finbot.core.contracts.models import OrderSide, OrderType
+from finbot.core.contracts.orders import Order, OrderStatus
+from finbot.core.contracts.realtime_data import Quote, QuoteProvider
+from finbot.services.execution.execution_simulator import ExecutionSimulator
+from finbot.services.realtime_data.quote_hub import QuoteHub, diff_quotes
+from web.backend.main import app
+from web.backend.routers import realtime_quotes as realtime_quotes_router
+
+_TIMESTAMP = datetime(2026, 2, 24, 15, 30, tzinfo=UTC)
+
+
+def _quote(symbol: str, price: float, **fields: object) -> Quote:
+    return Quote(symbol=symbol, price=price, timestamp=_TIMESTAMP, provider=QuoteProvider.ALPACA, **fields)
+
+
+class _FakeProvider:
+    """Stands in for CompositeQuoteProvider.arefresh, recording each poll."""
+
+    def __init__(self) -> None:
+        self.prices: dict[str, float] = {}
+        self.calls: list[list[str]] = []
+        self.lock = threading.Lock()
+
+    async def arefresh(self, symbols: Iterable[str]) -> dict[str, Quote]:
+        symbols = list(symbols)
+        with self.lock:
+            self.calls.append(sorted(symbols))
+            return {sym: _quote(sym, self.prices.get(sym, 100.0)) for sym in symbols}
+
+
+def _hub(provider: _FakeProvider | None = None, interval: float = 0.05) -> QuoteHub:
+    return QuoteHub(provider or _FakeProvider(), interval=interval)  # type: ignore[arg-type]
+
+
+class TestDiffQuotes:
+    """Tests for diff_quotes()."""
+
+    def test_first_message_is_full_snapshot(self) -> None:
+        diff = diff_quotes({}, {"SPY": _quote("SPY", 100.0, bid=99.9)})
+
+        assert diff["SPY"]["price"] == 100.0
+        assert diff["SPY"]["bid"] == 99.9
+        assert diff["SPY"]["provider"] == "ALPACA"
+        assert diff["SPY"]["timestamp"] == _TIMESTAMP.isoformat()
+        assert "symbol" not in diff["SPY"]
+
+    def test_only_changed_fields_are_sent(self) -> None:
+        sent = {"SPY": _quote("SPY", 100.0, bid=99.9), "QQQ": _quote("QQQ", 400.0)}
+        quotes = {"SPY": _quote("SPY", 100.5, bid=99.9), "QQQ": _quote("QQQ", 400.0)}
+
+        assert diff_quotes(sent, quotes) == {"SPY": {"price": 100.5}}
+
+
+class TestQuoteHub:
+    """Tests for QuoteHub publish/subscribe."""
+
+    def test_subscribers_receive_only_their_changed_symbols(self) -> None:
+        hub = _hub()
+        spy = hub.subscribe(["SPY"])
+        both = hub.subscribe(["SPY", "QQQ"])
+
+        assert hub.publish({"SPY": _quote("SPY", 1.0), "QQQ": _quote("QQQ", 2.0)}) == 3
+        assert set(spy.poll(0)) == {"SPY"}
+        assert set(both.poll(0)) == {"SPY", "QQQ"}
+
+        assert hub.publish({"SPY": _quote("SPY", 1.0), "QQQ": _quote("QQQ", 2.5)}) == 1
+        assert spy.poll(0) == {}
+        assert both.poll(0)["QQQ"].price == 2.5
+
+    def test_slow_subscriber_gets_latest_value_and_counts_drops(self) -> None:
+        hub = _hub()
+        sub = hub.subscribe(["SPY"])
+
+        for price in (1.0, 2.0, 3.0):
+            hub.publish({"SPY": _quote("SPY", price)})
+
+        assert sub.poll(0)["SPY"].price == 3.0
+        assert sub.dropped == 2
+        assert hub.stats().dropped == 2
+
+    def test_new_subscriber_gets_last_known_quotes(self) -> None:
+        hub = _hub()
+        hub.publish({"SPY": _quote("SPY", 1.0)})
+
+        sub = hub.subscribe(["SPY", "QQQ"])
+
+        assert set(sub.poll(0)) == {"SPY"}
+
+    def test_symbols_are_reference_counted(self) -> None:
+        hub = _hub()
+        first = hub.subscribe(["SPY", "QQQ"])
+        second = hub.subscribe(["SPY"])
+
+        first.close()
+        assert hub.symbols == ["SPY"]
+        second.set_symbols(["IWM"])
+        assert hub.symbols == ["IWM"]
+        second.close()
+        assert hub.symbols == []
+        assert hub.stats().subscribers == 0
+
+    def test_unsubscribing_discards_pending_quotes(self) -> None:
+        hub = _hub()
+        sub = hub.subscribe(["SPY", "QQQ"])
+        hub.publish({"SPY": _quote("SPY", 1.0), "QQQ": _quote("QQQ", 2.0)})
+
+        sub.set_symbols(["SPY"])
+
+        assert set(sub.poll(0)) == {"SPY"}
+        hub.publish({"QQQ": _quote("QQQ", 2.5)})
+        assert sub.poll(0) == {}
+
+    def test_closed_subscription_wakes_blocked_reader(self) -> None:
+        sub = _hub().subscribe(["SPY"])
+        threading.Timer(0.05, sub.close).start()
+
+        assert sub.poll(timeout=5.0) == {}
+        assert sub.closed
+
+    def test_many_subscribers_share_one_poll_per_tick(self) -> None:
+        provider = _FakeProvider()
+        hub = _hub(provider, interval=60.0)
+        symbols = [f"S{i:03d}" for i in range(100)]
+
+        async def main() -> list[dict[str, Quote]]:
+            subscriptions = [hub.subscribe(symbols) for _ in range(10)]
+            hub.start()
+            received = await asyncio.gather(*(sub.get() for sub in subscriptions))
+            await hub.stop()
+            return received
+
+        received = asyncio.run(main())
+
+        assert all(len(quotes) == 100 for quotes in received)
+        assert provider.calls == [sorted(symbols)]
+        assert hub.stats().polls == 1
+
+    def test_new_symbol_is_polled_without_waiting_for_the_tick(self) -> None:
+        provider = _FakeProvider()
+        hub = _hub(provider, interval=60.0)
+
+        async def main() -> dict[str, Quote]:
+            hub.subscribe(["SPY"])
+            hub.start()
+            await asyncio.sleep(0.05)
+            quotes = await asyncio.wait_for(hub.subscribe(["QQQ"]).get(), timeout=5.0)
+            await hub.stop()
+            return quotes
+
+        assert set(asyncio.run(main())) == {"QQQ"}
+        assert provider.calls == [["SPY"], ["QQQ", "SPY"]]
+
+    def test_rejects_non_positive_interval(self) -> None:
+        with pytest.raises(ValueError, match="interval must be positive"):
+            _hub(interval=0)
+
+
+def test_thread_hub_drives_paper_trading() -> None:
+    provider = _FakeProvider()
+    provider.prices["SPY"] = 450.0
+    hub = _hub(provider)
+    simulator = ExecutionSimulator(initial_cash=Decimal("100000"), slippage_bps=Decimal("0"))
+    simulator.submit_order(
+        Order(
+            order_id="order-001",
+            symbol="SPY",
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            quantity=Decimal("10"),
+            created_at=datetime.now(),
+        )
+    )
+
+    hub.start_in_thread()
+    try:
+        with hub.subscribe(["SPY"]) as sub:
+            executions = simulator.process_quotes(sub.poll(timeout=5.0))
+    finally:
+        hub.stop_in_thread(timeout=5.0)
+
+    assert [execution.price for execution in executions] == [Decimal("450.0")]
+    assert simulator.completed_orders["order-001"].status == OrderStatus.FILLED
+    assert simulator.positions["SPY"] == Decimal("10")
+    assert not hub.is_running
+
+
+class _Request:
+    def __init__(self, disconnect_after: int) -> None:
+        self.checks = 0
+        self.disconnect_after = disconnect_after
+
+    async def is_disconnected(self) -> bool:
+        self.checks += 1
+        return self.checks > self.disconnect_after
+
+
+def test_sse_events_send_diffs_and_keepalives() -> None:
+    hub = _hub()
+    sub = hub.subscribe(["SPY"])
+    hub.publish({"SPY": _quote("SPY", 1.0, bid=0.9)})
+
+    async def collect() -> list[str]:
+        events = realtime_quotes_router._sse_events(sub, _Request(disconnect_after=3), keepalive=0.01)  # type: ignore[arg-type]
+        messages = [await anext(events)]
+        hub.publish({"SPY": _quote("SPY", 2.0, bid=0.9)})
+        messages += [message async for message in events]
+        return messages
+
+    messages = asyncio.run(collect())
+
+    assert messages[0].startswith("event: quotes\ndata: ")
+    assert '"bid": 0.9' in messages[0]
+    assert messages[1] == 'event: quotes\ndata: {"SPY": {"price": 2.0}}\n\n'
+    assert messages[2] == ": keep-alive\n\n"
+    assert sub.closed
+
+
+def test_stream_requires_symbols() -> None:
+    response = TestClient(app).get("/api/realtime-quotes/stream", params={"symbols": " , "})
+
+    assert response.status_code == 422
+
+
+def test_websocket_pushes_diffs_and_accepts_subscriptions(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = _FakeProvider()
+    monkeypatch.setattr(realtime_quotes_router, "_hub", _hub(provider))
+
+    with TestClient(app) as client, client.websocket_connect("/api/realtime-quotes/ws?symbols=spy") as ws:
+        first = ws.receive_json()
+        assert first["type"] == "quotes"
+        assert first["quotes"]["SPY"]["price"] == 100.0
+
+        provider.prices["SPY"] = 101.0
+        assert ws.receive_json()["quotes"] == {"SPY": {"price": 101.0}}
+
+        ws.send_json({"action": "subscribe", "symbols": ["qqq"]})
+        assert set(ws.receive_json()["quotes"]) == {"QQQ"}
+
+        ws.send_json({"action": "bogus"})
+        assert ws.receive_json()["type"] == "error"
+
+    assert realtime_quotes_router.quote_hub_stats().subscribers == 0
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from itertools import pairwise
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -273,3 +275,119 @@ def test_regime_metrics_validation():
     # Invalid total_days
     with pytest.raises(ValueError, match="total_days must be non-negative"):
         RegimeMetrics(regime=MarketRegime.BULL, count_periods=1, total_days=-50, metrics={})
+
+
+def _loop_detect(df: pd.DataFrame, config: RegimeConfig) -> list[tuple]:
+    """Reference per-date loop (the previous implementation) as plain tuples."""
+    prices = df["Adj Close"] if "Adj Close" in df.columns else df["Close"]
+    returns = prices.pct_change()
+    rolling_returns = returns.rolling(window=config.lookback_days).mean() * 252
+    rolling_vol = returns.rolling(window=config.lookback_days).std() * (252**0.5)
+
+    periods: list[tuple] = []
+    current = None
+    for date in prices.index:
+        ret, vol = rolling_returns.loc[date], rolling_vol.loc[date]
+        if pd.isna(ret) or pd.isna(vol):
+            continue
+        if vol > config.volatility_threshold:
+            regime = MarketRegime.VOLATILE
+        elif ret > config.bull_threshold:
+            regime = MarketRegime.BULL
+        elif ret < config.bear_threshold:
+            regime = MarketRegime.BEAR
+        else:
+            regime = MarketRegime.SIDEWAYS
+        if current is None or regime != current[0]:
+            if current is not None:
+                periods.append((current[0], current[1], date - pd.Timedelta(days=1), current[2], current[3]))
+            current = (regime, date, [ret], [vol])
+        else:
+            current[2].append(ret)
+            current[3].append(vol)
+    if current is not None:
+        periods.append((current[0], current[1], prices.index[-1], current[2], current[3]))
+    return [(r, s, e, sum(rets) / len(rets), sum(vols) / len(vols)) for r, s, e, rets, vols in periods]
+
+
+def _as_tuples(periods) -> list[tuple]:
+    return [(p.regime, p.start, p.end, p.market_return, p.market_volatility) for p in periods]
+
+
+def _random_prices(seed: int, n_obs: int, volatility: float | list[float], columns: list[str]) -> pd.DataFrame:
+    """Random-walk business-day prices, one column per entry in ``columns``."""
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0004, volatility, (n_obs, len(columns)))
+    return pd.DataFrame(
+        100 * np.cumprod(1 + returns, axis=0),
+        index=pd.bdate_range("2018-01-01", periods=n_obs),
+        columns=columns,
+    )
+
+
+@pytest.mark.parametrize("volatility", [0.008, 0.015, 0.025])
+def test_vectorized_detect_matches_loop(volatility):
+    """Vectorized detection reproduces the per-date loop."""
+    df = _random_prices(7, 900, volatility, ["Close"])
+    config = RegimeConfig(bull_threshold=0.15, bear_threshold=-0.10, volatility_threshold=0.25, lookback_days=40)
+
+    actual = _as_tuples(SimpleRegimeDetector().detect(df, config))
+    expected = _loop_detect(df, config)
+
+    assert len(actual) > 3
+    assert [p[:3] for p in actual] == [p[:3] for p in expected]
+    np.testing.assert_allclose([p[3:] for p in actual], [p[3:] for p in expected], rtol=1e-12)
+
+
+def test_detect_batch_matches_single_ticker_detection():
+    """Batch detection over a wide frame equals detect() per ticker."""
+    wide = _random_prices(3, 600, [0.008, 0.012, 0.03], ["SPY", "QQQ", "TQQQ"])
+    config = RegimeConfig(lookback_days=60)
+    detector = SimpleRegimeDetector()
+
+    batch = detector.detect_batch(wide, config)
+    mapped = detector.detect_batch(
+        {ticker: wide[[ticker]].rename(columns={ticker: "Close"}) for ticker in wide}, config
+    )
+
+    assert list(batch) == ["SPY", "QQQ", "TQQQ"]
+    for ticker in wide:
+        single = detector.detect(wide[[ticker]].rename(columns={ticker: "Close"}), config)
+        assert batch[ticker] == single
+        assert mapped[ticker] == single
+
+
+def test_detect_batch_handles_unaligned_frames():
+    """Mapped frames with different indexes are detected individually."""
+    detector = SimpleRegimeDetector()
+    config = RegimeConfig(lookback_days=30)
+    long_df = _random_prices(1, 300, 0.01, ["Close"])
+    short_df = _random_prices(2, 120, 0.02, ["Close"])
+
+    result = detector.detect_batch({"LONG": long_df, "SHORT": short_df.iloc[5:]}, config)
+
+    assert result["LONG"] == detector.detect(long_df, config)
+    assert result["SHORT"] == detector.detect(short_df.iloc[5:], config)
+
+
+def test_detect_allows_one_day_periods():
+    """A regime lasting a single business day yields a period with start == end."""
+    df = _random_prices(0, 2000, 0.012, ["Close"])
+
+    periods = SimpleRegimeDetector().detect(df, RegimeConfig(lookback_days=252))
+
+    assert any(period.start == period.end for period in periods)
+    assert all(prev.end < cur.start for prev, cur in pairwise(periods))
+
+
+def test_segment_by_regime_accepts_detected_periods():
+    """Pre-detected periods give the same metrics without re-running detection."""
+    df = _random_prices(5, 300, 0.015, ["Close"])
+    config = RegimeConfig(lookback_days=40)
+    curve = df["Close"] * 10
+
+    periods = SimpleRegimeDetector().detect(df, config)
+    expected = segment_by_regime(None, df, config=config, equity_curve=curve)
+    actual = segment_by_regime(None, df, config=config, equity_curve=curve, periods=periods)
+
+    assert actual == expected
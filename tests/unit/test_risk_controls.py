@@ -6,6 +6,8 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
+import pytest
+
 from finbot.core.contracts.models import OrderSide, OrderType
 from finbot.core.contracts.orders import Order, OrderStatus, RejectionReason
 from finbot.core.contracts.risk import (
@@ -15,6 +17,8 @@ from finbot.core.contracts.risk import (
     RiskConfig,
 )
 from finbot.services.execution.execution_simulator import ExecutionSimulator
+from finbot.services.execution.ledger import NumericMode
+from finbot.services.execution.risk_checker import RiskChecker
 
 
 class TestPositionLimits:
@@ -451,3 +455,139 @@ class TestRiskStateTracking:
 
         # Peak should remain at 100k
         assert simulator.risk_checker.peak_value == Decimal("100000")
+
+
+def _market_order(symbol: str, side: OrderSide, quantity: str) -> Order:
+    return Order(
+        order_id=f"order-{uuid.uuid4().hex[:8]}",
+        symbol=symbol,
+        side=side,
+        order_type=OrderType.MARKET,
+        quantity=Decimal(quantity),
+        created_at=datetime.now(),
+    )
+
+
+class TestIncrementalRiskState:
+    """Test tracked exposure state in RiskChecker."""
+
+    @pytest.mark.parametrize("numeric_mode", [NumericMode.FLOAT, NumericMode.FIXED_POINT])
+    def test_tracked_exposure_matches_full_recompute(self, numeric_mode: NumericMode):
+        """Running gross/net exposure equals a full re-walk after fills and price moves."""
+        simulator = ExecutionSimulator(
+            initial_cash=Decimal("100000"),
+            risk_config=RiskConfig(exposure_limit=ExposureLimitRule(max_gross_exposure_pct=Decimal("200"))),
+            numeric_mode=numeric_mode,
+        )
+        simulator.positions = {"TLT": Decimal("-20")}
+        simulator.process_market_data_batch({"SPY": Decimal("450"), "QQQ": Decimal("380"), "TLT": Decimal("95")})
+        simulator.submit_order(_market_order("SPY", OrderSide.BUY, "40"))
+        simulator.submit_order(_market_order("QQQ", OrderSide.BUY, "25"))
+        simulator.process_market_data_batch({"SPY": Decimal("452.5"), "QQQ": Decimal("379.25")})
+        simulator.process_market_data("TLT", Decimal("96.1"))
+
+        checker = simulator.risk_checker
+        prices = simulator.last_prices
+        notionals = {symbol: float(qty * prices[symbol]) for symbol, qty in simulator.positions.items()}
+
+        assert checker.is_tracking
+        assert float(checker.gross_exposure) == pytest.approx(sum(abs(v) for v in notionals.values()))
+        assert float(checker.net_exposure) == pytest.approx(sum(notionals.values()))
+        assert float(checker.symbol_notional("TLT")) == pytest.approx(-20 * 96.1)
+        assert float(checker.portfolio_value) == pytest.approx(float(simulator.get_account_value()))
+
+    def test_decimal_mode_tracks_direct_position_edits(self):
+        """DECIMAL mode tracks state too; edits through ``positions`` update it."""
+        simulator = ExecutionSimulator(
+            initial_cash=Decimal("100000"),
+            risk_config=RiskConfig(position_limit=PositionLimitRule(max_shares=Decimal("100"))),
+        )
+        simulator.process_market_data("SPY", Decimal("100"))
+        simulator.positions["SPY"] = Decimal("95")
+
+        result = simulator.submit_order(_market_order("SPY", OrderSide.BUY, "10"))
+
+        assert simulator.risk_checker.is_tracking
+        assert result.rejection_reason == RejectionReason.RISK_POSITION_LIMIT
+        assert simulator.risk_checker.symbol_notional("SPY") == Decimal("9500")
+
+        del simulator.positions["SPY"]
+        assert simulator.risk_checker.gross_exposure == Decimal("0")
+        assert simulator.risk_checker.portfolio_value == simulator.get_account_value()
+
+    def test_marks_raise_peak_value(self):
+        """A mark-to-market gain raises the peak used for total drawdown."""
+        simulator = ExecutionSimulator(
+            initial_cash=Decimal("1000"),
+            risk_config=RiskConfig(drawdown_limit=DrawdownLimitRule(max_total_drawdown_pct=Decimal("10"))),
+        )
+        simulator.positions["SPY"] = Decimal("10")
+        simulator.process_market_data("SPY", Decimal("100"))
+        simulator.process_market_data("SPY", Decimal("150"))
+
+        assert simulator.risk_checker.peak_value == Decimal("2500")
+
+        simulator.process_market_data("SPY", Decimal("120"))
+        result = simulator.submit_order(_market_order("SPY", OrderSide.BUY, "1"))
+
+        assert result.rejection_reason == RejectionReason.RISK_DRAWDOWN_LIMIT
+
+    def test_untracked_check_requires_state(self):
+        """Checking without account state needs track_state() first."""
+        checker = RiskChecker(RiskConfig())
+
+        with pytest.raises(ValueError, match="not tracked"):
+            checker.check_order(_market_order("SPY", OrderSide.BUY, "1"))
+
+
+class TestBatchRiskChecks:
+    """Test RiskChecker.check_orders basket evaluation."""
+
+    def test_basket_limits_apply_cumulatively(self):
+        """Each buy fits alone, but the basket may not exceed gross exposure."""
+        checker = RiskChecker(RiskConfig(exposure_limit=ExposureLimitRule(max_gross_exposure_pct=Decimal("50"))))
+        prices = {"SPY": Decimal("100"), "QQQ": Decimal("100"), "IWM": Decimal("100")}
+        basket = [
+            _market_order("SPY", OrderSide.BUY, "200"),
+            _market_order("QQQ", OrderSide.BUY, "200"),
+            _market_order("IWM", OrderSide.BUY, "200"),
+        ]
+
+        result = checker.check_orders(basket, {}, prices, Decimal("100000"))
+
+        assert result.accepted.tolist() == [True, True, False]
+        assert result.rejected.tolist() == [False, False, True]
+        assert result.rejections[2][0] == RejectionReason.RISK_EXPOSURE_LIMIT
+        for order in basket:
+            assert checker.check_order(order, {}, prices, Decimal("100000")) is None
+
+    def test_sells_release_exposure_for_later_buys(self):
+        """A rebalance with sells first frees exposure for the buys."""
+        checker = RiskChecker(RiskConfig(exposure_limit=ExposureLimitRule(max_gross_exposure_pct=Decimal("50"))))
+        positions = {"TLT": Decimal("400")}
+        prices = {"TLT": Decimal("100"), "SPY": Decimal("100")}
+        cash = Decimal("60000")
+
+        buy_only = checker.check_orders([_market_order("SPY", OrderSide.BUY, "300")], positions, prices, cash)
+        rebalance = checker.check_orders(
+            [_market_order("TLT", OrderSide.SELL, "300"), _market_order("SPY", OrderSide.BUY, "300")],
+            positions,
+            prices,
+            cash,
+        )
+
+        assert buy_only.accepted.tolist() == [False]
+        assert rebalance.accepted.tolist() == [True, True]
+
+    def test_simulator_check_orders_uses_tracked_state(self):
+        """Simulator basket checks work in tracked and untracked modes."""
+        risk_config = RiskConfig(position_limit=PositionLimitRule(max_shares=Decimal("100")))
+        basket = [_market_order("SPY", OrderSide.BUY, "60"), _market_order("SPY", OrderSide.BUY, "60")]
+
+        for numeric_mode in NumericMode:
+            simulator = ExecutionSimulator(
+                initial_cash=Decimal("100000"), risk_config=risk_config, numeric_mode=numeric_mode
+            )
+            assert simulator.check_orders(basket).accepted.tolist() == [True, False]
+
+        assert ExecutionSimulator(initial_cash=Decimal("100000")).check_orders(basket).accepted.all()
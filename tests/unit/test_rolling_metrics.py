@@ -8,7 +8,7 @@ import numpy as np
 import pytest
 
 from finbot.core.contracts.portfolio_analytics import RollingMetricsResult
-from finbot.services.portfolio_analytics.rolling import compute_rolling_metrics
+from finbot.services.portfolio_analytics.rolling import compute_rolling_metrics, rolling_statistics
 
 RNG = np.random.default_rng(seed=42)
 RETURNS = RNG.normal(0.0005, 0.01, 300)
@@ -146,3 +146,85 @@ class TestComputeRollingMetrics:
         result = compute_rolling_metrics(const, window=30, risk_free_rate=0.0)
         valid = [x for x in result.sharpe if not math.isnan(x)]
         assert all(x == pytest.approx(0.0) for x in valid)
+
+    def test_constant_nonzero_series_has_zero_volatility(self) -> None:
+        """Cumulative-sum rounding noise does not produce a spurious Sharpe."""
+        const = np.full(300, 0.0123)
+        result = compute_rolling_metrics(const, window=30, risk_free_rate=0.04)
+        valid_vol = [x for x in result.volatility if not math.isnan(x)]
+        valid_sharpe = [x for x in result.sharpe if not math.isnan(x)]
+        assert all(x == 0.0 for x in valid_vol)
+        assert all(x == 0.0 for x in valid_sharpe)
+
+
+def _naive_window_metrics(returns: np.ndarray, bench: np.ndarray, window: int, rf: float) -> dict[str, np.ndarray]:
+    """Reference per-window computation (the original O(n * window) loop)."""
+    n = len(returns)
+    excess = returns - rf / 252
+    wealth = np.cumprod(1 + returns)
+    out = {name: np.full(n, np.nan) for name in ("sharpe", "vol", "sortino", "drawdown", "beta", "corr")}
+    for i in range(window - 1, n):
+        w_ex = excess[i - window + 1 : i + 1]
+        w_b = bench[i - window + 1 : i + 1]
+        mu, sigma = w_ex.mean(), w_ex.std(ddof=1)
+        downside = np.sqrt(np.mean(np.minimum(w_ex, 0) ** 2))
+        out["sharpe"][i] = mu / sigma * np.sqrt(252)
+        out["vol"][i] = sigma * np.sqrt(252)
+        out["sortino"][i] = mu / downside * np.sqrt(252)
+        out["drawdown"][i] = wealth[i] / wealth[i - window + 1 : i + 1].max() - 1
+        out["beta"][i] = np.cov(w_ex, w_b, ddof=1)[0, 1] / np.var(w_b, ddof=1)
+        out["corr"][i] = np.corrcoef(w_ex, w_b)[0, 1]
+    return out
+
+
+class TestRollingStatistics:
+    """Tests for the O(n) rolling_statistics kernel."""
+
+    def test_matches_naive_window_loop(self) -> None:
+        """Cumulative-sum kernel matches per-window NumPy computations."""
+        naive = _naive_window_metrics(RETURNS, BENCHMARK, window=42, rf=0.04)
+        result = compute_rolling_metrics(RETURNS, window=42, benchmark_returns=BENCHMARK, risk_free_rate=0.04)
+
+        np.testing.assert_allclose(result.sharpe, naive["sharpe"], rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(result.volatility, naive["vol"], rtol=1e-9)
+        np.testing.assert_allclose(result.sortino, naive["sortino"], rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(result.drawdown, naive["drawdown"], atol=1e-12)
+        np.testing.assert_allclose(result.beta, naive["beta"], rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(result.correlation, naive["corr"], rtol=1e-9, atol=1e-12)
+
+    def test_2d_input_matches_per_series(self) -> None:
+        """Each column of a 2-D input matches the 1-D computation."""
+        matrix = np.column_stack([RETURNS, HIGH_VOL, BENCHMARK])
+        stats = rolling_statistics(matrix, window=30, benchmark_returns=BENCHMARK)
+
+        assert stats.sharpe.shape == (300, 3)
+        for col in range(3):
+            single = compute_rolling_metrics(matrix[:, col], window=30, benchmark_returns=BENCHMARK)
+            np.testing.assert_allclose(stats.sharpe[:, col], single.sharpe, rtol=1e-12)
+            np.testing.assert_allclose(stats.drawdown[:, col], single.drawdown, rtol=1e-12)
+            np.testing.assert_allclose(stats.beta[:, col], single.beta, rtol=1e-12)
+
+    def test_per_series_benchmark(self) -> None:
+        """A 2-D benchmark pairs one benchmark column with each series."""
+        returns = np.column_stack([RETURNS, HIGH_VOL])
+        benchmarks = np.column_stack([BENCHMARK, RETURNS])
+        stats = rolling_statistics(returns, window=30, benchmark_returns=benchmarks)
+
+        single = compute_rolling_metrics(HIGH_VOL, window=30, benchmark_returns=RETURNS)
+        np.testing.assert_allclose(stats.beta[:, 1], single.beta, rtol=1e-12)
+
+    def test_self_correlation_is_one(self) -> None:
+        """Series against itself has correlation 1 once the window is full."""
+        stats = rolling_statistics(RETURNS, window=30, benchmark_returns=RETURNS)
+        np.testing.assert_allclose(stats.correlation[29:, 0], 1.0)
+        assert np.isnan(stats.correlation[:29, 0]).all()
+
+    def test_incompatible_benchmark_shape_raises(self) -> None:
+        """Benchmark with a different number of series raises ValueError."""
+        with pytest.raises(ValueError, match="incompatible"):
+            rolling_statistics(np.zeros((100, 3)), window=10, benchmark_returns=np.zeros((100, 2)))
+
+    def test_window_longer_than_series_raises(self) -> None:
+        """Window longer than the series raises ValueError."""
+        with pytest.raises(ValueError, match="window must be between"):
+            rolling_statistics(np.zeros(20), window=21)
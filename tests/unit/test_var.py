@@ -7,11 +7,18 @@ import pytest
 from scipy import stats
 
 from finbot.core.contracts.risk_analytics import CVaRResult, VaRBacktestResult, VaRMethod, VaRResult
-from finbot.services.risk_analytics.var import compute_cvar, compute_var, var_backtest
+from finbot.services.risk_analytics.var import (
+    compute_cvar,
+    compute_var,
+    rolling_var,
+    var_backtest,
+    var_surface,
+)
 
 RNG = np.random.default_rng(seed=0)
 NORMAL_RETURNS = RNG.normal(0.001, 0.01, 500)
 GOOD_RETURNS = RNG.normal(0.005, 0.01, 500)  # positive expected return
+FAT_TAILED = np.round(RNG.standard_t(4, (400, 3)) * 0.01, 3)  # rounded: many tied returns
 
 
 class TestHistoricalVaR:
@@ -212,3 +219,106 @@ class TestVaRBacktest:
 
         with pytest.raises(ValueError, match="must not contain NaN or infinite"):
             var_backtest(returns)
+
+    @pytest.mark.parametrize("method", list(VaRMethod))
+    @pytest.mark.parametrize("window", [None, 60])
+    def test_matches_window_by_window_forecasts(self, method: VaRMethod, window: int | None) -> None:
+        """Violations match re-estimating compute_var on every training window."""
+        returns = FAT_TAILED[:, 0]
+        violations = 0
+        for i in range(100, len(returns)):
+            train = returns[:i] if window is None else returns[i - window : i]
+            violations += returns[i] < -compute_var(train, confidence=0.9, method=method).var
+
+        result = var_backtest(returns, confidence=0.9, method=method, min_history=100, window=window)
+
+        assert result.n_observations == len(returns) - 100
+        assert result.n_violations == violations
+
+
+class TestVaRSurface:
+    """Tests for the confidence x horizon VaR grid."""
+
+    @pytest.mark.parametrize("method", list(VaRMethod))
+    def test_cells_match_compute_var(self, method: VaRMethod) -> None:
+        """Every cell equals the corresponding compute_var call."""
+        surface = var_surface(FAT_TAILED, confidences=(0.9, 0.99), horizons=(1, 10), method=method)
+
+        assert surface.var.shape == (3, 2, 2)
+        for series in range(3):
+            for i, confidence in enumerate((0.9, 0.99)):
+                for j, horizon in enumerate((1, 10)):
+                    expected = compute_var(FAT_TAILED[:, series], confidence, method, horizon_days=horizon).var
+                    assert surface.var[series, i, j] == pytest.approx(expected, rel=1e-12)
+
+    def test_historical_cvar_matches_compute_cvar(self) -> None:
+        """Historical CVaR equals compute_cvar, scaled like VaR across horizons."""
+        surface = var_surface(FAT_TAILED, confidences=(0.95,), horizons=(1, 4))
+
+        for series in range(3):
+            expected = compute_cvar(FAT_TAILED[:, series], confidence=0.95).cvar
+            np.testing.assert_allclose(surface.cvar[series, 0], [expected, 2 * expected], rtol=1e-12)
+
+    def test_cvar_only_for_historical(self) -> None:
+        """Parametric surfaces carry no CVaR."""
+        assert var_surface(NORMAL_RETURNS, method="parametric").cvar is None
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"confidences": (0.95, 1.0)}, "confidence must be in"),
+            ({"horizons": (0,)}, "horizons must be >= 1"),
+            ({"horizons": (1.5,)}, "horizons must be"),
+            ({"confidences": ()}, "confidences must be"),
+        ],
+    )
+    def test_invalid_grid_raises(self, kwargs: dict, match: str) -> None:
+        """Invalid confidence levels and horizons raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            var_surface(NORMAL_RETURNS, **kwargs)
+
+
+class TestRollingVaR:
+    """Tests for rolling and expanding VaR forecasts."""
+
+    @pytest.mark.parametrize("window", [None, 40, 100])
+    def test_historical_matches_compute_var_and_cvar(self, window: int | None) -> None:
+        """Each forecast equals compute_var/compute_cvar on its training window, tied returns included."""
+        surface = rolling_var(FAT_TAILED, confidences=(0.9, 0.95, 0.99), window=window, min_history=30)
+        first = 30 if window is None else max(30, window)
+
+        assert surface.var.shape == (400, 3, 3, 1)
+        assert np.isnan(surface.var[:first]).all()
+        for t in range(first, 400, 3):
+            train = FAT_TAILED[:t] if window is None else FAT_TAILED[t - window : t]
+            for series in range(3):
+                for i, confidence in enumerate((0.9, 0.95, 0.99)):
+                    assert surface.var[t, series, i, 0] == compute_var(train[:, series], confidence).var
+                    cvar = compute_cvar(train[:, series], confidence).cvar
+                    assert surface.cvar[t, series, i, 0] == pytest.approx(cvar, rel=1e-12)
+
+    @pytest.mark.parametrize("method", ["parametric", "montecarlo"])
+    def test_moment_methods_match_compute_var(self, method: str) -> None:
+        """Parametric and Monte Carlo forecasts match compute_var on rolling windows."""
+        surface = rolling_var(FAT_TAILED, confidences=(0.95, 0.99), method=method, window=50, min_history=30)
+
+        for t in range(50, 400, 7):
+            for i, confidence in enumerate((0.95, 0.99)):
+                expected = compute_var(FAT_TAILED[t - 50 : t, 1], confidence, method).var
+                assert surface.var[t, 1, i, 0] == pytest.approx(expected, rel=1e-9)
+
+    def test_horizons_scale_by_square_root_of_time(self) -> None:
+        """Multi-day forecasts are the 1-day forecast times sqrt(horizon)."""
+        surface = rolling_var(NORMAL_RETURNS, horizons=(1, 4, 9), method="parametric", min_history=100)
+
+        np.testing.assert_allclose(surface.var[100:, 0, 0, 1:], surface.var[100:, 0, 0, :1] * [2, 3])
+
+    def test_montecarlo_rejects_multi_day_horizons(self) -> None:
+        """Rolling Monte Carlo forecasts are 1-day only."""
+        with pytest.raises(ValueError, match="1-day horizons only"):
+            rolling_var(NORMAL_RETURNS, horizons=(1, 5), method="montecarlo")
+
+    def test_window_longer_than_history_raises(self) -> None:
+        """A rolling window must leave at least one bar to forecast."""
+        with pytest.raises(ValueError, match="Need more than 500"):
+            rolling_var(NORMAL_RETURNS, window=500, min_history=30)
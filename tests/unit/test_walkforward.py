@@ -2,12 +2,67 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+from datetime import UTC, datetime
+
 import pandas as pd
 import pytest
 
-from finbot.core.contracts import BacktestRunRequest, WalkForwardConfig
+from finbot.core.contracts import BacktestRunMetadata, BacktestRunRequest, BacktestRunResult, WalkForwardConfig
 from finbot.services.backtesting.adapters.backtrader_adapter import BacktraderAdapter
-from finbot.services.backtesting.walkforward import generate_windows, run_walk_forward
+from finbot.services.backtesting.walkforward import WindowResultCache, generate_windows, run_walk_forward
+
+
+class _RecordingEngine:
+    """Engine stub that records requests and returns the window length as a metric."""
+
+    def __init__(self, config: str = "default"):
+        self.config = config
+        self.requests: list[BacktestRunRequest] = []
+
+    def cache_key(self) -> str:
+        return self.config
+
+    def run(self, request: BacktestRunRequest) -> BacktestRunResult:
+        self.requests.append(request)
+        metadata = BacktestRunMetadata(
+            run_id=f"run-{len(self.requests)}",
+            engine_name="stub",
+            engine_version="0",
+            strategy_name=request.strategy_name,
+            created_at=datetime.now(UTC),
+            config_hash="",
+            data_snapshot_id=request.data_snapshot_id or "",
+        )
+        assert request.start is not None and request.end is not None
+        return BacktestRunResult(metadata=metadata, metrics={"days": float((request.end - request.start).days)})
+
+
+def _stock_history(periods: int) -> pd.DataFrame:
+    dates = pd.bdate_range("2020-01-01", periods=periods)
+    prices = pd.Series(range(100, 100 + periods), index=dates, dtype=float)
+    return pd.DataFrame(
+        {
+            "Open": prices * 0.99,
+            "High": prices * 1.01,
+            "Low": prices * 0.98,
+            "Close": prices,
+            "Adj Close": prices,
+            "Volume": 1000000,
+        }
+    )
+
+
+def _stub_request(snapshot_id: str | None = "snap-test") -> BacktestRunRequest:
+    return BacktestRunRequest(
+        strategy_name="NoRebalance",
+        symbols=("STOCK",),
+        start=pd.Timestamp("2020-01-01"),
+        end=pd.Timestamp("2020-12-31"),
+        initial_cash=10000.0,
+        parameters={"equity_proportions": [1.0]},
+        data_snapshot_id=snapshot_id,
+    )
 
 
 def test_walkforward_config_validation():
@@ -271,3 +326,152 @@ def test_window_dates_validation():
         # All dates within overall range
         assert window.train_start >= start
         assert window.test_end <= end
+
+
+def test_run_walk_forward_parallel_matches_sequential():
+    """Process-pool execution returns the same per-window metrics in window order."""
+    df = _stock_history(200)
+    adapter = BacktraderAdapter(price_histories={"STOCK": df})
+    config = WalkForwardConfig(train_window=50, test_window=20, step_size=20, anchored=False)
+    request = BacktestRunRequest(
+        strategy_name="NoRebalance",
+        symbols=("STOCK",),
+        start=df.index[0],
+        end=df.index[-1],
+        initial_cash=10000.0,
+        parameters={"equity_proportions": [1.0]},
+    )
+
+    sequential = run_walk_forward(adapter, request, config, include_train=True)
+    parallel = run_walk_forward(adapter, request, config, include_train=True, max_workers=2)
+
+    assert [r.metrics for r in parallel.test_results] == [r.metrics for r in sequential.test_results]
+    assert [r.metrics for r in parallel.train_results] == [r.metrics for r in sequential.train_results]
+    assert parallel.summary_metrics == sequential.summary_metrics
+
+
+def test_run_walk_forward_window_requests_keep_base_fields():
+    """Window requests only replace the dates; parameters and snapshot ID carry over."""
+    engine = _RecordingEngine()
+    request = _stub_request()
+    config = WalkForwardConfig(train_window=100, test_window=20, step_size=20)
+
+    result = run_walk_forward(engine, request, config, include_train=True)
+
+    assert len(engine.requests) == 2 * len(result.windows)
+    assert [(r.start, r.end) for r in engine.requests[: len(result.windows)]] == [
+        (w.test_start, w.test_end) for w in result.windows
+    ]
+    assert all(r.parameters == request.parameters for r in engine.requests)
+    assert all(r.data_snapshot_id == "snap-test" for r in engine.requests)
+
+
+def test_run_walk_forward_reuses_cached_windows():
+    """A re-run with the same config and snapshot is served from the cache."""
+    engine = _RecordingEngine()
+    cache = WindowResultCache()
+    config = WalkForwardConfig(train_window=100, test_window=20, step_size=20, anchored=True)
+
+    first = run_walk_forward(engine, _stub_request(), config, include_train=True, cache=cache)
+    calls = len(engine.requests)
+    second = run_walk_forward(engine, _stub_request(), config, include_train=True, cache=cache)
+
+    assert len(engine.requests) == calls
+    assert cache.hits == calls
+    assert second.test_results == first.test_results
+    assert second.train_results == first.train_results
+
+
+def test_run_walk_forward_cache_distinguishes_snapshot_and_parameters():
+    """Changed data or parameters miss the cache; requests without a snapshot are not cached."""
+    engine = _RecordingEngine()
+    cache = WindowResultCache()
+    config = WalkForwardConfig(train_window=100, test_window=20, step_size=20)
+
+    n_windows = len(run_walk_forward(engine, _stub_request(), config, cache=cache).windows)
+    run_walk_forward(engine, _stub_request(snapshot_id="snap-other"), config, cache=cache)
+    run_walk_forward(engine, replace(_stub_request(), parameters={"equity_proportions": [0.5]}), config, cache=cache)
+    assert len(engine.requests) == 3 * n_windows
+
+    run_walk_forward(engine, _stub_request(snapshot_id=None), config, cache=cache)
+    run_walk_forward(engine, _stub_request(snapshot_id=None), config, cache=cache)
+    assert len(engine.requests) == 5 * n_windows
+    assert len(cache) == 3 * n_windows
+
+
+def test_run_walk_forward_cache_distinguishes_engine_config():
+    """Engines configured differently never share cached windows."""
+    cache = WindowResultCache()
+    config = WalkForwardConfig(train_window=100, test_window=20, step_size=20)
+    first, second = _RecordingEngine("zero-commission"), _RecordingEngine("flat-commission")
+
+    run_walk_forward(first, _stub_request(), config, cache=cache)
+    run_walk_forward(second, _stub_request(), config, cache=cache)
+
+    assert len(second.requests) == len(first.requests)
+    assert cache.hits == 0
+
+
+def test_run_walk_forward_skips_cache_for_engines_without_cache_key():
+    """An engine that cannot fingerprint its configuration is never cached."""
+
+    class _UnkeyedEngine:
+        def __init__(self) -> None:
+            self.inner = _RecordingEngine()
+
+        def run(self, request: BacktestRunRequest) -> BacktestRunResult:
+            return self.inner.run(request)
+
+    engine = _UnkeyedEngine()
+    cache = WindowResultCache()
+    config = WalkForwardConfig(train_window=100, test_window=20, step_size=20)
+
+    n_windows = len(run_walk_forward(engine, _stub_request(), config, cache=cache).windows)
+    run_walk_forward(engine, _stub_request(), config, cache=cache)
+
+    assert len(engine.inner.requests) == 2 * n_windows
+    assert len(cache) == 0
+
+
+def test_run_walk_forward_reports_progress_per_window():
+    """Progress is reported per window, with cached windows counted as already done."""
+    engine = _RecordingEngine()
+    cache = WindowResultCache()
+    config = WalkForwardConfig(train_window=100, test_window=20, step_size=20)
+    first: list[tuple[int, int]] = []
+    second: list[tuple[int, int]] = []
+
+    result = run_walk_forward(engine, _stub_request(), config, cache=cache, progress=lambda *p: first.append(p))
+    n = len(result.windows)
+    run_walk_forward(
+        engine, _stub_request(), config, include_train=True, cache=cache, progress=lambda *p: second.append(p)
+    )
+
+    assert first == [(done, n) for done in range(1, n + 1)]
+    assert second == [(done, 2 * n) for done in range(n + 1, 2 * n + 1)]
+
+
+def test_run_walk_forward_invalid_max_workers():
+    """max_workers must be positive."""
+    config = WalkForwardConfig(train_window=100, test_window=20, step_size=20)
+
+    with pytest.raises(ValueError, match="max_workers must be >= 1"):
+        run_walk_forward(_RecordingEngine(), _stub_request(), config, max_workers=0)
+
+
+def test_window_result_cache_evicts_least_recently_used():
+    """The cache keeps at most max_entries results, dropping the least recently used."""
+    engine = _RecordingEngine()
+    results = [engine.run(_stub_request()) for _ in range(3)]
+    cache = WindowResultCache(max_entries=2)
+    keys = [("cfg", "snap", pd.Timestamp("2020-01-01"), pd.Timestamp(f"2020-02-0{i + 1}")) for i in range(3)]
+
+    cache.put(keys[0], results[0])
+    cache.put(keys[1], results[1])
+    assert cache.get(keys[0]) is results[0]
+    cache.put(keys[2], results[2])
+
+    assert len(cache) == 2
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is results[0]
+    assert cache.get(keys[2]) is results[2]
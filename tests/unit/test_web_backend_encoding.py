@@ -0,0 +1,115 @@
+"""Tests for Accept-negotiated table encodings and response compression."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from fastapi.testclient import TestClient
+
+from web.backend.main import app
+from web.backend.routers import monte_carlo as monte_carlo_router
+from web.backend.services.encoding import (
+    ARROW_METADATA_KEY,
+    ARROW_STREAM_MEDIA_TYPE,
+    COLUMNAR_JSON_MEDIA_TYPE,
+    TableLayout,
+    frame_to_arrow_stream,
+    negotiate_layout,
+)
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, TableLayout.RECORDS),
+        ("", TableLayout.RECORDS),
+        ("*/*", TableLayout.RECORDS),
+        ("text/html", TableLayout.RECORDS),
+        (COLUMNAR_JSON_MEDIA_TYPE, TableLayout.COLUMNS),
+        (f"{ARROW_STREAM_MEDIA_TYPE}, application/json;q=0.5", TableLayout.ARROW),
+        (f"application/json;q=0.5, {ARROW_STREAM_MEDIA_TYPE}", TableLayout.ARROW),
+        (f"{COLUMNAR_JSON_MEDIA_TYPE};q=0.2, application/json", TableLayout.RECORDS),
+        (f"{COLUMNAR_JSON_MEDIA_TYPE}, {ARROW_STREAM_MEDIA_TYPE}", TableLayout.COLUMNS),
+        (f"{ARROW_STREAM_MEDIA_TYPE};q=bad", TableLayout.RECORDS),
+    ],
+)
+def test_negotiate_layout(accept: str | None, expected: TableLayout) -> None:
+    assert negotiate_layout(accept) is expected
+
+
+def test_frame_to_arrow_stream_round_trips_index_and_metadata() -> None:
+    frame = pd.DataFrame(
+        {"Value": [1.0, np.nan, 3.0], 7: [1, 2, 3]},
+        index=pd.DatetimeIndex(["2024-01-02", "2024-01-03", "2024-01-04"]),
+    )
+
+    table = pa.ipc.open_stream(frame_to_arrow_stream(frame, {"final": float("nan")})).read_all()
+
+    assert table.column_names == ["Value", "7", "date"]
+    decoded = table.to_pandas()
+    assert decoded.index.name == "date"
+    np.testing.assert_array_equal(decoded["Value"].to_numpy(), frame["Value"].to_numpy())
+    assert json.loads(table.schema.metadata[ARROW_METADATA_KEY]) == {"final": None}
+
+
+class TestMonteCarloLayouts:
+    """Test the layouts of /api/monte-carlo/run."""
+
+    N_SIMS, SIM_PERIODS = 200, 300
+
+    @pytest.fixture(autouse=True)
+    def _fake_simulation(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fake_simulator(**kwargs: object) -> pd.DataFrame:
+            rng = np.random.default_rng(0)
+            steps = 1.0 + rng.normal(0.0005, 0.01, (int(kwargs["n_sims"]), int(kwargs["sim_periods"])))
+            return pd.DataFrame(float(kwargs["start_price"]) * np.cumprod(steps, axis=1))
+
+        monkeypatch.setattr(monte_carlo_router, "get_history", lambda _ticker: pd.DataFrame())
+        monkeypatch.setattr(monte_carlo_router, "monte_carlo_simulator", fake_simulator)
+
+    def _post(self, **headers: str):
+        payload = {"ticker": "SPY", "sim_periods": self.SIM_PERIODS, "n_sims": self.N_SIMS, "start_price": 100}
+        response = client.post("/api/monte-carlo/run", json=payload, headers=headers)
+        assert response.status_code == 200
+        return response
+
+    def test_default_is_band_records(self) -> None:
+        body = self._post().json()
+
+        assert [band["label"] for band in body["bands"]] == ["p5", "p25", "p50", "p75", "p95"]
+        assert len(body["bands"][0]["values"]) == self.SIM_PERIODS
+
+    def test_columnar_json_matches_records(self) -> None:
+        records = self._post().json()
+        response = self._post(accept=COLUMNAR_JSON_MEDIA_TYPE)
+
+        assert response.headers["content-type"] == COLUMNAR_JSON_MEDIA_TYPE
+        assert "Accept" in response.headers["vary"].split(", ")
+        body = response.json()
+        assert body["bands"]["index"] == list(range(self.SIM_PERIODS))
+        assert body["bands"]["columns"] == {band["label"]: band["values"] for band in records["bands"]}
+        assert body["statistics"] == records["statistics"]
+
+    def test_arrow_stream_carries_bands_and_metadata(self) -> None:
+        records = self._post().json()
+        response = self._post(accept=ARROW_STREAM_MEDIA_TYPE)
+
+        assert response.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.column_names == ["p5", "p25", "p50", "p75", "p95", "period"]
+        assert table.column("p50").to_pylist() == pytest.approx(records["bands"][2]["values"])
+        metadata = json.loads(table.schema.metadata[ARROW_METADATA_KEY])
+        assert "bands" not in metadata
+        assert metadata["statistics"] == pytest.approx(records["statistics"])
+
+    def test_large_json_is_gzipped(self) -> None:
+        response = self._post(**{"accept-encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["sample_paths"]) == 50
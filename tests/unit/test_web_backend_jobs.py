@@ -0,0 +1,344 @@
+"""Tests for the background job manager and the /api/jobs router."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import Counter
+from typing import Any
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from web.backend.main import app
+from web.backend.routers import simulations as simulations_router
+from web.backend.services.jobs import (
+    InMemoryJobStore,
+    JobManager,
+    JobRejectedError,
+    JobStatus,
+    SQLiteJobStore,
+    get_job_manager,
+    report_progress,
+)
+
+TIMEOUT = 30
+
+
+def _echo_runner(kind: str, payload: dict[str, Any]) -> dict[str, Any]:
+    """Picklable runner: echo the payload, or fail like an endpoint would."""
+    report_progress(0.5, "halfway")
+    if payload.get("fail"):
+        raise HTTPException(status_code=400, detail="bad request")
+    return {"kind": kind, **payload}
+
+
+def _crashing_runner(kind: str, payload: dict[str, Any]) -> dict[str, Any]:
+    """Picklable runner whose worker process dies on ``{"crash": True}``."""
+    if payload.get("crash"):
+        os._exit(1)
+    return {"kind": kind, **payload}
+
+
+class _BlockingRunner:
+    """Runner that holds every job until released and tracks concurrency."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+        self.active: Counter[str] = Counter()
+        self.peak: Counter[str] = Counter()
+
+    def __call__(self, kind: str, payload: dict[str, Any]) -> dict[str, Any]:
+        with self._lock:
+            self.active[kind] += 1
+            self.peak[kind] = max(self.peak[kind], self.active[kind])
+        report_progress(0.25, "started")
+        self.release.wait(TIMEOUT)
+        with self._lock:
+            self.active[kind] -= 1
+        return {"kind": kind, **payload}
+
+
+@pytest.fixture
+def blocking() -> _BlockingRunner:
+    runner = _BlockingRunner()
+    yield runner
+    runner.release.set()
+
+
+def _thread_manager(runner=_echo_runner, **kwargs: Any) -> JobManager:
+    return JobManager(use_processes=False, runner=runner, **kwargs)
+
+
+class TestJobManager:
+    """Test queuing, deduplication, limits and storage."""
+
+    def test_runs_job_and_stores_result(self):
+        manager = _thread_manager()
+
+        job, deduplicated = manager.submit("monte-carlo", {"ticker": "SPY"})
+        finished = manager.wait(job.job_id, TIMEOUT)
+
+        assert not deduplicated
+        assert finished.status == JobStatus.SUCCEEDED
+        assert finished.progress == 1.0
+        assert finished.result == {"kind": "monte-carlo", "ticker": "SPY"}
+        manager.shutdown()
+
+    def test_failed_job_keeps_http_status(self):
+        manager = _thread_manager()
+
+        job, _ = manager.submit("backtest", {"fail": True})
+        finished = manager.wait(job.job_id, TIMEOUT)
+
+        assert finished.status == JobStatus.FAILED
+        assert (finished.error_status, finished.error) == (400, "bad request")
+        manager.shutdown()
+
+    def test_identical_in_flight_requests_are_deduplicated(self, blocking: _BlockingRunner):
+        manager = _thread_manager(blocking)
+
+        first, _ = manager.submit("optimizer", {"ticker": "SPY"})
+        again, deduplicated = manager.submit("optimizer", {"ticker": "SPY"})
+        other, other_deduplicated = manager.submit("optimizer", {"ticker": "QQQ"})
+
+        assert deduplicated and again.job_id == first.job_id
+        assert not other_deduplicated and other.job_id != first.job_id
+
+        blocking.release.set()
+        manager.wait(first.job_id, TIMEOUT)
+        rerun, rerun_deduplicated = manager.submit("optimizer", {"ticker": "SPY"})
+        assert not rerun_deduplicated and rerun.job_id != first.job_id
+        manager.shutdown()
+
+    def test_per_kind_limits_and_worker_bound(self, blocking: _BlockingRunner):
+        manager = _thread_manager(blocking, max_workers=3, kind_limits={"optimizer": 1})
+
+        optimizer_jobs = [manager.submit("optimizer", {"n": n})[0] for n in range(3)]
+        backtest_jobs = [manager.submit("backtest", {"n": n})[0] for n in range(3)]
+
+        statuses = [manager.get(job.job_id).status for job in optimizer_jobs + backtest_jobs]
+        # optimizer is limited to one job; the remaining two workers take backtests
+        assert statuses == ["running", "queued", "queued", "running", "running", "queued"]
+
+        blocking.release.set()
+        for job in optimizer_jobs + backtest_jobs:
+            assert manager.wait(job.job_id, TIMEOUT).status == JobStatus.SUCCEEDED
+        assert blocking.peak["optimizer"] == 1
+        manager.shutdown()
+
+    def test_rejects_submissions_beyond_pending_limit(self, blocking: _BlockingRunner):
+        manager = _thread_manager(blocking, max_workers=1, max_pending=2)
+        manager.submit("backtest", {"n": 1})
+        manager.submit("backtest", {"n": 2})
+
+        with pytest.raises(JobRejectedError, match="queue is full"):
+            manager.submit("backtest", {"n": 3})
+        # Joining an in-flight job is still allowed
+        assert manager.submit("backtest", {"n": 2})[1]
+        manager.shutdown(wait=False)
+
+    def test_running_job_reports_progress(self, blocking: _BlockingRunner):
+        manager = _thread_manager(blocking)
+
+        job, _ = manager.submit("walk-forward", {"n": 1})
+        for _ in range(1000):
+            running = manager.get(job.job_id)
+            if running.progress > 0:
+                break
+            threading.Event().wait(0.01)
+
+        assert (running.progress, running.message) == (0.25, "started")
+        manager.shutdown(wait=False)
+
+    def test_in_memory_store_evicts_oldest_finished_jobs(self):
+        manager = _thread_manager(store=InMemoryJobStore(max_jobs=2))
+        jobs = [manager.submit("backtest", {"n": n})[0] for n in range(3)]
+        for job in jobs:
+            manager.wait(job.job_id, TIMEOUT)
+
+        assert manager.get(jobs[0].job_id) is None
+        assert manager.get(jobs[2].job_id).status == JobStatus.SUCCEEDED
+        manager.shutdown()
+
+    def test_sqlite_store_keeps_results_and_fails_interrupted_jobs(self, tmp_path):
+        path = tmp_path / "jobs.sqlite"
+        manager = _thread_manager(store=SQLiteJobStore(path))
+        job, _ = manager.submit("bond-ladder", {"normalize": True})
+        manager.wait(job.job_id, TIMEOUT)
+        manager.shutdown()
+
+        store = SQLiteJobStore(path)
+        assert store.get(job.job_id).result == {"kind": "bond-ladder", "normalize": True}
+
+        blocking = _BlockingRunner()
+        crashed = _thread_manager(blocking, store=store)
+        unfinished, _ = crashed.submit("bond-ladder", {"normalize": False})
+
+        restarted = _thread_manager(store=SQLiteJobStore(path))
+        interrupted = restarted.get(unfinished.job_id)
+        assert interrupted.status == JobStatus.FAILED
+        assert interrupted.error_status == 503
+        blocking.release.set()
+        crashed.shutdown()
+
+    def test_sqlite_store_evicts_oldest_finished_jobs(self, tmp_path):
+        manager = _thread_manager(store=SQLiteJobStore(tmp_path / "jobs.sqlite", max_jobs=2))
+        jobs = [manager.submit("backtest", {"n": n})[0] for n in range(3)]
+        for job in jobs:
+            manager.wait(job.job_id, TIMEOUT)
+
+        assert manager.get(jobs[0].job_id) is None
+        assert manager.get(jobs[2].job_id).status == JobStatus.SUCCEEDED
+        manager.shutdown()
+
+    def test_sqlite_store_persists_progress_of_running_jobs(self, tmp_path, blocking: _BlockingRunner):
+        path = tmp_path / "jobs.sqlite"
+        manager = _thread_manager(blocking, store=SQLiteJobStore(path))
+
+        job, _ = manager.submit("walk-forward", {"n": 1})
+        for _ in range(1000):
+            if manager.get(job.job_id).progress > 0:
+                break
+            threading.Event().wait(0.01)
+
+        stored = SQLiteJobStore(path).get(job.job_id)
+        assert (stored.status, stored.progress, stored.message) == (JobStatus.RUNNING, 0.25, "started")
+        assert stored.payload == {"n": 1}
+        manager.shutdown(wait=False)
+
+    def test_process_pool_runs_jobs(self):
+        manager = JobManager(max_workers=1, runner=_echo_runner)
+
+        job, _ = manager.submit("monte-carlo", {"ticker": "SPY"})
+        failed, _ = manager.submit("monte-carlo", {"fail": True})
+
+        assert manager.wait(job.job_id, 60).result == {"kind": "monte-carlo", "ticker": "SPY"}
+        assert manager.wait(failed.job_id, 60).error_status == 400
+        manager.shutdown()
+
+    def test_crashed_worker_fails_its_job_and_is_replaced(self):
+        manager = JobManager(max_workers=1, runner=_crashing_runner)
+
+        crashed, _ = manager.submit("backtest", {"crash": True})
+        after, _ = manager.submit("backtest", {"n": 1})
+
+        failed = manager.wait(crashed.job_id, 60)
+        assert failed.status == JobStatus.FAILED
+        assert failed.error_status == 500
+        assert manager.wait(after.job_id, 60).result == {"kind": "backtest", "n": 1}
+        manager.shutdown()
+
+
+class TestJobsRouter:
+    """Test the /api/jobs endpoints."""
+
+    @pytest.fixture
+    def client(self):
+        managers: list[JobManager] = []
+
+        def use(manager: JobManager) -> TestClient:
+            managers.append(manager)
+            app.dependency_overrides[get_job_manager] = lambda: manager
+            return TestClient(app)
+
+        yield use
+        app.dependency_overrides.pop(get_job_manager, None)
+        for manager in managers:
+            manager.shutdown(wait=False)
+
+    def test_submit_poll_and_fetch_result(self, client):
+        manager = _thread_manager()
+        api = client(manager)
+
+        submitted = api.post("/api/jobs/monte-carlo", json={"ticker": "spy", "n_sims": 500})
+        assert submitted.status_code == 202
+        job_id = submitted.json()["job_id"]
+        manager.wait(job_id, TIMEOUT)
+
+        status = api.get(f"/api/jobs/{job_id}").json()
+        assert status["status"] == "succeeded"
+        result = api.get(f"/api/jobs/{job_id}/result").json()
+        # The payload is the validated request, defaults included
+        assert result == {
+            "kind": "monte-carlo",
+            "ticker": "spy",
+            "sim_periods": 252,
+            "n_sims": 500,
+            "start_price": None,
+            "seed": None,
+            "max_points": None,
+        }
+
+    def test_event_stream_ends_with_final_state(self, client):
+        manager = _thread_manager()
+        api = client(manager)
+        job_id = api.post("/api/jobs/monte-carlo", json={"ticker": "SPY"}).json()["job_id"]
+
+        with api.stream("GET", f"/api/jobs/{job_id}/events") as response:
+            body = "".join(response.iter_text())
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert body.rstrip().split("\n\n")[-1].startswith("event: succeeded\ndata: ")
+
+    def test_runs_real_endpoint_and_surfaces_http_errors(self, client, monkeypatch):
+        def broken_simulator(**_: object):
+            raise RuntimeError("no yield data")
+
+        monkeypatch.setattr(simulations_router, "bond_ladder_simulator", broken_simulator)
+        manager = JobManager(use_processes=False)
+        api = client(manager)
+
+        job_id = api.post("/api/jobs/bond-ladder", json={"compare_tickers": []}).json()["job_id"]
+        manager.wait(job_id, TIMEOUT)
+
+        response = api.get(f"/api/jobs/{job_id}/result")
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Bond ladder simulation failed: no yield data"
+
+    def test_unfinished_result_is_conflict(self, client, blocking: _BlockingRunner):
+        api = client(_thread_manager(blocking))
+        job_id = api.post("/api/jobs/walk-forward", json=_walk_forward_payload()).json()["job_id"]
+
+        assert api.get(f"/api/jobs/{job_id}/result").status_code == 409
+
+    def test_full_queue_returns_429(self, client, blocking: _BlockingRunner):
+        api = client(_thread_manager(blocking, max_workers=1, max_pending=1))
+        api.post("/api/jobs/monte-carlo", json={"ticker": "SPY"})
+
+        response = api.post("/api/jobs/monte-carlo", json={"ticker": "QQQ"})
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "5"
+
+    @pytest.mark.parametrize(
+        ("path", "payload", "status_code"),
+        [
+            ("/api/jobs/not-a-kind", {}, 404),
+            ("/api/jobs/monte-carlo", {"n_sims": 1}, 422),
+        ],
+    )
+    def test_rejects_unknown_kinds_and_invalid_requests(self, client, path, payload, status_code):
+        api = client(_thread_manager())
+
+        assert api.post(path, json=payload).status_code == status_code
+
+    def test_unknown_job_is_404(self, client):
+        api = client(_thread_manager())
+
+        assert api.get("/api/jobs/missing").status_code == 404
+        assert api.get("/api/jobs/missing/events").status_code == 404
+
+
+def _walk_forward_payload() -> dict[str, Any]:
+    return {
+        "tickers": ["SPY"],
+        "strategy": "NoRebalance",
+        "start_date": "2020-01-01",
+        "end_date": "2021-01-01",
+        "train_window": 126,
+        "test_window": 21,
+        "step_size": 21,
+    }
@@ -0,0 +1,201 @@
+"""Tests for the deterministic endpoint result cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from finbot.utils.data_collection_utils.yfinance import _yfinance_utils
+from web.backend.main import app
+from web.backend.routers import monte_carlo as monte_carlo_router
+from web.backend.routers import risk_analytics as risk_analytics_router
+from web.backend.schemas.monte_carlo import MonteCarloRequest
+from web.backend.schemas.risk_analytics import VaRRequest, VaRResponse
+from web.backend.services import result_cache as result_cache_module
+from web.backend.services.encoding import ARROW_STREAM_MEDIA_TYPE
+from web.backend.services.jobs import request_model
+from web.backend.services.result_cache import (
+    CachedResult,
+    ResultCache,
+    SQLiteResultStore,
+    etag_matches,
+    referenced_tickers,
+    result_key,
+)
+
+
+def _prices(n_obs: int = 300, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2020-01-01", periods=n_obs)
+    close = 100.0 * np.cumprod(1.0 + rng.normal(0.0003, 0.01, n_obs))
+    return pd.DataFrame({"Close": close, "Adj Close": close}, index=index)
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Stored SPY history the cache key can version."""
+    (tmp_path / "history").mkdir()
+    _prices().to_parquet(tmp_path / "history" / "SPY_history_1d.parquet")
+    monkeypatch.setattr(_yfinance_utils, "YFINANCE_DATA_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> ResultCache:
+    fresh = ResultCache(max_bytes=10**7)
+    monkeypatch.setattr(result_cache_module, "_cache", fresh)
+    return fresh
+
+
+class TestResultCache:
+    """Test the memory and disk tiers."""
+
+    def test_evicts_least_recently_used_within_byte_budget(self):
+        cache = ResultCache(max_bytes=25)
+        for key in "abc":
+            cache.put(key, CachedResult(body=b"x" * 10))
+
+        assert cache.get("a") is None
+        assert cache.get("c") == CachedResult(body=b"x" * 10)
+        stats = cache.stats()
+        assert (stats.entries, stats.size_bytes, stats.evictions) == (2, 20, 1)
+        assert (stats.hits, stats.misses, stats.hit_rate) == (1, 1, 0.5)
+
+    def test_oversized_body_skips_memory(self):
+        cache = ResultCache(max_bytes=5)
+        cache.put("a", CachedResult(body=b"too large"))
+
+        assert len(cache) == 0
+
+    def test_disk_tier_survives_restart_and_refills_memory(self, tmp_path: Path):
+        path = tmp_path / "results.sqlite"
+        first = ResultCache(max_bytes=100, disk=SQLiteResultStore(path, max_bytes=1000))
+        first.put("a", CachedResult(body=b"{}", vary="Accept"))
+
+        second = ResultCache(max_bytes=100, disk=SQLiteResultStore(path, max_bytes=1000))
+
+        assert second.get("a") == CachedResult(body=b"{}", vary="Accept")
+        assert second.get("a") is not None
+        assert (second.stats().disk_hits, second.stats().hits) == (1, 1)
+
+    def test_disk_tier_drops_least_recently_read_beyond_budget(self, tmp_path: Path):
+        store = SQLiteResultStore(tmp_path / "results.sqlite", max_bytes=25)
+        store.put("a", CachedResult(body=b"x" * 10))
+        store.put("b", CachedResult(body=b"x" * 10))
+        store.get("a")
+        store.put("c", CachedResult(body=b"x" * 10))
+
+        assert store.get("b") is None
+        assert store.get("a") is not None
+        assert store.get("c") is not None
+
+
+class TestKeys:
+    """Test cache keys and ETag matching."""
+
+    def test_referenced_tickers_are_normalized(self):
+        assert referenced_tickers(VaRRequest(ticker=" spy ")) == ["SPY"]
+        assert referenced_tickers(MonteCarloRequest(ticker="qqq")) == ["QQQ"]
+
+    def test_key_changes_with_request_params_and_price_file(self, data_dir: Path):
+        req = VaRRequest(ticker="SPY")
+        key = result_key("var", req)
+
+        assert result_key("var", VaRRequest(ticker="SPY", confidence=0.95)) == key
+        assert result_key("var", VaRRequest(ticker="SPY", confidence=0.99)) != key
+        assert result_key("var", req, {"accept": "arrow"}) != key
+        assert result_key("kelly", req) != key
+
+        path = data_dir / "history" / "SPY_history_1d.parquet"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert result_key("var", req) != key
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [(None, False), ('"abc"', True), ('W/"abc"', True), ('"x", "abc"', True), ("*", True), ('"x"', False)],
+    )
+    def test_etag_matches(self, header: str | None, expected: bool):
+        assert etag_matches(header, '"abc"') is expected
+
+
+class TestCachedEndpoints:
+    """Test cached routes over HTTP and direct calls."""
+
+    @pytest.fixture
+    def history_calls(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        calls: list[str] = []
+
+        def fake_get_history(ticker: str) -> pd.DataFrame:
+            calls.append(ticker)
+            return _prices()
+
+        monkeypatch.setattr(risk_analytics_router, "get_history", fake_get_history)
+        monkeypatch.setattr(monte_carlo_router, "get_history", fake_get_history)
+        return calls
+
+    def test_repeat_request_is_served_from_cache(self, data_dir: Path, cache: ResultCache, history_calls: list[str]):
+        client = TestClient(app)
+
+        first = client.post("/api/risk-analytics/var", json={"ticker": "SPY"})
+        second = client.post("/api/risk-analytics/var", json={"ticker": "SPY"})
+
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert "var" in first.json()["historical"]
+        assert first.headers["etag"] == second.headers["etag"]
+        assert len(history_calls) == 1
+        assert client.get("/api/health").json()["result_cache"]["hits"] == 1
+
+    def test_if_none_match_returns_not_modified(self, data_dir: Path, cache: ResultCache, history_calls: list[str]):
+        client = TestClient(app)
+        etag = client.post("/api/risk-analytics/var", json={"ticker": "SPY"}).headers["etag"]
+
+        response = client.post("/api/risk-analytics/var", json={"ticker": "SPY"}, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert len(history_calls) == 1
+
+    def test_refreshed_price_file_invalidates(self, data_dir: Path, cache: ResultCache, history_calls: list[str]):
+        client = TestClient(app)
+        etag = client.post("/api/risk-analytics/var", json={"ticker": "SPY"}).headers["etag"]
+        _prices(n_obs=301).to_parquet(data_dir / "history" / "SPY_history_1d.parquet")
+
+        response = client.post("/api/risk-analytics/var", json={"ticker": "SPY"}, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert len(history_calls) == 2
+
+    def test_direct_call_returns_model_and_shares_cache(
+        self, data_dir: Path, cache: ResultCache, history_calls: list[str]
+    ):
+        TestClient(app).post("/api/risk-analytics/var", json={"ticker": "SPY"})
+
+        result = risk_analytics_router.compute_var_endpoint(VaRRequest(ticker="SPY"))
+
+        assert isinstance(result, VaRResponse)
+        assert len(history_calls) == 1
+        assert request_model("monte-carlo") is MonteCarloRequest
+
+    def test_monte_carlo_is_cached_only_when_seeded(self, data_dir: Path, cache: ResultCache, history_calls: list[str]):
+        client = TestClient(app)
+        payload = {"ticker": "SPY", "sim_periods": 20, "n_sims": 100}
+
+        unseeded = client.post("/api/monte-carlo/run", json=payload)
+        seeded = [client.post("/api/monte-carlo/run", json={**payload, "seed": 7}) for _ in range(2)]
+        arrow = client.post(
+            "/api/monte-carlo/run", json={**payload, "seed": 7}, headers={"Accept": ARROW_STREAM_MEDIA_TYPE}
+        )
+
+        assert "etag" not in unseeded.headers
+        assert seeded[0].json() == seeded[1].json()
+        assert arrow.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+        assert arrow.headers["etag"] != seeded[0].headers["etag"]
+        assert len(history_calls) == 3
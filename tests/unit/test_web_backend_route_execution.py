@@ -0,0 +1,202 @@
+"""Tests for the route execution policy: offloaded handlers, worker pools and route latency."""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from web.backend.config import settings
+from web.backend.main import app
+from web.backend.routers import health_economics as health_economics_router
+from web.backend.schemas.health_economics import InterventionInput, QALYRequest
+from web.backend.services import route_execution
+from web.backend.services.result_cache import get_result_cache
+from web.backend.services.route_execution import (
+    CLIENT_CLOSED_REQUEST,
+    LatencyRecorder,
+    RouteExecutionMiddleware,
+    RoutePool,
+    offloaded,
+)
+
+_POOL = "test-route-execution"
+
+
+@offloaded(_POOL, timeout=30)
+def _work(seconds: float) -> dict[str, int]:
+    time.sleep(seconds)
+    return {"pid": os.getpid()}
+
+
+@offloaded(_POOL)
+def _reject(status: int) -> None:
+    raise HTTPException(status_code=status, detail="rejected")
+
+
+_initialized: dict[str, str] = {}
+
+
+def _remember(tag: str) -> None:
+    _initialized["tag"] = tag
+
+
+def _initialized_tag() -> dict[str, str]:
+    return dict(_initialized)
+
+
+def _crash() -> None:
+    os._exit(1)
+
+
+_WORK = f"{__name__}:_work"
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[RoutePool]:
+    pool = RoutePool(_POOL, 1, modules=(__name__,))
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def offloading(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(settings, "route_offload_enabled", True)
+    monkeypatch.setattr(settings, "route_pool_sizes", {_POOL: 1, "analytics": 1})
+    yield
+    route_execution.shutdown_route_pools()
+
+
+class TestRoutePool:
+    """Tests for RoutePool."""
+
+    def test_runs_handler_in_a_warm_worker(self, pool: RoutePool) -> None:
+        first = pool.run(_WORK, (0.0,), timeout=60)
+        second = pool.run(_WORK, (0.0,), timeout=60)
+
+        assert first["pid"] != os.getpid()
+        assert second == first
+        assert pool.stats().completed >= 2
+
+    def test_handler_http_errors_are_raised_in_the_caller(self, pool: RoutePool) -> None:
+        with pytest.raises(HTTPException) as excinfo:
+            pool.run(f"{__name__}:_reject", (418,), timeout=60)
+
+        assert excinfo.value.status_code == 418
+        assert excinfo.value.detail == "rejected"
+
+    def test_timeout_kills_and_replaces_the_worker(self, pool: RoutePool) -> None:
+        before = pool.run(_WORK, (0.0,), timeout=60)["pid"]
+
+        with pytest.raises(HTTPException) as excinfo:
+            pool.run(_WORK, (30.0,), timeout=0.3)
+
+        assert excinfo.value.status_code == 504
+        assert pool.run(_WORK, (0.0,), timeout=60)["pid"] != before
+        stats = pool.stats()
+        assert stats.timeouts == 1
+        assert stats.restarts == 1
+        assert stats.busy == 0
+
+    def test_cancelled_call_stops_waiting(self, pool: RoutePool) -> None:
+        checks = iter([False, False, True])
+        started = time.monotonic()
+
+        with pytest.raises(HTTPException) as excinfo:
+            pool.run(_WORK, (30.0,), timeout=60, cancelled=lambda: next(checks))
+
+        assert excinfo.value.status_code == CLIENT_CLOSED_REQUEST
+        assert time.monotonic() - started < 10
+        assert pool.stats().cancelled == 1
+
+    def test_runs_module_functions_after_the_initializer(self) -> None:
+        pool = RoutePool("test-initializer", 1, modules=(__name__,), initializer=_remember, initargs=("warm",))
+        try:
+            assert pool.run(f"{__name__}:_initialized_tag", timeout=60) == {"tag": "warm"}
+        finally:
+            pool.shutdown()
+
+    def test_crashed_worker_is_replaced(self) -> None:
+        pool = RoutePool("test-crash", 1, modules=(__name__,))
+        try:
+            with pytest.raises(HTTPException) as excinfo:
+                pool.run(f"{__name__}:_crash", timeout=60)
+
+            assert excinfo.value.status_code == 500
+            assert pool.run(_WORK, (0.0,), timeout=60)["pid"] != os.getpid()
+            assert pool.stats().restarts == 1
+        finally:
+            pool.shutdown()
+
+    def test_rejects_empty_pool(self) -> None:
+        with pytest.raises(ValueError, match="size must be >= 1"):
+            RoutePool("empty", 0)
+
+
+def test_offloaded_handler_runs_inline_outside_requests() -> None:
+    assert _work(0.0) == {"pid": os.getpid()}
+    assert _work.route_policy.pool == _POOL
+
+
+def test_offloaded_endpoint_times_out(offloading: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "route_timeouts", {"_work": 0.5})
+    test_app = FastAPI()
+    test_app.add_middleware(RouteExecutionMiddleware, recorder=LatencyRecorder())
+    test_app.get("/work")(_work)
+
+    response = TestClient(test_app).get("/work", params={"seconds": 30})
+
+    assert response.status_code == 504
+    assert route_execution.route_pool_stats()[0].timeouts == 1
+
+
+def test_offloaded_route_matches_inline_result(offloading: None) -> None:
+    req = QALYRequest(
+        intervention=InterventionInput(name="Statin", cost_per_year=500, utility_gain=0.02), seed=7, n_sims=200
+    )
+    expected = health_economics_router.run_qaly(req).model_dump(mode="json")
+    get_result_cache().clear()
+
+    response = TestClient(app).post("/api/health-economics/qaly", json=req.model_dump(mode="json"))
+
+    assert response.status_code == 200
+    assert response.json() == expected
+    stats = {pool.name: pool for pool in route_execution.route_pool_stats()}
+    assert stats["analytics"].completed == 1
+
+
+def test_health_reports_route_latency_and_pools() -> None:
+    client = TestClient(app)
+    for _ in range(3):
+        client.get("/api/health")
+
+    latency = {row["route"]: row for row in client.get("/api/health/routes").json()}
+
+    assert latency["GET /api/health"]["count"] >= 3
+    assert 0 < latency["GET /api/health"]["p50_ms"] <= latency["GET /api/health"]["max_ms"]
+    assert "route_pools" in client.get("/api/health").json()
+
+
+class TestLatencyRecorder:
+    """Tests for LatencyRecorder."""
+
+    def test_percentiles_cover_the_window(self) -> None:
+        recorder = LatencyRecorder(window=100)
+        for ms in range(1, 201):
+            recorder.record("GET /x", ms / 1000)
+
+        (latency,) = recorder.snapshot()
+
+        assert latency.count == 200
+        assert latency.p50_ms == 150.0
+        assert latency.p90_ms == 190.0
+        assert latency.p99_ms == 199.0
+        assert latency.max_ms == 200.0
+
+    def test_rejects_empty_window(self) -> None:
+        with pytest.raises(ValueError, match="window must be >= 1"):
+            LatencyRecorder(window=0)
@@ -9,11 +9,13 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from types import SimpleNamespace
 
+import numpy as np
 import pandas as pd
 import pytest
 from fastapi.testclient import TestClient
 
 from finbot.core.contracts.models import BacktestRunMetadata, BacktestRunResult
+from finbot.core.contracts.walkforward import WalkForwardResult
 from finbot.services.backtesting.experiment_registry import ExperimentRegistry
 from finbot.services.backtesting.snapshot_registry import DataSnapshotRegistry
 from web.backend.main import app
@@ -22,6 +24,7 @@ from web.backend.routers import experiments as experiments_router
 from web.backend.routers import monte_carlo as monte_carlo_router
 from web.backend.routers import optimizer as optimizer_router
 from web.backend.routers import simulations as simulations_router
+from web.backend.routers import walkforward as walkforward_router
 
 client = TestClient(app)
 
@@ -488,10 +491,58 @@ class TestSimulationsRouter:
         assert body["metrics"][0]["start_value"] == pytest.approx(100.0)
         assert len(body["metrics"]) == 3
 
+    def test_bond_ladder_route_downsamples_series_but_not_metrics(self, monkeypatch: pytest.MonkeyPatch):
+        def fake_bond_ladder_simulator(**_kwargs: object) -> pd.DataFrame:
+            return _make_ohlcv_frame(100.0, periods=600, step=0.5)[["Close"]]
+
+        monkeypatch.setattr(simulations_router, "bond_ladder_simulator", fake_bond_ladder_simulator)
+
+        response = client.post(
+            "/api/simulations/bond-ladder/run",
+            json={"min_maturity_years": 1, "max_maturity_years": 5, "compare_tickers": [], "max_points": 50},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["series"][0]["dates"]) == 50
+        assert body["series"][0]["values"][-1] == pytest.approx(100.0 * (1 + 599 * 0.5 / 100.0))
+        assert body["metrics"][0]["end_value"] == pytest.approx(body["series"][0]["values"][-1])
+
+    def test_bond_ladder_route_rejects_tiny_max_points(self):
+        response = client.post(
+            "/api/simulations/bond-ladder/run",
+            json={"min_maturity_years": 1, "max_maturity_years": 5, "max_points": 2},
+        )
+
+        assert response.status_code == 422
+
 
 class TestMonteCarloRouter:
     """Test Monte Carlo research endpoints."""
 
+    def test_single_asset_route_downsamples_bands_and_paths_together(self, monkeypatch: pytest.MonkeyPatch):
+        def fake_simulator(**kwargs: object) -> pd.DataFrame:
+            rng = np.random.default_rng(1)
+            steps = 1.0 + rng.normal(0.0, 0.01, (int(kwargs["n_sims"]), int(kwargs["sim_periods"])))
+            return pd.DataFrame(100.0 * np.cumprod(steps, axis=1))
+
+        monkeypatch.setattr(monte_carlo_router, "get_history", lambda _ticker: pd.DataFrame())
+        monkeypatch.setattr(monte_carlo_router, "monte_carlo_simulator", fake_simulator)
+        payload = {"ticker": "SPY", "sim_periods": 2520, "n_sims": 100}
+
+        full = client.post("/api/monte-carlo/run", json=payload).json()
+        body = client.post("/api/monte-carlo/run", json={**payload, "max_points": 200}).json()
+
+        assert len(full["periods"]) == 2520
+        assert len(body["periods"]) <= 200
+        assert body["periods"][0] == 0
+        assert body["periods"][-1] == 2519
+        assert all(len(band["values"]) == len(body["periods"]) for band in body["bands"])
+        assert all(len(path) == len(body["periods"]) for path in body["sample_paths"])
+        median = dict(zip(full["periods"], full["bands"][2]["values"], strict=True))
+        assert body["bands"][2]["values"] == [median[period] for period in body["periods"]]
+        assert body["statistics"] == full["statistics"]
+
     def test_multi_asset_route_returns_correlated_portfolio_payload(self, monkeypatch: pytest.MonkeyPatch):
         captured_kwargs: dict[str, object] = {}
 
@@ -609,6 +660,8 @@ class TestOptimizerRouter:
         assert len(body["pareto_front"]) == 2
         assert len(body["dominated_points"]) == 1
         assert {point["strategy_name"] for point in body["pareto_front"]} == {"NoRebalance", "RiskParity"}
+        assert {point["pareto_rank"] for point in body["pareto_front"]} == {1}
+        assert body["dominated_points"][0]["pareto_rank"] == 2
         assert body["warnings"] == []
 
     def test_efficient_frontier_route_returns_highlighted_portfolios(self, monkeypatch: pytest.MonkeyPatch):
@@ -629,20 +682,82 @@ class TestOptimizerRouter:
                 "start_date": "2020-01-01",
                 "end_date": "2020-12-31",
                 "risk_free_rate": 0.02,
-                "n_portfolios": 200,
+                "n_points": 20,
+                "max_weight": 0.6,
             },
         )
 
         assert response.status_code == 200
         body = response.json()
-        assert len(body["portfolios"]) == 200
-        assert len(body["frontier"]) >= 1
+        assert len(body["frontier"]) == 20
+        assert len(body["turning_points"]) >= 2
+        assert max(max(point["weights"].values()) for point in body["frontier"]) <= 0.6 + 1e-12
         assert set(body["max_sharpe"]["weights"].keys()) == {"SPY", "TLT", "GLD"}
         assert set(body["min_volatility"]["weights"].keys()) == {"SPY", "TLT", "GLD"}
         assert len(body["asset_stats"]) == 3
         assert set(body["correlation_matrix"].keys()) == {"SPY", "TLT", "GLD"}
 
 
+class TestWalkForwardRouter:
+    """Test walk-forward execution and snapshot identification."""
+
+    def test_windows_run_serially_with_shared_cache(self, monkeypatch: pytest.MonkeyPatch):
+        calls: list[dict[str, object]] = []
+
+        def fake_run_walk_forward(**kwargs: object) -> WalkForwardResult:
+            calls.append(kwargs)
+            return WalkForwardResult(
+                config=kwargs["config"], windows=(), test_results=(), summary_metrics={"sharpe": 1.0}
+            )
+
+        monkeypatch.setattr(walkforward_router, "get_history", lambda _: _make_ohlcv_frame(100.0))
+        monkeypatch.setattr(walkforward_router, "run_walk_forward", fake_run_walk_forward)
+
+        response = client.post(
+            "/api/walk-forward/run",
+            json={
+                "tickers": ["SPY"],
+                "strategy": "NoRebalance",
+                "start_date": "2020-01-01",
+                "end_date": "2020-03-01",
+                "train_window": 21,
+                "test_window": 5,
+                "step_size": 5,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["summary_metrics"] == {"sharpe": 1.0}
+        (kwargs,) = calls
+        assert "max_workers" not in kwargs
+        assert kwargs["cache"] is walkforward_router._window_cache
+        assert callable(kwargs["progress"])
+
+    def test_snapshot_id_is_hashed_once_per_data_version(self, monkeypatch: pytest.MonkeyPatch):
+        versions = [[("SPY", 1, 100)]]
+        hashed: list[list[str]] = []
+
+        def counting_hash(symbols: list[str], data: dict[str, pd.DataFrame]) -> str:
+            hashed.append(symbols)
+            return f"snap-{len(hashed)}"
+
+        monkeypatch.setattr(walkforward_router, "get_history", lambda _: _make_ohlcv_frame(100.0))
+        monkeypatch.setattr(walkforward_router, "price_data_version", lambda _: versions[0])
+        monkeypatch.setattr(walkforward_router, "compute_snapshot_hash", counting_hash)
+        monkeypatch.setattr(walkforward_router, "_snapshot_ids", type(walkforward_router._snapshot_ids)())
+        start, end = pd.Timestamp("2020-01-01"), pd.Timestamp("2020-02-01")
+
+        first = walkforward_router._load_price_data(("SPY",), start, end)[1]
+        second = walkforward_router._load_price_data(("SPY",), start, end)[1]
+        versions[0] = [("SPY", 2, 120)]
+        rewritten = walkforward_router._load_price_data(("SPY",), start, end)[1]
+        versions[0] = [("SPY", None, None)]
+        unversioned = walkforward_router._load_price_data(("SPY",), start, end)[1]
+
+        assert (first, second, rewritten, unversioned) == ("snap-1", "snap-1", "snap-2", "snap-3")
+        assert len(hashed) == 3
+
+
 class TestPortfolioAnalyticsRouter:
     """Test portfolio analytics endpoint validation."""
 
@@ -10,7 +10,9 @@ import pandas as pd
 import pytest
 
 from web.backend.services.serializers import (
+    dataframe_to_columns,
     dataframe_to_records,
+    sanitize_array,
     sanitize_value,
     series_to_timeseries,
     stats_df_to_dict,
@@ -118,3 +120,27 @@ def test_stats_df_to_dict_uses_first_row_and_sanitizes_values() -> None:
 
 def test_stats_df_to_dict_empty_input_returns_empty_dict() -> None:
     assert stats_df_to_dict(pd.DataFrame()) == {}
+
+
+def test_sanitize_array_handles_each_dtype_kind() -> None:
+    assert sanitize_array(np.array([1.5, np.nan, np.inf])) == [1.5, None, None]
+    assert sanitize_array(np.array([1, 2], dtype=np.int32)) == [1, 2]
+    assert sanitize_array(np.array([True, False])) == [True, False]
+    assert sanitize_array(pd.DatetimeIndex(["2024-01-02", "2024-01-03 12:30"])) == [
+        "2024-01-02T00:00:00",
+        "2024-01-03T12:30:00",
+    ]
+    assert sanitize_array(np.array(["a", 1.0, np.nan], dtype=object)) == ["a", 1.0, None]
+
+
+def test_dataframe_to_columns_keeps_index_and_column_order() -> None:
+    frame = pd.DataFrame(
+        {"b": [1.0, np.nan], 3: [4, 5]},
+        index=pd.DatetimeIndex(["2024-01-02", "2024-01-03"]),
+    )
+
+    assert dataframe_to_columns(frame) == {
+        "index": ["2024-01-02T00:00:00", "2024-01-03T00:00:00"],
+        "columns": {"b": [1.0, None], "3": [4, 5]},
+    }
+    assert dataframe_to_columns(pd.DataFrame()) == {"index": [], "columns": {}}
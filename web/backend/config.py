@@ -1,5 +1,7 @@
 """Backend configuration via pydantic-settings."""
 
+import os
+
 from pydantic_settings import BaseSettings
 
 
@@ -10,6 +12,40 @@ class Settings(BaseSettings):
     port: int = 8000
     cors_origins: list[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
     debug: bool = False
+    # Responses smaller than this are sent uncompressed
+    gzip_minimum_size: int = 1024
+
+    # Background jobs (see web.backend.services.jobs)
+    job_max_workers: int = max(1, (os.cpu_count() or 2) - 1)
+    job_max_pending: int = 32
+    job_kind_limits: dict[str, int] = {"optimizer": 1, "pareto": 1, "walk-forward": 1}
+    job_use_processes: bool = True
+    job_store_path: str | None = None
+
+    # Results of deterministic endpoints (see web.backend.services.result_cache)
+    result_cache_max_bytes: int = 64 * 1024 * 1024
+    result_cache_path: str | None = None
+    result_cache_disk_max_bytes: int = 1024 * 1024 * 1024
+
+    # Realtime quotes: quotes up to this far past the 15 s TTL are served while
+    # refreshed in the background; watchlist symbols are kept warm continuously
+    realtime_quote_stale_grace_seconds: float = 15.0
+    realtime_quote_cache_max_entries: int = 10_000
+    realtime_watchlist: list[str] = []
+    # Streaming subscribers share one poll of their symbols per tick
+    realtime_stream_interval_seconds: float = 2.0
+    realtime_stream_keepalive_seconds: float = 15.0
+
+    # CPU-bound routes run on warm worker processes (see
+    # web.backend.services.route_execution): workers per pool (0 runs the
+    # pool's routes in the request thread) and timeouts by handler name,
+    # overriding the route's own
+    route_offload_enabled: bool = True
+    route_pool_sizes: dict[str, int] = {"backtest": 2, "optimizer": 1, "simulation": 1, "analytics": 2}
+    route_default_pool_size: int = 1
+    route_timeouts: dict[str, float] = {}
+    # Requests per route the latency percentiles cover
+    route_latency_window: int = 1024
 
     model_config = {"env_prefix": "FINBOT_API_"}
 
@@ -1,8 +1,14 @@
 """FastAPI application entry point."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
+from finbot.utils.pandas_utils.dataframe_cache import price_history_cache
 from web.backend.config import settings
 from web.backend.routers import (
     backtesting,
@@ -10,6 +16,7 @@ from web.backend.routers import (
     experiments,
     factor_analytics,
     health_economics,
+    jobs,
     monte_carlo,
     optimizer,
     portfolio_analytics,
@@ -18,11 +25,34 @@ from web.backend.routers import (
     simulations,
     walkforward,
 )
+from web.backend.services.jobs import shutdown_job_manager
+from web.backend.services.result_cache import get_result_cache
+from web.backend.services.route_execution import (
+    RouteExecutionMiddleware,
+    route_latency,
+    route_pool_stats,
+    shutdown_route_pools,
+    start_route_pools,
+)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Start route workers, quote prefetching and streaming; stop workers and quote clients on shutdown."""
+    start_route_pools()
+    realtime_quotes.start_quote_prefetcher()
+    realtime_quotes.start_quote_hub()
+    yield
+    shutdown_job_manager()
+    shutdown_route_pools()
+    await realtime_quotes.shutdown_quote_provider()
+
 
 app = FastAPI(
     title="Finbot API",
     description="Financial simulation, backtesting, and analysis API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -31,7 +61,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets the frontend revalidate cached results with If-None-Match
+    expose_headers=["ETag"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_minimum_size)
+app.add_middleware(RouteExecutionMiddleware)
 
 app.include_router(simulations.router, prefix="/api/simulations", tags=["simulations"])
 app.include_router(backtesting.router, prefix="/api/backtesting", tags=["backtesting"])
@@ -45,9 +79,28 @@ app.include_router(risk_analytics.router, prefix="/api/risk-analytics", tags=["r
 app.include_router(portfolio_analytics.router, prefix="/api/portfolio-analytics", tags=["portfolio-analytics"])
 app.include_router(realtime_quotes.router, prefix="/api/realtime-quotes", tags=["realtime-quotes"])
 app.include_router(factor_analytics.router, prefix="/api/factor-analytics", tags=["factor-analytics"])
+app.include_router(jobs.router, prefix="/api/jobs", tags=["jobs"])
 
 
 @app.get("/api/health")
-def health_check() -> dict[str, str]:
-    """Health check endpoint."""
-    return {"status": "ok"}
+async def health_check() -> dict[str, object]:
+    """Health check endpoint, with price history, result cache, quote stream and route worker metrics.
+
+    Async so it is answered from the event loop even while every request
+    thread is busy.
+    """
+    prices = price_history_cache.stats()
+    results = get_result_cache().stats()
+    return {
+        "status": "ok",
+        "price_history_cache": {**asdict(prices), "hit_rate": round(prices.hit_rate, 4)},
+        "result_cache": {**asdict(results), "hit_rate": round(results.hit_rate, 4)},
+        "quote_hub": asdict(realtime_quotes.quote_hub_stats()),
+        "route_pools": [asdict(stats) for stats in route_pool_stats()],
+    }
+
+
+@app.get("/api/health/routes")
+async def route_latency_check() -> list[dict[str, object]]:
+    """Latency percentiles of every route over its recent requests."""
+    return [asdict(latency) for latency in route_latency()]
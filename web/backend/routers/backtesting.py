@@ -4,12 +4,12 @@ from __future__ import annotations
 
 from collections import defaultdict
 from math import isclose
-from typing import Any
+from typing import Annotated, Any
 
 import backtrader as bt
 import numpy as np
 import pandas as pd
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
 
 from finbot.core.contracts.missing_data import MissingDataPolicy
 from finbot.core.contracts.regime import MarketRegime, RegimeConfig
@@ -41,6 +41,7 @@ from finbot.services.backtesting.strategies.sma_rebal_mix import SmaRebalMix
 from finbot.services.portfolio_analytics.benchmark import compute_benchmark_comparison
 from finbot.services.portfolio_analytics.rolling import compute_rolling_metrics
 from finbot.utils.data_collection_utils.yfinance.get_history import get_history
+from finbot.utils.data_science_utils.data_transformation.downsampling import downsample_frame
 from web.backend.schemas.backtesting import (
     AppliedBacktestCostAssumptions,
     BacktestBenchmarkStats,
@@ -63,7 +64,15 @@ from web.backend.schemas.backtesting import (
     WithdrawalDurabilitySummary,
 )
 from web.backend.schemas.portfolio_analytics import RollingMetricsResponse
-from web.backend.services.serializers import dataframe_to_records, sanitize_value, stats_df_to_dict
+from web.backend.services.encoding import TableLayout, negotiate_layout, table_response
+from web.backend.services.route_execution import offloaded
+from web.backend.services.serializers import (
+    dataframe_to_records,
+    nanmean_or_none,
+    sanitize_sequence,
+    sanitize_value,
+    stats_df_to_dict,
+)
 
 router = APIRouter()
 
@@ -753,28 +762,21 @@ def _build_rolling_metrics_response(
     except (ValueError, TypeError):
         return None
 
-    sharpe_arr = np.array(result.sharpe, dtype=float)
-    vol_arr = np.array(result.volatility, dtype=float)
-    mean_sharpe = sanitize_value(float(np.nanmean(sharpe_arr)))
-    mean_vol = sanitize_value(float(np.nanmean(vol_arr)))
-
-    mean_beta: float | None = None
-    beta_list: list[float | None] | None = None
-    if result.beta is not None:
-        beta_arr = np.array(result.beta, dtype=float)
-        beta_list = [sanitize_value(value) for value in result.beta]
-        mean_beta = sanitize_value(float(np.nanmean(beta_arr)))
-
     return RollingMetricsResponse(
         window=result.window,
         n_obs=result.n_obs,
-        sharpe=[sanitize_value(value) for value in result.sharpe],
-        volatility=[sanitize_value(value) for value in result.volatility],
-        beta=beta_list,
+        sharpe=sanitize_sequence(result.sharpe),
+        volatility=sanitize_sequence(result.volatility),
+        beta=sanitize_sequence(result.beta),
         dates=list(result.dates),
-        mean_sharpe=mean_sharpe,
-        mean_vol=mean_vol,
-        mean_beta=mean_beta,
+        mean_sharpe=nanmean_or_none(result.sharpe),
+        mean_vol=nanmean_or_none(result.volatility),
+        mean_beta=nanmean_or_none(result.beta),
+        sortino=sanitize_sequence(result.sortino),
+        drawdown=sanitize_sequence(result.drawdown),
+        correlation=sanitize_sequence(result.correlation),
+        mean_sortino=nanmean_or_none(result.sortino),
+        mean_correlation=nanmean_or_none(result.correlation),
     )
 
 
@@ -894,6 +896,7 @@ def _build_regime_response(
             detector=detector,
             config=config,
             equity_curve=equity_curve,
+            periods=periods,
         )
     except ValueError:
         return reference_ticker, [], []
@@ -1014,8 +1017,19 @@ def list_strategies() -> list[StrategyInfo]:
 
 
 @router.post("/run", response_model=BacktestResponse)
-def run_backtest(req: BacktestRequest) -> BacktestResponse:
-    """Run a backtest with the given configuration."""
+@offloaded("backtest", timeout=600)
+def run_backtest(
+    req: BacktestRequest,
+    accept: Annotated[str | None, Header()] = None,
+) -> BacktestResponse | Response:
+    """Run a backtest with the given configuration.
+
+    The value history is sent as row records by default, or columnar/Arrow
+    when the ``Accept`` header asks for it (see ``services.encoding``).  With
+    ``max_points`` set, only the value history is downsampled; statistics
+    use every day.
+    """
+    layout = negotiate_layout(accept)
     if req.strategy not in STRATEGIES:
         raise HTTPException(status_code=400, detail=f"Unknown strategy: {req.strategy}")
 
@@ -1075,7 +1089,8 @@ def run_backtest(req: BacktestRequest) -> BacktestResponse:
 
     # Serialize results
     stats = stats_df_to_dict(stats_df)
-    vh_records = dataframe_to_records(value_hist)
+    chart_hist = value_hist if req.max_points is None else downsample_frame(value_hist, req.max_points)
+    vh_records = dataframe_to_records(chart_hist) if layout is TableLayout.RECORDS else []
     monthly_returns = _build_period_return_table(value_hist, "M")
     annual_returns = _build_period_return_table(value_hist, "Y")
     benchmark_stats: BacktestBenchmarkStats | None = None
@@ -1153,7 +1168,7 @@ def run_backtest(req: BacktestRequest) -> BacktestResponse:
         value_history=value_hist,
     )
 
-    return BacktestResponse(
+    response = BacktestResponse(
         stats=stats,
         value_history=vh_records,
         trades=trades,
@@ -1175,3 +1190,4 @@ def run_backtest(req: BacktestRequest) -> BacktestResponse:
         annual_returns=annual_returns,
         walk_forward_request=walk_forward_request,
     )
+    return table_response(response, layout, field="value_history", table=chart_hist)
@@ -11,10 +11,14 @@ router = APIRouter()
 
 
 @router.get("/", response_model=DataStatusResponse)
-def get_data_status() -> DataStatusResponse:
-    """Check freshness of all data sources."""
+def get_data_status(rescan: bool = False) -> DataStatusResponse:
+    """Check freshness of all data sources.
+
+    Unchanged directories are answered from the data catalog; ``rescan``
+    re-checks every file.
+    """
     try:
-        statuses = check_all_freshness()
+        statuses = check_all_freshness(rescan=rescan)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to check data freshness: {e}") from e
 
@@ -37,6 +41,7 @@ def get_data_status() -> DataStatusResponse:
                 newest_file=s.newest_file.isoformat() if s.newest_file else None,
                 total_size_bytes=s.total_size_bytes,
                 max_age_days=s.source.max_age_days,
+                last_data_timestamp=s.last_data_timestamp.isoformat() if s.last_data_timestamp else None,
             )
         )
         total_files += s.file_count
@@ -19,6 +19,8 @@ from web.backend.schemas.factor_analytics import (
     RollingRSquaredRequest,
     RollingRSquaredResponse,
 )
+from web.backend.services.result_cache import cached_endpoint
+from web.backend.services.route_execution import offloaded
 from web.backend.services.serializers import sanitize_value
 
 router = APIRouter()
@@ -55,6 +57,8 @@ def _build_factor_df(factor_data: list[dict[str, float]], factor_names: list[str
 
 
 @router.post("/regression", response_model=FactorRegressionResponse)
+@cached_endpoint()
+@offloaded("analytics", timeout=120)
 def run_regression(req: FactorRegressionRequest) -> FactorRegressionResponse:
     """Run OLS factor regression on ticker returns."""
     returns = _load_returns(req.ticker, req.start_date, req.end_date)
@@ -87,6 +91,8 @@ def run_regression(req: FactorRegressionRequest) -> FactorRegressionResponse:
 
 
 @router.post("/attribution", response_model=FactorAttributionResponse)
+@cached_endpoint()
+@offloaded("analytics", timeout=120)
 def run_attribution(req: FactorRegressionRequest) -> FactorAttributionResponse:
     """Decompose portfolio return into per-factor contributions."""
     returns = _load_returns(req.ticker, req.start_date, req.end_date)
@@ -113,6 +119,8 @@ def run_attribution(req: FactorRegressionRequest) -> FactorAttributionResponse:
 
 
 @router.post("/risk-decomposition", response_model=FactorRiskResponse)
+@cached_endpoint()
+@offloaded("analytics", timeout=120)
 def run_risk_decomposition(req: FactorRegressionRequest) -> FactorRiskResponse:
     """Decompose portfolio variance into systematic and idiosyncratic components."""
     returns = _load_returns(req.ticker, req.start_date, req.end_date)
@@ -139,6 +147,8 @@ def run_risk_decomposition(req: FactorRegressionRequest) -> FactorRiskResponse:
 
 
 @router.post("/rolling-r-squared", response_model=RollingRSquaredResponse)
+@cached_endpoint()
+@offloaded("analytics", timeout=120)
 def run_rolling_r_squared(req: RollingRSquaredRequest) -> RollingRSquaredResponse:
     """Compute rolling-window R-squared for factor model fit over time."""
     returns = _load_returns(req.ticker, req.start_date, req.end_date)
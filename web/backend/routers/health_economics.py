@@ -23,6 +23,8 @@ from web.backend.schemas.health_economics import (
     TreatmentOptimizerRequest,
     TreatmentOptimizerResponse,
 )
+from web.backend.services.result_cache import cached_endpoint
+from web.backend.services.route_execution import offloaded
 from web.backend.services.serializers import dataframe_to_records, sanitize_value
 
 router = APIRouter()
@@ -61,7 +63,17 @@ def _percentiles(series: Any) -> dict[str, float]:
     }
 
 
+def _is_seeded(req: QALYRequest | TreatmentOptimizerRequest) -> bool:
+    return req.seed is not None
+
+
+def _all_seeded(req: CEARequest) -> bool:
+    return all(intervention.seed is not None for intervention in req.interventions)
+
+
 @router.post("/qaly", response_model=QALYResponse)
+@cached_endpoint(when=_is_seeded)
+@offloaded("analytics", timeout=120)
 def run_qaly(req: QALYRequest) -> QALYResponse:
     """Run QALY Monte Carlo simulation."""
     intervention = _intervention_from_input(req.intervention)
@@ -94,6 +106,8 @@ def run_qaly(req: QALYRequest) -> QALYResponse:
 
 
 @router.post("/cea", response_model=CEAResponse)
+@cached_endpoint(when=_all_seeded)
+@offloaded("analytics", timeout=120)
 def run_cea(req: CEARequest) -> CEAResponse:
     """Run cost-effectiveness analysis across multiple interventions."""
     sim_results: dict[str, dict] = {}
@@ -137,6 +151,8 @@ def run_cea(req: CEARequest) -> CEAResponse:
 
 
 @router.post("/treatment-optimizer", response_model=TreatmentOptimizerResponse)
+@cached_endpoint(when=_is_seeded)
+@offloaded("analytics", timeout=120)
 def run_treatment_optimizer(req: TreatmentOptimizerRequest) -> TreatmentOptimizerResponse:
     """Run treatment schedule optimization."""
     try:
@@ -165,6 +181,8 @@ def run_treatment_optimizer(req: TreatmentOptimizerRequest) -> TreatmentOptimize
 
 
 @router.post("/scenarios", response_model=ScenarioResponse)
+@cached_endpoint()
+@offloaded("analytics", timeout=120)
 def run_scenario(req: ScenarioRequest) -> ScenarioResponse:
     """Run a pre-built clinical scenario analysis."""
     if req.scenario not in SCENARIO_RUNNERS:
@@ -0,0 +1,113 @@
+"""Background job router.
+
+Long-running endpoints can be submitted as jobs under their kind (see
+``JOB_KINDS``) with the same request body.  Submission returns a job ID at
+once; progress is available from the status endpoint or as a Server-Sent
+Events stream, and the endpoint's response from the result endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
+
+from web.backend.schemas.jobs import JobStatusResponse, JobSubmitResponse
+from web.backend.services.jobs import Job, JobManager, JobRejectedError, JobStatus, get_job_manager, request_model
+
+router = APIRouter()
+
+SSE_POLL_SECONDS = 0.25
+RETRY_AFTER_SECONDS = 5
+
+
+def _status_response(job: Job) -> JobStatusResponse:
+    return JobStatusResponse(
+        job_id=job.job_id,
+        kind=job.kind,
+        status=str(job.status),
+        progress=job.progress,
+        message=job.message,
+        created_at=job.created_at.isoformat(),
+        started_at=job.started_at.isoformat() if job.started_at else None,
+        finished_at=job.finished_at.isoformat() if job.finished_at else None,
+        error=job.error,
+        error_status=job.error_status,
+    )
+
+
+def _get_job(manager: JobManager, job_id: str) -> Job:
+    job = manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
+@router.post("/{kind}", response_model=JobSubmitResponse, status_code=202)
+def submit_job(
+    kind: str,
+    payload: dict[str, Any] = Body(...),
+    manager: JobManager = Depends(get_job_manager),
+) -> JobSubmitResponse:
+    """Submit a long-running endpoint as a background job."""
+    try:
+        model = request_model(kind)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Unknown job kind: {kind}") from e
+
+    try:
+        request = model.model_validate(payload)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False)) from e
+
+    try:
+        job, deduplicated = manager.submit(kind, request.model_dump(mode="json"))
+    except JobRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(RETRY_AFTER_SECONDS)}) from e
+
+    return JobSubmitResponse(**_status_response(job).model_dump(), deduplicated=deduplicated)
+
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+def get_job_status(job_id: str, manager: JobManager = Depends(get_job_manager)) -> JobStatusResponse:
+    """Return a job's state and progress."""
+    return _status_response(_get_job(manager, job_id))
+
+
+@router.get("/{job_id}/result")
+def get_job_result(job_id: str, manager: JobManager = Depends(get_job_manager)) -> JSONResponse:
+    """Return a finished job's response, or the error it failed with."""
+    job = _get_job(manager, job_id)
+    if job.status == JobStatus.FAILED:
+        raise HTTPException(status_code=job.error_status or 500, detail=job.error)
+    if job.status != JobStatus.SUCCEEDED:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is still {job.status}")
+    return JSONResponse(job.result)
+
+
+async def _job_events(manager: JobManager, job_id: str) -> AsyncIterator[str]:
+    """Yield an SSE event for every state change until the job finishes."""
+    last: Job | None = None
+    while (job := manager.get(job_id)) is not None:
+        if job != last:
+            yield f"event: {job.status}\ndata: {_status_response(job).model_dump_json()}\n\n"
+            last = job
+        if job.status.is_finished:
+            return
+        await asyncio.sleep(SSE_POLL_SECONDS)
+
+
+@router.get("/{job_id}/events")
+def stream_job_events(job_id: str, manager: JobManager = Depends(get_job_manager)) -> StreamingResponse:
+    """Stream a job's status changes as Server-Sent Events."""
+    _get_job(manager, job_id)
+    return StreamingResponse(
+        _job_events(manager, job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Annotated, Any
 
 import numpy as np
 import pandas as pd
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
 
 from finbot.services.simulation.monte_carlo.monte_carlo_simulator import monte_carlo_simulator
 from finbot.services.simulation.monte_carlo.multi_asset_monte_carlo import multi_asset_monte_carlo
 from finbot.utils.data_collection_utils.yfinance.get_history import get_history
+from finbot.utils.data_science_utils.data_transformation.downsampling import downsample_frame_indices
 from web.backend.schemas.monte_carlo import (
     MonteCarloRequest,
     MonteCarloResponse,
@@ -20,7 +21,10 @@ from web.backend.schemas.monte_carlo import (
     MultiAssetWeight,
     PercentileBand,
 )
-from web.backend.services.serializers import sanitize_value
+from web.backend.services.encoding import negotiate_layout, table_response
+from web.backend.services.result_cache import cached_endpoint
+from web.backend.services.route_execution import offloaded
+from web.backend.services.serializers import sanitize_array, sanitize_value
 
 router = APIRouter()
 
@@ -28,9 +32,24 @@ MAX_SAMPLE_PATHS = 50
 PERCENTILES = [5, 25, 50, 75, 95]
 
 
+def _is_seeded(req: MonteCarloRequest) -> bool:
+    return req.seed is not None
+
+
 @router.post("/run", response_model=MonteCarloResponse)
-def run_monte_carlo(req: MonteCarloRequest) -> MonteCarloResponse:
-    """Run Monte Carlo simulation for a single asset."""
+@cached_endpoint(when=_is_seeded)
+@offloaded("simulation", timeout=300)
+def run_monte_carlo(
+    req: MonteCarloRequest,
+    accept: Annotated[str | None, Header()] = None,
+) -> MonteCarloResponse | Response:
+    """Run Monte Carlo simulation for a single asset.
+
+    Percentile bands are sent as ``PercentileBand`` lists by default, or
+    columnar/Arrow when the ``Accept`` header asks for it.  With
+    ``max_points`` set, bands and sample paths share the periods kept by
+    downsampling the bands; statistics use every period.
+    """
     try:
         price_df = get_history(req.ticker.upper())
     except Exception as e:
@@ -42,28 +61,21 @@ def run_monte_carlo(req: MonteCarloRequest) -> MonteCarloResponse:
             sim_periods=req.sim_periods,
             n_sims=req.n_sims,
             start_price=req.start_price,
+            seed=req.seed,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Monte Carlo simulation failed: {e}") from e
 
     trials = trials_df.values  # shape: (n_sims, sim_periods)
-    periods = list(range(trials.shape[1]))
-
-    # Compute percentile bands
-    bands: list[PercentileBand] = []
-    for p in PERCENTILES:
-        pct_vals = np.percentile(trials, p, axis=0)
-        bands.append(
-            PercentileBand(
-                label=f"p{p}",
-                values=[sanitize_value(v) for v in pct_vals],
-            )
-        )
+    bands_df = _percentile_bands(trials)
+    if req.max_points is not None:
+        bands_df = bands_df.iloc[downsample_frame_indices(bands_df, req.max_points)]
+    periods = bands_df.index.tolist()
 
     # Select sample paths (evenly spaced across simulations)
     n_paths = min(MAX_SAMPLE_PATHS, trials.shape[0])
     indices = np.linspace(0, trials.shape[0] - 1, n_paths, dtype=int)
-    sample_paths = [[sanitize_value(v) for v in trials[i]] for i in indices]
+    sample_paths = [sanitize_array(path) for path in trials[np.ix_(indices, periods)]]
 
     # Final value statistics
     final_values = trials[:, -1]
@@ -80,12 +92,13 @@ def run_monte_carlo(req: MonteCarloRequest) -> MonteCarloResponse:
         "prob_loss": sanitize_value(float(np.mean(final_values < trials[0, 0]))),
     }
 
-    return MonteCarloResponse(
+    response = MonteCarloResponse(
         periods=periods,
-        bands=bands,
+        bands=_bands_to_schema(bands_df),
         sample_paths=sample_paths,
         statistics=statistics,
     )
+    return table_response(response, negotiate_layout(accept), field="bands", table=bands_df)
 
 
 def _extract_returns_frame(price_data: dict[str, pd.DataFrame]) -> pd.DataFrame:
@@ -120,17 +133,18 @@ def _validate_multi_asset_request(req: MultiAssetMonteCarloRequest) -> tuple[lis
     return cleaned_tickers, dict(zip(cleaned_tickers, raw_weights, strict=True))
 
 
-def _build_portfolio_bands(portfolio_trials: np.ndarray) -> list[PercentileBand]:
-    portfolio_bands: list[PercentileBand] = []
-    for percentile in PERCENTILES:
-        values = np.percentile(portfolio_trials, percentile, axis=0)
-        portfolio_bands.append(
-            PercentileBand(
-                label=f"p{percentile}",
-                values=[sanitize_value(value) for value in values],
-            )
-        )
-    return portfolio_bands
+def _percentile_bands(trials: np.ndarray) -> pd.DataFrame:
+    """Percentiles of simulated values per period, one column per percentile."""
+    values = np.percentile(trials, PERCENTILES, axis=0)
+    return pd.DataFrame(
+        values.T,
+        index=pd.RangeIndex(trials.shape[1], name="period"),
+        columns=[f"p{percentile}" for percentile in PERCENTILES],
+    )
+
+
+def _bands_to_schema(bands: pd.DataFrame) -> list[PercentileBand]:
+    return [PercentileBand(label=label, values=sanitize_array(bands[label])) for label in bands.columns]
 
 
 def _build_portfolio_statistics(portfolio_trials: np.ndarray, *, start_value: float) -> dict[str, float | None]:
@@ -160,14 +174,14 @@ def _build_multi_asset_response(
     periods = list(range(portfolio_trials.shape[1]))
     n_paths = min(MAX_SAMPLE_PATHS, portfolio_trials.shape[0])
     indices = np.linspace(0, portfolio_trials.shape[0] - 1, n_paths, dtype=int)
-    sample_paths = [[sanitize_value(value) for value in portfolio_trials[index]] for index in indices]
+    sample_paths = [sanitize_array(portfolio_trials[index]) for index in indices]
 
     weights = result["weights"]
     returns_df = _extract_returns_frame(price_data)
     correlation = result["correlation"]
     return MultiAssetMonteCarloResponse(
         periods=periods,
-        portfolio_bands=_build_portfolio_bands(portfolio_trials),
+        portfolio_bands=_bands_to_schema(_percentile_bands(portfolio_trials)),
         portfolio_sample_paths=sample_paths,
         portfolio_statistics=_build_portfolio_statistics(portfolio_trials, start_value=start_value),
         weights=[
@@ -191,6 +205,7 @@ def _build_multi_asset_response(
 
 
 @router.post("/multi-asset/run", response_model=MultiAssetMonteCarloResponse)
+@offloaded("simulation", timeout=300)
 def run_multi_asset_monte_carlo(req: MultiAssetMonteCarloRequest) -> MultiAssetMonteCarloResponse:
     """Run correlated multi-asset Monte Carlo portfolio simulation."""
     cleaned_tickers, weight_map = _validate_multi_asset_request(req)
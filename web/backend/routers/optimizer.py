@@ -28,6 +28,9 @@ from web.backend.schemas.optimizer import (
     ParetoOptimizerResponse,
     ParetoPointResponse,
 )
+from web.backend.services.jobs import report_progress
+from web.backend.services.result_cache import cached_endpoint
+from web.backend.services.route_execution import offloaded
 from web.backend.services.serializers import dataframe_to_records, sanitize_value
 
 router = APIRouter()
@@ -141,17 +144,17 @@ def _run_strategy(
     return result
 
 
-def _portfolio_to_response(portfolio) -> EfficientFrontierPortfolioResponse:
+def _portfolio_to_response(result, portfolio) -> EfficientFrontierPortfolioResponse:
     return EfficientFrontierPortfolioResponse(
         expected_return=portfolio.expected_return,
         volatility=portfolio.volatility,
         sharpe_ratio=portfolio.sharpe_ratio,
-        weights=portfolio.weights,
+        weights=result.weight_map(portfolio),
     )
 
 
 def _build_pareto_point(
-    result: BacktestRunResult, *, objective_a: str, objective_b: str, is_front: bool
+    result: BacktestRunResult, *, objective_a: str, objective_b: str, is_front: bool, pareto_rank: int | None = None
 ) -> ParetoPointResponse:
     metrics = {key: sanitize_value(value) for key, value in result.metrics.items()}
     return ParetoPointResponse(
@@ -162,10 +165,12 @@ def _build_pareto_point(
         objective_a=float(result.metrics[objective_a]),
         objective_b=float(result.metrics[objective_b]),
         is_pareto_optimal=is_front,
+        pareto_rank=pareto_rank,
     )
 
 
 @router.post("/run", response_model=DCAOptimizerResponse)
+@offloaded("optimizer", timeout=900)
 def run_optimizer(req: DCAOptimizerRequest) -> DCAOptimizerResponse:
     """Run DCA optimizer grid search."""
     try:
@@ -186,6 +191,7 @@ def run_optimizer(req: DCAOptimizerRequest) -> DCAOptimizerResponse:
             start_step=req.start_step,
             save_df=False,
             analyze_results=False,
+            progress=lambda done, total: report_progress(done / total, f"{done}/{total} trials"),
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Optimizer failed: {e}") from e
@@ -203,6 +209,8 @@ def run_optimizer(req: DCAOptimizerRequest) -> DCAOptimizerResponse:
 
 
 @router.post("/pareto/run", response_model=ParetoOptimizerResponse)
+@cached_endpoint()
+@offloaded("optimizer", timeout=900)
 def run_pareto_optimizer(req: ParetoOptimizerRequest) -> ParetoOptimizerResponse:
     """Run a canonical strategy sweep and surface the Pareto-optimal frontier."""
     cleaned_tickers = [ticker.strip().upper() for ticker in req.tickers if ticker.strip()]
@@ -218,7 +226,8 @@ def run_pareto_optimizer(req: ParetoOptimizerRequest) -> ParetoOptimizerResponse
         raise HTTPException(status_code=400, detail=f"Failed to load price data: {exc}") from exc
 
     results: list[BacktestRunResult] = []
-    for strategy_name in req.strategies:
+    for done, strategy_name in enumerate(req.strategies):
+        report_progress(done / len(req.strategies), f"Running {strategy_name}")
         tickers_used, params, warning = _default_strategy_params(strategy_name, cleaned_tickers)
         if warning is not None:
             warnings.append(f"{strategy_name}: {warning}")
@@ -251,21 +260,22 @@ def run_pareto_optimizer(req: ParetoOptimizerRequest) -> ParetoOptimizerResponse
             objective_b=req.objective_b,
             maximize_a=req.maximize_a,
             maximize_b=req.maximize_b,
+            compute_ranks=True,
         )
     except KeyError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    front_names = {point.strategy_name for point in pareto.pareto_front}
     all_points = [
         _build_pareto_point(
             result,
             objective_a=req.objective_a,
             objective_b=req.objective_b,
-            is_front=result.metadata.strategy_name in front_names,
+            is_front=point.is_pareto_optimal,
+            pareto_rank=point.pareto_rank,
         )
-        for result in results
+        for result, point in zip(results, pareto.all_points, strict=True)
     ]
     pareto_front = [point for point in all_points if point.is_pareto_optimal]
     dominated_points = [point for point in all_points if not point.is_pareto_optimal]
@@ -282,6 +292,8 @@ def run_pareto_optimizer(req: ParetoOptimizerRequest) -> ParetoOptimizerResponse
 
 
 @router.post("/efficient-frontier/run", response_model=EfficientFrontierResponse)
+@cached_endpoint()
+@offloaded("optimizer", timeout=300)
 def run_efficient_frontier(req: EfficientFrontierRequest) -> EfficientFrontierResponse:
     """Compute a long-only efficient frontier from historical asset returns."""
     cleaned_tickers = [ticker.strip().upper() for ticker in req.tickers if ticker.strip()]
@@ -298,8 +310,9 @@ def run_efficient_frontier(req: EfficientFrontierRequest) -> EfficientFrontierRe
     try:
         result = compute_efficient_frontier(
             histories,
-            n_portfolios=req.n_portfolios,
+            n_points=req.n_points,
             risk_free_rate=req.risk_free_rate,
+            max_weight=req.max_weight,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -307,10 +320,10 @@ def run_efficient_frontier(req: EfficientFrontierRequest) -> EfficientFrontierRe
         raise HTTPException(status_code=500, detail=f"Efficient frontier failed: {exc}") from exc
 
     return EfficientFrontierResponse(
-        portfolios=[_portfolio_to_response(portfolio) for portfolio in result.portfolios],
-        frontier=[_portfolio_to_response(portfolio) for portfolio in result.frontier],
-        max_sharpe=_portfolio_to_response(result.max_sharpe),
-        min_volatility=_portfolio_to_response(result.min_volatility),
+        frontier=[_portfolio_to_response(result, portfolio) for portfolio in result.frontier],
+        turning_points=[_portfolio_to_response(result, portfolio) for portfolio in result.turning_points],
+        max_sharpe=_portfolio_to_response(result, result.max_sharpe),
+        min_volatility=_portfolio_to_response(result, result.min_volatility),
         asset_stats=[
             EfficientFrontierAssetStatResponse(
                 ticker=stat.ticker,
@@ -22,7 +22,8 @@ from web.backend.schemas.portfolio_analytics import (
     RollingMetricsRequest,
     RollingMetricsResponse,
 )
-from web.backend.services.serializers import sanitize_value
+from web.backend.services.route_execution import offloaded
+from web.backend.services.serializers import nanmean_or_none, sanitize_sequence, sanitize_value
 
 router = APIRouter()
 
@@ -58,6 +59,7 @@ def _load_returns(
 
 
 @router.post("/rolling", response_model=RollingMetricsResponse)
+@offloaded("analytics", timeout=120)
 def rolling_metrics(req: RollingMetricsRequest) -> RollingMetricsResponse:
     """Compute rolling Sharpe, volatility, and optionally beta."""
     returns_series = _load_returns(req.ticker, req.start_date, req.end_date)
@@ -88,36 +90,26 @@ def rolling_metrics(req: RollingMetricsRequest) -> RollingMetricsResponse:
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Rolling metrics computation failed: {e}") from e
 
-    sharpe_list = [sanitize_value(v) for v in result.sharpe]
-    vol_list = [sanitize_value(v) for v in result.volatility]
-    beta_list = [sanitize_value(v) for v in result.beta] if result.beta is not None else None
-    dates_list = list(result.dates)
-
-    # Compute means ignoring NaN values
-    sharpe_arr_np = np.array(result.sharpe, dtype=float)
-    vol_arr_np = np.array(result.volatility, dtype=float)
-    mean_sharpe = sanitize_value(float(np.nanmean(sharpe_arr_np)))
-    mean_vol = sanitize_value(float(np.nanmean(vol_arr_np)))
-
-    mean_beta: float | None = None
-    if result.beta is not None:
-        beta_arr_np = np.array(result.beta, dtype=float)
-        mean_beta = sanitize_value(float(np.nanmean(beta_arr_np)))
-
     return RollingMetricsResponse(
         window=result.window,
         n_obs=result.n_obs,
-        sharpe=sharpe_list,
-        volatility=vol_list,
-        beta=beta_list,
-        dates=dates_list,
-        mean_sharpe=mean_sharpe,
-        mean_vol=mean_vol,
-        mean_beta=mean_beta,
+        sharpe=sanitize_sequence(result.sharpe),
+        volatility=sanitize_sequence(result.volatility),
+        beta=sanitize_sequence(result.beta),
+        dates=list(result.dates),
+        mean_sharpe=nanmean_or_none(result.sharpe),
+        mean_vol=nanmean_or_none(result.volatility),
+        mean_beta=nanmean_or_none(result.beta),
+        sortino=sanitize_sequence(result.sortino),
+        drawdown=sanitize_sequence(result.drawdown),
+        correlation=sanitize_sequence(result.correlation),
+        mean_sortino=nanmean_or_none(result.sortino),
+        mean_correlation=nanmean_or_none(result.correlation),
     )
 
 
 @router.post("/benchmark", response_model=BenchmarkResponse)
+@offloaded("analytics", timeout=120)
 def benchmark_comparison(req: BenchmarkRequest) -> BenchmarkResponse:
     """Compute benchmark comparison statistics (alpha, beta, R-squared, etc.)."""
     portfolio_series = _load_returns(req.portfolio_ticker, req.start_date, req.end_date)
@@ -157,6 +149,7 @@ def benchmark_comparison(req: BenchmarkRequest) -> BenchmarkResponse:
 
 
 @router.post("/drawdown", response_model=DrawdownResponse)
+@offloaded("analytics", timeout=120)
 def drawdown_analysis(req: DrawdownRequest) -> DrawdownResponse:
     """Compute drawdown analysis with top-N episodes and underwater curve."""
     returns_series = _load_returns(req.ticker, req.start_date, req.end_date)
@@ -183,11 +176,9 @@ def drawdown_analysis(req: DrawdownRequest) -> DrawdownResponse:
         for p in result.periods
     ]
 
-    underwater = [sanitize_value(v) for v in result.underwater_curve]
-
     return DrawdownResponse(
         periods=periods,
-        underwater_curve=underwater,
+        underwater_curve=sanitize_sequence(result.underwater_curve),
         n_periods=result.n_periods,
         max_depth=sanitize_value(result.max_depth),
         avg_depth=sanitize_value(result.avg_depth),
@@ -199,6 +190,7 @@ def drawdown_analysis(req: DrawdownRequest) -> DrawdownResponse:
 
 
 @router.post("/correlation", response_model=CorrelationResponse)
+@offloaded("analytics", timeout=120)
 def correlation_metrics(req: CorrelationRequest) -> CorrelationResponse:
     """Compute correlation and diversification metrics for multiple assets."""
     # Load returns for each ticker
@@ -1,10 +1,24 @@
-"""Realtime quotes router -- wraps CompositeQuoteProvider."""
+"""Realtime quotes router -- wraps CompositeQuoteProvider.
+
+Quotes can be pulled (``POST /quotes``) or pushed: ``GET /stream`` (SSE) and
+``/ws`` (WebSocket) subscribe to a shared ``QuoteHub`` and receive only the
+fields that changed since the previous message, keyed by symbol.
+"""
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 
+from finbot.core.contracts.realtime_data import Quote
 from finbot.services.realtime_data.composite_provider import CompositeQuoteProvider
+from finbot.services.realtime_data.prefetcher import QuotePrefetcher
+from finbot.services.realtime_data.quote_hub import QuoteHub, QuoteHubStats, QuoteSubscription, diff_quotes
+from web.backend.config import settings
 from web.backend.schemas.realtime_quotes import (
     ProviderStatusResponse,
     ProviderStatusSchema,
@@ -15,14 +29,44 @@ from web.backend.schemas.realtime_quotes import (
 
 router = APIRouter()
 
-_provider = CompositeQuoteProvider()
+_provider = CompositeQuoteProvider(
+    stale_grace_seconds=settings.realtime_quote_stale_grace_seconds,
+    max_cache_entries=settings.realtime_quote_cache_max_entries,
+)
+_prefetcher = QuotePrefetcher(_provider)
+_hub = QuoteHub(_provider, interval=settings.realtime_stream_interval_seconds)
+
+
+def start_quote_prefetcher() -> None:
+    """Keep the configured watchlist warm, if there is one, from the running event loop."""
+    if settings.realtime_watchlist:
+        _prefetcher.subscribe(settings.realtime_watchlist)
+        _prefetcher.start()
+
+
+def start_quote_hub() -> None:
+    """Start polling for streaming subscribers on the running event loop."""
+    _hub.start()
+
+
+def quote_hub_stats() -> QuoteHubStats:
+    """Return the streaming hub's activity counters."""
+    return _hub.stats()
+
+
+async def shutdown_quote_provider() -> None:
+    """Stop the hub, prefetcher and background refreshes and close pooled HTTP clients."""
+    await _hub.stop()
+    await _prefetcher.stop()
+    _provider.close()
+    await _provider.aclose()
 
 
 @router.post("/quotes", response_model=QuotesResponse)
-def get_quotes(req: QuotesRequest) -> QuotesResponse:
+async def get_quotes(req: QuotesRequest) -> QuotesResponse:
     """Fetch real-time quotes for the requested symbols."""
     try:
-        batch = _provider.get_quotes(req.symbols)
+        batch = await _provider.aget_quotes(req.symbols)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch quotes: {e}") from e
 
@@ -64,8 +108,110 @@ def get_provider_status() -> ProviderStatusResponse:
             last_error=status.last_error,
             total_requests=status.total_requests,
             total_errors=status.total_errors,
+            cache_hits=status.cache_hits,
+            cache_stale_hits=status.cache_stale_hits,
+            cache_misses=status.cache_misses,
         )
         for status in statuses
     ]
 
     return ProviderStatusResponse(providers=providers)
+
+
+def _parse_symbols(symbols: str) -> list[str]:
+    return [sym.strip().upper() for sym in symbols.split(",") if sym.strip()]
+
+
+def _sse_message(event: str, data: object) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _sse_events(subscription: QuoteSubscription, request: Request, keepalive: float) -> AsyncIterator[str]:
+    """Yield SSE messages with changed quote fields until the client disconnects."""
+    sent: dict[str, Quote] = {}
+    try:
+        while not await request.is_disconnected():
+            try:
+                quotes = await asyncio.wait_for(subscription.get(), timeout=keepalive)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            diff = diff_quotes(sent, quotes)
+            sent.update(quotes)
+            if diff:
+                yield _sse_message("quotes", diff)
+    finally:
+        subscription.close()
+
+
+@router.get("/stream")
+async def stream_quotes(request: Request, symbols: str) -> StreamingResponse:
+    """Stream quote updates for comma-separated *symbols* as server-sent events.
+
+    The first ``quotes`` event carries every field of each symbol's last known
+    quote; later events carry only fields that changed.
+    """
+    symbol_list = _parse_symbols(symbols)
+    if not symbol_list:
+        raise HTTPException(status_code=422, detail="At least one symbol is required")
+    subscription = _hub.subscribe(symbol_list)
+    return StreamingResponse(
+        _sse_events(subscription, request, settings.realtime_stream_keepalive_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _receive_ws_actions(websocket: WebSocket, subscription: QuoteSubscription, sent: dict[str, Quote]) -> None:
+    """Apply subscribe/unsubscribe messages from *websocket* until it disconnects."""
+    while True:
+        try:
+            message = await websocket.receive_json()
+        except WebSocketDisconnect:
+            return
+        except ValueError:
+            await websocket.send_json({"type": "error", "detail": "Messages must be JSON"})
+            continue
+        action = message.get("action") if isinstance(message, dict) else None
+        if action not in ("subscribe", "unsubscribe") or not isinstance(message.get("symbols"), list):
+            await websocket.send_json({"type": "error", "detail": "Expected {action: subscribe|unsubscribe, symbols}"})
+            continue
+        requested = {str(sym).strip().upper() for sym in message["symbols"]}
+        if action == "subscribe":
+            subscription.set_symbols(subscription.symbols | requested)
+        else:
+            subscription.set_symbols(subscription.symbols - requested)
+            for sym in requested:
+                sent.pop(sym, None)
+
+
+@router.websocket("/ws")
+async def stream_quotes_ws(websocket: WebSocket, symbols: str = "") -> None:
+    """Push quote updates over a WebSocket.
+
+    Messages from the server are ``{"type": "quotes", "quotes": {symbol: fields}}``
+    with only the fields that changed.  Clients change the subscription by
+    sending ``{"action": "subscribe" | "unsubscribe", "symbols": [...]}``.
+    """
+    await websocket.accept()
+    subscription = _hub.subscribe(_parse_symbols(symbols))
+    sent: dict[str, Quote] = {}
+    receiver = asyncio.create_task(_receive_ws_actions(websocket, subscription, sent))
+    try:
+        while True:
+            getter = asyncio.ensure_future(subscription.get())
+            await asyncio.wait({receiver, getter}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver.done():
+                getter.cancel()
+                break
+            # A read that raced an unsubscribe may still carry removed symbols
+            quotes = {sym: quote for sym, quote in getter.result().items() if sym in subscription.symbols}
+            diff = diff_quotes(sent, quotes)
+            sent.update(quotes)
+            if diff:
+                await websocket.send_json({"type": "quotes", "quotes": diff})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        subscription.close()
@@ -25,6 +25,8 @@ from web.backend.schemas.risk_analytics import (
     VaRResponse,
     VaRResultSchema,
 )
+from web.backend.services.result_cache import cached_endpoint
+from web.backend.services.route_execution import offloaded
 from web.backend.services.serializers import sanitize_value
 
 router = APIRouter()
@@ -69,6 +71,8 @@ def _load_returns(ticker: str, start_date: str | None, end_date: str | None) ->
 
 
 @router.post("/var", response_model=VaRResponse)
+@cached_endpoint()
+@offloaded("analytics", timeout=120)
 def compute_var_endpoint(req: VaRRequest) -> VaRResponse:
     """Compute Value at Risk using all three methods plus CVaR."""
     returns = _load_returns(req.ticker, req.start_date, req.end_date)
@@ -127,6 +131,8 @@ def compute_var_endpoint(req: VaRRequest) -> VaRResponse:
 
 
 @router.post("/stress", response_model=StressTestResponse)
+@cached_endpoint()
+@offloaded("analytics", timeout=120)
 def run_stress_test_endpoint(req: StressTestRequest) -> StressTestResponse:
     """Run stress tests for specified scenarios."""
     returns = _load_returns(req.ticker, req.start_date, req.end_date)
@@ -163,6 +169,8 @@ def run_stress_test_endpoint(req: StressTestRequest) -> StressTestResponse:
 
 
 @router.post("/kelly", response_model=KellyResponse)
+@cached_endpoint()
+@offloaded("analytics", timeout=120)
 def compute_kelly_endpoint(req: KellyRequest) -> KellyResponse:
     """Compute Kelly criterion for a single asset."""
     returns = _load_returns(req.ticker, req.start_date, req.end_date)
@@ -187,6 +195,8 @@ def compute_kelly_endpoint(req: KellyRequest) -> KellyResponse:
 
 
 @router.post("/kelly-multi", response_model=MultiKellyResponse)
+@cached_endpoint()
+@offloaded("analytics", timeout=120)
 def compute_multi_kelly_endpoint(req: MultiKellyRequest) -> MultiKellyResponse:
     """Compute multi-asset Kelly weights."""
     returns_dict: dict[str, np.ndarray] = {}
@@ -235,12 +245,14 @@ def compute_multi_kelly_endpoint(req: MultiKellyRequest) -> MultiKellyResponse:
 
 
 @router.post("/var-backtest", response_model=VaRBacktestResponse)
+@cached_endpoint()
+@offloaded("analytics", timeout=120)
 def run_var_backtest_endpoint(req: VaRBacktestRequest) -> VaRBacktestResponse:
     """Run a VaR model backtest (violation analysis)."""
     returns = _load_returns(req.ticker, req.start_date, req.end_date)
 
     try:
-        result = var_backtest(returns, confidence=req.confidence, method=req.method)
+        result = var_backtest(returns, confidence=req.confidence, method=req.method, window=req.window)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
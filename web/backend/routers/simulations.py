@@ -6,11 +6,12 @@ from typing import Annotated
 
 import numpy as np
 import pandas as pd
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query, Response
 
 from finbot.services.simulation.bond_ladder.bond_ladder_simulator import bond_ladder_simulator
 from finbot.services.simulation.sim_specific_funds import FUND_CONFIGS, simulate_fund
 from finbot.utils.data_collection_utils.yfinance.get_history import get_history
+from finbot.utils.data_science_utils.data_transformation.downsampling import MIN_POINTS, downsample_series
 from web.backend.schemas.simulations import (
     BondLadderMetric,
     BondLadderRequest,
@@ -19,6 +20,8 @@ from web.backend.schemas.simulations import (
     SimulationResponse,
     TimeSeries,
 )
+from web.backend.services.encoding import negotiate_layout, table_response
+from web.backend.services.route_execution import offloaded
 from web.backend.services.serializers import sanitize_value, series_to_timeseries
 
 router = APIRouter()
@@ -45,12 +48,22 @@ def list_funds() -> list[FundInfo]:
 
 
 @router.get("/run", response_model=SimulationResponse)
+@offloaded("simulation", timeout=300)
 def run_simulation(
     tickers: Annotated[list[str], Query(min_length=1)],
     normalize: Annotated[bool, Query()] = False,
-) -> SimulationResponse:
-    """Run fund simulations for the given tickers."""
+    max_points: Annotated[int | None, Query(ge=MIN_POINTS)] = None,
+    accept: Annotated[str | None, Header()] = None,
+) -> SimulationResponse | Response:
+    """Run fund simulations for the given tickers.
+
+    Series are sent as ``TimeSeries`` lists by default, or as one
+    date-aligned table (columnar/Arrow) when the ``Accept`` header asks for it.
+    With ``max_points`` set, each series is downsampled (LTTB) after the
+    metrics are computed.
+    """
     series_list: list[TimeSeries] = []
+    closes: dict[str, pd.Series] = {}
     metrics_list: list[dict[str, object]] = []
 
     for ticker in tickers:
@@ -69,9 +82,9 @@ def run_simulation(
             if first_val != 0:
                 close = close / first_val * 100
 
-        dates = [d.isoformat() for d in close.index]
-        values = [sanitize_value(v) for v in close.values]
-        series_list.append(TimeSeries(name=ticker_upper, dates=dates, values=values))
+        close = _chart_series(close, max_points)
+        series_list.append(TimeSeries(**series_to_timeseries(close, name=ticker_upper)))
+        closes[ticker_upper] = close
 
         # Compute basic metrics
         if len(df) > 1:
@@ -99,7 +112,17 @@ def run_simulation(
             }
         )
 
-    return SimulationResponse(series=series_list, metrics=metrics_list)
+    response = SimulationResponse(series=series_list, metrics=metrics_list)
+    return table_response(response, negotiate_layout(accept), field="series", table=_align_series(closes))
+
+
+def _chart_series(series: pd.Series, max_points: int | None) -> pd.Series:
+    return series if max_points is None else downsample_series(series, max_points)
+
+
+def _align_series(series: dict[str, pd.Series]) -> pd.DataFrame:
+    """One column per series on the union of their dates."""
+    return pd.concat(series, axis=1) if series else pd.DataFrame()
 
 
 def _filter_history(df: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
@@ -146,8 +169,16 @@ def _compute_metric_row(ticker: str, name: str, series: pd.Series) -> BondLadder
 
 
 @router.post("/bond-ladder/run", response_model=BondLadderResponse)
-def run_bond_ladder(req: BondLadderRequest) -> BondLadderResponse:
-    """Run the bond ladder research surface with optional ETF comparisons."""
+@offloaded("simulation", timeout=300)
+def run_bond_ladder(
+    req: BondLadderRequest,
+    accept: Annotated[str | None, Header()] = None,
+) -> BondLadderResponse | Response:
+    """Run the bond ladder research surface with optional ETF comparisons.
+
+    Series are sent as ``TimeSeries`` lists by default, or as one
+    date-aligned table (columnar/Arrow) when the ``Accept`` header asks for it.
+    """
     if req.max_maturity_years <= req.min_maturity_years:
         raise HTTPException(status_code=400, detail="max_maturity_years must be greater than min_maturity_years")
 
@@ -169,7 +200,9 @@ def run_bond_ladder(req: BondLadderRequest) -> BondLadderResponse:
 
     base_series = _normalize_series(ladder_close) if req.normalize else ladder_close
     ladder_label = f"{req.min_maturity_years}Y-{req.max_maturity_years}Y Ladder"
-    series_list = [series_to_timeseries(base_series, name=ladder_label)]
+    chart_series = _chart_series(base_series, req.max_points)
+    series_list = [series_to_timeseries(chart_series, name=ladder_label)]
+    aligned = {ladder_label: chart_series}
     metrics = [_compute_metric_row("BOND_LADDER", ladder_label, base_series)]
 
     cleaned_compare = [ticker.strip().upper() for ticker in req.compare_tickers if ticker.strip()]
@@ -189,7 +222,9 @@ def run_bond_ladder(req: BondLadderRequest) -> BondLadderResponse:
             continue
         compare_series = _normalize_series(compare_series) if req.normalize else compare_series
 
-        series_list.append(series_to_timeseries(compare_series, name=ticker))
+        chart_series = _chart_series(compare_series, req.max_points)
+        series_list.append(series_to_timeseries(chart_series, name=ticker))
+        aligned[ticker] = chart_series
         metrics.append(
             _compute_metric_row(
                 ticker,
@@ -198,4 +233,5 @@ def run_bond_ladder(req: BondLadderRequest) -> BondLadderResponse:
             )
         )
 
-    return BondLadderResponse(series=series_list, metrics=metrics)
+    response = BondLadderResponse(series=series_list, metrics=metrics)
+    return table_response(response, negotiate_layout(accept), field="series", table=_align_series(aligned))
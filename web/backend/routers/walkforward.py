@@ -2,34 +2,83 @@
 
 from __future__ import annotations
 
-from datetime import UTC
+import contextlib
+import threading
+from collections import OrderedDict
+from datetime import UTC, datetime
 from typing import Any
 
 import backtrader as bt
 import pandas as pd
 from fastapi import APIRouter, HTTPException
 
-from finbot.core.contracts.models import BacktestRunRequest
+from finbot.core.contracts.models import BacktestRunMetadata, BacktestRunRequest, BacktestRunResult
+from finbot.core.contracts.snapshot import compute_snapshot_hash
 from finbot.core.contracts.walkforward import WalkForwardConfig
 from finbot.services.backtesting.backtest_runner import BacktestRunner
 from finbot.services.backtesting.brokers.commission_schemes import CommInfo_NoCommission
-from finbot.services.backtesting.walkforward import run_walk_forward
+from finbot.services.backtesting.walkforward import WindowResultCache, run_walk_forward
 from finbot.utils.data_collection_utils.yfinance.get_history import get_history
 from web.backend.routers.backtesting import STRATEGIES
 from web.backend.schemas.walkforward import WalkForwardRequest, WalkForwardResponse, WalkForwardWindowResult
+from web.backend.services.jobs import report_progress
+from web.backend.services.result_cache import price_data_version
+from web.backend.services.route_execution import offloaded
 from web.backend.services.serializers import sanitize_value
 
 router = APIRouter()
 
+# Window results shared across requests; keys include the price data's content hash
+_window_cache = WindowResultCache()
+
+# Content hashes of the price data, by (symbols, dates, stored file versions)
+_MAX_SNAPSHOT_IDS = 256
+_snapshot_ids: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+_snapshot_ids_lock = threading.Lock()
+
+
+def _load_price_data(
+    symbols: tuple[str, ...], start: pd.Timestamp, end: pd.Timestamp
+) -> tuple[dict[str, pd.DataFrame], str]:
+    """Load each symbol's history between the dates, with the data's snapshot ID.
+
+    The histories are only hashed again when a stored history file has
+    changed since the same symbols and dates were last requested.
+    """
+    # Versions are read before loading, so a file rewritten in between is hashed again next time
+    versions = price_data_version(symbols)
+    key = (symbols, start, end, tuple(versions)) if all(mtime is not None for _, mtime, _ in versions) else None
+
+    price_histories = {symbol: get_history(symbol).loc[start:end] for symbol in symbols}
+    with _snapshot_ids_lock:
+        snapshot_id = _snapshot_ids.get(key) if key is not None else None
+    if snapshot_id is None:
+        snapshot_id = compute_snapshot_hash(list(symbols), price_histories)
+        if key is not None:
+            with _snapshot_ids_lock:
+                _snapshot_ids[key] = snapshot_id
+                while len(_snapshot_ids) > _MAX_SNAPSHOT_IDS:
+                    _snapshot_ids.popitem(last=False)
+    return price_histories, snapshot_id
+
 
 class _BacktraderEngine:
-    """Minimal BacktestEngine adapter for walk-forward analysis."""
+    """Minimal BacktestEngine adapter for walk-forward analysis.
+
+    Holds the price histories loaded once per walk-forward run; each window
+    backtest selects its dates from them.
+    """
 
-    def run(self, request: BacktestRunRequest) -> Any:
-        """Run a single backtest and return a BacktestRunResult-like object."""
-        price_histories: dict[str, pd.DataFrame] = {}
-        for symbol in request.symbols:
-            price_histories[symbol] = get_history(symbol)
+    def __init__(self, price_histories: dict[str, pd.DataFrame]):
+        self._price_histories = price_histories
+
+    def cache_key(self) -> str:
+        """Fingerprint of the fixed broker, commission and sizer settings."""
+        return f"{bt.brokers.BackBroker.__name__}/{CommInfo_NoCommission.__name__}/{bt.sizers.AllInSizer.__name__}"
+
+    def run(self, request: BacktestRunRequest) -> BacktestRunResult:
+        """Run a single window backtest."""
+        price_histories = {symbol: self._price_histories[symbol] for symbol in request.symbols}
 
         strat_cls = STRATEGIES.get(request.strategy_name)
         if strat_cls is None:
@@ -53,9 +102,6 @@ class _BacktraderEngine:
             plot=False,
         )
         stats_df = runner.run_backtest()
-        import contextlib
-
-        from finbot.core.contracts.models import BacktestRunMetadata, BacktestRunResult
 
         metrics: dict[str, float] = {}
         if stats_df is not None and not stats_df.empty:
@@ -64,8 +110,6 @@ class _BacktraderEngine:
                 with contextlib.suppress(ValueError, TypeError):
                     metrics[col] = float(val)
 
-        from datetime import datetime
-
         metadata = BacktestRunMetadata(
             run_id="wf-window",
             engine_name="backtrader",
@@ -73,12 +117,13 @@ class _BacktraderEngine:
             strategy_name=request.strategy_name,
             created_at=datetime.now(tz=UTC),
             config_hash="",
-            data_snapshot_id="",
+            data_snapshot_id=request.data_snapshot_id or "",
         )
         return BacktestRunResult(metadata=metadata, metrics=metrics)
 
 
 @router.post("/run", response_model=WalkForwardResponse)
+@offloaded("backtest", timeout=1800)
 def run_walkforward(req: WalkForwardRequest) -> WalkForwardResponse:
     """Run walk-forward analysis."""
     if req.strategy not in STRATEGIES:
@@ -91,23 +136,30 @@ def run_walkforward(req: WalkForwardRequest) -> WalkForwardResponse:
         anchored=req.anchored,
     )
 
-    request = BacktestRunRequest(
-        strategy_name=req.strategy,
-        symbols=tuple(t.upper() for t in req.tickers),
-        start=pd.Timestamp(req.start_date),
-        end=pd.Timestamp(req.end_date),
-        initial_cash=req.initial_cash,
-        parameters=req.strategy_params,
-    )
-
-    engine = _BacktraderEngine()
+    symbols = tuple(t.upper() for t in req.tickers)
+    start = pd.Timestamp(req.start_date)
+    end = pd.Timestamp(req.end_date)
 
     try:
+        price_histories, snapshot_id = _load_price_data(symbols, start, end)
+        request = BacktestRunRequest(
+            strategy_name=req.strategy,
+            symbols=symbols,
+            start=start,
+            end=end,
+            initial_cash=req.initial_cash,
+            parameters=req.strategy_params,
+            data_snapshot_id=snapshot_id,
+        )
+        # Windows run serially: this handler already occupies one bounded route
+        # or job worker, and a process pool per request would oversubscribe the host
         result = run_walk_forward(
-            engine=engine,
+            engine=_BacktraderEngine(price_histories),
             request=request,
             config=config,
             include_train=req.include_train,
+            cache=_window_cache,
+            progress=lambda done, total: report_progress(done / total, f"{done}/{total} windows"),
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Walk-forward analysis failed: {e}") from e
@@ -7,6 +7,7 @@ from typing import Any, Literal
 from pydantic import BaseModel, Field
 
 from finbot.core.contracts.missing_data import DEFAULT_MISSING_DATA_POLICY, MissingDataPolicy
+from finbot.utils.data_science_utils.data_transformation.downsampling import MIN_POINTS as MIN_CHART_POINTS
 from web.backend.schemas.portfolio_analytics import RollingMetricsResponse
 
 CommissionMode = Literal["none", "per_share", "percentage"]
@@ -129,6 +130,7 @@ class BacktestRequest(BaseModel):
     inflation_rate: float = 0.0
     missing_data_policy: MissingDataPolicy = DEFAULT_MISSING_DATA_POLICY
     cost_assumptions: BacktestCostAssumptions = Field(default_factory=BacktestCostAssumptions)
+    max_points: int | None = Field(default=None, ge=MIN_CHART_POINTS)  # Downsample chart series (LTTB)
 
 
 class RecurringCashflowRule(BaseModel):
@@ -18,6 +18,7 @@ class DataSourceInfo(BaseModel):
     newest_file: str | None
     total_size_bytes: int
     max_age_days: int
+    last_data_timestamp: str | None = None
 
 
 class DataStatusResponse(BaseModel):
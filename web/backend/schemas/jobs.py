@@ -0,0 +1,26 @@
+"""Pydantic schemas for background job endpoints."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class JobStatusResponse(BaseModel):
+    """State of a background job (without its result)."""
+
+    job_id: str
+    kind: str
+    status: str
+    progress: float
+    message: str
+    created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    error: str | None = None
+    error_status: int | None = None
+
+
+class JobSubmitResponse(JobStatusResponse):
+    """Response to a job submission."""
+
+    deduplicated: bool
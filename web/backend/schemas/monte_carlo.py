@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pydantic import BaseModel, Field
 
+from finbot.utils.data_science_utils.data_transformation.downsampling import MIN_POINTS as MIN_CHART_POINTS
+
 
 class MonteCarloRequest(BaseModel):
     """Request to run a Monte Carlo simulation."""
@@ -12,6 +14,8 @@ class MonteCarloRequest(BaseModel):
     sim_periods: int = Field(default=252, ge=1, le=2520)
     n_sims: int = Field(default=1000, ge=100, le=10000)
     start_price: float | None = None
+    seed: int | None = None  # Reproducible trials; seeded runs are cached
+    max_points: int | None = Field(default=None, ge=MIN_CHART_POINTS)  # Downsample chart series (LTTB)
 
 
 class PercentileBand(BaseModel):
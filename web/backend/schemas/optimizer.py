@@ -59,6 +59,7 @@ class ParetoPointResponse(BaseModel):
     objective_a: float
     objective_b: float
     is_pareto_optimal: bool
+    pareto_rank: int | None = None
 
 
 class ParetoOptimizerResponse(BaseModel):
@@ -80,11 +81,12 @@ class EfficientFrontierRequest(BaseModel):
     start_date: str | None = None
     end_date: str | None = None
     risk_free_rate: float = Field(default=0.04, ge=0.0, le=1.0)
-    n_portfolios: int = Field(default=2500, ge=100, le=10000)
+    n_points: int = Field(default=50, ge=2, le=500)
+    max_weight: float = Field(default=1.0, gt=0.0, le=1.0)
 
 
 class EfficientFrontierPortfolioResponse(BaseModel):
-    """A sampled or highlighted portfolio on the efficient frontier surface."""
+    """A frontier, turning-point or highlighted efficient frontier portfolio."""
 
     expected_return: float
     volatility: float
@@ -103,8 +105,8 @@ class EfficientFrontierAssetStatResponse(BaseModel):
 class EfficientFrontierResponse(BaseModel):
     """Response from the efficient frontier endpoint."""
 
-    portfolios: list[EfficientFrontierPortfolioResponse]
     frontier: list[EfficientFrontierPortfolioResponse]
+    turning_points: list[EfficientFrontierPortfolioResponse]
     max_sharpe: EfficientFrontierPortfolioResponse
     min_volatility: EfficientFrontierPortfolioResponse
     asset_stats: list[EfficientFrontierAssetStatResponse]
@@ -28,6 +28,11 @@ class RollingMetricsResponse(BaseModel):
     mean_sharpe: float | None = None
     mean_vol: float | None = None
     mean_beta: float | None = None
+    sortino: list[float | None] | None = None
+    drawdown: list[float | None] | None = None
+    correlation: list[float | None] | None = None
+    mean_sortino: float | None = None
+    mean_correlation: float | None = None
 
 
 class BenchmarkRequest(BaseModel):
@@ -78,7 +83,7 @@ class DrawdownResponse(BaseModel):
     """Response from drawdown analysis."""
 
     periods: list[DrawdownPeriodSchema]
-    underwater_curve: list[float]
+    underwater_curve: list[float | None]
     n_periods: int
     max_depth: float
     avg_depth: float
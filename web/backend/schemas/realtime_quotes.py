@@ -45,6 +45,9 @@ class ProviderStatusSchema(BaseModel):
     last_error: str | None = None
     total_requests: int = 0
     total_errors: int = 0
+    cache_hits: int = 0
+    cache_stale_hits: int = 0
+    cache_misses: int = 0
 
 
 class ProviderStatusResponse(BaseModel):
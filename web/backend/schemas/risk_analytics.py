@@ -134,6 +134,7 @@ class VaRBacktestRequest(BaseModel):
     ticker: str
     confidence: float = Field(default=0.95, gt=0, lt=1)
     method: str = "historical"
+    window: int | None = Field(default=None, ge=30)
     start_date: str | None = None
     end_date: str | None = None
 
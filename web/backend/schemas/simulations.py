@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pydantic import BaseModel, Field
 
+from finbot.utils.data_science_utils.data_transformation.downsampling import MIN_POINTS as MIN_CHART_POINTS
+
 
 class TimeSeries(BaseModel):
     """Time-series data with dates and values."""
@@ -36,6 +38,7 @@ class BondLadderRequest(BaseModel):
     max_maturity_years: int = Field(default=10, ge=1, le=30)
     compare_tickers: list[str] = Field(default_factory=lambda: ["SHY", "IEF", "TLT"])
     normalize: bool = True
+    max_points: int | None = Field(default=None, ge=MIN_CHART_POINTS)  # Downsample chart series (LTTB)
 
 
 class BondLadderMetric(BaseModel):
@@ -0,0 +1,129 @@
+"""Content negotiation for endpoints that return large tables.
+
+Value histories, simulated series and Monte Carlo bands dominate the size
+of their responses.  Endpoints built around one such table answer in the
+layout picked from the ``Accept`` header:
+
+- ``application/json`` (default): the endpoint's response model, with the
+  table as row records.
+- ``application/vnd.finbot.columnar+json``: the same fields, with the table
+  field replaced by ``{"index": [...], "columns": {name: [...]}}``.
+- ``application/vnd.apache.arrow.stream``: the table as an Arrow IPC stream.
+  The remaining fields are stored as JSON in the schema metadata under
+  ``finbot.response``.
+
+JSON bodies are compressed by ``GZipMiddleware`` when the client accepts it.
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from typing import Any, TypeVar
+
+import pandas as pd
+import pyarrow as pa
+from fastapi import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from web.backend.services.serializers import dataframe_to_columns
+
+COLUMNAR_JSON_MEDIA_TYPE = "application/vnd.finbot.columnar+json"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+ARROW_METADATA_KEY = b"finbot.response"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class TableLayout(StrEnum):
+    """How the table of a response is encoded."""
+
+    RECORDS = "records"
+    COLUMNS = "columns"
+    ARROW = "arrow"
+
+
+_LAYOUTS_BY_MEDIA_TYPE = {
+    "application/json": TableLayout.RECORDS,
+    "application/*": TableLayout.RECORDS,
+    "*/*": TableLayout.RECORDS,
+    COLUMNAR_JSON_MEDIA_TYPE: TableLayout.COLUMNS,
+    ARROW_STREAM_MEDIA_TYPE: TableLayout.ARROW,
+}
+
+
+def negotiate_layout(accept: str | None) -> TableLayout:
+    """Pick the layout an ``Accept`` header prefers.
+
+    The supported media type with the highest q-value wins; ties go to the
+    one listed first.  Missing headers and headers naming no supported type
+    get row records.
+    """
+    best, best_quality = TableLayout.RECORDS, 0.0
+    for entry in (accept or "").split(","):
+        media_type, *params = (part.strip() for part in entry.split(";"))
+        layout = _LAYOUTS_BY_MEDIA_TYPE.get(media_type.lower())
+        if layout is None:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > best_quality:
+            best, best_quality = layout, quality
+    return best
+
+
+def frame_to_arrow_stream(frame: pd.DataFrame, metadata: dict[str, Any] | None = None) -> bytes:
+    """Encode a DataFrame (index included) as an Arrow IPC stream.
+
+    Args:
+        frame: Table to encode; a DatetimeIndex becomes a ``date`` column and
+            any other unnamed index an ``index`` column.
+        metadata: JSON-safe values stored under ``finbot.response`` in the
+            schema metadata.
+    """
+    if frame.index.name is None:
+        frame = frame.rename_axis("date" if isinstance(frame.index, pd.DatetimeIndex) else "index")
+    frame = frame.set_axis([str(col) for col in frame.columns], axis=1)
+    table = pa.Table.from_pandas(frame, preserve_index=True)
+    if metadata is not None:
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), ARROW_METADATA_KEY: to_json(metadata, inf_nan_mode="null")}
+        )
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def table_response(
+    model: ModelT,
+    layout: TableLayout,
+    *,
+    field: str,
+    table: pd.DataFrame,
+) -> ModelT | Response:
+    """Return ``model`` as-is for records, or re-encode it around ``table``.
+
+    Args:
+        model: Response model; its ``field`` is left out of the columnar and
+            Arrow layouts, so it may be empty there.
+        layout: Negotiated layout.
+        field: Name of the model field holding the table.
+        table: The table, as a DataFrame.
+    """
+    if layout is TableLayout.RECORDS:
+        return model
+
+    rest = model.model_dump(mode="json", exclude={field})
+    headers = {"Vary": "Accept"}
+    if layout is TableLayout.ARROW:
+        return Response(frame_to_arrow_stream(table, rest), media_type=ARROW_STREAM_MEDIA_TYPE, headers=headers)
+    body = to_json({**rest, field: dataframe_to_columns(table)}, inf_nan_mode="null")
+    return Response(body, media_type=COLUMNAR_JSON_MEDIA_TYPE, headers=headers)
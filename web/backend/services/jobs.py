@@ -0,0 +1,615 @@
+"""Background jobs for long-running API endpoints.
+
+Backtests, optimizers, Monte Carlo runs, walk-forward analysis and the bond
+ladder can take minutes.  Submitting them as jobs returns a job ID at once
+instead of holding a request worker for the whole run.
+
+``JobManager`` queues submissions, deduplicates identical in-flight
+requests, rejects new work beyond a pending-job limit and starts queued jobs
+on a bounded pool of worker processes (or threads, for in-process use)
+subject to per-kind concurrency limits.  The workers form a ``RoutePool``, so
+a worker that crashes fails only its own job and is replaced.  Job state is
+kept in a ``JobStore``: in memory, or in a SQLite file so results outlive
+the server process.  No external broker is involved.
+
+A job of kind ``k`` runs the endpoint handler registered in ``JOB_KINDS``
+on the validated request and stores the response's JSON dump, or the
+status code and detail of the ``HTTPException`` it raised.  Handlers can
+call ``report_progress`` to publish progress while they run.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import importlib
+import json
+import queue
+import sqlite3
+import threading
+import uuid
+from collections import Counter, OrderedDict, deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from datetime import UTC, datetime
+from enum import StrEnum
+from functools import partial
+from pathlib import Path
+from typing import Any, Protocol, get_type_hints
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from finbot.utils.multiprocessing_utils.process_pools import pool_context
+from web.backend.config import settings
+from web.backend.services.route_execution import RoutePool
+
+# Job kind -> (module, handler) of the endpoint the job runs
+JOB_KINDS: dict[str, tuple[str, str]] = {
+    "backtest": ("web.backend.routers.backtesting", "run_backtest"),
+    "optimizer": ("web.backend.routers.optimizer", "run_optimizer"),
+    "pareto": ("web.backend.routers.optimizer", "run_pareto_optimizer"),
+    "monte-carlo": ("web.backend.routers.monte_carlo", "run_monte_carlo"),
+    "multi-asset-monte-carlo": ("web.backend.routers.monte_carlo", "run_multi_asset_monte_carlo"),
+    "walk-forward": ("web.backend.routers.walkforward", "run_walkforward"),
+    "bond-ladder": ("web.backend.routers.simulations", "run_bond_ladder"),
+}
+
+_DEFAULT_MAX_JOBS = 1000
+
+# How often the progress listener checks whether the manager was shut down
+_PROGRESS_POLL_SECONDS = 0.2
+
+# What process-mode workers run: ``_execute`` below, by RoutePool key
+_EXECUTE_KEY = f"{__name__}:_execute"
+
+JobRunner = Callable[[str, dict[str, Any]], dict[str, Any]]
+ProgressSink = Callable[[str, float, str], None]
+
+
+class JobStatus(StrEnum):
+    """Lifecycle state of a job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    @property
+    def is_finished(self) -> bool:
+        """True once the job has a result or an error."""
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    """Snapshot of one job.
+
+    Attributes:
+        job_id: Unique job identifier.
+        kind: Job kind (a ``JOB_KINDS`` key).
+        request_key: Hash of kind and payload used to deduplicate submissions.
+        payload: JSON-safe request body.
+        status: Lifecycle state.
+        created_at: Submission time (UTC).
+        progress: Completion fraction in [0, 1].
+        message: Latest progress message.
+        started_at: Time the job started running.
+        finished_at: Time the job succeeded or failed.
+        result: JSON-safe response body of a successful job.
+        error: Error detail of a failed job.
+        error_status: HTTP status code of a failed job.
+    """
+
+    job_id: str
+    kind: str
+    request_key: str
+    payload: dict[str, Any]
+    status: JobStatus
+    created_at: datetime
+    progress: float = 0.0
+    message: str = ""
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    error_status: int | None = None
+
+
+class JobRejectedError(RuntimeError):
+    """Raised when the pending-job limit is reached."""
+
+
+def request_key(kind: str, payload: dict[str, Any]) -> str:
+    """Hash identifying identical requests of one kind."""
+    canonical = json.dumps([kind, payload], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _job_to_json(job: Job) -> str:
+    data = asdict(job)
+    for name in ("created_at", "started_at", "finished_at"):
+        data[name] = data[name].isoformat() if data[name] is not None else None
+    return json.dumps(data)
+
+
+def _job_from_json(text: str) -> Job:
+    data = json.loads(text)
+    for name in ("created_at", "started_at", "finished_at"):
+        data[name] = datetime.fromisoformat(data[name]) if data[name] is not None else None
+    data["status"] = JobStatus(data["status"])
+    return Job(**data)
+
+
+def _stored_job(data: str, progress: float, message: str) -> Job:
+    return replace(_job_from_json(data), progress=progress, message=message)
+
+
+# ── Stores ────────────────────────────────────────────────────────────────────
+
+
+class JobStore(Protocol):
+    """Persistence for job snapshots."""
+
+    def save(self, job: Job) -> None:
+        """Insert or replace a job."""
+        ...
+
+    def save_progress(self, job_id: str, progress: float, message: str) -> None:
+        """Update only the progress fields of a stored job."""
+        ...
+
+    def get(self, job_id: str) -> Job | None:
+        """Return a job, or None if unknown."""
+        ...
+
+    def unfinished(self) -> list[Job]:
+        """Return queued and running jobs."""
+        ...
+
+
+class InMemoryJobStore:
+    """Thread-safe in-process job store.
+
+    Args:
+        max_jobs: Maximum number of jobs kept; the oldest finished jobs are
+            dropped first.
+    """
+
+    def __init__(self, max_jobs: int = _DEFAULT_MAX_JOBS):
+        if max_jobs < 1:
+            raise ValueError(f"max_jobs must be >= 1, got {max_jobs}")
+        self._max_jobs = max_jobs
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def save(self, job: Job) -> None:
+        """Insert or replace a job, evicting old finished jobs if full."""
+        with self._lock:
+            self._jobs[job.job_id] = job
+            excess = len(self._jobs) - self._max_jobs
+            if excess > 0:
+                expired = [key for key, stored in self._jobs.items() if stored.status.is_finished][:excess]
+                for key in expired:
+                    del self._jobs[key]
+
+    def save_progress(self, job_id: str, progress: float, message: str) -> None:
+        """Update only the progress fields of a stored job."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._jobs[job_id] = replace(job, progress=progress, message=message)
+
+    def get(self, job_id: str) -> Job | None:
+        """Return a job, or None if unknown."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def unfinished(self) -> list[Job]:
+        """Return queued and running jobs."""
+        with self._lock:
+            return [job for job in self._jobs.values() if not job.status.is_finished]
+
+
+class SQLiteJobStore:
+    """Job store backed by a SQLite file, so results survive restarts.
+
+    Progress lives in its own columns, so progress updates do not rewrite
+    the job's payload.
+
+    Args:
+        path: Database file; parent directories are created.
+        max_jobs: Maximum number of jobs kept; the earliest finished jobs
+            are dropped first.
+    """
+
+    def __init__(self, path: str | Path, max_jobs: int = _DEFAULT_MAX_JOBS):
+        if max_jobs < 1:
+            raise ValueError(f"max_jobs must be >= 1, got {max_jobs}")
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_jobs = max_jobs
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, status TEXT NOT NULL, "
+                "finished_at TEXT, progress REAL NOT NULL, message TEXT NOT NULL, data TEXT NOT NULL)"
+            )
+
+    def save(self, job: Job) -> None:
+        """Insert or replace a job, evicting old finished jobs if full."""
+        finished_at = job.finished_at.isoformat() if job.finished_at is not None else None
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, status, finished_at, progress, message, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job.job_id, str(job.status), finished_at, job.progress, job.message, _job_to_json(job)),
+            )
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM jobs").fetchone()
+            if count > self._max_jobs:
+                self._connection.execute(
+                    "DELETE FROM jobs WHERE job_id IN (SELECT job_id FROM jobs WHERE finished_at IS NOT NULL "
+                    "ORDER BY finished_at LIMIT ?)",
+                    (count - self._max_jobs,),
+                )
+
+    def save_progress(self, job_id: str, progress: float, message: str) -> None:
+        """Update only the progress fields of a stored job."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE jobs SET progress = ?, message = ? WHERE job_id = ?", (progress, message, job_id)
+            )
+
+    def get(self, job_id: str) -> Job | None:
+        """Return a job, or None if unknown."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data, progress, message FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return _stored_job(*row) if row is not None else None
+
+    def unfinished(self) -> list[Job]:
+        """Return queued and running jobs."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data, progress, message FROM jobs WHERE status IN (?, ?)",
+                (str(JobStatus.QUEUED), str(JobStatus.RUNNING)),
+            ).fetchall()
+        return [_stored_job(*row) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+# ── Execution ─────────────────────────────────────────────────────────────────
+
+_worker_sink: ProgressSink | None = None
+_current = threading.local()
+
+
+def report_progress(fraction: float, message: str = "") -> None:
+    """Publish progress of the job running in this thread (no-op outside jobs)."""
+    job_id = getattr(_current, "job_id", None)
+    sink = getattr(_current, "sink", None)
+    if job_id is not None and sink is not None:
+        sink(job_id, fraction, message)
+
+
+def _init_worker(progress_queue: Any) -> None:
+    """Process-pool initializer: route progress through the shared queue."""
+    global _worker_sink
+    _worker_sink = lambda job_id, fraction, message: progress_queue.put((job_id, fraction, message))  # noqa: E731
+
+
+def _execute(
+    runner: JobRunner, job_id: str, kind: str, payload: dict[str, Any], sink: ProgressSink | None
+) -> tuple[dict[str, Any] | None, int | None, str | None]:
+    """Run one job and return ``(result, error_status, error)``."""
+    _current.job_id = job_id
+    _current.sink = sink if sink is not None else _worker_sink
+    try:
+        return runner(kind, payload), None, None
+    except HTTPException as exc:
+        return None, exc.status_code, str(exc.detail)
+    except Exception as exc:
+        return None, 500, f"{kind} job failed: {exc}"
+    finally:
+        _current.job_id = None
+        _current.sink = None
+
+
+def _handler(kind: str) -> Callable[[BaseModel], BaseModel]:
+    module_name, handler_name = JOB_KINDS[kind]
+    return getattr(importlib.import_module(module_name), handler_name)
+
+
+def request_model(kind: str) -> type[BaseModel]:
+    """Request schema of the endpoint behind a job kind."""
+    if kind not in JOB_KINDS:
+        raise KeyError(kind)
+    return get_type_hints(_handler(kind))["req"]
+
+
+def run_endpoint(kind: str, payload: dict[str, Any]) -> dict[str, Any]:
+    """Default job runner: call the endpoint handler and dump its response."""
+    request = request_model(kind).model_validate(payload)
+    return _handler(kind)(request).model_dump(mode="json")
+
+
+class JobManager:
+    """Queue, deduplicate and run jobs with bounded concurrency.
+
+    Args:
+        store: Where job snapshots are kept; defaults to an in-memory store.
+            Jobs a previous process left unfinished are marked failed.
+        max_workers: Number of workers (jobs running at once).
+        max_pending: Maximum number of queued plus running jobs; further
+            submissions raise ``JobRejectedError``.
+        kind_limits: Maximum concurrently running jobs per kind; kinds not
+            listed may use every worker.
+        use_processes: Run jobs on worker processes (default) or, when
+            False, on threads of this process.
+        runner: ``runner(kind, payload) -> result``; defaults to
+            ``run_endpoint``.  Must be picklable when ``use_processes``.
+    """
+
+    def __init__(
+        self,
+        store: JobStore | None = None,
+        *,
+        max_workers: int = 2,
+        max_pending: int = 32,
+        kind_limits: dict[str, int] | None = None,
+        use_processes: bool = True,
+        runner: JobRunner = run_endpoint,
+    ):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be >= 1, got {max_pending}")
+        self._store: JobStore = store if store is not None else InMemoryJobStore()
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._kind_limits = dict(kind_limits or {})
+        self._use_processes = use_processes
+        self._runner = runner
+
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
+        self._live: dict[str, Job] = {}
+        self._queue: deque[str] = deque()
+        self._running: Counter[str] = Counter()
+        self._in_flight: dict[str, str] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._pool: RoutePool | None = None
+        self._closed = False
+        self._progress_queue: Any = None
+        self._progress_thread: threading.Thread | None = None
+        self._progress_stop = threading.Event()
+
+        interrupted_at = datetime.now(tz=UTC)
+        for job in self._store.unfinished():
+            self._store.save(
+                replace(
+                    job,
+                    status=JobStatus.FAILED,
+                    finished_at=interrupted_at,
+                    error="Job interrupted by a server restart",
+                    error_status=503,
+                )
+            )
+
+    def submit(self, kind: str, payload: dict[str, Any]) -> tuple[Job, bool]:
+        """Queue a job, or join an identical one already queued or running.
+
+        Args:
+            kind: Job kind.
+            payload: JSON-safe request body (validated by the caller).
+
+        Returns:
+            ``(job, deduplicated)``; ``deduplicated`` is True when an
+            identical in-flight job was returned instead of a new one.
+
+        Raises:
+            JobRejectedError: If ``max_pending`` jobs are already in flight.
+        """
+        key = request_key(kind, payload)
+        with self._lock:
+            existing = self._in_flight.get(key)
+            if existing is not None:
+                return self._live[existing], True
+            if len(self._in_flight) >= self._max_pending:
+                raise JobRejectedError(f"Job queue is full ({self._max_pending} pending jobs)")
+
+            job = Job(
+                job_id=uuid.uuid4().hex,
+                kind=kind,
+                request_key=key,
+                payload=payload,
+                status=JobStatus.QUEUED,
+                created_at=datetime.now(tz=UTC),
+            )
+            self._update(job)
+            self._queue.append(job.job_id)
+            self._in_flight[key] = job.job_id
+        self._dispatch()
+        return job, False
+
+    def get(self, job_id: str) -> Job | None:
+        """Return the latest snapshot of a job, or None if unknown."""
+        with self._lock:
+            live = self._live.get(job_id)
+        return live if live is not None else self._store.get(job_id)
+
+    def wait(self, job_id: str, timeout: float | None = None) -> Job | None:
+        """Block until a job finishes (or ``timeout`` seconds pass) and return it."""
+        with self._changed:
+            self._changed.wait_for(lambda: job_id not in self._live, timeout=timeout)
+        return self.get(job_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers and the progress listener; queued jobs are not started."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+            pool, self._pool = self._pool, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+        if pool is not None:
+            # Without waiting, running jobs fail as their workers are killed
+            pool.shutdown()
+        if self._progress_thread is not None:
+            # No sentinel is put on the queue: a killed worker may have died holding its write lock
+            self._progress_stop.set()
+            self._progress_thread.join()
+            self._progress_thread = None
+            self._progress_queue = None
+
+    # ── internals ─────────────────────────────────────────────────────────────
+
+    def _update(self, job: Job) -> None:
+        """Record a new snapshot (lock held) and wake waiters."""
+        if job.status.is_finished:
+            self._live.pop(job.job_id, None)
+        else:
+            self._live[job.job_id] = job
+        self._store.save(job)
+        self._changed.notify_all()
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        """Start the dispatch threads and, in process mode, the worker pool (lock held)."""
+        if self._executor is not None:
+            return self._executor
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="finbot-job")
+        if self._use_processes:
+            self._progress_queue = pool_context().Queue()
+            self._progress_thread = threading.Thread(
+                target=self._drain_progress, name="finbot-job-progress", daemon=True
+            )
+            self._progress_thread.start()
+            # Each dispatch thread waits on one worker; a crashed worker fails its job and is replaced
+            self._pool = RoutePool(
+                "jobs", self._max_workers, initializer=_init_worker, initargs=(self._progress_queue,)
+            )
+        return self._executor
+
+    def _take_startable(self) -> list[Job]:
+        """Move queued jobs that fit the worker and per-kind limits to running (lock held)."""
+        started: list[Job] = []
+        available = self._max_workers - sum(self._running.values())
+        for job_id in list(self._queue):
+            if available == 0:
+                break
+            job = self._live[job_id]
+            if self._running[job.kind] >= self._kind_limits.get(job.kind, self._max_workers):
+                continue
+            self._queue.remove(job_id)
+            self._running[job.kind] += 1
+            available -= 1
+            job = replace(job, status=JobStatus.RUNNING, started_at=datetime.now(tz=UTC))
+            self._update(job)
+            started.append(job)
+        return started
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            started = self._take_startable()
+            if not started:
+                return
+            executor = self._ensure_executor()
+            pool = self._pool
+        for job in started:
+            args = (self._runner, job.job_id, job.kind, job.payload)
+            try:
+                if pool is not None:
+                    future = executor.submit(pool.run, _EXECUTE_KEY, (*args, None))
+                else:
+                    future = executor.submit(_execute, *args, self._apply_progress)
+            except Exception as exc:
+                self._finish(job.job_id, None, error=(500, f"Could not start job: {exc}"))
+                continue
+            future.add_done_callback(partial(self._finish, job.job_id))
+
+    def _finish(self, job_id: str, future: Future | None, error: tuple[int, str] | None = None) -> None:
+        """Record a job's outcome: from its future, else the ``(status, detail)`` error it failed with."""
+        result: dict[str, Any] | None = None
+        error_status: int | None
+        detail: str | None
+        if future is not None:
+            try:
+                result, error_status, detail = future.result()
+            except HTTPException as exc:
+                # Raised by the worker pool, e.g. when the worker died mid-job
+                error_status, detail = exc.status_code, str(exc.detail)
+            except Exception as exc:
+                error_status, detail = 500, f"Job worker failed: {exc}"
+        else:
+            error_status, detail = error if error is not None else (500, "Job failed")
+        with self._lock:
+            job = self._live[job_id]
+            self._running[job.kind] -= 1
+            self._in_flight.pop(job.request_key, None)
+            now = datetime.now(tz=UTC)
+            if error_status is None:
+                job = replace(job, status=JobStatus.SUCCEEDED, progress=1.0, finished_at=now, result=result)
+            else:
+                job = replace(job, status=JobStatus.FAILED, finished_at=now, error=detail, error_status=error_status)
+            self._update(job)
+        self._dispatch()
+
+    def _apply_progress(self, job_id: str, fraction: float, message: str) -> None:
+        with self._lock:
+            job = self._live.get(job_id)
+            if job is None or job.status != JobStatus.RUNNING:
+                return
+            job = replace(job, progress=min(max(float(fraction), 0.0), 1.0), message=message)
+            self._live[job_id] = job
+            self._store.save_progress(job_id, job.progress, job.message)
+            self._changed.notify_all()
+
+    def _drain_progress(self) -> None:
+        while not self._progress_stop.is_set():
+            try:
+                item = self._progress_queue.get(timeout=_PROGRESS_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            self._apply_progress(*item)
+
+
+_manager: JobManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """Process-wide job manager configured from the API settings."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            store = SQLiteJobStore(settings.job_store_path) if settings.job_store_path else InMemoryJobStore()
+            _manager = JobManager(
+                store,
+                max_workers=settings.job_max_workers,
+                max_pending=settings.job_max_pending,
+                kind_limits=settings.job_kind_limits,
+                use_processes=settings.job_use_processes,
+            )
+        return _manager
+
+
+def shutdown_job_manager() -> None:
+    """Shut down the process-wide job manager, if it was started."""
+    global _manager
+    with _manager_lock:
+        manager, _manager = _manager, None
+    if manager is not None:
+        manager.shutdown()
+
+
+# Registered after ``shutdown_route_pools``, so it runs first and stops the job pool itself
+atexit.register(shutdown_job_manager)
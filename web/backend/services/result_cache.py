@@ -0,0 +1,434 @@
+"""Result cache for deterministic analytics endpoints.
+
+Efficient frontiers, Pareto sweeps, risk and factor analytics, seeded
+health economics and seeded Monte Carlo runs are pure functions of their
+request and the stored price data.  Dashboards send the same requests again
+whenever users switch tabs, so ``cached_endpoint`` stores the encoded
+response of such handlers and replays it.
+
+The cache key hashes the handler, the request (as canonical JSON), the
+negotiated response layout and the version (mtime and size) of the price
+file of every ticker the request names.  Refreshing a price file therefore
+changes the key, and stale results simply age out.  Entries live in a
+byte-bounded in-memory LRU and, optionally, a SQLite file shared by worker
+processes and restarts.
+
+The key doubles as the response's ``ETag``: a request whose
+``If-None-Match`` matches gets ``304 Not Modified`` without touching the
+handler or the cache.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from types import UnionType
+from typing import Annotated, Any, TypeVar, Union, get_args, get_origin, get_type_hints
+
+from fastapi import Header, Request, Response
+from pydantic import BaseModel
+
+from finbot.utils.data_collection_utils.yfinance._yfinance_utils import get_data_file_path
+from web.backend.config import settings
+from web.backend.services.encoding import negotiate_layout
+
+# Bump when cached response bodies change shape, so the disk tier is not reused
+CACHE_VERSION = 1
+JSON_MEDIA_TYPE = "application/json"
+
+# Request fields naming the tickers whose price data a result depends on
+_TICKER_FIELDS = ("ticker", "tickers", "benchmark_ticker")
+
+# Handler parameters other than the request that change the response; the
+# value is reduced to what actually matters before hashing
+_PARAM_NORMALIZERS: dict[str, Callable[[Any], Any]] = {"accept": negotiate_layout}
+
+HandlerT = TypeVar("HandlerT", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResult:
+    """An encoded response body.
+
+    Attributes:
+        body: Response bytes.
+        media_type: Content type of ``body``.
+        vary: ``Vary`` header of the original response, if any.
+    """
+
+    body: bytes
+    media_type: str = JSON_MEDIA_TYPE
+    vary: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ResultCacheStats:
+    """Snapshot of cache counters.
+
+    Attributes:
+        hits: Lookups served from memory.
+        disk_hits: Lookups served from the disk tier.
+        misses: Lookups that ran the handler.
+        evictions: Entries dropped from memory to stay within the byte budget.
+        entries: Entries in memory.
+        size_bytes: Memory used by the cached bodies.
+        max_bytes: Memory byte budget.
+    """
+
+    hits: int
+    disk_hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from memory or disk (0.0 before any lookup)."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / lookups if lookups else 0.0
+
+
+class SQLiteResultStore:
+    """Disk tier backed by a SQLite file, shared by processes and restarts.
+
+    Args:
+        path: Database file; parent directories are created.
+        max_bytes: Total size of stored bodies; the least recently read
+            entries are deleted beyond it.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int):
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, media_type TEXT NOT NULL, vary TEXT, body BLOB NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> CachedResult | None:
+        """Return a stored result, or None if unknown."""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT media_type, vary, body FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+        return CachedResult(body=bytes(row[2]), media_type=row[0], vary=row[1])
+
+    def put(self, key: str, result: CachedResult) -> None:
+        """Store a result, deleting the least recently read ones beyond the budget."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (key, media_type, vary, body, size, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, result.media_type, result.vary, result.body, len(result.body), time.time()),
+            )
+            (total,) = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+            if total > self._max_bytes:
+                # Keep the most recently read entries that fit in the budget
+                self._connection.execute(
+                    "DELETE FROM results WHERE key NOT IN ("
+                    "SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY accessed DESC) AS running FROM results) "
+                    "WHERE running <= ?)",
+                    (self._max_bytes,),
+                )
+
+    def clear(self) -> None:
+        """Delete all stored results."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class ResultCache:
+    """Thread-safe LRU of encoded responses bounded by memory, with an optional disk tier.
+
+    Args:
+        max_bytes: Memory budget of the cached bodies.  Larger bodies skip
+            the memory tier.
+        disk: Optional second tier consulted on memory misses.
+    """
+
+    def __init__(self, max_bytes: int, disk: SQLiteResultStore | None = None):
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        self._max_bytes = max_bytes
+        self._disk = disk
+        self._entries: OrderedDict[str, CachedResult] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _remember(self, key: str, result: CachedResult) -> None:
+        """Insert into the memory tier, evicting old entries (lock held)."""
+        stale = self._entries.pop(key, None)
+        if stale is not None:
+            self._size_bytes -= len(stale.body)
+        if len(result.body) > self._max_bytes:
+            return
+        self._entries[key] = result
+        self._size_bytes += len(result.body)
+        while self._size_bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size_bytes -= len(evicted.body)
+            self.evictions += 1
+
+    def get(self, key: str) -> CachedResult | None:
+        """Return a cached result from memory, then disk, or None."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+        result = self._disk.get(key) if self._disk is not None else None
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.disk_hits += 1
+                self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: CachedResult) -> None:
+        """Cache a result in memory and on disk."""
+        with self._lock:
+            self._remember(key, result)
+        if self._disk is not None:
+            self._disk.put(key, result)
+
+    def stats(self) -> ResultCacheStats:
+        """Return the current counters."""
+        with self._lock:
+            return ResultCacheStats(
+                hits=self.hits,
+                disk_hits=self.disk_hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop all entries (disk tier included) and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            self.evictions = 0
+        if self._disk is not None:
+            self._disk.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# ── Keys ──────────────────────────────────────────────────────────────────────
+
+
+def referenced_tickers(req: BaseModel) -> list[str]:
+    """Upper-cased tickers named by a request's ticker fields, sorted."""
+    tickers: set[str] = set()
+    for name in _TICKER_FIELDS:
+        value = getattr(req, name, None)
+        if isinstance(value, str):
+            tickers.add(value)
+        elif isinstance(value, Iterable):
+            tickers.update(str(item) for item in value)
+    return sorted({ticker.strip().upper() for ticker in tickers if ticker.strip()})
+
+
+def price_data_version(tickers: Iterable[str]) -> list[tuple[str, int, int] | tuple[str, None, None]]:
+    """``(ticker, mtime_ns, size)`` of each stored daily price history."""
+    versions: list[tuple[str, int, int] | tuple[str, None, None]] = []
+    for ticker in tickers:
+        try:
+            stat = os.stat(get_data_file_path(ticker))
+        except OSError:
+            versions.append((ticker, None, None))
+        else:
+            versions.append((ticker, stat.st_mtime_ns, stat.st_size))
+    return versions
+
+
+def result_key(endpoint: str, req: BaseModel, params: dict[str, Any] | None = None) -> str:
+    """Hash identifying a deterministic result.
+
+    Args:
+        endpoint: Handler identifier.
+        req: Validated request.
+        params: Other response-shaping parameters (e.g. the negotiated layout).
+    """
+    canonical = json.dumps(
+        [
+            CACHE_VERSION,
+            endpoint,
+            req.model_dump(mode="json"),
+            params or {},
+            price_data_version(referenced_tickers(req)),
+        ],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header lists ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+# ── Endpoint decorator ────────────────────────────────────────────────────────
+
+
+def _response_model(annotation: Any) -> type[BaseModel] | None:
+    """The pydantic model among a handler's return annotation."""
+    candidates = get_args(annotation) if get_origin(annotation) in (Union, UnionType) else (annotation,)
+    for candidate in candidates:
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+    return None
+
+
+def _encode(result: Any) -> CachedResult | None:
+    """Encode a handler result the way FastAPI would send it, if cacheable."""
+    if isinstance(result, BaseModel):
+        return CachedResult(body=result.model_dump_json(by_alias=True).encode())
+    if isinstance(result, Response) and result.status_code == 200:
+        return CachedResult(
+            body=bytes(result.body), media_type=result.media_type or JSON_MEDIA_TYPE, vary=result.headers.get("vary")
+        )
+    return None
+
+
+def _to_response(result: CachedResult, etag: str) -> Response:
+    headers = {"ETag": etag}
+    if result.vary is not None:
+        headers["Vary"] = result.vary
+    return Response(result.body, media_type=result.media_type, headers=headers)
+
+
+def cached_endpoint(when: Callable[[Any], bool] | None = None) -> Callable[[HandlerT], HandlerT]:
+    """Cache a deterministic endpoint handler's responses.
+
+    The handler's first parameter must be its request model.  Over HTTP the
+    wrapped handler answers with the cached bytes and an ``ETag``, or
+    ``304`` when ``If-None-Match`` matches.  Called directly (as background
+    jobs do) it returns the response model, as the handler does.
+
+    Args:
+        when: Predicate on the request; requests it rejects (e.g. unseeded
+            simulations) are neither cached nor given an ETag.
+    """
+
+    def decorate(handler: HandlerT) -> HandlerT:
+        signature = inspect.signature(handler)
+        hints = get_type_hints(handler, include_extras=True)
+        request_param = next(iter(signature.parameters))
+        response_model = _response_model(hints.get("return"))
+        endpoint = f"{handler.__module__}.{handler.__qualname__}"
+
+        @functools.wraps(handler)
+        def wrapper(*args: Any, if_none_match: str | None = None, http_request: Request | None = None, **kwargs: Any):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            req = bound.arguments[request_param]
+            if when is not None and not when(req):
+                return handler(*bound.args, **bound.kwargs)
+
+            params = {
+                name: _PARAM_NORMALIZERS.get(name, str)(value)
+                for name, value in bound.arguments.items()
+                if name != request_param
+            }
+            key = result_key(endpoint, req, params)
+            etag = f'"{key}"'
+            if http_request is not None and etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+
+            cache = get_result_cache()
+            cached = cache.get(key)
+            if cached is None:
+                result = handler(*bound.args, **bound.kwargs)
+                cached = _encode(result)
+                if cached is None:
+                    return result
+                cache.put(key, cached)
+                if http_request is None:
+                    return result
+            elif http_request is None and cached.media_type == JSON_MEDIA_TYPE and response_model is not None:
+                return response_model.model_validate_json(cached.body)
+            return _to_response(cached, etag)
+
+        # FastAPI reads this signature: the handler's parameters (annotations
+        # resolved) plus the If-None-Match header and the raw request
+        wrapper.__signature__ = signature.replace(  # type: ignore[attr-defined]
+            parameters=[
+                *(
+                    param.replace(annotation=hints.get(name, param.annotation))
+                    for name, param in signature.parameters.items()
+                ),
+                inspect.Parameter(
+                    "if_none_match",
+                    inspect.Parameter.KEYWORD_ONLY,
+                    default=None,
+                    annotation=Annotated[str | None, Header()],
+                ),
+                inspect.Parameter("http_request", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Request),
+            ],
+            return_annotation=hints.get("return", signature.return_annotation),
+        )
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+_cache: ResultCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """Process-wide result cache configured from the API settings."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            disk = (
+                SQLiteResultStore(settings.result_cache_path, settings.result_cache_disk_max_bytes)
+                if settings.result_cache_path
+                else None
+            )
+            _cache = ResultCache(settings.result_cache_max_bytes, disk)
+        return _cache
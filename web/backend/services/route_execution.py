@@ -0,0 +1,594 @@
+"""Route execution policy: CPU-bound handlers on warm worker processes.
+
+FastAPI runs ``def`` handlers on a thread pool, so a Backtrader run, an
+optimizer looping over NumPy in Python or a quantstats report holds the GIL
+and slows every other request, ``/api/health`` included.  Handlers marked
+with ``offloaded`` run instead on a named pool of worker processes.  Each
+worker imports the modules of its pool's handlers when it starts, so a
+request pays neither interpreter start-up nor imports.
+
+Pool sizes and per-route timeouts come from the ``route_*`` API settings.
+The request thread only waits for its worker, without holding the GIL.
+When the timeout passes or the client disconnects, the worker is killed
+and replaced, and the request fails with 504 or 499.  A marked handler
+called outside a request (background jobs, tests, scripts), or with
+offloading disabled, runs in the calling thread.
+
+``RouteExecutionMiddleware`` makes the current request visible to marked
+handlers and times every route; ``route_latency`` reports percentiles over
+a sliding window of recent requests.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import functools
+import importlib
+import inspect
+import math
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any, TypeVar, get_type_hints
+
+import anyio.from_thread
+from fastapi import HTTPException, Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from finbot.utils.multiprocessing_utils.process_pools import pool_context
+from web.backend.config import settings
+
+# How often a waiting request checks its deadline and whether the client left
+_CHECK_INTERVAL_SECONDS = 0.1
+
+# Status of requests abandoned by the client (nginx convention); nobody reads it
+CLIENT_CLOSED_REQUEST = 499
+
+HandlerT = TypeVar("HandlerT", bound=Callable[..., Any])
+
+# Outcome sent back by a worker: ("ok", result) or ("error", status, detail, headers)
+_Outcome = tuple[Any, ...]
+
+_current_request: contextvars.ContextVar[Request | None] = contextvars.ContextVar("finbot_route_request", default=None)
+
+
+@dataclass(frozen=True, slots=True)
+class RoutePolicy:
+    """Where a marked handler runs and how long a request waits for it.
+
+    Attributes:
+        pool: Name of the worker pool.
+        timeout: Seconds before the request fails with 504; None waits as
+            long as the handler runs.
+    """
+
+    pool: str
+    timeout: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RoutePoolStats:
+    """Snapshot of a worker pool's counters.
+
+    Attributes:
+        name: Pool name.
+        size: Worker processes.
+        busy: Workers running a handler.
+        queued: Requests waiting for a free worker.
+        completed: Handler runs that returned a result.
+        failed: Handler runs that raised.
+        timeouts: Requests that gave up after their timeout.
+        cancelled: Requests whose client disconnected first.
+        restarts: Workers replaced after a timeout, disconnect or crash.
+    """
+
+    name: str
+    size: int
+    busy: int
+    queued: int
+    completed: int
+    failed: int
+    timeouts: int
+    cancelled: int
+    restarts: int
+
+
+@dataclass(frozen=True, slots=True)
+class RouteLatency:
+    """Latency percentiles of one route over its recent requests.
+
+    Attributes:
+        route: ``"<METHOD> <path template>"``.
+        count: Requests recorded since start-up.
+        p50_ms: Median latency of the window, in milliseconds.
+        p90_ms: 90th percentile.
+        p99_ms: 99th percentile.
+        max_ms: Slowest request of the window.
+    """
+
+    route: str
+    count: int
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+# Handler key ("module:qualname") -> (undecorated handler, policy)
+_ROUTES: dict[str, tuple[Callable[..., Any], RoutePolicy]] = {}
+
+
+# ── Worker processes ──────────────────────────────────────────────────────────
+
+
+def _route_handler(key: str) -> Callable[..., Any]:
+    """The undecorated handler registered under ``key``, else the module-level function it names."""
+    if key not in _ROUTES:
+        module_name, _, qualname = key.partition(":")
+        module = importlib.import_module(module_name)
+        if key not in _ROUTES:
+            return getattr(module, qualname)
+    return _ROUTES[key][0]
+
+
+def _run_task(key: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> _Outcome:
+    try:
+        return ("ok", _route_handler(key)(*args, **kwargs))
+    except HTTPException as exc:
+        return ("error", exc.status_code, exc.detail, exc.headers)
+    except Exception as exc:
+        return ("error", 500, f"{key.partition(':')[2]} failed: {exc}", None)
+
+
+def _worker_main(
+    conn: Connection,
+    modules: tuple[str, ...],
+    initializer: Callable[..., object] | None,
+    initargs: tuple[Any, ...],
+) -> None:
+    """Worker process loop: import the pool's modules, then run handlers until told to stop."""
+    for module in modules:
+        importlib.import_module(module)
+    if initializer is not None:
+        initializer(*initargs)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        outcome = _run_task(*task)
+        try:
+            conn.send(outcome)
+        except Exception as exc:
+            conn.send(("error", 500, f"Could not return the result: {exc}", None))
+
+
+class _Worker:
+    """One worker process and the parent's end of its pipe."""
+
+    def __init__(
+        self,
+        context: Any,
+        name: str,
+        modules: tuple[str, ...],
+        initializer: Callable[..., object] | None,
+        initargs: tuple[Any, ...],
+    ):
+        self.conn, child = context.Pipe()
+        # Not daemonic: handlers such as walk-forward start process pools of their own
+        self.process = context.Process(target=_worker_main, args=(child, modules, initializer, initargs), name=name)
+        self.process.start()
+        child.close()
+
+    def stop(self, kill: bool = False) -> None:
+        if not kill:
+            try:
+                self.conn.send(None)
+            except OSError:
+                kill = True
+        if kill:
+            self.process.kill()
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class RoutePool:
+    """Fixed-size pool of warm worker processes for marked handlers.
+
+    Unlike ``ProcessPoolExecutor``, a running call can be abandoned, and a
+    worker that crashes does not break the pool: either way the worker is
+    killed and replaced, and the other workers keep running.
+
+    Args:
+        name: Pool name, used in stats and process names.
+        size: Number of worker processes.
+        modules: Modules every worker imports when it starts.
+        initializer: Called with ``initargs`` in every worker after the
+            imports (arguments are inherited, not pickled per call).
+        initargs: Arguments for ``initializer``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        modules: tuple[str, ...] = (),
+        *,
+        initializer: Callable[..., object] | None = None,
+        initargs: tuple[Any, ...] = (),
+    ):
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        self.name = name
+        self.size = size
+        self._modules = modules
+        self._initializer = initializer
+        self._initargs = initargs
+        self._context = pool_context()
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._workers: set[_Worker] = set()
+        self._idle: list[_Worker] = []
+        self._started = False
+        self._closed = False
+        self._spawned = 0
+        self._queued = 0
+        self._counts: Counter[str] = Counter()
+
+    def start(self) -> None:
+        """Start the workers (idempotent); they import their modules in the background."""
+        with self._lock:
+            if self._started or self._closed:
+                return
+            self._started = True
+            for _ in range(self.size):
+                self._add_worker()
+
+    def run(
+        self,
+        key: str,
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
+        cancelled: Callable[[], bool] | None = None,
+    ) -> Any:
+        """Run a registered handler on a worker and return its result.
+
+        Args:
+            key: Handler key (``"module:qualname"``); keys of unmarked
+                module-level functions run those functions.
+            args: Positional arguments; must be picklable.
+            kwargs: Keyword arguments; must be picklable.
+            timeout: Seconds to wait, queueing included; None waits indefinitely.
+            cancelled: Polled while waiting; True abandons the call.
+
+        Raises:
+            HTTPException: The handler's own, 504 on timeout,
+                ``CLIENT_CLOSED_REQUEST`` when cancelled, 500 when the
+                handler or its worker failed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.start()
+        worker = self._acquire(deadline, cancelled)
+        try:
+            worker.conn.send((key, args, kwargs or {}))
+            while not worker.conn.poll(_CHECK_INTERVAL_SECONDS):
+                self._check(deadline, cancelled)
+            outcome = worker.conn.recv()
+        except (EOFError, OSError) as exc:
+            self._replace(worker)
+            self._count("failed")
+            raise HTTPException(status_code=500, detail=f"Route worker {self.name} exited unexpectedly") from exc
+        except BaseException:
+            # Timed out, cancelled or unpicklable arguments: the worker may be mid-call
+            self._replace(worker)
+            raise
+        self._release(worker)
+
+        if outcome[0] == "ok":
+            self._count("completed")
+            return outcome[1]
+        self._count("failed")
+        _, status, detail, headers = outcome
+        raise HTTPException(status_code=status, detail=detail, headers=headers)
+
+    def stats(self) -> RoutePoolStats:
+        """Return the current counters."""
+        with self._lock:
+            return RoutePoolStats(
+                name=self.name,
+                size=self.size,
+                busy=len(self._workers) - len(self._idle),
+                queued=self._queued,
+                completed=self._counts["completed"],
+                failed=self._counts["failed"],
+                timeouts=self._counts["timeouts"],
+                cancelled=self._counts["cancelled"],
+                restarts=self._counts["restarts"],
+            )
+
+    def shutdown(self) -> None:
+        """Stop every worker; calls still running fail with 500."""
+        with self._lock:
+            self._closed = True
+            workers, self._workers, self._idle = self._workers, set(), []
+            self._available.notify_all()
+        for worker in workers:
+            worker.stop(kill=True)
+
+    # ── internals ─────────────────────────────────────────────────────────────
+
+    def _add_worker(self) -> None:
+        """Start one worker and mark it idle (lock held)."""
+        self._spawned += 1
+        worker = _Worker(
+            self._context, f"finbot-route-{self.name}-{self._spawned}", self._modules, self._initializer, self._initargs
+        )
+        self._workers.add(worker)
+        self._idle.append(worker)
+        self._available.notify()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counts[counter] += 1
+
+    def _check(self, deadline: float | None, cancelled: Callable[[], bool] | None) -> None:
+        """Raise if the call timed out or its client went away."""
+        if deadline is not None and time.monotonic() >= deadline:
+            self._count("timeouts")
+            raise HTTPException(status_code=504, detail=f"Request exceeded its time limit in pool {self.name}")
+        if cancelled is not None and cancelled():
+            self._count("cancelled")
+            raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Client disconnected")
+
+    def _acquire(self, deadline: float | None, cancelled: Callable[[], bool] | None) -> _Worker:
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise HTTPException(status_code=503, detail=f"Route pool {self.name} is shut down")
+                if self._idle:
+                    return self._idle.pop()
+                self._queued += 1
+                try:
+                    self._available.wait(_CHECK_INTERVAL_SECONDS)
+                finally:
+                    self._queued -= 1
+            self._check(deadline, cancelled)
+
+    def _release(self, worker: _Worker) -> None:
+        with self._lock:
+            if worker in self._workers:
+                self._idle.append(worker)
+                self._available.notify()
+
+    def _replace(self, worker: _Worker) -> None:
+        """Kill a worker that was abandoned or crashed and start a fresh one."""
+        with self._lock:
+            owned = worker in self._workers
+            self._workers.discard(worker)
+        worker.stop(kill=True)
+        with self._lock:
+            if owned and not self._closed:
+                self._counts["restarts"] += 1
+                self._add_worker()
+
+
+_pools: dict[str, RoutePool] = {}
+_pools_lock = threading.Lock()
+
+
+def _pool_modules(pool: str) -> tuple[str, ...]:
+    return tuple(sorted({key.partition(":")[0] for key, (_, policy) in _ROUTES.items() if policy.pool == pool}))
+
+
+def get_route_pool(name: str) -> RoutePool | None:
+    """Process-wide pool for ``name``, or None when its routes run in the request thread."""
+    if not settings.route_offload_enabled:
+        return None
+    size = settings.route_pool_sizes.get(name, settings.route_default_pool_size)
+    if size < 1:
+        return None
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = _pools[name] = RoutePool(name, size, _pool_modules(name))
+        return pool
+
+
+def start_route_pools() -> None:
+    """Start the pools of every marked handler so the first requests find warm workers.
+
+    The handlers' modules are imported once by the fork server, if it is not
+    running yet, so workers start with them already loaded.
+    """
+    pools = [pool for name in sorted({policy.pool for _, policy in _ROUTES.values()}) if (pool := get_route_pool(name))]
+    if pools:
+        modules = {key.partition(":")[0] for key in _ROUTES}
+        pool_context().set_forkserver_preload(sorted(modules))
+    for pool in pools:
+        pool.start()
+
+
+def route_pool_stats() -> list[RoutePoolStats]:
+    """Counters of the pools started so far."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [pool.stats() for pool in pools]
+
+
+def shutdown_route_pools() -> None:
+    """Stop every pool's workers."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+# Workers are not daemonic, so multiprocessing would wait for them at exit
+atexit.register(shutdown_route_pools)
+
+
+# ── Handler decorator ─────────────────────────────────────────────────────────
+
+
+def route_timeout(handler_name: str, policy: RoutePolicy) -> float | None:
+    """Timeout of a route: the ``route_timeouts`` setting, else the route's own."""
+    return settings.route_timeouts.get(handler_name, policy.timeout)
+
+
+def _client_disconnected(request: Request) -> bool:
+    try:
+        return anyio.from_thread.run(request.is_disconnected)
+    except RuntimeError:
+        # Not on a worker thread of the server's event loop
+        return False
+
+
+def offloaded(pool: str, *, timeout: float | None = None) -> Callable[[HandlerT], HandlerT]:
+    """Run a CPU-bound endpoint handler on a warm worker process.
+
+    Apply it to the handler itself, below ``cached_endpoint`` when both are
+    used, so cached responses are still served without a worker.  The
+    handler's arguments and result must be picklable.
+
+    Args:
+        pool: Worker pool the handler runs on.
+        timeout: Default seconds a request waits for the handler; the
+            ``route_timeouts`` setting overrides it by handler name.
+    """
+    policy = RoutePolicy(pool, timeout)
+
+    def decorate(handler: HandlerT) -> HandlerT:
+        key = f"{handler.__module__}:{handler.__qualname__}"
+        _ROUTES[key] = (handler, policy)
+        signature = inspect.signature(handler)
+        hints = get_type_hints(handler, include_extras=True)
+
+        @functools.wraps(handler)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            request = _current_request.get()
+            if request is None or (route_pool := get_route_pool(pool)) is None:
+                return handler(*args, **kwargs)
+            return route_pool.run(
+                key,
+                args,
+                kwargs,
+                timeout=route_timeout(handler.__name__, policy),
+                cancelled=functools.partial(_client_disconnected, request),
+            )
+
+        # FastAPI resolves annotations in the wrapper's module, so hand it resolved ones
+        wrapper.__signature__ = signature.replace(  # type: ignore[attr-defined]
+            parameters=[
+                param.replace(annotation=hints.get(name, param.annotation))
+                for name, param in signature.parameters.items()
+            ],
+            return_annotation=hints.get("return", signature.return_annotation),
+        )
+        wrapper.route_policy = policy  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+# ── Latency ───────────────────────────────────────────────────────────────────
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class LatencyRecorder:
+    """Thread-safe per-route latency samples over a sliding window.
+
+    Args:
+        window: Most recent requests per route the percentiles cover.
+    """
+
+    def __init__(self, window: int = 1024):
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, route: str, seconds: float) -> None:
+        """Add one request's latency."""
+        with self._lock:
+            samples = self._samples.get(route)
+            if samples is None:
+                samples = self._samples[route] = deque(maxlen=self._window)
+            samples.append(seconds)
+            self._counts[route] += 1
+
+    def snapshot(self) -> list[RouteLatency]:
+        """Percentiles of every route, sorted by route."""
+        with self._lock:
+            windows = {route: sorted(samples) for route, samples in self._samples.items()}
+            counts = dict(self._counts)
+        return [
+            RouteLatency(
+                route=route,
+                count=counts[route],
+                p50_ms=round(_percentile(ordered, 0.50) * 1000, 3),
+                p90_ms=round(_percentile(ordered, 0.90) * 1000, 3),
+                p99_ms=round(_percentile(ordered, 0.99) * 1000, 3),
+                max_ms=round(ordered[-1] * 1000, 3),
+            )
+            for route, ordered in sorted(windows.items())
+        ]
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+
+_latency = LatencyRecorder(settings.route_latency_window)
+
+
+def route_latency() -> list[RouteLatency]:
+    """Latency percentiles of every route served by this process."""
+    return _latency.snapshot()
+
+
+class RouteExecutionMiddleware:
+    """ASGI middleware exposing the request to marked handlers and timing each route.
+
+    Args:
+        app: Wrapped application.
+        recorder: Where latencies go; defaults to the process-wide recorder.
+    """
+
+    def __init__(self, app: ASGIApp, recorder: LatencyRecorder | None = None):
+        self.app = app
+        self.recorder = recorder if recorder is not None else _latency
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _current_request.set(Request(scope, receive))
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_request.reset(token)
+            # Set by the router once a route matched
+            path = getattr(scope.get("route"), "path", None)
+            if path is not None:
+                self.recorder.record(f"{scope['method']} {path}", time.perf_counter() - started)
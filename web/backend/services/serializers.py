@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, overload
 
 import numpy as np
 import pandas as pd
@@ -39,25 +40,101 @@ def sanitize_value(v: Any) -> Any:
     return v
 
 
+def _isoformat_datetimes(index: pd.DatetimeIndex) -> list[str]:
+    """ISO strings equal to ``Timestamp.isoformat()`` for every entry."""
+    if index.tz is None and not index.hasnans and not (index.to_numpy(dtype="int64") % 1_000_000_000).any():
+        # Whole-second naive times: one vectorized conversion instead of a Timestamp per entry
+        return np.datetime_as_string(index.to_numpy().astype("datetime64[s]")).tolist()
+    return [ts.isoformat() for ts in index]
+
+
+def sanitize_array(values: np.ndarray | pd.Series | pd.Index | Sequence[Any]) -> list[Any]:
+    """Vectorized ``sanitize_value`` over a 1-D array (NaN/Inf become None)."""
+    array = values.to_numpy() if isinstance(values, pd.Series | pd.Index) else np.asarray(values)
+    kind = array.dtype.kind
+    if kind == "f":
+        result = array.tolist()
+        for position in np.flatnonzero(~np.isfinite(array)):
+            result[position] = None
+        return result
+    if kind in "iub":
+        return array.tolist()
+    if kind == "M":
+        dates = pd.DatetimeIndex(array)
+        if not dates.hasnans:
+            return _isoformat_datetimes(dates)
+        return [sanitize_value(v) for v in dates]
+    items = values.tolist() if isinstance(values, pd.Series | pd.Index) else array.tolist()
+    return [sanitize_value(v) for v in items]
+
+
+@overload
+def sanitize_sequence(values: Sequence[float]) -> list[float | None]: ...
+@overload
+def sanitize_sequence(values: None) -> None: ...
+@overload
+def sanitize_sequence(values: Sequence[float] | None) -> list[float | None] | None: ...
+def sanitize_sequence(values: Sequence[float] | None) -> list[float | None] | None:
+    """Convert a float sequence to a JSON-safe list (NaN/Inf become None)."""
+    if values is None:
+        return None
+    return sanitize_array(np.asarray(values, dtype=float))
+
+
+def nanmean_or_none(values: Sequence[float] | None) -> float | None:
+    """Mean of the finite values in a sequence, or None if there are none."""
+    if values is None:
+        return None
+    arr = np.asarray(values, dtype=float)
+    finite = arr[np.isfinite(arr)]
+    return float(finite.mean()) if finite.size else None
+
+
+def _index_entries(index: pd.Index) -> tuple[list[str], list[Any]]:
+    """Record key (``"date"`` or ``"index"``) and JSON-safe value of every index entry."""
+    if isinstance(index, pd.DatetimeIndex) and not index.hasnans:
+        return ["date"] * len(index), _isoformat_datetimes(index)
+    if index.dtype.kind in "iufb":
+        return ["index"] * len(index), sanitize_array(index)
+
+    keys: list[str] = []
+    values: list[Any] = []
+    for idx in index:
+        if isinstance(idx, pd.Timestamp | datetime):
+            keys.append("date")
+            values.append(idx.isoformat())
+        elif isinstance(idx, str):
+            keys.append("index")
+            values.append(idx)
+        else:
+            keys.append("index")
+            values.append(sanitize_value(idx))
+    return keys, values
+
+
 def dataframe_to_records(df: pd.DataFrame) -> list[dict[str, Any]]:
     """Convert a DataFrame to a list of JSON-safe dicts, one per row."""
     if df is None or df.empty:
         return []
 
-    records = []
-    for idx, row in df.iterrows():
-        record: dict[str, Any] = {}
-        if isinstance(idx, pd.Timestamp | datetime):
-            record["date"] = idx.isoformat()
-        elif isinstance(idx, str):
-            record["index"] = idx
-        else:
-            record["index"] = sanitize_value(idx)
+    keys, index_values = _index_entries(df.index)
+    names = [str(col) for col in df.columns]
+    columns = [sanitize_array(df.iloc[:, position]) for position in range(df.shape[1])]
+    headers = {key: (key, *names) for key in set(keys)}
+    rows = zip(index_values, *columns, strict=True)
+    return [dict(zip(headers[key], row, strict=False)) for key, row in zip(keys, rows, strict=True)]
 
-        for col in df.columns:
-            record[str(col)] = sanitize_value(row[col])
-        records.append(record)
-    return records
+
+def dataframe_to_columns(df: pd.DataFrame) -> dict[str, Any]:
+    """Convert a DataFrame to a JSON-safe ``{"index": [...], "columns": {name: [...]}}`` dict."""
+    if df is None or df.empty:
+        return {"index": [], "columns": {}}
+
+    _, index_values = _index_entries(df.index)
+    return {
+        "index": index_values,
+        "columns": {str(col): sanitize_array(df.iloc[:, position]) for position, col in enumerate(df.columns)},
+    }
 
 
 def series_to_timeseries(series: pd.Series, name: str | None = None) -> dict[str, Any]:
@@ -65,16 +142,12 @@ def series_to_timeseries(series: pd.Series, name: str | None = None) -> dict[str
     if series is None or series.empty:
         return {"name": name or "", "dates": [], "values": []}
 
-    dates = []
-    values = []
-    for idx, val in series.items():
-        if isinstance(idx, pd.Timestamp | datetime):
-            dates.append(idx.isoformat())
-        else:
-            dates.append(str(idx))
-        values.append(sanitize_value(val))
+    if isinstance(series.index, pd.DatetimeIndex) and not series.index.hasnans:
+        dates = _isoformat_datetimes(series.index)
+    else:
+        dates = [idx.isoformat() if isinstance(idx, pd.Timestamp | datetime) else str(idx) for idx in series.index]
 
-    return {"name": name or str(series.name) or "", "dates": dates, "values": values}
+    return {"name": name or str(series.name) or "", "dates": dates, "values": sanitize_array(series)}
 
 
 def stats_df_to_dict(stats_df: pd.DataFrame) -> dict[str, Any]:
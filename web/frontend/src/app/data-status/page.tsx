@@ -106,6 +106,12 @@ export default function DataStatusPage() {
                 format: (v) =>
                   v != null ? String(v) : "N/A",
               },
+              {
+                key: "last_data_timestamp",
+                label: "Data Through",
+                format: (v) =>
+                  v != null ? String(v).slice(0, 10) : "N/A",
+              },
               {
                 key: "is_stale",
                 label: "Status",
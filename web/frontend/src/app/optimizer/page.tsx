@@ -668,7 +668,8 @@ function EfficientFrontierWorkspace() {
     const [startDate, setStartDate] = useState("2015-01-01");
     const [endDate, setEndDate] = useState("2024-12-31");
     const [riskFreeRate, setRiskFreeRate] = useState(0.04);
-    const [nPortfolios, setNPortfolios] = useState(2500);
+    const [nPoints, setNPoints] = useState(50);
+    const [maxWeight, setMaxWeight] = useState(1);
 
     const mutation = useMutation({
         mutationFn: (request: EfficientFrontierRequest) =>
@@ -696,13 +697,14 @@ function EfficientFrontierWorkspace() {
             start_date: startDate,
             end_date: endDate,
             risk_free_rate: riskFreeRate,
-            n_portfolios: nPortfolios,
+            n_points: nPoints,
+            max_weight: maxWeight,
         });
     };
 
     const result = mutation.data;
-    const scatterData =
-        result?.portfolios.map((portfolio) => ({
+    const turningPointData =
+        result?.turning_points.map((portfolio) => ({
             x: portfolio.volatility,
             y: portfolio.expected_return,
             label: `Sharpe ${portfolio.sharpe_ratio.toFixed(2)}`,
@@ -780,16 +782,32 @@ function EfficientFrontierWorkspace() {
                         </div>
                         <div className="space-y-2">
                             <Label className="text-xs text-muted-foreground">
-                                Portfolios Sampled
+                                Frontier Points
                             </Label>
                             <Input
                                 className="border-border/50 bg-background/50"
                                 type="number"
-                                min={100}
-                                max={10000}
-                                value={nPortfolios}
+                                min={2}
+                                max={500}
+                                value={nPoints}
                                 onChange={(event) =>
-                                    setNPortfolios(Number(event.target.value))
+                                    setNPoints(Number(event.target.value))
+                                }
+                            />
+                        </div>
+                        <div className="space-y-2">
+                            <Label className="text-xs text-muted-foreground">
+                                Max Weight
+                            </Label>
+                            <Input
+                                className="border-border/50 bg-background/50"
+                                type="number"
+                                step={0.05}
+                                min={0.05}
+                                max={1}
+                                value={maxWeight}
+                                onChange={(event) =>
+                                    setMaxWeight(Number(event.target.value))
                                 }
                             />
                         </div>
@@ -824,8 +842,11 @@ function EfficientFrontierWorkspace() {
                 <>
                     <div className="grid grid-cols-1 gap-4 sm:grid-cols-2 lg:grid-cols-4">
                         <StatCard
-                            label="Sampled Portfolios"
-                            value={formatNumber(result.portfolios.length, 0)}
+                            label="Turning Points"
+                            value={formatNumber(
+                                result.turning_points.length,
+                                0,
+                            )}
                             trend="neutral"
                         />
                         <StatCard
@@ -849,10 +870,10 @@ function EfficientFrontierWorkspace() {
                         />
                     </div>
 
-                    {scatterData.length > 0 && (
-                        <ChartCard title="Sampled Portfolio Surface">
+                    {turningPointData.length > 0 && (
+                        <ChartCard title="Turning Points">
                             <ScatterChartWrapper
-                                data={scatterData}
+                                data={turningPointData}
                                 xLabel="Volatility"
                                 yLabel="Expected Return"
                                 height={360}
@@ -956,14 +977,15 @@ function EfficientFrontierWorkspace() {
             {!mutation.isPending && !mutation.isError && !result && (
                 <EmptyState
                     icon={Target}
-                    message="Sample long-only portfolios to estimate the efficient frontier and highlight max-Sharpe versus min-volatility allocations."
+                    message="Solve the exact long-only efficient frontier and highlight max-Sharpe versus min-volatility allocations."
                     presets={[
                         {
                             label: "SPY / TLT / GLD",
                             onClick: () => {
                                 setTickers("SPY, TLT, GLD");
                                 setRiskFreeRate(0.04);
-                                setNPortfolios(2500);
+                                setNPoints(50);
+                                setMaxWeight(1);
                             },
                         },
                     ]}
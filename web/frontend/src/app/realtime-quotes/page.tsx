@@ -18,6 +18,7 @@ import { MetricBadge } from "@/components/common/metric-badge";
 import { Zap, Plus, X, RefreshCw } from "lucide-react";
 import { apiPost, apiGet } from "@/lib/api";
 import { formatNumber, formatCurrency } from "@/lib/format";
+import { useQuoteStream } from "@/hooks/use-quote-stream";
 import { useWatchlistStore } from "@/stores/watchlist-store";
 import type {
   QuotesResponse,
@@ -212,7 +213,10 @@ export default function RealtimeQuotesPage() {
 
   // Summary stats for live quotes
   const liveQuotes = liveQuotesMutation.data?.quotes;
-  const watchlistQuotes = watchlistMutation.data?.quotes;
+  // Watchlist quotes are pushed by the server; "Refresh All" fetches on demand
+  const streamedQuotes = useQuoteStream(watchlist);
+  const watchlistQuotes =
+    streamedQuotes.length > 0 ? streamedQuotes : watchlistMutation.data?.quotes;
 
   return (
     <div className="space-y-8">
@@ -497,6 +501,9 @@ export default function RealtimeQuotesPage() {
                   <div className="mt-3 space-y-1 text-xs text-muted-foreground">
                     <p>Requests: {p.total_requests}</p>
                     <p>Errors: {p.total_errors}</p>
+                    <p>
+                      Cache: {p.cache_hits} hits, {p.cache_stale_hits} stale, {p.cache_misses} misses
+                    </p>
                     {p.last_success && (
                       <p>Last Success: {new Date(p.last_success).toLocaleString()}</p>
                     )}
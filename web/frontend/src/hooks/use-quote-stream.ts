@@ -0,0 +1,45 @@
+"use client";
+
+import { useEffect, useState } from "react";
+import { apiUrl } from "@/lib/api";
+import type { QuoteSchema } from "@/types/api";
+
+type QuoteDiff = Record<string, Partial<Omit<QuoteSchema, "symbol">>>;
+
+/**
+ * Subscribe to pushed quote updates for `symbols` over server-sent events.
+ *
+ * The server sends only the fields that changed, so each message is merged
+ * into the quotes received so far. Returns the latest quote per symbol, in
+ * the order of `symbols`.
+ */
+export function useQuoteStream(symbols: string[], enabled = true): QuoteSchema[] {
+  const [quotes, setQuotes] = useState<Record<string, QuoteSchema>>({});
+  const key = symbols.join(",");
+
+  useEffect(() => {
+    setQuotes({});
+    if (!enabled || !key) return;
+
+    const source = new EventSource(
+      apiUrl(`/api/realtime-quotes/stream?symbols=${encodeURIComponent(key)}`),
+    );
+    const handler = (e: MessageEvent<string>) => {
+      const diff = JSON.parse(e.data) as QuoteDiff;
+      setQuotes((prev) => {
+        const next = { ...prev };
+        for (const [symbol, fields] of Object.entries(diff)) {
+          next[symbol] = { ...next[symbol], ...fields, symbol } as QuoteSchema;
+        }
+        return next;
+      });
+    };
+    source.addEventListener("quotes", handler);
+    return () => {
+      source.removeEventListener("quotes", handler);
+      source.close();
+    };
+  }, [key, enabled]);
+
+  return symbols.filter((s) => s in quotes).map((s) => quotes[s]);
+}
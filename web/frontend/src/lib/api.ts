@@ -7,6 +7,10 @@ function getBaseUrl(): string {
   return baseUrl.replace(/\/$/, "");
 }
 
+export function apiUrl(url: string): string {
+  return `${getBaseUrl()}${url}`;
+}
+
 async function request<T>(
   url: string,
   init: RequestInit,
@@ -16,7 +20,7 @@ async function request<T>(
   const timer = setTimeout(() => controller.abort(), timeout);
 
   try {
-    const res = await fetch(`${getBaseUrl()}${url}`, {
+    const res = await fetch(apiUrl(url), {
       ...init,
       signal: controller.signal,
     });
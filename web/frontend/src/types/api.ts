@@ -35,6 +35,7 @@ export interface BondLadderRequest {
     max_maturity_years: number;
     compare_tickers?: string[];
     normalize?: boolean;
+    max_points?: number;
 }
 
 export interface BondLadderMetric {
@@ -148,6 +149,7 @@ export interface BacktestRequest {
     inflation_rate?: number;
     missing_data_policy?: MissingDataPolicy;
     cost_assumptions?: BacktestCostAssumptions;
+    max_points?: number;
 }
 
 export interface RecurringCashflowRule {
@@ -278,6 +280,7 @@ export interface MonteCarloRequest {
     sim_periods: number;
     n_sims: number;
     start_price?: number;
+    max_points?: number;
 }
 
 export interface PercentileBand {
@@ -359,6 +362,7 @@ export interface ParetoPointResponse {
     objective_a: number;
     objective_b: number;
     is_pareto_optimal: boolean;
+    pareto_rank?: number | null;
 }
 
 export interface ParetoOptimizerResponse {
@@ -376,7 +380,8 @@ export interface EfficientFrontierRequest {
     start_date?: string;
     end_date?: string;
     risk_free_rate?: number;
-    n_portfolios?: number;
+    n_points?: number;
+    max_weight?: number;
 }
 
 export interface EfficientFrontierPortfolio {
@@ -393,8 +398,8 @@ export interface EfficientFrontierAssetStat {
 }
 
 export interface EfficientFrontierResponse {
-    portfolios: EfficientFrontierPortfolio[];
     frontier: EfficientFrontierPortfolio[];
+    turning_points: EfficientFrontierPortfolio[];
     max_sharpe: EfficientFrontierPortfolio;
     min_volatility: EfficientFrontierPortfolio;
     asset_stats: EfficientFrontierAssetStat[];
@@ -661,6 +666,7 @@ export interface VaRBacktestRequest {
     ticker: string;
     confidence?: number;
     method?: string;
+    window?: number | null;
     start_date?: string;
     end_date?: string;
 }
@@ -695,6 +701,11 @@ export interface RollingMetricsResponse {
     mean_sharpe: number | null;
     mean_vol: number | null;
     mean_beta: number | null;
+    sortino?: (number | null)[] | null;
+    drawdown?: (number | null)[] | null;
+    correlation?: (number | null)[] | null;
+    mean_sortino?: number | null;
+    mean_correlation?: number | null;
 }
 
 export interface BenchmarkRequest {
@@ -798,6 +809,9 @@ export interface ProviderStatusSchema {
     last_error: string | null;
     total_requests: number;
     total_errors: number;
+    cache_hits: number;
+    cache_stale_hits: number;
+    cache_misses: number;
 }
 
 export interface ProviderStatusResponse {
@@ -864,6 +878,7 @@ export interface DataSourceInfo {
     newest_file: string | null;
     total_size_bytes: number;
     max_age_days: number;
+    last_data_timestamp: string | null;
 }
 
 export interface DataStatusResponse {
@@ -873,3 +888,23 @@ export interface DataStatusResponse {
     fresh_count: number;
     stale_count: number;
 }
+
+// --- Jobs ---
+export type JobStatus = "queued" | "running" | "succeeded" | "failed";
+
+export interface JobStatusResponse {
+    job_id: string;
+    kind: string;
+    status: JobStatus;
+    progress: number;
+    message: string;
+    created_at: string;
+    started_at: string | null;
+    finished_at: string | null;
+    error: string | null;
+    error_status: number | null;
+}
+
+export interface JobSubmitResponse extends JobStatusResponse {
+    deduplicated: boolean;
+}